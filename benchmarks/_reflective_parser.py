@@ -0,0 +1,123 @@
+"""The reflective model parser the compiled parsers are measured against.
+
+A copy of `parse_model` as it was before parsers were compiled and
+cached, kept here as the reference for benchmarks.
+"""
+import dataclasses
+from typing import Any, Dict, Iterable, Optional, Type, TypeVar, Union, cast
+
+from signal_ocean.util.parsing_helpers import (
+    NoneType,
+    ParsableClass,
+    _parse_class,
+    _to_snake_case,
+)
+
+TModel = TypeVar("TModel")
+
+
+def reflective_parse_model(data: Union[Dict[str, Any], Iterable[Any], Any],
+                           cls: Union[Type[TModel], Type[Any]],
+                           rename_keys: Optional[Dict[str, str]] = None) \
+        -> Union[TModel, Any]:
+    """Instantiates an object of the provided class cls for a provided mapping.
+
+    Instantiates an object of a class specifying a model for the provided
+    mapping. An entry in the mapping must be provided for all non-optional
+    attribute of the class. Keys are expected to be in CapsWords, matching
+    the snake_case corresponding class attributes. Any additional entries
+    found in the mapping that do not correspond to class attributes are
+    ignored.
+
+    Args:
+        data: Dictionary containing pairs with the names of the attributes
+            and their respective values provided to instantiate the model
+            class.
+        cls: The model class to instantiate.
+        rename_keys: Key names to rename to match model attribute names,
+            used when an automated translation of the name from CapsWords
+            to snake_case is to sufficient. Renaming must provide the name
+            in CapsWords.
+
+    Returns:
+        The instantiated model class object.
+
+    Raises:
+        TypeError: Cannot parse the value of a class attribute to the
+            appropriate type.
+        NotImplementedError: The type of a class attribute is not supported.
+    """
+    if cls is not NoneType and dataclasses.is_dataclass(cls) \
+            and isinstance(data, dict):
+        if rename_keys:
+            for k, r, in rename_keys.items():
+                if k in data:
+                    data[r] = data.pop(k)
+
+        field_names = set(f.name for f in dataclasses.fields(cls))
+        field_types = {f.name: f.type for f in dataclasses.fields(cls)}
+
+        parsed_data: Dict[str, Any] = {}
+        for key, value in data.items():
+            key = _to_snake_case(key)
+            if key in field_names:
+                field_type = field_types[key]
+                parsed_data[key] = reflective_parse_model(
+                    value, field_type, rename_keys=rename_keys
+                )
+
+        args = []
+        for f in dataclasses.fields(cls):
+            if f.name in parsed_data:
+                a = parsed_data[f.name]
+            elif f.default is not dataclasses.MISSING:
+                a = f.default
+            else:
+                fc = getattr(f, 'default_factory')
+                if fc is not dataclasses.MISSING:
+                    a = fc()
+                else:
+                    raise TypeError(f'Cannot initialize class {cls}. '
+                                    f'Missing required parameter {f.name}')
+            args.append(a)
+
+        return cls(*args)
+
+    field_type_origin = getattr(cls, '__origin__', None)
+
+    if field_type_origin is Union:
+        for candidate_cls in getattr(cls, '__args__', []):
+            try:
+                return reflective_parse_model(
+                    data, candidate_cls, rename_keys=rename_keys
+                )
+            except (TypeError, ValueError, NotImplementedError):
+                continue
+
+        raise ValueError(f'Cannot parse value {data} as {cls}')
+
+    if field_type_origin is list and isinstance(data, Iterable):
+        list_field_type = getattr(cls, '__args__', [])[0]
+        if type(list_field_type) is TypeVar:
+            return list(data)
+        return [reflective_parse_model(
+            v, list_field_type, rename_keys=rename_keys
+            ) for v in data
+        ]
+
+    if field_type_origin is tuple and isinstance(data, Iterable):
+        tuple_field_types = getattr(cls, '__args__', [])
+
+        if not tuple_field_types:
+            return tuple(data)
+        return tuple(
+            reflective_parse_model(
+                v, tuple_field_types[0], rename_keys=rename_keys
+                ) for v in data
+            )
+
+    parsable_classes = tuple(getattr(ParsableClass, '__args__', []))
+    if cls in parsable_classes:
+        return _parse_class(data, cast(Type[ParsableClass], cls))
+
+    raise NotImplementedError(f'Cannot parse data {data} as {cls}.')
@@ -0,0 +1,61 @@
+"""A minimal local HTTP server used to benchmark the SDK request layer."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, Optional
+from contextlib import contextmanager
+
+Responder = Callable[[str, str, Optional[bytes]], Any]
+
+
+def _echo(method: str, path: str, body: Optional[bytes]) -> Any:
+    return {"Method": method, "Path": path}
+
+
+@contextmanager
+def stub_server(responder: Responder = _echo) -> Iterator[str]:
+    """Serves JSON produced by `responder` on a random local port.
+
+    The server speaks HTTP/1.1 so that clients are able to keep connections
+    alive between requests.
+
+    Args:
+        responder: Called with the request method, path and body; its return
+            value is serialised as the JSON response body.
+
+    Yields:
+        The base URL of the running server.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def _respond(self, body: Optional[bytes] = None) -> None:
+            payload = json.dumps(
+                responder(self.command, self.path, body)
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self) -> None:  # noqa: N802
+            self._respond()
+
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            self._respond(self.rfile.read(length))
+
+        def log_message(self, *args: Dict[str, Any]) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
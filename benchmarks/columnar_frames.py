@@ -0,0 +1,117 @@
+"""Compares building data frames via models with the columnar decoding.
+
+Builds a data frame out of pages of synthetic scraped fixtures both by
+parsing model objects and converting them with `pd.DataFrame`, and by
+decoding the records straight into columns with `FrameBuilder`. Prints the
+time and the peak memory allocated by each approach.
+
+Run from the repository root with:
+
+    python -m benchmarks.columnar_frames
+"""
+import dataclasses
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+import pandas as pd
+
+from signal_ocean.scraped_fixtures.models import (
+    ScrapedFixture,
+    ScrapedFixturesResponse,
+)
+from signal_ocean.util.frame_helpers import FrameBuilder
+from signal_ocean.util.parsing_helpers import _to_camel_case, parse_model
+
+RECORDS = 100000
+PAGE_SIZE = 10000
+REPEATS = 3
+
+_CHARTERERS = ["Shell", "Vitol", "Trafigura", "Glencore", "Unipec"]
+
+
+def _sample_value(field_type: Any, i: int) -> Any:
+    if field_type is int:
+        return i
+    if field_type is float:
+        return i / 10
+    if field_type is bool:
+        return i % 2 == 0
+    if field_type is datetime:
+        return f"2021-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00"
+    return _CHARTERERS[i % len(_CHARTERERS)]
+
+
+def _sample_fixture(i: int) -> Dict[str, Any]:
+    record = {}
+    for f in dataclasses.fields(ScrapedFixture):
+        field_type = getattr(f.type, "__args__", (f.type,))[0]
+        record[_to_camel_case(f.name)] = _sample_value(field_type, i)
+    return record
+
+
+def _pages() -> List[Dict[str, Any]]:
+    return [
+        {
+            "NextPageToken": None,
+            "Data": [
+                _sample_fixture(i) for i in range(start, start + PAGE_SIZE)
+            ],
+        }
+        for start in range(0, RECORDS, PAGE_SIZE)
+    ]
+
+
+def _via_models(pages: List[Dict[str, Any]]) -> pd.DataFrame:
+    records: List[ScrapedFixture] = []
+    for page in pages:
+        records.extend(parse_model(page, ScrapedFixturesResponse).data)
+    return pd.DataFrame([vars(r) for r in records])
+
+
+def _columnar(pages: List[Dict[str, Any]]) -> pd.DataFrame:
+    builder = FrameBuilder(ScrapedFixture)
+    for page in pages:
+        builder.add(page["Data"])
+    return builder.to_frame()
+
+
+Build = Callable[[List[Dict[str, Any]]], pd.DataFrame]
+
+
+def _measure(build: Build, pages: List[Dict[str, Any]]) -> Tuple[float, int]:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        build(pages)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    frame = build(pages)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(frame) == RECORDS
+    return best, peak
+
+
+def main() -> None:
+    """Prints the time and peak memory of both approaches."""
+    pages = _pages()
+    model_time, model_peak = _measure(_via_models, pages)
+    columnar_time, columnar_peak = _measure(_columnar, pages)
+    for name, elapsed, peak in (
+        ("via models", model_time, model_peak),
+        ("columnar", columnar_time, columnar_peak),
+    ):
+        print(
+            f"{name:10} {elapsed:7.2f} s   peak {peak / 2 ** 20:8.1f} MiB"
+        )
+    print(
+        f"speed-up {model_time / columnar_time:5.2f}x   "
+        f"memory {model_peak / columnar_peak:5.2f}x less"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compares request throughput with and without connection pooling.
+
+Run from the repository root with:
+
+    python -m benchmarks.connection_pooling
+"""
+import time
+from urllib.parse import urljoin
+
+import requests
+
+from benchmarks._stub_server import stub_server
+from signal_ocean import Connection
+
+REQUESTS = 1000
+
+
+def _unpooled(host: str) -> float:
+    start = time.perf_counter()
+    for i in range(REQUESTS):
+        requests.get(urljoin(host, f"page/{i}")).raise_for_status()
+    return REQUESTS / (time.perf_counter() - start)
+
+
+def _pooled(host: str) -> float:
+    with Connection("key", host) as connection:
+        start = time.perf_counter()
+        for i in range(REQUESTS):
+            connection._make_get_request(f"page/{i}").raise_for_status()
+        return REQUESTS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Prints requests per second for both request strategies."""
+    with stub_server() as host:
+        unpooled = _unpooled(host)
+        pooled = _pooled(host)
+
+    print(f"new connection per request: {unpooled:10.1f} req/s")
+    print(f"pooled keep-alive session:  {pooled:10.1f} req/s")
+    print(f"speed-up:                   {pooled / unpooled:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measures the per-record cost of converting keys between cases.
+
+Converts the keys of every record of a synthetic 100k-row scraped positions
+payload from CapWords to snake_case, as done when parsing responses, and
+the field names of every record back to CapWords, as done when building
+requests and data frames, with and without the memoised conversions.
+
+Run from the repository root with:
+
+    python -m benchmarks.key_case_conversion
+"""
+import dataclasses
+import time
+from typing import Callable, List
+
+from signal_ocean.scraped_positions import ScrapedPosition
+from signal_ocean.util.parsing_helpers import (
+    _snake_to_cap_words,
+    _to_snake_case,
+)
+
+RECORDS = 100000
+
+Conversion = Callable[[str], str]
+
+
+def _time_per_record(convert: Conversion, records: List[List[str]]) -> float:
+    start = time.perf_counter()
+    for keys in records:
+        for key in keys:
+            convert(key)
+    return (time.perf_counter() - start) / len(records) * 1e6
+
+
+def _compare(name: str, cached: Conversion, records: List[List[str]]) -> None:
+    uncached = cached.__wrapped__  # type: ignore
+    before = _time_per_record(uncached, records)
+    after = _time_per_record(cached, records)
+    print(
+        f"{name:22} uncached {before:6.2f} us/record   "
+        f"memoised {after:6.2f} us/record   "
+        f"speed-up {before / after:5.2f}x"
+    )
+
+
+def main() -> None:
+    """Prints the per-record cost of both conversion directions."""
+    field_names = [f.name for f in dataclasses.fields(ScrapedPosition)]
+    cap_words = [_snake_to_cap_words(name) for name in field_names]
+    print(f"{RECORDS} records of {len(field_names)} keys")
+
+    _compare("CapWords -> snake_case", _to_snake_case, [cap_words] * RECORDS)
+    _compare(
+        "snake_case -> CapWords", _snake_to_cap_words, [field_names] * RECORDS
+    )
+
+
+if __name__ == "__main__":
+    main()
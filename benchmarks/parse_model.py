@@ -0,0 +1,95 @@
+"""Compares the compiled model parsers with the reflective parser.
+
+Parses pages of nested voyages, built from the voyages test fixtures, and
+pages of synthetic scraped fixtures with both parsers, checks that they
+produce identical objects and prints the time per record.
+
+Run from the repository root with:
+
+    python -m benchmarks.parse_model
+"""
+import dataclasses
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from benchmarks._reflective_parser import reflective_parse_model
+from signal_ocean.scraped_fixtures.models import (
+    ScrapedFixture,
+    ScrapedFixturesResponse,
+)
+from signal_ocean.util.parsing_helpers import _to_camel_case, parse_model
+from signal_ocean.voyages.models import VoyagesPagedResponse
+from tests.voyages.test_voyages import (
+    _mock_nested_voyage_data_1,
+    _mock_nested_voyage_data_2,
+)
+
+RECORDS = 10000
+REPEATS = 3
+
+_SAMPLE_VALUES: Dict[Any, Any] = {
+    int: 42,
+    float: 4.2,
+    bool: True,
+    str: "value",
+    datetime: "2021-01-01T00:00:00",
+}
+
+
+def _sample_fixture(fixture_id: int) -> Dict[str, Any]:
+    record = {}
+    for f in dataclasses.fields(ScrapedFixture):
+        field_type = getattr(f.type, "__args__", (f.type,))[0]
+        record[_to_camel_case(f.name)] = _SAMPLE_VALUES[field_type]
+    record["FixtureId"] = fixture_id
+    return record
+
+
+def _voyages_page() -> Dict[str, Any]:
+    voyages = [_mock_nested_voyage_data_1, _mock_nested_voyage_data_2]
+    return {
+        "NextPageToken": None,
+        "Data": [voyages[i % 2] for i in range(RECORDS)],
+    }
+
+
+def _fixtures_page() -> Dict[str, Any]:
+    return {
+        "NextPageToken": None,
+        "Data": [_sample_fixture(i) for i in range(RECORDS)],
+    }
+
+
+Parser = Callable[[Any, Any], Any]
+
+
+def _time_per_record(parse: Parser, page: Dict[str, Any], cls: Any) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        parse(page, cls)
+        best = min(best, time.perf_counter() - start)
+    return best / RECORDS * 1e6
+
+
+def _compare(name: str, page: Dict[str, Any], cls: Any) -> None:
+    assert parse_model(page, cls) == reflective_parse_model(page, cls)
+
+    reflective = _time_per_record(reflective_parse_model, page, cls)
+    compiled = _time_per_record(parse_model, page, cls)
+    print(
+        f"{name:16} reflective {reflective:8.1f} us/record   "
+        f"compiled {compiled:8.1f} us/record   "
+        f"speed-up {reflective / compiled:5.2f}x"
+    )
+
+
+def main() -> None:
+    """Prints the time per record of both parsers for each payload."""
+    _compare("nested voyages", _voyages_page(), VoyagesPagedResponse)
+    _compare("scraped fixtures", _fixtures_page(), ScrapedFixturesResponse)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compares serial and prefetching retrieval of a token-paged resource.
+
+Every page served by the stub holds a few hundred voyages and is delayed to
+simulate network latency, so that prefetching overlaps the wait for page
+N + 1 with parsing page N.
+
+Run from the repository root with:
+
+    python -m benchmarks.prefetching_pagination
+"""
+import time
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks._stub_server import stub_server
+from signal_ocean import Connection
+from signal_ocean.util.request_helpers import get_pages, token_page_request
+from signal_ocean.voyages.models import VoyagesPagedResponse
+
+PAGES = 20
+VOYAGES_PER_PAGE = 300
+LATENCY = 0.05
+
+_VOYAGE = {
+    "IMO": 9000001,
+    "VoyageNumber": 1,
+    "VesselTypeID": 1,
+    "VesselClassID": 84,
+    "Deadweight": 300000,
+    "CommercialOperatorID": 1,
+    "Deleted": False,
+    "Events": [
+        {
+            "ID": "e1",
+            "VoyageID": "v1",
+            "EventTypeID": 2,
+            "EventType": "PortCall",
+            "Purpose": "Load",
+            "ArrivalDate": "2021-01-01T00:00:00",
+            "SailingDate": "2021-01-02T00:00:00",
+            "Latitude": 25.0,
+            "Longitude": 55.0,
+        }
+    ],
+    "StartDate": "2021-01-01T00:00:00",
+    "EndDate": "2021-02-01T00:00:00",
+}
+
+
+def _respond(method: str, path: str, body: Optional[bytes]) -> Any:
+    time.sleep(LATENCY)
+    token = parse_qs(urlparse(path).query).get("token", ["0"])[0]
+    page = int(token)
+    return {
+        "NextPageToken": str(page + 1) if page + 1 < PAGES else None,
+        "Data": [_VOYAGE] * VOYAGES_PER_PAGE,
+    }
+
+
+def _retrieve(host: str, prefetch: bool) -> float:
+    with Connection("key", host) as connection:
+        start = time.perf_counter()
+        pages = list(
+            get_pages(
+                connection,
+                VoyagesPagedResponse,
+                token_page_request("voyages"),
+                prefetch=prefetch,
+            )
+        )
+        elapsed = time.perf_counter() - start
+    assert len(pages) == PAGES
+    return elapsed
+
+
+def main() -> None:
+    """Prints the wall time of both retrieval strategies."""
+    with stub_server(_respond) as host:
+        serial = _retrieve(host, prefetch=False)
+        prefetched = _retrieve(host, prefetch=True)
+
+    print(f"serial:      {serial:8.3f} s")
+    print(f"prefetching: {prefetched:8.3f} s")
+    print(f"speed-up:    {serial / prefetched:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Compares the columnar and row-based historical tonnage list conversion.
+
+Converts a synthetic year of tonnage lists to a data frame with
+`HistoricalTonnageList.to_data_frame`, which writes each vessel field
+straight into its column or categorical codes, and with the row-based
+conversion it replaced, which built a tuple per vessel and converted the
+categorical columns afterwards.
+Prints the time and peak memory allocated by each.
+
+Run from the repository root with:
+
+    python -m benchmarks.tonnage_list_data_frame
+"""
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Tuple
+
+import pandas as pd
+
+from signal_ocean.tonnage_list import (
+    Area,
+    Column,
+    HistoricalTonnageList,
+    IndexLevel,
+    LocationTaxonomy,
+    TonnageList,
+)
+from tests.tonnage_list.builders import create_vessel
+
+DAYS = 365
+VESSELS = 1000
+
+
+def _historical_tonnage_list() -> HistoricalTonnageList:
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    areas = tuple(
+        (
+            Area(i, f"country {i}", LocationTaxonomy.COUNTRY, 0),
+            Area(i, f"narrow {i}", LocationTaxonomy.NARROW_AREA, 1),
+            Area(i, f"wide {i % 5}", LocationTaxonomy.WIDE_AREA, 2),
+        )
+        for i in range(20)
+    )
+    vessels = [
+        create_vessel(
+            imo=9000000 + i,
+            name=f"Vessel {i}",
+            open_port=f"Port {i % 150}",
+            open_port_id=i % 150,
+            commercial_operator=f"Operator {i % 300}",
+            commercial_operator_id=i % 300,
+            open_areas=areas[i % 20],
+        )
+        for i in range(VESSELS)
+    ]
+    return HistoricalTonnageList(
+        TonnageList(vessels, start + timedelta(days=day))
+        for day in range(DAYS)
+    )
+
+
+def _row_based(htl: HistoricalTonnageList) -> pd.DataFrame:
+    index_tuples = []
+    data = []
+    for tonnage_list in htl:
+        for vessel in tonnage_list.vessels:
+            index_tuples.append((tonnage_list.date, vessel.imo))
+            data.append(vessel._to_data_frame_row())
+
+    data_frame = pd.DataFrame(
+        data,
+        index=pd.MultiIndex.from_tuples(
+            index_tuples, names=[IndexLevel.DATE, IndexLevel.IMO]
+        ),
+        columns=list(Column),
+    )
+    return data_frame.astype(Column._get_data_types())  # type: ignore
+
+
+def _measure(convert: Callable[[], pd.DataFrame]) -> Tuple[float, int]:
+    start = time.perf_counter()
+    convert()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    convert()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Prints the time and peak memory of both conversions."""
+    htl = _historical_tonnage_list()
+    pd.testing.assert_frame_equal(htl.to_data_frame(), _row_based(htl))
+
+    row_time, row_peak = _measure(lambda: _row_based(htl))
+    columnar_time, columnar_peak = _measure(htl.to_data_frame)
+    for name, elapsed, peak in (
+        ("row-based", row_time, row_peak),
+        ("columnar", columnar_time, columnar_peak),
+    ):
+        print(f"{name:10} {elapsed:6.2f} s   peak {peak / 2 ** 20:8.1f} MiB")
+    print(
+        f"speed-up {row_time / columnar_time:5.2f}x   "
+        f"memory {row_peak / columnar_peak:5.2f}x less"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Measures how joining static vessel data scales with tonnage list size.
+
+Joins the point-in-time data of synthetic historical tonnage lists with
+their static vessel data, once with the linear search the JSON parsers used
+to perform for every vessel and once through the IMO index they build now.
+The linear join is only timed for a single day and extrapolated to a year,
+as running it for every day of the larger lists would take hours.
+
+Run from the repository root with:
+
+    python -m benchmarks.tonnage_list_static_join
+"""
+import random
+import time
+from typing import Any, Dict, List, Mapping
+
+from signal_ocean._internals import index_by_imo
+
+VESSEL_COUNTS = (1000, 5000, 20000)
+DAYS = 365
+
+Record = Mapping[str, Any]
+
+
+def _static_vessel_data(vessels: int) -> List[Record]:
+    return [
+        {"imo": 9000000 + i, "vesselName": f"Vessel {i}"}
+        for i in range(vessels)
+    ]
+
+
+def _point_in_time_data(vessels: int) -> List[Record]:
+    imos = [9000000 + i for i in range(vessels)]
+    random.shuffle(imos)
+    return [{"imo": imo} for imo in imos]
+
+
+def _linear_join(pit_data: List[Record], static: List[Record]) -> None:
+    for pit in pit_data:
+        imo = pit["imo"]
+        next((svd for svd in static if svd["imo"] == imo), {})
+
+
+def _indexed_join(
+    days: List[List[Record]], static: List[Record]
+) -> None:
+    index: Dict[Any, Record] = index_by_imo(static)
+    for pit_data in days:
+        for pit in pit_data:
+            index.get(pit["imo"], {})
+
+
+def main() -> None:
+    """Prints the time the join takes for a year of tonnage lists."""
+    random.seed(0)
+    for vessels in VESSEL_COUNTS:
+        static = _static_vessel_data(vessels)
+        day = _point_in_time_data(vessels)
+
+        start = time.perf_counter()
+        _linear_join(day, static)
+        linear = (time.perf_counter() - start) * DAYS
+
+        start = time.perf_counter()
+        _indexed_join([day] * DAYS, static)
+        indexed = time.perf_counter() - start
+
+        print(
+            f"{vessels:6} vessels x {DAYS} days   "
+            f"linear ~{linear:9.1f} s   indexed {indexed:6.2f} s   "
+            f"speed-up ~{linear / indexed:8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,9 @@ setup(
         "strictly-typed-pandas==0.1.4",
         "typeguard>=2.13.3,<3.0.0"
     ],
+    extras_require={
+        "async": ["aiohttp>=3.7,<4"],
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Programming Language :: Python :: 3.7",
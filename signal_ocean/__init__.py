@@ -3,15 +3,28 @@
 Contains classes common across all submodules and used across APIs.
 
 Classes:
+    AsyncConnection: Facilitates authenticated, asynchronous communication
+        with Signal APIs.
     Connection: Facilitates authenticated communication with Signal APIs.
     Port: A maritime facility where vessels can dock.
     PortAPI: An API used to fetch port data.
     PortFilter: A filter that used to find specific ports.
+    RateLimit: A request budget enforced by a token bucket.
+    RateLimiter: Spaces out requests so that they stay within the API's
+        budgets.
+    RateLimiterStats: Counters describing how long callers waited for the
+        rate limiter.
+    ResponseCache: Stores API responses on disk so they can be reused
+        across processes.
+    ResponseCacheStats: Counters describing how requests were served by a
+        response cache.
+    RetryPolicy: Controls how a connection retries failed requests.
     VesselClass: A group of vessels of similar characteristics.
     VesselClassAPI: An API used to fetch available vessel classes.
     VesselClassFilter: A filter used to find specific vessel classes.
 """
 
+from .async_connection import AsyncConnection
 from .connection import Connection
 from .market_rates import MarketRatesAPI
 from .freight_rates import FreightRatesAPI
@@ -19,11 +32,15 @@ from .port import Port
 from .port_api import PortAPI
 from .port_expenses import PortExpensesAPI
 from .port_filter import PortFilter
+from .rate_limiter import RateLimit, RateLimiter, RateLimiterStats
+from .response_cache import ResponseCache, ResponseCacheStats
+from .retry_policy import RetryPolicy
 from .vessel_class import VesselClass
 from .vessel_class_api import VesselClassAPI
 from .vessel_class_filter import VesselClassFilter
 
 __all__ = [
+    "AsyncConnection",
     "Connection",
     "Port",
     "PortAPI",
@@ -31,6 +48,12 @@ __all__ = [
     "MarketRatesAPI",
     "FreightRatesAPI",
     "PortFilter",
+    "RateLimit",
+    "RateLimiter",
+    "RateLimiterStats",
+    "ResponseCache",
+    "ResponseCacheStats",
+    "RetryPolicy",
     "VesselClass",
     "VesselClassAPI",
     "VesselClassFilter",
@@ -1,12 +1,17 @@
 from datetime import date, datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Union, Optional, Mapping, Iterable, Iterator
+from functools import lru_cache
+from typing import (
+    Any, Dict, Union, Optional, Mapping, Iterable, Iterator, Tuple, TypeVar
+)
 
 from dateutil import parser
 
 QueryStringParam = Union[str, int, float, Iterable[Union[str, int, float]]]
 QueryString = Mapping[str, Optional[QueryStringParam]]
 
+_T = TypeVar("_T")
+
 
 class IterableConstants(type):
     def __iter__(cls) -> Iterator[str]:
@@ -51,6 +56,25 @@ def parse_datetime(value: Optional[str]) -> Optional[datetime]:
     return result.replace(tzinfo=timezone.utc)
 
 
+def index_by_imo(
+    records: Iterable[Mapping[str, Any]]
+) -> Dict[Any, Mapping[str, Any]]:
+    index: Dict[Any, Mapping[str, Any]] = {}
+    for record in records:
+        # Keep the first record of an IMO, as a linear search would.
+        index.setdefault(record["imo"], record)
+    return index
+
+
+def unique_by_id(groups: Iterable[Iterable[_T]]) -> Tuple[_T, ...]:
+    unique: Dict[Any, _T] = {}
+    for item in (i for group in groups for i in group):
+        # Keep the first item of an ID, in the order of the groups.
+        unique.setdefault(getattr(item, "id"), item)
+    return tuple(unique.values())
+
+
+@lru_cache(maxsize=4096)
 def snake_to_camel_case(input_string: str) -> str:
     """Function to reformat input string from snake_case to CamelCase.
 
@@ -0,0 +1,235 @@
+# noqa: D100
+
+import asyncio
+import copy
+import json
+import time
+from types import TracebackType
+from typing import Any, Dict, Optional, Tuple, Type
+from urllib.parse import urlencode, urljoin
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ._internals import QueryString
+from .connection import _get_api_host, _get_headers
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+
+class _AsyncSessionPool:
+    """Lazily creates and holds an aiohttp session bound to an event loop.
+
+    When used from another event loop, e.g. by a second `asyncio.run` call,
+    the session of the previous loop is closed and replaced.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.__max_concurrency = max_concurrency
+        self.__session: Optional["aiohttp.ClientSession"] = None
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get(
+        self,
+    ) -> Tuple["aiohttp.ClientSession", asyncio.Semaphore]:
+        loop = asyncio.get_running_loop()
+        stale = None
+        if (
+            self.__session is None
+            or self.__session.closed
+            or self.__loop is not loop
+        ):
+            # The replacement is set up before awaiting anything, so that
+            # concurrent requests share it.
+            stale = self.__session
+            self.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.__max_concurrency)
+            )
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+            self.__loop = loop
+
+        session, semaphore = self.__session, self.__semaphore
+        if stale is not None and not stale.closed:
+            await stale.close()
+        return session, semaphore  # type: ignore
+
+    async def close(self) -> None:
+        session, self.__session = self.__session, None
+        if session is not None:
+            await session.close()
+
+
+class AsyncConnection:
+    """Facilitates authenticated, non-blocking communication with Signal APIs.
+
+    The asyncio counterpart of `Connection`, used by the async API classes.
+    Requests are sent through a pooled aiohttp session that is created on
+    the first request and must be released by awaiting `close` or by using
+    the connection as an async context manager. At most `max_concurrency`
+    requests are in flight at any time, so callers can fan out thousands of
+    coroutines without overwhelming the API.
+
+    Responses are returned as `requests.Response` objects, so status checks
+    and errors behave exactly as with the synchronous connection.
+
+    Requires the aiohttp package, available through the "async" extra:
+    pip install signal-ocean[async]
+    """
+
+    __DEFAULT_MAX_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_host: Optional[str] = None,
+        max_concurrency: int = __DEFAULT_MAX_CONCURRENCY,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        """Initializes the connection.
+
+        Args:
+            api_key: The API subscription key retrieved from Signal's API
+                developer portal. If not provided, will be retrieved from the
+                SIGNAL_OCEAN_API_KEY environment variable.
+            api_host: Used to override the base URL used to contact the APIs.
+                If not provided, can be overridden by the SIGNAL_OCEAN_API_HOST
+                environment variable. If the environment variable is not
+                defined, the base URL will fall back to where Signal's APIs are
+                hosted.
+            max_concurrency: The maximum number of requests in flight at the
+                same time.
+            retry_policy: Controls how requests failing with a transient
+                error are retried. If not provided, requests are not retried.
+            rate_limiter: Spaces out requests, including retries, to stay
+                within the API's budgets. Can be shared with synchronous
+                connections. If not provided, requests are sent as soon as
+                possible.
+        """
+        if aiohttp is None:  # pragma: no cover
+            raise ImportError(
+                "AsyncConnection requires the aiohttp package. Install it "
+                "with: pip install signal-ocean[async]"
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        self.__api_key = api_key
+        self.__api_host = api_host
+        self.__auth_header = "Api-Key"
+        self.__session_pool = _AsyncSessionPool(max_concurrency)
+        self.__retry_policy = retry_policy
+        self.__rate_limiter = rate_limiter
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "AsyncConnection":
+        """Copies the connection settings, sharing its pooled HTTP session."""
+        copied = copy.copy(self)
+        memo[id(self)] = copied
+        return copied
+
+    async def __aenter__(self) -> "AsyncConnection":
+        """Returns the connection for use in an `async with` statement."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the connection when leaving an `async with` statement."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes all pooled HTTP connections held by this connection.
+
+        The connection remains usable: a new session is opened on the next
+        request.
+        """
+        await self.__session_pool.close()
+
+    def _with_auth_header(self, auth_header: str) -> "AsyncConnection":
+        copied = copy.deepcopy(self)
+        copied.__auth_header = auth_header
+        return copied
+
+    async def _make_get_request(
+        self, relative_url: str, query_string: Optional[QueryString] = None
+    ) -> requests.Response:
+        url = urljoin(_get_api_host(self.__api_host), relative_url)
+        if query_string:
+            params = urlencode(
+                {k: v for k, v in query_string.items() if v is not None},
+                doseq=True,
+            )
+            if params:
+                url += ("&" if "?" in url else "?") + params
+
+        return await self.__send("GET", url)
+
+    async def _make_post_request(
+        self, relative_url: str, query_string: Optional[QueryString] = None
+    ) -> requests.Response:
+        url = urljoin(_get_api_host(self.__api_host), relative_url)
+
+        return await self.__send("POST", url, json.dumps(query_string))
+
+    async def __send(
+        self, method: str, url: str, data: Optional[str] = None
+    ) -> requests.Response:
+        policy = self.__retry_policy
+        if policy is None or not policy._can_retry(method):
+            return await self.__send_once(method, url, data)
+
+        started = time.monotonic()
+        retry = 0
+        while True:
+            try:
+                response = await self.__send_once(method, url, data)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                delay = policy._get_retry_delay(retry, started)
+                if delay is None:
+                    raise
+            else:
+                if not policy._is_retryable(response):
+                    return response
+                delay = policy._get_retry_delay(retry, started, response)
+                if delay is None:
+                    return response
+
+            await asyncio.sleep(delay)
+            retry += 1
+
+    async def __send_once(
+        self, method: str, url: str, data: Optional[str]
+    ) -> requests.Response:
+        if self.__rate_limiter is not None:
+            await self.__rate_limiter.acquire_async(url)
+
+        session, semaphore = await self.__session_pool.get()
+        headers = {
+            k: v
+            for k, v in _get_headers(
+                self.__api_key, self.__auth_header
+            ).items()
+            if v is not None
+        }
+
+        async with semaphore:
+            async with session.request(
+                method, url, data=data, headers=headers
+            ) as http_response:
+                response = requests.Response()
+                response.status_code = http_response.status
+                response.reason = http_response.reason or ""
+                response.headers = CaseInsensitiveDict(http_response.headers)
+                response.url = url
+                response.encoding = "utf-8"
+                response._content = await http_response.read()
+                return response
@@ -1,22 +1,100 @@
 # noqa: D100
 
+import copy
 import json
 import os
-from typing import Optional, Dict
+import time
+from threading import Lock
+from types import TracebackType
+from typing import Any, Callable, Mapping, Optional, Dict, Type
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ._internals import QueryString
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry_policy import RetryPolicy
+
+
+_DEFAULT_API_HOST = "https://api-gateway.signalocean.com/"
+
+
+def _get_api_host(api_host: Optional[str]) -> str:
+    host = (
+        api_host
+        or os.environ.get("SIGNAL_OCEAN_API_HOST")
+        or _DEFAULT_API_HOST
+    )
+
+    return host if host.endswith("/") else host + "/"
+
+
+def _get_headers(
+    api_key: Optional[str], auth_header: str = "Api-Key"
+) -> Dict[str, Optional[str]]:
+    return {
+        auth_header: api_key or os.environ.get("SIGNAL_OCEAN_API_KEY"),
+        "Content-Type": "application/json",
+        "Source": "SignalSDK",
+    }
+
+
+class _SessionPool:
+    """Lazily creates and holds a pooled, keep-alive HTTP session."""
+
+    def __init__(self, pool_size: int):
+        self.__pool_size = pool_size
+        self.__session: Optional[requests.Session] = None
+        self.__lock = Lock()
+
+    def get(self) -> requests.Session:
+        session = self.__session
+        if session is not None:
+            return session
+
+        with self.__lock:
+            if self.__session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.__pool_size,
+                    pool_maxsize=self.__pool_size,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self.__session = session
+
+            return self.__session
+
+    def close(self) -> None:
+        with self.__lock:
+            session, self.__session = self.__session, None
+
+        if session is not None:
+            session.close()
 
 
 class Connection:
-    """Facilitates authenticated communication with Signal APIs."""
+    """Facilitates authenticated communication with Signal APIs.
 
-    __DEFAULT_API_HOST = "https://api-gateway.signalocean.com/"
+    All requests made through a connection share a single pooled, keep-alive
+    HTTP session, so API objects that are given the same connection reuse
+    the same underlying TCP/TLS connections. The session is created lazily
+    on the first request and released by calling `close` or by using the
+    connection as a context manager.
+    """
+
+    __DEFAULT_POOL_SIZE = 10
 
     def __init__(
-        self, api_key: Optional[str] = None, api_host: Optional[str] = None
+        self,
+        api_key: Optional[str] = None,
+        api_host: Optional[str] = None,
+        pool_size: int = __DEFAULT_POOL_SIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         """Initializes the connection.
 
@@ -29,27 +107,116 @@ class Connection:
                 environment variable. If the environment variable is not
                 defined, the base URL will fall back to where Signal's APIs are
                 hosted.
+            pool_size: The maximum number of keep-alive connections kept open
+                to the API host. Should be at least as large as the number of
+                threads issuing requests through this connection.
+            retry_policy: Controls how requests failing with a transient
+                error are retried. If not provided, requests are not retried.
+            rate_limiter: Spaces out requests, including retries, to stay
+                within the API's budgets. Can be shared between connections.
+                If not provided, requests are sent as soon as possible.
+            response_cache: Serves requests to the routes it is configured
+                for from responses stored on disk. Can be shared between
+                connections. If not provided, responses are not cached.
         """
+        if pool_size < 1:
+            raise ValueError("pool_size must be a positive integer.")
+
         self.__api_key = api_key
         self.__api_host = api_host
+        self.__pool_size = pool_size
+        self.__session_pool = _SessionPool(pool_size)
+        self.__retry_policy = retry_policy
+        self.__rate_limiter = rate_limiter
+        self.__response_cache = response_cache
 
-    def __get_headers(self) -> Dict[str, Optional[str]]:
-        api_key = self.__api_key or os.environ.get("SIGNAL_OCEAN_API_KEY")
+    @property
+    def pool_size(self) -> int:
+        """The maximum number of keep-alive connections kept open."""
+        return self.__pool_size
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Connection":
+        """Copies the connection settings, sharing its pooled HTTP session."""
+        copied = copy.copy(self)
+        memo[id(self)] = copied
+        return copied
+
+    def __enter__(self) -> "Connection":
+        """Returns the connection for use in a `with` statement."""
+        return self
 
-        return {
-            "Api-Key": api_key,
-            "Content-Type": "application/json",
-            "Source": "SignalSDK",
-        }
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the connection when leaving a `with` statement."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes all pooled HTTP connections held by this connection.
+
+        The connection remains usable: a new session is opened on the next
+        request.
+        """
+        self.__session_pool.close()
+
+    def __get_headers(self) -> Dict[str, Optional[str]]:
+        return _get_headers(self.__api_key)
 
     def __get_api_host(self) -> str:
-        host = (
-            self.__api_host
-            or os.environ.get("SIGNAL_OCEAN_API_HOST")
-            or Connection.__DEFAULT_API_HOST
-        )
+        return _get_api_host(self.__api_host)
+
+    def __send(
+        self, method: str, url: str, send: Callable[[], requests.Response]
+    ) -> requests.Response:
+        rate_limiter = self.__rate_limiter
+        if rate_limiter is not None:
+            unlimited_send = send
+
+            def send() -> requests.Response:
+                rate_limiter.acquire(url)
+                return unlimited_send()
+
+        policy = self.__retry_policy
+        if policy is None or not policy._can_retry(method):
+            return send()
 
-        return host if host.endswith("/") else host + "/"
+        started = time.monotonic()
+        retry = 0
+        while True:
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout):
+                delay = policy._get_retry_delay(retry, started)
+                if delay is None:
+                    raise
+            else:
+                if not policy._is_retryable(response):
+                    return response
+                delay = policy._get_retry_delay(retry, started, response)
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            retry += 1
+
+    def __send_cacheable(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Optional[str],
+        headers: Mapping[str, Optional[str]],
+        send: Callable[[Mapping[str, str]], requests.Response],
+    ) -> requests.Response:
+        cache = self.__response_cache
+        if cache is None:
+            return send({})
+
+        return cache._fetch(method, url, params, body, headers, send)
 
     def _make_get_request(
         self, relative_url: str, query_string: Optional[QueryString] = None
@@ -59,10 +226,23 @@ class Connection:
         # Ignoring "params" type because None is acceptable according to
         # https://requests.readthedocs.io/en/latest/user/quickstart/#passing-parameters-in-urls
         # but the stub file does not include it
-        return requests.get(
-            url,
-            params=query_string,  # type: ignore
-            headers=self.__get_headers(),
+        session = self.__session_pool.get()
+        headers = self.__get_headers()
+
+        def send(validators: Mapping[str, str]) -> requests.Response:
+            return self.__send(
+                "GET",
+                url,
+                lambda: session.get(
+                    url,
+                    params=query_string,  # type: ignore
+                    headers={**headers, **validators} if validators
+                    else headers,
+                ),
+            )
+
+        return self.__send_cacheable(
+            "GET", url, query_string, None, headers, send
         )
 
     def _make_post_request(
@@ -70,8 +250,20 @@ class Connection:
     ) -> requests.Response:
         url = urljoin(self.__get_api_host(), relative_url)
 
-        return requests.post(
-            url,
-            data=json.dumps(query_string),
-            headers=self.__get_headers(),
-        )
+        session = self.__session_pool.get()
+        data = json.dumps(query_string)
+        headers = self.__get_headers()
+
+        def send(validators: Mapping[str, str]) -> requests.Response:
+            return self.__send(
+                "POST",
+                url,
+                lambda: session.post(
+                    url,
+                    data=data,
+                    headers={**headers, **validators} if validators
+                    else headers,
+                ),
+            )
+
+        return self.__send_cacheable("POST", url, None, data, headers, send)
@@ -3,6 +3,15 @@
 Classes:
     DistancesAPI: Represents Signal's Distances API.
 
+    DistanceCache: Memoises the distances and routes retrieved by
+        DistancesAPI.
+
+    DistanceEstimator: Estimates sea distances between ports without
+        calling the API.
+
+    AsyncDistancesAPI: Represents Signal's Distances API, accessed
+        asynchronously.
+
     VesselClass: A group of vessels of similar characteristics.
 
     VesselClassFilter: A filter used to find specific vessel classes.
@@ -17,6 +26,12 @@ Classes:
 
     AlternativePath: An alternative path for the route
 
+    CompactRoute: A route between two points with its coordinates held in
+        an array.
+
+    CompactPath: A path between two points with its coordinates held in an
+        array.
+
     PointsOnRoute: A point and extra properties needed for a route
 
     Point: A point in latitude and longitude.
@@ -24,6 +39,9 @@ Classes:
 """
 
 from .distances_api import DistancesAPI
+from .distance_cache import DistanceCache
+from .distance_estimator import DistanceEstimator
+from .async_distances_api import AsyncDistancesAPI
 from .vessel_class import VesselClass
 from .vessel_class_filter import VesselClassFilter
 from .port import Port
@@ -36,9 +54,14 @@ from .models import (
     Point,
     RouteRestrictions,
 )
+from .compact_route import CompactRoute, CompactPath
+from ..util.chunked_retrieval import ChunkRetrievalError
 
 __all__ = [
     "DistancesAPI",
+    "DistanceCache",
+    "DistanceEstimator",
+    "AsyncDistancesAPI",
     "VesselClass",
     "VesselClassFilter",
     "Port",
@@ -46,7 +69,10 @@ __all__ = [
     "LoadingCondition",
     "RouteResponse",
     "AlternativePath",
+    "CompactRoute",
+    "CompactPath",
     "PointsOnRoute",
     "Point",
     "RouteRestrictions",
+    "ChunkRetrievalError",
 ]
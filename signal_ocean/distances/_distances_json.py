@@ -1,5 +1,8 @@
 from typing import Mapping, cast, Any
 from decimal import Decimal
+import numpy as np
+
+from .compact_route import CompactPath, CompactRoute
 from .models import RouteResponse, AlternativePath, PointsOnRoute, Point
 from .._internals import as_decimal
 
@@ -70,3 +73,51 @@ def parse_point(json: JsonObject) -> Point:
         cast(Decimal, as_decimal(json.get("lat"))),
         cast(Decimal, as_decimal(json.get("lon"))),
     )
+
+
+def parse_compact_route_response(json: JsonObject) -> CompactRoute:
+    return CompactRoute(
+        parse_coordinates(json.get("calculatedRoute")),
+        parse_float(json.get("distance")),
+        tuple(
+            parse_points_on_route(cast(JsonObject, rp))
+            for rp in json.get("routingPointsOnRoute", [])
+        ),
+        parse_float(json.get("piracyDistance")),
+        parse_float(json.get("secaDistance")),
+        cast(int, json.get("id")),
+        parse_point(cast(JsonObject, json.get("startPoint"))),
+        parse_point(cast(JsonObject, json.get("endPoint"))),
+        tuple(
+            parse_compact_path(cast(JsonObject, ap))
+            for ap in json.get("alternativePaths", [])
+        ),
+        cast(bool, json.get("isEmpty")),
+        tuple(parse_float(b) for b in json.get("bBox") or ()),
+    )
+
+
+def parse_compact_path(json: JsonObject) -> CompactPath:
+    return CompactPath(
+        parse_coordinates(json.get("calculatedRoute")),
+        parse_float(json.get("distance")),
+        tuple(
+            parse_points_on_route(cast(JsonObject, rp))
+            for rp in json.get("routingPointsOnRoute", [])
+        ),
+        parse_float(json.get("piracyDistance")),
+        parse_float(json.get("secaDistance")),
+    )
+
+
+def parse_coordinates(json: Any) -> np.ndarray:
+    coordinates = np.array(
+        [(p.get("lat"), p.get("lon")) for p in json or ()], dtype=float
+    ).reshape(-1, 2)
+    # Routes may be shared through a cache, so they must not be modified.
+    coordinates.setflags(write=False)
+    return coordinates
+
+
+def parse_float(value: Any) -> float:
+    return float("nan") if value is None else float(value)
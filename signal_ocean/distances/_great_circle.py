@@ -0,0 +1,18 @@
+import numpy as np
+
+# The mean radius of Earth in nautical miles.
+EARTH_RADIUS_NM = 3440.065
+
+
+def get_great_circle_distances(
+    coordinates_from: np.ndarray, coordinates_to: np.ndarray
+) -> np.ndarray:
+    lat_from, lon_from = np.moveaxis(np.radians(coordinates_from), -1, 0)
+    lat_to, lon_to = np.moveaxis(np.radians(coordinates_to), -1, 0)
+    haversine = (
+        np.sin((lat_to - lat_from) / 2) ** 2
+        + np.cos(lat_from)
+        * np.cos(lat_to)
+        * np.sin((lon_to - lon_from) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_NM * np.arcsin(np.sqrt(np.clip(haversine, 0, 1)))
@@ -0,0 +1,267 @@
+# noqa: D100
+
+from datetime import date
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+
+from ..async_connection import AsyncConnection
+from .port import Port
+from .port_filter import PortFilter
+from .vessel_class import VesselClass
+from .vessel_class_filter import VesselClassFilter
+from . import _distances_json
+from .._internals import QueryString, as_decimal, format_iso_date
+from .models import RouteResponse, Point, RouteRestrictions
+
+
+class AsyncDistancesAPI:
+    """Represents Signal's Distances API, accessed asynchronously.
+
+    Mirrors `DistancesAPI` as coroutines returning the same models, so that
+    many distances or routes can be requested concurrently.
+    """
+
+    def __init__(self, connection: Optional[AsyncConnection] = None):
+        """Initializes AsyncDistancesAPI.
+
+        Args:
+            connection: API connection configuration. If not provided, the
+                default connection method is used.
+        """
+        self.__connection = connection or AsyncConnection()
+
+    async def __get_json(
+        self, relative_url: str, query_string: Optional[QueryString] = None
+    ) -> Any:
+        response = await self.__connection._make_get_request(
+            relative_url, query_string
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def get_vessel_classes(
+        self, class_filter: Optional[VesselClassFilter] = None
+    ) -> Tuple[VesselClass, ...]:
+        """Retrieves available vessel classes.
+
+        Args:
+            class_filter: A filter used to find specific vessel classes. If not
+                specified, returns all available vessel classes.
+
+        Returns:
+            A tuple of available vessel classes that match the filter.
+        """
+        data = await self.__get_json("/distances-api/api/v1/VesselClasses")
+
+        classes = (VesselClass(**c) for c in data)
+        class_filter = class_filter or VesselClassFilter()
+
+        return tuple(class_filter._apply(classes))
+
+    async def get_ports(
+        self, port_filter: Optional[PortFilter] = None
+    ) -> Tuple[Port, ...]:
+        """Retrieves available ports.
+
+        Args:
+            port_filter: A filter used to find specific ports. If not
+                specified, returns all available ports.
+
+        Returns:
+            A tuple of available ports that match the filter.
+        """
+        data = await self.__get_json("/distances-api/api/v1/ports")
+
+        ports = (Port(**p) for p in data)
+        port_filter = port_filter or PortFilter()
+
+        return tuple(port_filter._apply(ports))
+
+    async def get_point_to_point_distance(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        start_point: Point,
+        end_point: Point,
+    ) -> Optional[Decimal]:
+        """Retrieves the distance from one point to another.
+
+        See `DistancesAPI.get_point_to_point_distance`.
+
+        Returns:
+            A Decimal representing the distance in NM between two points.
+        """
+        data = await self.__get_json(
+            "/distances-api/api/v1/Distance/PointToPoint",
+            {
+                "vesselclass": vessel_class.id,
+                "loadingcondition": loading_condition_id,
+                "latitudefrom": str(start_point.lat),
+                "latitudeto": str(end_point.lat),
+                "longitudefrom": str(start_point.lon),
+                "longitudeto": str(end_point.lon),
+            },
+        )
+        return as_decimal(data)
+
+    async def get_point_to_port_distance(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        point: Point,
+        port: Port,
+    ) -> Optional[Decimal]:
+        """Retrieves the distance from a point to a port.
+
+        See `DistancesAPI.get_point_to_port_distance`.
+
+        Returns:
+            A Decimal representing the distance in NM between a point
+                and a port.
+        """
+        data = await self.__get_json(
+            "/distances-api/api/v1/Distance/PointToPort",
+            {
+                "vesselclass": vessel_class.id,
+                "loadingcondition": loading_condition_id,
+                "latitude": str(point.lat),
+                "longitude": str(point.lon),
+                "portid": port.id,
+            },
+        )
+        return as_decimal(data)
+
+    async def get_port_to_port_distance(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        port_from: Port,
+        port_to: Port,
+    ) -> Optional[Decimal]:
+        """Retrieves the distance from one port to another.
+
+        See `DistancesAPI.get_port_to_port_distance`.
+
+        Returns:
+            A Decimal representing the distance in NM between two ports.
+        """
+        data = await self.__get_json(
+            "/distances-api/api/v1/Distance/PortToPort",
+            {
+                "vesselclass": vessel_class.id,
+                "loadingcondition": loading_condition_id,
+                "portIdFrom": port_from.id,
+                "portIdTo": port_to.id,
+            },
+        )
+        return as_decimal(data)
+
+    async def get_point_to_point_route(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        start_point: Point,
+        end_point: Point,
+    ) -> RouteResponse:
+        """Retrieves the route from one point to another.
+
+        See `DistancesAPI.get_point_to_point_route`.
+
+        Returns:
+            A Route between two points with distance in NM.
+        """
+        data = await self.__get_json(
+            "/distances-api/api/v1/Distance/PointToPoint/Route",
+            {
+                "vesselclass": vessel_class.id,
+                "loadingcondition": loading_condition_id,
+                "latitudefrom": str(start_point.lat),
+                "latitudeto": str(end_point.lat),
+                "longitudefrom": str(start_point.lon),
+                "longitudeto": str(end_point.lon),
+            },
+        )
+        return _distances_json.parse_route_response(data)
+
+    async def get_point_to_port_route(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        point: Point,
+        port: Port,
+    ) -> RouteResponse:
+        """Retrieves the route from a point to a port.
+
+        See `DistancesAPI.get_point_to_port_route`.
+
+        Returns:
+            A Route between a point and a port with distance in NM.
+        """
+        data = await self.__get_json(
+            "/distances-api/api/v1/Distance/PointToPort/Route",
+            {
+                "vesselclass": vessel_class.id,
+                "loadingcondition": loading_condition_id,
+                "latitude": str(point.lat),
+                "longitude": str(point.lon),
+                "portid": port.id,
+            },
+        )
+        return _distances_json.parse_route_response(data)
+
+    async def get_port_to_port_route(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        port_from: Port,
+        port_to: Port,
+    ) -> RouteResponse:
+        """Retrieves the route from one port to another.
+
+        See `DistancesAPI.get_port_to_port_route`.
+
+        Returns:
+            A Route between two ports with distance in NM.
+        """
+        data = await self.__get_json(
+            "/distances-api/api/v1/Distance/PortToPort/Route",
+            {
+                "vesselclass": vessel_class.id,
+                "loadingcondition": loading_condition_id,
+                "portIdFrom": port_from.id,
+                "portIdTo": port_to.id,
+            },
+        )
+        return _distances_json.parse_route_response(data)
+
+    async def get_generic_point_to_point_route(
+        self,
+        start_point: Point,
+        end_point: Point,
+        route_restrictions: Optional[RouteRestrictions] = None,
+        delays_valid_at: Optional[date] = None,
+        get_alternatives: Optional[bool] = None,
+    ) -> RouteResponse:
+        """Retrieves a generic route between two points.
+
+        See `DistancesAPI.get_generic_point_to_point_route`.
+
+        Returns:
+            A Route between two points with distance in NM.
+        """
+        route_restrictions = route_restrictions or RouteRestrictions()
+        data = await self.__get_json(
+            "/distances-api/api/v1/Distance/Generic",
+            {
+                "StartPointLatitude": str(start_point.lat),
+                "StartPointLongitude": str(start_point.lon),
+                "EndPointLatitude": str(end_point.lat),
+                "EndPointLongitude": str(end_point.lon),
+                "DelaysValidAt": format_iso_date(delays_valid_at)
+                if delays_valid_at
+                else None,
+                "GetAlternatives": get_alternatives,
+                **route_restrictions._to_query_string(),
+            },
+        )
+        return _distances_json.parse_route_response(data)
@@ -0,0 +1,192 @@
+# noqa: D100
+
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+import numpy as np
+
+from .models import AlternativePath, Point, PointsOnRoute, RouteResponse
+from ._great_circle import get_great_circle_distances
+from .._internals import as_decimal
+
+
+@dataclass(frozen=True, eq=False)
+class CompactPath:
+    """A path between two points with its coordinates held in an array.
+
+    A compact alternative to `AlternativePath` for long routes: coordinates
+    are held in a single NumPy array and distances are floats, instead of a
+    `Point` of two decimals per coordinate.
+
+    Attributes:
+        coordinates: An (N, 2) float64 array of the latitude and longitude
+            of each point of the path, in order. Read-only for paths
+            retrieved from the API, as they may be shared through a cache.
+        distance: The distance of the path in NM. NaN if unknown.
+        routing_points_on_route: List of points on the path.
+        piracy_distance: The distance of the path when piracy is considered.
+            NaN if unknown.
+        seca_distance: The distance of the path when SECA is considered. NaN
+            if unknown.
+    """
+
+    coordinates: np.ndarray
+    distance: float
+    routing_points_on_route: Tuple[PointsOnRoute, ...]
+    piracy_distance: float
+    seca_distance: float
+
+    def to_points(self) -> Tuple[Point, ...]:
+        """Converts the coordinates to points.
+
+        Returns:
+            A point per coordinate, as held by `AlternativePath` and
+            `RouteResponse`.
+        """
+        return tuple(
+            Point(as_decimal(lat), as_decimal(lon))  # type: ignore
+            for lat, lon in self.coordinates.tolist()
+        )
+
+    def cumulative_distances(self) -> np.ndarray:
+        """Calculates the distance travelled up to each point of the path.
+
+        Distances between consecutive points are calculated along great
+        circles, so their sum can differ slightly from `distance`.
+
+        Returns:
+            An array holding, for each point, the distance in NM from the
+            first point of the path. Empty if the path has no points.
+        """
+        if not len(self.coordinates):
+            return np.zeros(0)
+
+        legs = get_great_circle_distances(
+            self.coordinates[:-1], self.coordinates[1:]
+        )
+        return np.concatenate(([0.0], np.cumsum(legs)))
+
+    def bounding_box(self) -> Tuple[float, float, float, float]:
+        """Calculates the bounding box of the path.
+
+        Longitudes are measured along the path, taking into account paths
+        crossing the antimeridian. As in GeoJSON, the western longitude of
+        the box is then greater than its eastern longitude.
+
+        Returns:
+            The western longitude, minimum latitude, eastern longitude and
+            maximum latitude of the path's points, in the order used by
+            GeoJSON.
+
+        Raises:
+            ValueError: The path has no points.
+        """
+        self.__require_points()
+        lat, lon = self.coordinates.T
+        unwrapped_lon = _unwrap_longitudes(lon)
+        west, east = unwrapped_lon.min(), unwrapped_lon.max()
+        if east - west >= 360:
+            west, east = -180.0, 180.0
+        west, east = _wrap_longitudes(np.array([west, east]))
+        return float(west), float(lat.min()), float(east), float(lat.max())
+
+    def interpolate(
+        self, distance: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """Finds the positions at given distances along the path.
+
+        Positions are interpolated linearly between the points of the path,
+        taking into account paths crossing the antimeridian. Distances
+        outside the path are clipped to its ends.
+
+        Args:
+            distance: The distance, or an array of distances, in NM from the
+                first point of the path, measured as by
+                `cumulative_distances`.
+
+        Returns:
+            The latitude and longitude at the distance, as an array of shape
+            (2,), or of shape (M, 2) for an array of M distances. For a path
+            of a single point, that point.
+
+        Raises:
+            ValueError: The path has no points.
+        """
+        self.__require_points()
+        cumulative = self.cumulative_distances()
+        lat, lon = self.coordinates.T
+        result_lat = np.interp(distance, cumulative, lat)
+        result_lon = np.interp(distance, cumulative, _unwrap_longitudes(lon))
+        return np.stack((result_lat, _wrap_longitudes(result_lon)), axis=-1)
+
+    def to_alternative_path(self) -> AlternativePath:
+        """Converts the path to an `AlternativePath`."""
+        return AlternativePath(
+            self.to_points(),
+            as_decimal(_to_optional(self.distance)),  # type: ignore
+            self.routing_points_on_route,
+            as_decimal(_to_optional(self.piracy_distance)),  # type: ignore
+            as_decimal(_to_optional(self.seca_distance)),  # type: ignore
+        )
+
+    def __require_points(self) -> None:
+        if not len(self.coordinates):
+            raise ValueError("The path has no points.")
+
+
+@dataclass(frozen=True, eq=False)
+class CompactRoute(CompactPath):
+    """A route between two points with its coordinates held in an array.
+
+    A compact alternative to `RouteResponse` for long routes. See
+    `CompactPath` for the attributes and helpers shared with alternative
+    paths.
+
+    Attributes:
+        id: The id of the route response.
+        start_point: Start point coordinates.
+        end_point: End point coordinates.
+        alternative_paths: List of alternative paths between the two points.
+        is_empty: If the response is empty.
+        bbox: The bounding box of the route, as provided by the API.
+    """
+
+    id: int
+    start_point: Point
+    end_point: Point
+    alternative_paths: Tuple[CompactPath, ...]
+    is_empty: bool
+    bbox: Tuple[float, ...]
+
+    def to_route_response(self) -> RouteResponse:
+        """Converts the route to a `RouteResponse`."""
+        path = self.to_alternative_path()
+        return RouteResponse(
+            self.id,
+            self.start_point,
+            self.end_point,
+            path.calculated_route,
+            self.routing_points_on_route,
+            path.distance,
+            path.piracy_distance,
+            path.seca_distance,
+            tuple(p.to_alternative_path() for p in self.alternative_paths),
+            self.is_empty,
+            tuple(
+                as_decimal(b) for b in self.bbox  # type: ignore
+            ) if self.bbox else None,
+        )
+
+
+def _unwrap_longitudes(lon: np.ndarray) -> np.ndarray:
+    # Shifts longitudes by multiples of 360 degrees, so that consecutive
+    # points never differ by more than 180 degrees.
+    return np.degrees(np.unwrap(np.radians(lon)))
+
+
+def _wrap_longitudes(lon: np.ndarray) -> np.ndarray:
+    return np.where(np.abs(lon) <= 180, lon, (lon + 180) % 360 - 180)
+
+
+def _to_optional(value: float) -> Union[float, None]:
+    return None if np.isnan(value) else value
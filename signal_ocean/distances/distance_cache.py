@@ -0,0 +1,231 @@
+# noqa: D100
+
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS distances (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS distances_last_used ON distances (last_used);
+"""
+
+TValue = TypeVar("TValue")
+
+
+class DistanceCache:
+    """Memoises the distances and routes retrieved by `DistancesAPI`.
+
+    Distances and routes are keyed on every input of their request, i.e.
+    the ports or points, vessel class, loading condition, route restrictions
+    and the date delays are valid at, so each of them is retrieved from the
+    API at most once. Retrieved results are kept in memory, where a lookup
+    takes microseconds, and, optionally, in an SQLite database, so they
+    outlive the process and can be shared between processes.
+
+    Both the memory and the database hold up to a maximum number of
+    entries, evicting the least recently used ones first. The recency of
+    an entry in the database is updated when it is read from the database,
+    not on every lookup served from memory.
+
+    A single cache can be shared between `DistancesAPI` instances and is
+    safe to use from multiple threads.
+    """
+
+    __DEFAULT_MAX_ENTRIES = 1_000_000
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = __DEFAULT_MAX_ENTRIES,
+    ):
+        """Initializes the cache.
+
+        Args:
+            path: The path of the SQLite database backing the cache. It is
+                created if it does not exist. If not provided, results are
+                kept in memory only.
+            max_entries: The maximum number of results held in memory and in
+                the database.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+
+        self.__max_entries = max_entries
+        self.__entries: "OrderedDict[str, Any]" = OrderedDict()
+        self.__lock = Lock()
+        self.__db: Optional[sqlite3.Connection] = None
+        self.__stored = 0
+        if path is not None:
+            if path != ":memory:":
+                os.makedirs(
+                    os.path.dirname(os.path.abspath(path)), exist_ok=True
+                )
+            self.__db = sqlite3.connect(
+                path, timeout=30, check_same_thread=False
+            )
+            with self.__lock, self.__db:
+                self.__db.executescript(_SCHEMA)
+                self.__stored = self.__count_stored()
+
+    def preload(self) -> int:
+        """Loads the most recently used results of the database in memory.
+
+        Warms the cache up, so that the first lookup of each of the loaded
+        results does not have to read the database.
+
+        Returns:
+            The number of results loaded.
+        """
+        if self.__db is None:
+            return 0
+
+        with self.__lock:
+            rows = self.__db.execute(
+                "SELECT key, data FROM distances ORDER BY last_used DESC "
+                "LIMIT ?",
+                (self.__max_entries,),
+            ).fetchall()
+
+        # Results are parsed on their first lookup. Loaded results are
+        # less recently used than the ones already in memory.
+        with self.__lock:
+            for key, data in rows:
+                if key not in self.__entries:
+                    self.__entries[key] = _Unparsed(data)
+                    self.__entries.move_to_end(key, last=False)
+            self.__evict_from_memory()
+        return len(rows)
+
+    def clear(self) -> None:
+        """Removes all results from memory and the database."""
+        with self.__lock:
+            self.__entries.clear()
+            if self.__db is not None:
+                with self.__db:
+                    self.__db.execute("DELETE FROM distances")
+                self.__stored = 0
+
+    def close(self) -> None:
+        """Closes the underlying database, if any."""
+        with self.__lock:
+            if self.__db is not None:
+                self.__db.close()
+
+    def __len__(self) -> int:  # noqa: D105
+        with self.__lock:
+            return len(self.__entries)
+
+    def _fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        parse: Callable[[Any], TValue],
+        variant: str = "",
+    ) -> TValue:
+        # A response can be parsed into different types, e.g. routes and
+        # compact routes, which are kept in memory under distinct keys. The
+        # database, and the entries preloaded from it, hold the response
+        # once, under the plain key.
+        memory_key = f"{variant}:{key}" if variant else key
+        with self.__lock:
+            entry = self.__entries.get(memory_key, _MISSING)
+            if entry is _MISSING and variant:
+                preloaded = self.__entries.get(key)
+                if isinstance(preloaded, _Unparsed):
+                    entry = preloaded
+            elif entry is not _MISSING:
+                self.__entries.move_to_end(memory_key)
+
+        if isinstance(entry, _Unparsed):
+            return self.__remember(memory_key, parse(json.loads(entry.data)))
+
+        if entry is _MISSING:
+            data = self.__read(key)
+            if data is _MISSING:
+                data = fetch()
+                self.__write(key, data)
+            return self.__remember(memory_key, parse(data))
+
+        cached: TValue = entry
+        return cached
+
+    def __remember(self, key: str, value: TValue) -> TValue:
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            self.__evict_from_memory()
+        return value
+
+    def __read(self, key: str) -> Any:
+        if self.__db is None:
+            return _MISSING
+
+        with self.__lock, self.__db:
+            row = self.__db.execute(
+                "SELECT data FROM distances WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return _MISSING
+            self.__db.execute(
+                "UPDATE distances SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return json.loads(row[0])
+
+    def __write(self, key: str, data: Any) -> None:
+        if self.__db is None:
+            return
+
+        with self.__lock, self.__db:
+            self.__db.execute(
+                "INSERT OR REPLACE INTO distances VALUES (?, ?, ?)",
+                (key, json.dumps(data), time.time()),
+            )
+            self.__stored += 1
+            if self.__stored > self.__max_entries:
+                self.__stored = self.__count_stored()
+                if self.__stored > self.__max_entries:
+                    self.__db.execute(
+                        "DELETE FROM distances WHERE key IN (SELECT key "
+                        "FROM distances ORDER BY last_used LIMIT ?)",
+                        (self.__stored - self.__max_entries,),
+                    )
+                    self.__stored = self.__max_entries
+
+    def __count_stored(self) -> int:
+        assert self.__db is not None
+        (count,) = self.__db.execute(
+            "SELECT COUNT(*) FROM distances"
+        ).fetchone()
+        return int(count)
+
+    def __evict_from_memory(self) -> None:
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+
+_MISSING = object()
+
+
+class _Unparsed:
+    __slots__ = ("data",)
+
+    def __init__(self, data: str):
+        self.data = data
+
+
+def _get_key(relative_url: str, query_string: Any) -> str:
+    params = sorted(
+        (str(k), str(v))
+        for k, v in (query_string or {}).items()
+        if v is not None
+    )
+    return json.dumps([relative_url, params])
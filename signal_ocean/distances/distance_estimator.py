@@ -0,0 +1,339 @@
+# noqa: D100
+
+from decimal import Decimal
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ._great_circle import get_great_circle_distances
+from .distances_api import DistancesAPI
+from .models import Point
+from .port import Port
+from .vessel_class import VesselClass
+from ..geos.models import Port as GeoPort
+from ..util.chunked_retrieval import fetch_chunks
+
+Points = Union[Sequence[Point], np.ndarray]
+
+_RegionPair = Tuple[Optional[int], Optional[int]]
+
+
+class DistanceEstimator:
+    """Estimates sea distances between ports without calling the API.
+
+    Distances are estimated from the great-circle distance between the
+    coordinates of two ports, as provided by `GeosAPI.get_ports`, scaled by
+    a correction factor for the regions the ports belong to. Correction
+    factors are calibrated against distances retrieved from the Distances
+    API, e.g. with `DistancesAPI.get_distance_matrix`, and account for
+    routes going around land masses. Until calibrated, estimates are plain
+    great-circle distances, which are a lower bound of sea distances.
+
+    Estimates are vectorised and take microseconds per pair, which makes
+    them suitable for screening many candidate pairs before requesting the
+    distances of the most promising ones, see `get_nearest`.
+    """
+
+    def __init__(self, ports: Iterable[GeoPort], region_level: int = 1):
+        """Initializes the estimator.
+
+        Args:
+            ports: The ports to estimate distances between, as returned by
+                `GeosAPI.get_ports`. Ports without coordinates are ignored.
+            region_level: The level of the areas the correction factors are
+                calibrated for, from 0 to 3. Lower levels are more
+                accurate, but need more distances to be calibrated. See the
+                `Port` class of the Geos API for the available levels.
+        """
+        if region_level not in range(4):
+            raise ValueError("region_level must be between 0 and 3.")
+
+        self.__coordinates: Dict[int, Tuple[float, float]] = {}
+        self.__regions: Dict[int, Optional[int]] = {}
+        for port in ports:
+            if port.latitude is None or port.longitude is None:
+                continue
+            self.__coordinates[port.port_id] = (port.latitude, port.longitude)
+            self.__regions[port.port_id] = getattr(
+                port, f"area_id_level{region_level}"
+            )
+        self.__factors: Dict[_RegionPair, float] = {}
+        self.__default_factor = 1.0
+
+    @staticmethod
+    def great_circle_distances(
+        points_from: Points, points_to: Points
+    ) -> np.ndarray:
+        """Calculates the great-circle distance between pairs of points.
+
+        Args:
+            points_from: The starting points, or an (N, 2) array of their
+                latitudes and longitudes.
+            points_to: The ending points, or an (N, 2) array of their
+                latitudes and longitudes.
+
+        Returns:
+            An array of the N distances in NM.
+        """
+        return get_great_circle_distances(
+            _to_coordinates(points_from), _to_coordinates(points_to)
+        )
+
+    def calibrate(self, distances: pd.DataFrame) -> int:
+        """Calibrates the correction factors against retrieved distances.
+
+        The factor of a pair of regions is the median ratio of the retrieved
+        distance to the great-circle distance of the port pairs between
+        them. Pairs of regions without distances use the median ratio of all
+        distances. Previous factors are replaced.
+
+        Args:
+            distances: Distances in NM retrieved from the Distances API,
+                indexed by the IDs of the starting ports, with a column per ID
+                of the ending ports, as returned by
+                `DistancesAPI.get_distance_matrix`.
+
+        Returns:
+            The number of port pairs the factors were calibrated with.
+        """
+        pairs = distances.stack().astype(float)
+        pairs = pairs[np.isfinite(pairs.to_numpy())]
+        from_ids = pairs.index.get_level_values(0)
+        to_ids = pairs.index.get_level_values(1)
+        ratios = pairs.to_numpy() / get_great_circle_distances(
+            self.__get_coordinates(from_ids), self.__get_coordinates(to_ids)
+        )
+
+        ratios_by_region: Dict[_RegionPair, List[float]] = {}
+        for region_pair, ratio in zip(
+            zip(self.__get_regions(from_ids), self.__get_regions(to_ids)),
+            ratios,
+        ):
+            # Skips ports without coordinates and pairs of the same port.
+            if np.isfinite(ratio):
+                ratios_by_region.setdefault(region_pair, []).append(ratio)
+
+        all_ratios = [r for rs in ratios_by_region.values() for r in rs]
+        self.__factors = {
+            region_pair: float(np.median(region_ratios))
+            for region_pair, region_ratios in ratios_by_region.items()
+        }
+        self.__default_factor = (
+            float(np.median(all_ratios)) if all_ratios else 1.0
+        )
+        return len(all_ratios)
+
+    def get_correction_factor(
+        self, port_from_id: int, port_to_id: int
+    ) -> float:
+        """Gets the factor great-circle distances between ports are scaled by.
+
+        Args:
+            port_from_id: The ID of the starting port.
+            port_to_id: The ID of the ending port.
+
+        Returns:
+            The correction factor of the regions of the ports.
+        """
+        return self.__get_factor(
+            (self.__regions.get(port_from_id), self.__regions.get(port_to_id))
+        )
+
+    def estimate(
+        self, ports_from: Sequence[Port], ports_to: Sequence[Port]
+    ) -> pd.DataFrame:
+        """Estimates the distances between every pair of two sets of ports.
+
+        Args:
+            ports_from: The starting ports, one per row of the matrix.
+            ports_to: The ending ports, one per column of the matrix.
+
+        Returns:
+            A data frame of estimated distances in NM, indexed by the IDs of
+            the starting ports, with a column per ID of the ending ports, as
+            returned by `DistancesAPI.get_distance_matrix`. Pairs involving a
+            port without coordinates are NaN.
+        """
+        from_ids = [p.id for p in ports_from]
+        to_ids = [p.id for p in ports_to]
+        great_circle = get_great_circle_distances(
+            self.__get_coordinates(from_ids)[:, np.newaxis],
+            self.__get_coordinates(to_ids)[np.newaxis, :],
+        )
+        # Factors are looked up once per pair of regions rather than per
+        # pair of ports.
+        from_codes, from_regions = _factorize(self.__get_regions(from_ids))
+        to_codes, to_regions = _factorize(self.__get_regions(to_ids))
+        factors = np.array(
+            [
+                [self.__get_factor((f, t)) for t in to_regions]
+                for f in from_regions
+            ],
+            dtype=float,
+        ).reshape(len(from_regions), len(to_regions))
+        return pd.DataFrame(
+            great_circle * factors[np.ix_(from_codes, to_codes)],
+            index=pd.Index(from_ids, name="port_from_id"),
+            columns=pd.Index(to_ids, name="port_to_id"),
+        )
+
+    def estimate_from_points(
+        self, points: Points, ports_to: Sequence[Port]
+    ) -> pd.DataFrame:
+        """Estimates the distances from points, e.g. vessels, to ports.
+
+        Since points do not belong to a region, great-circle distances are
+        scaled by the median correction factor of all regions.
+
+        Args:
+            points: The starting points, or an (N, 2) array of their
+                latitudes and longitudes, one per row of the matrix.
+            ports_to: The ending ports, one per column of the matrix.
+
+        Returns:
+            A data frame of estimated distances in NM, indexed by the
+            position of the starting points, with a column per ID of the
+            ending ports. Pairs involving a port without coordinates are NaN.
+        """
+        to_ids = [p.id for p in ports_to]
+        great_circle = get_great_circle_distances(
+            _to_coordinates(points)[:, np.newaxis],
+            self.__get_coordinates(to_ids)[np.newaxis, :],
+        )
+        return pd.DataFrame(
+            great_circle * self.__default_factor,
+            columns=pd.Index(to_ids, name="port_to_id"),
+        )
+
+    def get_nearest(
+        self,
+        api: DistancesAPI,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        ports_from: Sequence[Port],
+        ports_to: Sequence[Port],
+        top_k: int,
+        max_workers: int = 1,
+    ) -> pd.DataFrame:
+        """Finds the nearest pairs of ports in two stages.
+
+        Distances are first estimated for every pair of ports, then
+        retrieved from the API only for the `top_k` pairs with the shortest
+        estimates. Since estimates are approximate, `top_k` should exceed
+        the number of pairs needed.
+
+        Args:
+            api: The API the distances of the nearest pairs are retrieved
+                from. Configuring it with a `DistanceCache` avoids
+                requesting the same pairs again.
+            vessel_class: Vessel class for which the distances will be
+                calculated.
+            loading_condition_id: Loading condition of the vessels
+                for which the distances will be calculated.
+                Options available: Laden and Ballast.
+            ports_from: The starting ports.
+            ports_to: The ending ports.
+            top_k: The number of pairs to retrieve the distances of.
+            max_workers: The maximum number of distances requested at the
+                same time. Should not exceed the pool size of the API's
+                connection.
+
+        Returns:
+            A data frame of up to `top_k` pairs, with the `port_from_id`,
+            `port_to_id`, `estimated_distance` and `distance` columns,
+            ordered by distance. Pairs involving a port without coordinates
+            are never selected.
+        """
+        estimates = self.estimate(ports_from, ports_to)
+        candidates = (
+            pd.DataFrame(
+                {
+                    "port_from_id": np.repeat(
+                        estimates.index.to_numpy(), len(estimates.columns)
+                    ),
+                    "port_to_id": np.tile(
+                        estimates.columns.to_numpy(), len(estimates.index)
+                    ),
+                    "estimated_distance": estimates.to_numpy().ravel(),
+                }
+            )
+            .dropna()
+            .sort_values("estimated_distance", kind="stable")
+            .iloc[:top_k]
+            .reset_index(drop=True)
+        )
+
+        pairs = list(
+            zip(candidates["port_from_id"], candidates["port_to_id"])
+        )
+        return fetch_chunks(
+            pairs,
+            partial(
+                self.__get_distance,
+                api,
+                vessel_class,
+                loading_condition_id,
+                {p.id: p for p in (*ports_from, *ports_to)},
+            ),
+            partial(_add_distances, candidates),
+            max_workers,
+        )
+
+    @staticmethod
+    def __get_distance(
+        api: DistancesAPI,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        ports_by_id: Dict[int, Port],
+        pair: Tuple[int, int],
+    ) -> Optional[Decimal]:
+        port_from_id, port_to_id = pair
+        return api.get_port_to_port_distance(
+            vessel_class,
+            loading_condition_id,
+            ports_by_id[port_from_id],
+            ports_by_id[port_to_id],
+        )
+
+    def __get_coordinates(self, port_ids: Iterable[int]) -> np.ndarray:
+        missing = (np.nan, np.nan)
+        return np.array(
+            [self.__coordinates.get(i, missing) for i in port_ids],
+            dtype=float,
+        ).reshape(-1, 2)
+
+    def __get_regions(self, port_ids: Iterable[int]) -> List[Optional[int]]:
+        return [self.__regions.get(i) for i in port_ids]
+
+    def __get_factor(self, region_pair: _RegionPair) -> float:
+        return self.__factors.get(region_pair, self.__default_factor)
+
+
+def _to_coordinates(points: Points) -> np.ndarray:
+    if isinstance(points, np.ndarray):
+        return points.astype(float).reshape(-1, 2)
+    return np.array(
+        [(p.lat, p.lon) for p in points], dtype=float
+    ).reshape(-1, 2)
+
+
+def _factorize(
+    regions: List[Optional[int]],
+) -> Tuple[np.ndarray, List[Optional[int]]]:
+    codes: Dict[Optional[int], int] = {}
+    region_codes = [codes.setdefault(r, len(codes)) for r in regions]
+    return np.array(region_codes, dtype=int), list(codes)
+
+
+def _add_distances(
+    candidates: pd.DataFrame, distances: List[Optional[Decimal]]
+) -> pd.DataFrame:
+    candidates["distance"] = np.array(
+        [float(d) if d is not None else np.nan for d in distances],
+        dtype=float,
+    )
+    return candidates.sort_values("distance", kind="stable").reset_index(
+        drop=True
+    )
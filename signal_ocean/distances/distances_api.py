@@ -1,8 +1,20 @@
 # noqa: D100
 
-from typing import Tuple, Optional
+from typing import (
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from datetime import date
 from decimal import Decimal
+from functools import partial
+
+import numpy as np
+import pandas as pd
 
 from .. import Connection
 from .port import Port
@@ -10,21 +22,39 @@ from .port_filter import PortFilter
 from .vessel_class import VesselClass
 from .vessel_class_filter import VesselClassFilter
 from . import _distances_json
-from .._internals import as_decimal, format_iso_date
+from .distance_cache import DistanceCache, _get_key
+from .._internals import QueryString, as_decimal, format_iso_date
 from .models import RouteResponse, Point, RouteRestrictions
+from .compact_route import CompactRoute
+from ..util.chunked_retrieval import fetch_chunks, get_max_workers
+
+# Vessel class ID, loading condition ID, from port ID, to port ID.
+_PortPair = Tuple[int, int, int, int]
+
+# Distinguishes compact routes from routes in the memory of the cache.
+_COMPACT = "compact"
+
+TValue = TypeVar("TValue")
 
 
 class DistancesAPI:
     """Represents Signal's Distances API."""
 
-    def __init__(self, connection: Optional[Connection] = None):
+    def __init__(
+        self,
+        connection: Optional[Connection] = None,
+        cache: Optional[DistanceCache] = None,
+    ):
         """Initializes DistancesAPI.
 
         Args:
             connection: API connection configuration. If not provided, the
                 default connection method is used.
+            cache: Memoises the retrieved distances and routes. If not
+                provided, every call makes a request.
         """
         self.__connection = connection or Connection()
+        self.__cache = cache
 
     def get_vessel_classes(
         self, class_filter: Optional[VesselClassFilter] = None
@@ -91,7 +121,7 @@ class DistancesAPI:
         Returns:
             A Decimal representing the distance in NM between two points.
         """
-        response = self.__connection._make_get_request(
+        return self.__get(
             "/distances-api/api/v1/Distance/PointToPoint",
             {
                 "vesselclass": vessel_class.id,
@@ -101,12 +131,9 @@ class DistancesAPI:
                 "longitudefrom": str(start_point.lon),
                 "longitudeto": str(end_point.lon),
             },
+            as_decimal,
         )
 
-        response.raise_for_status()
-
-        return as_decimal(response.json())
-
     def get_point_to_port_distance(
         self,
         vessel_class: VesselClass,
@@ -129,7 +156,7 @@ class DistancesAPI:
             A Decimal representing the distance in NM between a point
                 and a port.
         """
-        response = self.__connection._make_get_request(
+        return self.__get(
             "/distances-api/api/v1/Distance/PointToPort",
             {
                 "vesselclass": vessel_class.id,
@@ -138,12 +165,9 @@ class DistancesAPI:
                 "longitude": str(point.lon),
                 "portid": port.id,
             },
+            as_decimal,
         )
 
-        response.raise_for_status()
-
-        return as_decimal(response.json())
-
     def get_port_to_port_distance(
         self,
         vessel_class: VesselClass,
@@ -167,19 +191,18 @@ class DistancesAPI:
         Returns:
             A Decimal representing the distance in NM between two ports.
         """
-        response = self.__connection._make_get_request(
-            "/distances-api/api/v1/Distance/PortToPort",
-            {
-                "vesselclass": vessel_class.id,
-                "loadingcondition": loading_condition_id,
-                "portIdFrom": port_from.id,
-                "portIdTo": port_to.id,
-            },
+        return self.__get_port_to_port_distance(
+            (vessel_class.id, loading_condition_id, port_from.id, port_to.id)
         )
 
-        response.raise_for_status()
-
-        return as_decimal(response.json())
+    def __get_port_to_port_distance(
+        self, pair: _PortPair
+    ) -> Optional[Decimal]:
+        return self.__get(
+            "/distances-api/api/v1/Distance/PortToPort",
+            _get_port_to_port_query(*pair),
+            as_decimal,
+        )
 
     def get_point_to_point_route(
         self,
@@ -202,22 +225,14 @@ class DistancesAPI:
         Returns:
             A Route between two points with distance in NM.
         """
-        response = self.__connection._make_get_request(
+        return self.__get(
             "/distances-api/api/v1/Distance/PointToPoint/Route",
-            {
-                "vesselclass": vessel_class.id,
-                "loadingcondition": loading_condition_id,
-                "latitudefrom": str(start_point.lat),
-                "latitudeto": str(end_point.lat),
-                "longitudefrom": str(start_point.lon),
-                "longitudeto": str(end_point.lon),
-            },
+            _get_point_to_point_query(
+                vessel_class, loading_condition_id, start_point, end_point
+            ),
+            _distances_json.parse_route_response,
         )
 
-        response.raise_for_status()
-
-        return _distances_json.parse_route_response(response.json())
-
     def get_point_to_port_route(
         self,
         vessel_class: VesselClass,
@@ -240,21 +255,14 @@ class DistancesAPI:
         Returns:
             A Route between a point and a port with distance in NM.
         """
-        response = self.__connection._make_get_request(
+        return self.__get(
             "/distances-api/api/v1/Distance/PointToPort/Route",
-            {
-                "vesselclass": vessel_class.id,
-                "loadingcondition": loading_condition_id,
-                "latitude": str(point.lat),
-                "longitude": str(point.lon),
-                "portid": port.id,
-            },
+            _get_point_to_port_query(
+                vessel_class, loading_condition_id, point, port
+            ),
+            _distances_json.parse_route_response,
         )
 
-        response.raise_for_status()
-
-        return _distances_json.parse_route_response(response.json())
-
     def get_port_to_port_route(
         self,
         vessel_class: VesselClass,
@@ -278,20 +286,14 @@ class DistancesAPI:
         Returns:
             A Route between two ports with distance in NM.
         """
-        response = self.__connection._make_get_request(
+        return self.__get(
             "/distances-api/api/v1/Distance/PortToPort/Route",
-            {
-                "vesselclass": vessel_class.id,
-                "loadingcondition": loading_condition_id,
-                "portIdFrom": port_from.id,
-                "portIdTo": port_to.id,
-            },
+            _get_port_to_port_query(
+                vessel_class.id, loading_condition_id, port_from.id, port_to.id
+            ),
+            _distances_json.parse_route_response,
         )
 
-        response.raise_for_status()
-
-        return _distances_json.parse_route_response(response.json())
-
     def get_generic_point_to_point_route(
         self,
         start_point: Point,
@@ -316,21 +318,348 @@ class DistancesAPI:
         Returns:
             A Route between two points with distance in NM.
         """
-        route_restrictions = route_restrictions or RouteRestrictions()
-        response = self.__connection._make_get_request(
+        return self.__get(
             "/distances-api/api/v1/Distance/Generic",
-            {
-                "StartPointLatitude": str(start_point.lat),
-                "StartPointLongitude": str(start_point.lon),
-                "EndPointLatitude": str(end_point.lat),
-                "EndPointLongitude": str(end_point.lon),
-                "DelaysValidAt": format_iso_date(delays_valid_at)
-                if delays_valid_at
-                else None,
-                "GetAlternatives": get_alternatives,
-                **route_restrictions._to_query_string(),
-            },
+            _get_generic_query(
+                start_point,
+                end_point,
+                route_restrictions,
+                delays_valid_at,
+                get_alternatives,
+            ),
+            _distances_json.parse_route_response,
         )
 
-        response.raise_for_status()
-        return _distances_json.parse_route_response(response.json())
+    def get_point_to_point_compact_route(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        start_point: Point,
+        end_point: Point,
+    ) -> CompactRoute:
+        """Retrieves the route from one point to another in compact form.
+
+        Same as `get_point_to_point_route`, but the route's coordinates are
+        held in a NumPy array. Preferable for long routes or when retrieving
+        many routes.
+
+        Args:
+            vessel_class: Vessel class for which the distance will be
+                calculated.
+            loading_condition_id: Loading condition of the vessels
+                for which the distance will be calculated.
+                Options available: Laden and Ballast.
+            start_point: The starting point latitude and longitude.
+            end_point: The ending point latitude and longitude.
+
+        Returns:
+            A compact Route between two points with distance in NM.
+        """
+        return self.__get(
+            "/distances-api/api/v1/Distance/PointToPoint/Route",
+            _get_point_to_point_query(
+                vessel_class, loading_condition_id, start_point, end_point
+            ),
+            _distances_json.parse_compact_route_response,
+            _COMPACT,
+        )
+
+    def get_point_to_port_compact_route(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        point: Point,
+        port: Port,
+    ) -> CompactRoute:
+        """Retrieves the route from a point to a port in compact form.
+
+        Same as `get_point_to_port_route`, but the route's coordinates are
+        held in a NumPy array. Preferable for long routes or when retrieving
+        many routes.
+
+        Args:
+            vessel_class: Vessel class for which the distance will be
+                calculated.
+            loading_condition_id: Loading condition of the vessels
+                for which the distance will be calculated.
+                Options available: Laden and Ballast.
+            point: The starting point latitude and longitude.
+            port: The ending port for the distance
+                route calculation.
+
+        Returns:
+            A compact Route between a point and a port with distance in NM.
+        """
+        return self.__get(
+            "/distances-api/api/v1/Distance/PointToPort/Route",
+            _get_point_to_port_query(
+                vessel_class, loading_condition_id, point, port
+            ),
+            _distances_json.parse_compact_route_response,
+            _COMPACT,
+        )
+
+    def get_port_to_port_compact_route(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        port_from: Port,
+        port_to: Port,
+    ) -> CompactRoute:
+        """Retrieves the route from one port to another in compact form.
+
+        Same as `get_port_to_port_route`, but the route's coordinates are
+        held in a NumPy array. Preferable for long routes or when retrieving
+        many routes.
+
+        Args:
+            vessel_class: Vessel class for which the distance will be
+                calculated.
+            loading_condition_id: Loading condition of the vessels
+                for which the distance will be calculated.
+                Options available: Laden and Ballast.
+            port_from: The starting port for the distance
+                route calculation.
+            port_to: The ending port for the distance
+                route calculation.
+
+        Returns:
+            A compact Route between two ports with distance in NM.
+        """
+        return self.__get(
+            "/distances-api/api/v1/Distance/PortToPort/Route",
+            _get_port_to_port_query(
+                vessel_class.id, loading_condition_id, port_from.id, port_to.id
+            ),
+            _distances_json.parse_compact_route_response,
+            _COMPACT,
+        )
+
+    def get_generic_point_to_point_compact_route(
+        self,
+        start_point: Point,
+        end_point: Point,
+        route_restrictions: Optional[RouteRestrictions] = None,
+        delays_valid_at: Optional[date] = None,
+        get_alternatives: Optional[bool] = None,
+    ) -> CompactRoute:
+        """Retrieves a generic route between two points in compact form.
+
+        Same as `get_generic_point_to_point_route`, but the coordinates of
+        the route and of its alternatives are held in NumPy arrays.
+        Preferable for long routes or when retrieving many routes.
+
+        Args:
+            start_point: The starting point latitude and longitude.
+            end_point: The ending point latitude and longitude.
+            route_restrictions: Restrictions to obey while calculating the
+                route.
+            delays_valid_at: Date at which the route delays are valid.
+            get_alternatives: Whether or not to include alternative routes.
+
+        Returns:
+            A compact Route between two points with distance in NM.
+        """
+        return self.__get(
+            "/distances-api/api/v1/Distance/Generic",
+            _get_generic_query(
+                start_point,
+                end_point,
+                route_restrictions,
+                delays_valid_at,
+                get_alternatives,
+            ),
+            _distances_json.parse_compact_route_response,
+            _COMPACT,
+        )
+
+    def __get(
+        self,
+        relative_url: str,
+        query_string: QueryString,
+        parse: Callable[[Any], TValue],
+        variant: str = "",
+    ) -> TValue:
+        def fetch() -> Any:
+            response = self.__connection._make_get_request(
+                relative_url, query_string
+            )
+            response.raise_for_status()
+            return response.json()
+
+        if self.__cache is None:
+            return parse(fetch())
+
+        return self.__cache._fetch(
+            _get_key(relative_url, query_string), fetch, parse, variant
+        )
+
+    def get_distance_matrix(
+        self,
+        vessel_class: VesselClass,
+        loading_condition_id: int,
+        ports_from: Sequence[Port],
+        ports_to: Sequence[Port],
+        symmetric: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Retrieves the distances between every pair of two sets of ports.
+
+        Each distinct pair of ports is requested only once. If the API was
+        initialized with a cache, distances already in it, e.g. from a
+        previous matrix, are not requested again. The pairs are requested
+        concurrently.
+
+        Args:
+            vessel_class: Vessel class for which the distances will be
+                calculated.
+            loading_condition_id: Loading condition of the vessels
+                for which the distances will be calculated.
+                Options available: Laden and Ballast.
+            ports_from: The starting ports, one per row of the matrix.
+            ports_to: The ending ports, one per column of the matrix.
+            symmetric: Whether the distance from a port to another can be
+                assumed to equal the distance back, so that only one of the
+                two is requested.
+            max_workers: The maximum number of distances requested at the
+                same time, capped at the pool size of the connection. If not
+                specified, the pool size is used. If 1, distances are
+                requested one after another.
+
+        Returns:
+            A data frame of distances in NM, indexed by the IDs of the
+            starting ports, with a column per ID of the ending ports. Pairs
+            without a distance are NaN.
+
+        Raises:
+            ChunkRetrievalError: Some distances could not be retrieved.
+                Distances retrieved successfully are kept, so calling its
+                `retry` method requests only the failed pairs again.
+        """
+        from_ids = [p.id for p in ports_from]
+        to_ids = [p.id for p in ports_to]
+        pairs = {
+            (vessel_class.id, loading_condition_id, f, t)
+            for f in from_ids
+            for t in to_ids
+        }
+        requested = sorted(
+            {_get_ordered_pair(pair) if symmetric else pair for pair in pairs}
+        )
+
+        return fetch_chunks(
+            requested,
+            self.__get_port_to_port_distance,
+            partial(
+                _build_distance_matrix,
+                vessel_class.id,
+                loading_condition_id,
+                from_ids,
+                to_ids,
+                symmetric,
+                requested,
+            ),
+            get_max_workers(max_workers, self.__connection.pool_size),
+        )
+
+
+def _build_distance_matrix(
+    vessel_class_id: int,
+    loading_condition_id: int,
+    from_ids: List[int],
+    to_ids: List[int],
+    symmetric: bool,
+    pairs: List[_PortPair],
+    distances: List[Optional[Decimal]],
+) -> pd.DataFrame:
+    distances_by_pair = dict(zip(pairs, distances))
+    matrix = np.full((len(from_ids), len(to_ids)), np.nan)
+    for row, from_id in enumerate(from_ids):
+        for column, to_id in enumerate(to_ids):
+            pair = (vessel_class_id, loading_condition_id, from_id, to_id)
+            distance = distances_by_pair[
+                _get_ordered_pair(pair) if symmetric else pair
+            ]
+            if distance is not None:
+                matrix[row, column] = distance
+
+    return pd.DataFrame(
+        matrix,
+        index=pd.Index(from_ids, name="port_from_id"),
+        columns=pd.Index(to_ids, name="port_to_id"),
+    )
+
+
+def _get_reverse_pair(pair: _PortPair) -> _PortPair:
+    vessel_class_id, loading_condition_id, from_id, to_id = pair
+    return vessel_class_id, loading_condition_id, to_id, from_id
+
+
+def _get_ordered_pair(pair: _PortPair) -> _PortPair:
+    return min(pair, _get_reverse_pair(pair))
+
+
+def _get_point_to_point_query(
+    vessel_class: VesselClass,
+    loading_condition_id: int,
+    start_point: Point,
+    end_point: Point,
+) -> QueryString:
+    return {
+        "vesselclass": vessel_class.id,
+        "loadingcondition": loading_condition_id,
+        "latitudefrom": str(start_point.lat),
+        "latitudeto": str(end_point.lat),
+        "longitudefrom": str(start_point.lon),
+        "longitudeto": str(end_point.lon),
+    }
+
+
+def _get_point_to_port_query(
+    vessel_class: VesselClass,
+    loading_condition_id: int,
+    point: Point,
+    port: Port,
+) -> QueryString:
+    return {
+        "vesselclass": vessel_class.id,
+        "loadingcondition": loading_condition_id,
+        "latitude": str(point.lat),
+        "longitude": str(point.lon),
+        "portid": port.id,
+    }
+
+
+def _get_port_to_port_query(
+    vessel_class_id: int,
+    loading_condition_id: int,
+    port_from_id: int,
+    port_to_id: int,
+) -> QueryString:
+    return {
+        "vesselclass": vessel_class_id,
+        "loadingcondition": loading_condition_id,
+        "portIdFrom": port_from_id,
+        "portIdTo": port_to_id,
+    }
+
+
+def _get_generic_query(
+    start_point: Point,
+    end_point: Point,
+    route_restrictions: Optional[RouteRestrictions],
+    delays_valid_at: Optional[date],
+    get_alternatives: Optional[bool],
+) -> QueryString:
+    route_restrictions = route_restrictions or RouteRestrictions()
+    return {
+        "StartPointLatitude": str(start_point.lat),
+        "StartPointLongitude": str(start_point.lon),
+        "EndPointLatitude": str(end_point.lat),
+        "EndPointLongitude": str(end_point.lon),
+        "DelaysValidAt": format_iso_date(delays_valid_at)
+        if delays_valid_at
+        else None,
+        "GetAlternatives": get_alternatives,
+        **route_restrictions._to_query_string(),
+    }
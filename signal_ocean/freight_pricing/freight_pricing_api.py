@@ -1,7 +1,12 @@
 # noqa: D100
 
+from dataclasses import dataclass
 from datetime import date
-from typing import Tuple, Optional, Dict, Any
+from functools import partial
+from itertools import product
+from typing import Tuple, Optional, Dict, Any, Sequence
+
+import pandas as pd
 
 from .. import Connection
 from .._internals import format_iso_date
@@ -14,6 +19,27 @@ from .vessel_class import VesselClass
 from .vessel_class_filter import VesselClassFilter
 from .vessel_type import VesselType
 from .vessel_type_filter import VesselTypeFilter
+from ..util.chunked_retrieval import fetch_chunks, get_max_workers
+from ..util.frame_helpers import pricing_grid_to_frame
+
+_AMOUNTS = {
+    "cargo_quantity": "cargo_quantity",
+    "freight_rate": "costs.freight_rate",
+    "freight_cost": "costs.freight_cost",
+    "canal": "costs.canal",
+    "total_cost": "totals.total_cost",
+    "total_cost_per_ton": "totals.total_cost_per_ton",
+}
+
+
+@dataclass(frozen=True)
+class _PricingKey:
+    vessel_type_id: int
+    load_port_id: int
+    discharge_port_id: int
+    date: date
+    vessel_subclass: Optional[int]
+    vessel_class_ids: Optional[Tuple[int, ...]]
 
 
 class FreightPricingAPI:
@@ -53,19 +79,32 @@ class FreightPricingAPI:
         Returns:
             A tuple of freight pricings, one per vessel class.
         """
+        return self.__get_freight_pricing(
+            _get_pricing_key(
+                vessel_type,
+                load_port,
+                discharge_port,
+                date,
+                vessel_subclass,
+                vessel_classes,
+            )
+        )
+
+    def __get_freight_pricing(
+        self, key: _PricingKey
+    ) -> Tuple[FreightPricing, ...]:
         query_string: Dict[str, Any] = {
-            'vesselType': vessel_type.id,
-            'loadPortId': load_port.id,
-            'dischargePortId': discharge_port.id,
-            'date': format_iso_date(date)
+            'vesselType': key.vessel_type_id,
+            'loadPortId': key.load_port_id,
+            'dischargePortId': key.discharge_port_id,
+            'date': format_iso_date(key.date)
         }
 
-        if vessel_classes is not None:
-            query_string['vesselClassId'] = [
-                vc.id for vc in vessel_classes]
+        if key.vessel_class_ids is not None:
+            query_string['vesselClassId'] = list(key.vessel_class_ids)
 
-        if vessel_subclass is not None:
-            query_string['vesselSubclass'] = vessel_subclass.value
+        if key.vessel_subclass is not None:
+            query_string['vesselSubclass'] = key.vessel_subclass
 
         response = self.__connection._make_get_request(
             'freight-pricing-api/freight-pricing',
@@ -74,6 +113,78 @@ class FreightPricingAPI:
         response.raise_for_status()
         return _freight_pricing_json.parse(response.json())
 
+    def get_freight_pricing_grid(
+            self,
+            vessel_type: VesselType,
+            load_ports: Sequence[Port],
+            discharge_ports: Sequence[Port],
+            dates: Sequence[date],
+            vessel_subclass: Optional[VesselSubclass] = None,
+            vessel_classes: Optional[Tuple[VesselClass, ...]] = None,
+            max_workers: Optional[int] = None,
+            ) -> pd.DataFrame:
+        """Retrieves freight prices for every combination of ports and dates.
+
+        A request is made per distinct combination of load port, discharge
+        port and date, covering all vessel classes at once. The combinations
+        are requested concurrently. To avoid requesting prices again for a
+        later grid, give the connection a `ResponseCache` for the
+        `freight-pricing-api/freight-pricing` route.
+
+        Args:
+            vessel_type: The type of vessel to calculate the prices for.
+            load_ports: Ports where the commodity is loaded.
+            discharge_ports: Ports where the commodity is discharged.
+            dates: Dates at which the freight prices are requested.
+            vessel_subclass: The vessel's subclass. This is an optional
+             parameter.
+            vessel_classes: The vessel classes to price. If not provided,
+             all vessel classes of the vessel type are priced.
+            max_workers: The maximum number of requests made at the same
+             time. If 1, requests are made one after another. Defaults to,
+             and is capped at, the pool size of the connection.
+
+        Returns:
+            A data frame with a row per load port, discharge port, date and
+            vessel class, ordered by load port, discharge port and date as
+            provided, with the `load_port_id`, `discharge_port_id`, `date`,
+            `vessel_class`, `cargo_quantity`, `freight_rate`,
+            `freight_cost`, `canal`, `total_cost` and `total_cost_per_ton`
+            columns.
+
+        Raises:
+            ChunkRetrievalError: Some prices could not be retrieved. Prices
+                retrieved successfully are kept, so calling its `retry`
+                method requests only the failed combinations again.
+        """
+        keys = list(
+            dict.fromkeys(
+                _get_pricing_key(
+                    vessel_type,
+                    load_port,
+                    discharge_port,
+                    pricing_date,
+                    vessel_subclass,
+                    vessel_classes,
+                )
+                for load_port, discharge_port, pricing_date in product(
+                    load_ports, discharge_ports, dates
+                )
+            )
+        )
+
+        return fetch_chunks(
+            keys,
+            self.__get_freight_pricing,
+            partial(
+                pricing_grid_to_frame,
+                keys,
+                categories=("vessel_class",),
+                amounts=_AMOUNTS,
+            ),
+            get_max_workers(max_workers, self.__connection.pool_size),
+        )
+
     def get_ports(
         self, port_filter: Optional[PortFilter] = None
     ) -> Tuple[Port, ...]:
@@ -139,3 +250,23 @@ class FreightPricingAPI:
         type_filter = type_filter or VesselTypeFilter()
 
         return tuple(type_filter._apply(types))
+
+
+def _get_pricing_key(
+    vessel_type: VesselType,
+    load_port: Port,
+    discharge_port: Port,
+    pricing_date: date,
+    vessel_subclass: Optional[VesselSubclass],
+    vessel_classes: Optional[Tuple[VesselClass, ...]],
+) -> _PricingKey:
+    return _PricingKey(
+        vessel_type.id,
+        load_port.id,
+        discharge_port.id,
+        pricing_date,
+        vessel_subclass.value if vessel_subclass else None,
+        tuple(vc.id for vc in vessel_classes)
+        if vessel_classes is not None
+        else None,
+    )
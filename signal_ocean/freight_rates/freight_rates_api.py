@@ -1,14 +1,42 @@
 # noqa: D100
 
+from dataclasses import dataclass
 from datetime import date
-from typing import Optional, Tuple, List
+from functools import partial
+from itertools import product
+from typing import Optional, Sequence, Tuple, List
+
+import pandas as pd
 
 from .. import Connection
-from .._internals import QueryString
+from .._internals import QueryString, unique_by_id
 from .enums import VesselClass
 from .models import FreightPricing, Port
 from .port_filter import PortFilter
 from ._freight_rates_json import parse_freight_pricing, parse_ports
+from ..util.chunked_retrieval import fetch_chunks, get_max_workers
+from ..util.daily_memo import DailyMemo
+from ..util.frame_helpers import pricing_grid_to_frame
+
+_AMOUNTS = {
+    "rate": "rate",
+    "estimated_flat_rate": "estimated_flat_rate",
+    "canal": "costs.canal",
+    "freight_cost": "costs.freight_cost",
+    "other_port_expenses": "costs.other_port_expenses",
+    "total_freight_cost": "total_freight_cost",
+    "total_freight_rate": "total_freight_rate",
+    "quantity": "quantity",
+}
+
+
+@dataclass(frozen=True)
+class _PricingKey:
+    load_port_id: int
+    discharge_port_id: int
+    vessel_classes: Tuple[str, ...]
+    is_clean: bool
+    date: date
 
 
 class FreightRatesAPI:
@@ -22,6 +50,7 @@ class FreightRatesAPI:
                 default connection method is used.
         """
         self.__connection = connection or Connection()
+        self.__ports: DailyMemo[Tuple[Port, ...]] = DailyMemo()
 
     def get_freight_pricing(
             self, load_ports: List[int], discharge_ports: List[int],
@@ -64,6 +93,74 @@ class FreightRatesAPI:
 
         return return_object
 
+    def get_freight_pricing_grid(
+            self, load_ports: Sequence[int], discharge_ports: Sequence[int],
+            vessel_classes: List[str], is_clean: bool,
+            dates: Sequence[date], max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Provides freight pricing for every combination of ports and dates.
+
+        A request is made per distinct combination of load port, discharge
+        port and date, covering all vessel classes at once. The combinations
+        are requested concurrently. To avoid requesting prices again for a
+        later grid, give the connection a `ResponseCache` for the
+        `freight/api/Freight/v3/pricing` route.
+
+        Args:
+            load_ports: Load ports, each priced separately.
+            discharge_ports: Discharge ports, each priced separately.
+            vessel_classes: Vessel classes for which to return the freight e.g.
+            VLCC, Aframax etc.
+            is_clean: True if it is clean cargo.
+            dates: Dates of pricing.
+            max_workers: The maximum number of requests made at the same
+            time. If 1, requests are made one after another. Defaults to,
+            and is capped at, the pool size of the connection.
+
+        Returns:
+            A data frame with a row per load port, discharge port, date and
+            vessel class, ordered by load port, discharge port and date as
+            provided. Besides the `load_port_id`, `discharge_port_id`,
+            `date` and `vessel_class` columns, it holds a column per
+            attribute of `FreightPricing`, with the costs breakdown
+            flattened into the `canal`, `freight_cost` and
+            `other_port_expenses` columns. Ports and routing choices are not
+            included.
+
+        Raises:
+            ChunkRetrievalError: Some prices could not be retrieved. Prices
+                retrieved successfully are kept, so calling its `retry`
+                method requests only the failed combinations again.
+        """
+        keys = list(dict.fromkeys(
+            _PricingKey(load_port, discharge_port, tuple(vessel_classes),
+                        is_clean, pricing_date)
+            for load_port, discharge_port, pricing_date in product(
+                load_ports, discharge_ports, dates
+            )
+        ))
+
+        return fetch_chunks(
+            keys,
+            self.__get_freight_pricing,
+            partial(
+                pricing_grid_to_frame,
+                keys,
+                categories=("vessel_class", "rate_type", "route_type"),
+                flags=("min_flat_augusta_used",),
+                amounts=_AMOUNTS,
+            ),
+            get_max_workers(max_workers, self.__connection.pool_size),
+        )
+
+    def __get_freight_pricing(
+        self, key: _PricingKey
+    ) -> Tuple[FreightPricing, ...]:
+        return self.get_freight_pricing(
+            [key.load_port_id], [key.discharge_port_id],
+            list(key.vessel_classes), key.is_clean, key.date
+        )
+
     @staticmethod
     def get_vessel_classes() -> Tuple[str, ...]:
         """Retrieves all available vessel classes.
@@ -76,25 +173,53 @@ class FreightRatesAPI:
         return vessel_classes
 
     def get_ports(
-        self, port_filter: Optional[PortFilter] = None
+        self,
+        port_filter: Optional[PortFilter] = None,
+        max_workers: Optional[int] = None,
     ) -> Tuple[Port, ...]:
         """Retrieves available ports.
 
+        The ports available for each vessel class are requested, optionally
+        concurrently, and merged so that each port is returned once. The
+        merged ports are memoised for the rest of the day, so only the
+        first call of a day makes requests.
+
         Args:
             port_filter: A filter used to find specific ports. If not
                 specified, returns all available ports.
+            max_workers: The maximum number of vessel classes whose ports
+                are requested at the same time, capped at the pool size of
+                the connection. If not specified, the pool size is used. If
+                1, they are requested one after another.
 
         Returns:
             A tuple of available ports that match the filter.
+
+        Raises:
+            requests.HTTPError: The ports of a vessel class could not be
+                retrieved, when vessel classes are requested one after
+                another.
+            ChunkRetrievalError: The ports of some vessel classes could not
+                be retrieved, when vessel classes are requested
+                concurrently. Calling its `retry` method requests only the
+                failed vessel classes again.
         """
-        query_dict = {
-            "date": date.today().isoformat()
-        }
+        available_ports = self.__ports.get(
+            partial(self.__get_available_ports, max_workers=max_workers)
+        )
 
-        query_string: QueryString = query_dict
+        port_filter = port_filter or PortFilter()
+
+        return tuple(port_filter._apply(available_ports))
+
+    def __get_available_ports(
+        self, today: date, max_workers: Optional[int]
+    ) -> Tuple[Port, ...]:
+        query_string: QueryString = {"date": today.isoformat()}
 
-        available_ports: List[Port] = []
-        for vessel_class in VesselClass:
+        def get_vessel_class_ports(
+            vessel_class: VesselClass,
+        ) -> Tuple[Port, ...]:
             response = self.__connection._make_get_request(
                 f"freight/api/Freight/v2/pricing/"
                 f"availablePorts/{vessel_class.name}",
@@ -102,8 +227,12 @@ class FreightRatesAPI:
             )
             response.raise_for_status()
             response_json = response.json()
-            available_ports += parse_ports(response_json)
-
-        port_filter = port_filter or PortFilter()
-
-        return tuple(port_filter._apply(available_ports))
+            return parse_ports(response_json)
+
+        return fetch_chunks(
+            list(VesselClass),
+            get_vessel_class_ports,
+            unique_by_id,
+            get_max_workers(max_workers, self.__connection.pool_size),
+            raise_first_error=max_workers == 1,
+        )
@@ -31,7 +31,8 @@ def create_dataframe(
                                         response_dict['discharge_ports']]
     response_dict.pop('costs')
     df = pd.DataFrame([response_dict])
-    for column_name, _ in df.items():
-        df = df.rename(
-            columns={column_name: snake_to_camel_case(str(column_name))})
-    return df
+    return df.rename(
+        columns={
+            column_name: snake_to_camel_case(str(column_name))
+            for column_name in df.columns
+        })
@@ -30,6 +30,9 @@ Classes:
     OperationalStatus: Contains constants for available operational statuses.
 
     FixtureType: Contains constants for available fixture types.
+
+    ChunkRetrievalError: Raised when some chunks of a Historical Tonnage List
+        could not be retrieved.
 """
 import warnings
 
@@ -48,6 +51,7 @@ from .column import Column
 from .index_level import IndexLevel
 from .operational_status import OperationalStatus
 from .fixture_type import FixtureType
+from ..util.chunked_retrieval import ChunkRetrievalError
 
 warnings.warn(
     "The historical_tonnage_list package is deprecated and will be removed in "
@@ -73,4 +77,5 @@ __all__ = [
     "IndexLevel",
     "OperationalStatus",
     "FixtureType",
+    "ChunkRetrievalError",
 ]
@@ -1,14 +1,14 @@
 from datetime import datetime
-from typing import Iterable, cast, Mapping, Any, Tuple
+from typing import cast, Mapping, Any, Tuple
 
 from .tonnage_list import TonnageList
 from .vessel import Vessel
 from .area import Area
-from .._internals import parse_datetime
+from .._internals import index_by_imo, parse_datetime
 
 
 def parse_tonnage_lists(json: Mapping[str, Any]) -> Tuple[TonnageList, ...]:
-    static_vessel_data = json.get("staticVesselData", [])
+    static_vessel_data = index_by_imo(json.get("staticVesselData", []))
     tonnage_lists = json.get("tonnageLists", [])
 
     return tuple(
@@ -18,12 +18,10 @@ def parse_tonnage_lists(json: Mapping[str, Any]) -> Tuple[TonnageList, ...]:
 
 def to_vessel(
     pit_vessel_data: Mapping[str, Any],
-    static_vessel_data: Iterable[Mapping[str, Any]],
+    static_vessel_data: Mapping[int, Mapping[str, Any]],
 ) -> Vessel:
     imo = pit_vessel_data["imo"]
-    data_for_imo: Mapping[str, Any] = next(
-        (svd for svd in static_vessel_data if svd["imo"] == imo), {}
-    )
+    data_for_imo: Mapping[str, Any] = static_vessel_data.get(imo, {})
 
     return Vessel(
         imo,
@@ -57,7 +55,7 @@ def to_vessel(
 
 def to_tonnage_list(
     tonnage_list_json: Mapping[str, Any],
-    static_vessel_data: Iterable[Mapping[str, Any]],
+    static_vessel_data: Mapping[int, Mapping[str, Any]],
 ) -> TonnageList:
     date = cast(datetime, parse_datetime(tonnage_list_json["date"]))
     vessels = tuple(
@@ -1,6 +1,6 @@
 # noqa: D100
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 
 from .._internals import IterableConstants
 from .vessel import Vessel
@@ -18,6 +18,33 @@ def _category(name: str) -> str:
     return name
 
 
+_vessel_attributes = (
+    "name",
+    "vessel_class",
+    "ice_class",
+    "year_built",
+    "deadweight",
+    "length_overall",
+    "breadth_extreme",
+    "subclass",
+    "market_deployment",
+    "push_type",
+    "open_port",
+    "open_date",
+    "operational_status",
+    "commercial_operator",
+    "commercial_status",
+    "eta",
+    "latest_ais",
+    "open_prediction_accuracy",
+    "open_country",
+    "open_narrow_area",
+    "open_wide_area",
+    "availability_port_type",
+    "availability_date_type",
+)
+
+
 class Column(metaclass=IterableConstants):
     """Contains constants for data frame column names."""
 
@@ -47,31 +74,11 @@ class Column(metaclass=IterableConstants):
 
     @staticmethod
     def _create_row(vessel: Vessel) -> List[Any]:
-        return [
-            vessel.name,
-            vessel.vessel_class,
-            vessel.ice_class,
-            vessel.year_built,
-            vessel.deadweight,
-            vessel.length_overall,
-            vessel.breadth_extreme,
-            vessel.subclass,
-            vessel.market_deployment,
-            vessel.push_type,
-            vessel.open_port,
-            vessel.open_date,
-            vessel.operational_status,
-            vessel.commercial_operator,
-            vessel.commercial_status,
-            vessel.eta,
-            vessel.latest_ais,
-            vessel.open_prediction_accuracy,
-            vessel.open_country,
-            vessel.open_narrow_area,
-            vessel.open_wide_area,
-            vessel.availability_port_type,
-            vessel.availability_date_type
-        ]
+        return [getattr(vessel, name) for name in _vessel_attributes]
+
+    @staticmethod
+    def _get_vessel_attributes() -> Tuple[str, ...]:
+        return _vessel_attributes
 
     @staticmethod
     def _get_data_types() -> Dict[str, str]:
@@ -7,6 +7,7 @@ import pandas as pd
 from .tonnage_list import TonnageList
 from .column import Column
 from .index_level import IndexLevel
+from ..util.frame_helpers import tonnage_lists_to_frame
 
 
 class HistoricalTonnageList(Sequence[TonnageList]):
@@ -48,19 +49,10 @@ class HistoricalTonnageList(Sequence[TonnageList]):
 
     def to_data_frame(self) -> pd.DataFrame:
         """Converts the Historical Tonnage List to a pandas data frame."""
-        index_tuples = []
-        data = []
-        for tonnage_list in self.__tonnage_lists:
-            for vessel in tonnage_list.vessels:
-                index_tuples.append((tonnage_list.date, vessel.imo))
-                data.append(Column._create_row(vessel))
-
-        data_frame = pd.DataFrame(
-            data,
-            index=pd.MultiIndex.from_tuples(
-                index_tuples, names=[IndexLevel.DATE, IndexLevel.IMO]
-            ),
-            columns=list(Column),
+        return tonnage_lists_to_frame(
+            self.__tonnage_lists,
+            dict(zip(Column, Column._get_vessel_attributes())),
+            Column._get_data_types(),
+            IndexLevel.DATE,
+            IndexLevel.IMO,
         )
-
-        return data_frame.astype(Column._get_data_types())  # type: ignore
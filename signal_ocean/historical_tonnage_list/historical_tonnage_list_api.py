@@ -1,10 +1,12 @@
 # noqa: D100
 
 from datetime import date, time, timedelta
+from functools import partial
 from typing import Optional, Iterable, List
 
 from .. import Connection, Port, VesselClass
 from .._internals import format_iso_date, QueryString
+from ..util.chunked_retrieval import fetch_chunks
 from .historical_tonnage_list import HistoricalTonnageList
 from .tonnage_list import TonnageList
 from .vessel_filter import VesselFilter
@@ -60,6 +62,8 @@ class HistoricalTonnageListAPI:
         end_date: Optional[date] = None,
         time: Optional[time] = None,
         vessel_filter: Optional[VesselFilter] = None,
+        chunk_days: int = __MAX_DATE_RANGE_DAYS,
+        max_workers: int = 1,
     ) -> HistoricalTonnageList:
         """Retrieves a Historical Tonnage List.
 
@@ -81,29 +85,47 @@ class HistoricalTonnageListAPI:
                 It can get the values 00, 06, 12, 18.
             vessel_filter: A filter defining which vessels should be included
                 in the response see Vessel Filter class for more details.
+            chunk_days: The number of days requested at once. Date ranges
+                longer than this are split into chunks, each retrieved with
+                a separate request. Cannot exceed 365 days.
+            max_workers: The maximum number of chunks retrieved at the same
+                time. If 1, chunks are retrieved one after another. Should
+                not exceed the pool size of the connection.
 
         Returns:
             Given a time-range, returns a Historical Tonnage List containing a
             Tonnage List for every day between the start and end dates, at the
-            requested time of day.
+            requested time of day, in chronological order.
+
+        Raises:
+            requests.HTTPError: A chunk could not be retrieved, when chunks
+                are retrieved one after another. The remaining chunks are
+                not requested.
+            ChunkRetrievalError: Some chunks could not be retrieved, when
+                chunks are retrieved concurrently. Calling its `retry`
+                method retrieves only the failed chunks again and returns
+                the complete Historical Tonnage List.
         """
-        all_tonnage_lists: List[TonnageList] = []
-        date_ranges = _DateRange(start_date, end_date).split(
-            HistoricalTonnageListAPI.__MAX_DATE_RANGE_DAYS
-        )
+        max_days = HistoricalTonnageListAPI.__MAX_DATE_RANGE_DAYS
+        if not 1 <= chunk_days <= max_days:
+            raise ValueError(f"chunk_days must be between 1 and {max_days}.")
+
+        date_ranges = _DateRange(start_date, end_date).split(chunk_days)
 
-        for date_range in date_ranges:
-            tonnage_lists = self._get_htl_chunk(
+        return fetch_chunks(
+            list(date_ranges),
+            partial(
+                self._get_htl_chunk,
                 loading_port,
                 vessel_class,
-                date_range,
-                laycan_end_in_days,
-                time,
-                vessel_filter,
-            )
-            all_tonnage_lists.extend(tonnage_lists)
-
-        return HistoricalTonnageList(all_tonnage_lists)
+                laycan_end_in_days=laycan_end_in_days,
+                time=time,
+                vessel_filter=vessel_filter,
+            ),
+            _combine_chunks,
+            max_workers,
+            raise_first_error=True,
+        )
 
     def _get_htl_chunk(
         self,
@@ -132,3 +154,11 @@ class HistoricalTonnageListAPI:
         return _historical_tonnage_list_json.parse_tonnage_lists(
             response.json()
         )
+
+
+def _combine_chunks(
+    chunks: List[Iterable[TonnageList]],
+) -> HistoricalTonnageList:
+    return HistoricalTonnageList(
+        tonnage_list for chunk in chunks for tonnage_list in chunk
+    )
@@ -19,14 +19,25 @@ Classes:
 
     PortFilter: A filter used to find specific ports.
 
+    PortExpensesScenario: The parameters of a port expenses estimation for a
+        vessel.
+
+    ModelVesselExpensesScenario: The parameters of a port expenses
+        estimation for a model vessel.
+
+    PortExpensesResult: The outcome of a port expenses estimation in a
+        batch.
+
 """
 
 from .enums import Operation, OperationStatus, EstimationStatus, \
     ItalianAnchorageDues
-from .models import PortExpenses, Port, VesselType
+from .models import PortExpenses, Port, VesselType, PortExpensesScenario, \
+    ModelVesselExpensesScenario, PortExpensesResult
 from .port_expenses_api import PortExpensesAPI
 from .port_filter import PortFilter
 
 __all__ = ["Operation", "OperationStatus", "EstimationStatus",
            "ItalianAnchorageDues", "PortExpenses", "PortExpensesAPI",
-           "PortFilter", "Port", "VesselType"]
+           "PortFilter", "Port", "VesselType", "PortExpensesScenario",
+           "ModelVesselExpensesScenario", "PortExpensesResult"]
@@ -1,6 +1,15 @@
 # noqa: D100
 
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Union
+
+from .enums import (
+    EstimationStatus,
+    ItalianAnchorageDues,
+    Operation,
+    OperationStatus,
+)
 
 
 @dataclass(frozen=True)
@@ -71,3 +80,86 @@ class VesselType:
 
     id: int
     name: str
+
+
+@dataclass(frozen=True)
+class PortExpensesScenario:
+    """The parameters of a port expenses estimation for a vessel.
+
+    See `PortExpensesAPI.get_port_expenses` for the meaning of each
+    attribute.
+
+    Attributes:
+        imo: The vessel's IMO number.
+        port_id: ID of the port to retrieve the expenses for.
+        vessel_type_id: Vessel type ID.
+        estimated_time_of_berth: Estimated time of berth.
+        estimated_time_of_sail: Estimated time of sail.
+        operation: Operation type.
+        italian_anchorage_dues: Italian anchorage dues.
+        cargo_type: Cargo type.
+        operation_status: Operation status.
+        utc_date: UTC date.
+        historical_tce: Flag for Historical TCE.
+        estimation_status: Estimation status.
+    """
+
+    imo: int
+    port_id: int
+    vessel_type_id: Optional[int] = None
+    estimated_time_of_berth: Optional[datetime] = None
+    estimated_time_of_sail: Optional[datetime] = None
+    operation: Optional[Operation] = None
+    italian_anchorage_dues: Optional[ItalianAnchorageDues] = None
+    cargo_type: Optional[str] = None
+    operation_status: Optional[OperationStatus] = None
+    utc_date: Optional[datetime] = None
+    historical_tce: Optional[bool] = None
+    estimation_status: Optional[EstimationStatus] = None
+
+
+@dataclass(frozen=True)
+class ModelVesselExpensesScenario:
+    """The parameters of a port expenses estimation for a model vessel.
+
+    See `PortExpensesAPI.get_port_model_vessel_expenses` for the meaning of
+    each attribute.
+
+    Attributes:
+        port_id: ID of the port to retrieve the expenses for.
+        vessel_type_id: Vessel type ID.
+        formula_calculation_date: Formula calculation date.
+        vessel_class_id: Vessel class ID.
+        operation_status: Operation status.
+        historical_tce: Flag for historical TCE.
+        estimation_status: Estimation status.
+    """
+
+    port_id: int
+    vessel_type_id: int
+    formula_calculation_date: datetime
+    vessel_class_id: int = 0
+    operation_status: OperationStatus = OperationStatus.BALLAST
+    historical_tce: bool = False
+    estimation_status: EstimationStatus = (
+        EstimationStatus.PRIORITY_TO_FORMULAS
+    )
+
+
+Scenario = Union[PortExpensesScenario, ModelVesselExpensesScenario]
+
+
+@dataclass(frozen=True)
+class PortExpensesResult:
+    """The outcome of a port expenses estimation in a batch.
+
+    Attributes:
+        scenario: The parameters of the estimation.
+        port_expenses: The estimated port expenses, or None if the port,
+            vessel or vessel type does not exist or the estimation failed.
+        error: The error that made the estimation fail, if any.
+    """
+
+    scenario: Scenario
+    port_expenses: Optional[PortExpenses] = None
+    error: Optional[Exception] = None
@@ -1,15 +1,26 @@
 # noqa: D100
 
-from datetime import datetime
-from typing import cast, Optional, List, Tuple
+import dataclasses
+from datetime import date, datetime
+from functools import partial
+from typing import cast, Any, Dict, Iterable, Iterator, Optional, List, \
+    Tuple
+
+import numpy as np
+import pandas as pd
 
 from .. import Connection
-from .._internals import QueryString
+from .._internals import QueryString, unique_by_id
 from .enums import Operation, OperationStatus, EstimationStatus,\
     ItalianAnchorageDues, VesselTypeEnum
-from .models import PortExpenses, Port, VesselType
+from .models import PortExpenses, Port, VesselType, \
+    ModelVesselExpensesScenario, PortExpensesResult, Scenario
 from .port_filter import PortFilter
 from ._port_expenses_json import parse_port_expenses, parse_ports
+from ..util.chunked_retrieval import fetch_chunks, fetch_each, \
+    get_max_workers
+from ..util.daily_memo import DailyMemo
+from ..util.frame_helpers import columns_to_frame
 
 
 class PortExpensesAPI:
@@ -23,6 +34,7 @@ class PortExpensesAPI:
                 default connection method is used.
         """
         self.__connection = connection or Connection()
+        self.__ports: DailyMemo[Tuple[Port, ...]] = DailyMemo()
 
     def get_port_expenses(
         self, imo: int, port_id: int,
@@ -141,6 +153,104 @@ class PortExpensesAPI:
 
         return return_object
 
+    def get_port_expenses_batch(
+        self, scenarios: Iterable[Scenario],
+        max_workers: Optional[int] = None
+    ) -> Iterator[PortExpensesResult]:
+        """Retrieves port expenses for many scenarios.
+
+        Scenarios are either `PortExpensesScenario`, estimated as by
+        `get_port_expenses`, or `ModelVesselExpensesScenario`, estimated as
+        by `get_port_model_vessel_expenses`. Identical scenarios are
+        estimated once. Scenarios are read lazily and estimated
+        concurrently through the API's connection, with a bounded number of
+        them in flight, and their results are returned as they become
+        available, in the order of the scenarios.
+
+        A failing scenario does not abort the batch: its error is captured
+        in its result instead.
+
+        Args:
+            scenarios: The scenarios to estimate.
+            max_workers: The maximum number of scenarios estimated at the
+                same time. If 1, they are estimated one after another.
+                Defaults to, and is capped at, the pool size of the
+                connection.
+
+        Returns:
+            An iterator of the result of each distinct scenario.
+        """
+        results = fetch_each(
+            _get_distinct(scenarios),
+            self.__get_scenario_expenses,
+            get_max_workers(max_workers, self.__connection.pool_size),
+        )
+        for scenario, port_expenses, error in results:
+            yield PortExpensesResult(scenario, port_expenses, error)
+
+    def get_port_expenses_batch_frame(
+        self, scenarios: Iterable[Scenario],
+        max_workers: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Retrieves port expenses for many scenarios into a data frame.
+
+        Scenarios are estimated as by `get_port_expenses_batch`.
+
+        Args:
+            scenarios: The scenarios to estimate.
+            max_workers: The maximum number of scenarios estimated at the
+                same time. If 1, they are estimated one after another.
+                Defaults to, and is capped at, the pool size of the
+                connection.
+
+        Returns:
+            A data frame with a row per distinct scenario, in the order of
+            the scenarios. It holds the `imo` (missing for model vessels),
+            `port_id` and `vessel_type_id` of the scenario, a column per
+            attribute of `PortExpenses`, missing if the expenses could not
+            be estimated, and an `error` column describing failures. Costs
+            are floats, since the API may return fractional amounts.
+        """
+        columns: Dict[str, List[Any]] = {
+            name: [] for name in _SCENARIO_COLUMNS + _EXPENSES_COLUMNS
+        }
+        errors: List[Optional[str]] = []
+        for result in self.get_port_expenses_batch(scenarios, max_workers):
+            for name in _SCENARIO_COLUMNS:
+                columns[name].append(getattr(result.scenario, name, None))
+            for name in _EXPENSES_COLUMNS:
+                columns[name].append(
+                    getattr(result.port_expenses, name)
+                    if result.port_expenses
+                    else None
+                )
+            errors.append(repr(result.error) if result.error else None)
+
+        return columns_to_frame(
+            {
+                **{
+                    name: pd.array(columns[name], dtype="Int64")
+                    for name in _SCENARIO_COLUMNS
+                },
+                **{
+                    name: _to_expenses_column(name, columns[name])
+                    for name in _EXPENSES_COLUMNS
+                },
+                "error": errors,
+            }
+        )
+
+    def __get_scenario_expenses(
+        self, scenario: Scenario
+    ) -> Optional[PortExpenses]:
+        parameters = {
+            field.name: getattr(scenario, field.name)
+            for field in dataclasses.fields(scenario)
+        }
+        if isinstance(scenario, ModelVesselExpensesScenario):
+            return self.get_port_model_vessel_expenses(**parameters)
+        return self.get_port_expenses(**parameters)
+
     def get_required_formula_parameters(
         self, port_id: int, vessel_type_id: int,
             calculation_date: Optional[datetime] = None
@@ -183,33 +293,90 @@ class PortExpensesAPI:
         return vessel_types
 
     def get_ports(
-        self, port_filter: Optional[PortFilter] = None
+        self,
+        port_filter: Optional[PortFilter] = None,
+        max_workers: Optional[int] = None,
     ) -> Tuple[Port, ...]:
         """Retrieves available ports.
 
+        The ports available for each vessel type are requested, optionally
+        concurrently, and merged so that each port is returned once. The
+        merged ports are memoised for the rest of the day, so only the
+        first call of a day makes requests.
+
         Args:
             port_filter: A filter used to find specific ports. If not
                 specified, returns all available ports.
+            max_workers: The maximum number of vessel types whose ports are
+                requested at the same time, capped at the pool size of the
+                connection. If not specified, the pool size is used. If 1,
+                they are requested one after another.
 
         Returns:
             A tuple of available ports that match the filter.
+
+        Raises:
+            requests.HTTPError: The ports of a vessel type could not be
+                retrieved, when vessel types are requested one after
+                another.
+            ChunkRetrievalError: The ports of some vessel types could not be
+                retrieved, when vessel types are requested concurrently.
+                Calling its `retry` method requests only the failed vessel
+                types again.
         """
-        query_dict = {
-            "date": datetime.now().isoformat()
-        }
+        available_ports = self.__ports.get(
+            partial(self.__get_available_ports, max_workers=max_workers)
+        )
 
-        query_string: QueryString = query_dict
+        port_filter = port_filter or PortFilter()
+
+        return tuple(port_filter._apply(available_ports))
+
+    def __get_available_ports(
+        self, today: date, max_workers: Optional[int]
+    ) -> Tuple[Port, ...]:
+        query_string: QueryString = {"date": today.isoformat()}
 
-        available_ports: List[Port] = []
-        for vessel_type in VesselTypeEnum:
+        def get_vessel_type_ports(
+            vessel_type: VesselTypeEnum,
+        ) -> Tuple[Port, ...]:
             response = self.__connection._make_get_request(
                 f"port-expenses/api/v1/AvailablePorts/{vessel_type.value}",
                 query_string
             )
             response.raise_for_status()
             response_json = response.json()
-            available_ports += parse_ports(response_json)
+            return parse_ports(response_json)
+
+        return fetch_chunks(
+            list(VesselTypeEnum),
+            get_vessel_type_ports,
+            unique_by_id,
+            get_max_workers(max_workers, self.__connection.pool_size),
+            raise_first_error=max_workers == 1,
+        )
 
-        port_filter = port_filter or PortFilter()
 
-        return tuple(port_filter._apply(available_ports))
+def _to_expenses_column(name: str, values: List[Any]) -> Any:
+    if name == "is_estimated":
+        return pd.array(values, dtype="boolean")
+    return np.array(
+        [np.nan if value is None else value for value in values],
+        dtype="float64",
+    )
+
+
+_SCENARIO_COLUMNS = ("imo", "port_id", "vessel_type_id")
+_EXPENSES_COLUMNS = tuple(
+    field.name
+    for field in dataclasses.fields(PortExpenses)
+    if field.name != "port_id"
+)
+
+
+def _get_distinct(scenarios: Iterable[Scenario]) -> Iterator[Scenario]:
+    seen = set()
+    for scenario in scenarios:
+        if scenario not in seen:
+            seen.add(scenario)
+            yield scenario
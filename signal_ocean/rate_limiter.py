@@ -0,0 +1,179 @@
+# noqa: D100
+
+import asyncio
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A request budget enforced by a token bucket.
+
+    Attributes:
+        requests_per_second: The sustained number of requests allowed per
+            second.
+        burst: The maximum number of requests that may be sent at once after
+            a period of inactivity. Defaults to one second worth of requests.
+    """
+
+    requests_per_second: float
+    burst: Optional[int] = None
+
+    def __post_init__(self) -> None:  # noqa: D105
+        if self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive.")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be a positive integer.")
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Counters describing how long callers waited for the rate limiter.
+
+    Attributes:
+        requests: The number of requests that went through the limiter.
+        delayed_requests: The number of requests that had to wait.
+        total_wait_time: The total time, in seconds, callers waited.
+        max_wait_time: The longest time, in seconds, a single caller waited.
+    """
+
+    requests: int = 0
+    delayed_requests: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+
+class _TokenBucket:
+    def __init__(self, limit: RateLimit, now: float):
+        self.__rate = limit.requests_per_second
+        self.__capacity = float(
+            limit.burst or max(1, int(limit.requests_per_second))
+        )
+        self.__tokens = self.__capacity
+        self.__updated = now
+
+    def reserve(self, now: float) -> float:
+        elapsed = max(0.0, now - self.__updated)
+        self.__tokens = min(
+            self.__capacity, self.__tokens + elapsed * self.__rate
+        )
+        self.__updated = now
+        self.__tokens -= 1
+
+        return 0.0 if self.__tokens >= 0 else -self.__tokens / self.__rate
+
+
+class RateLimiter:
+    """Spaces out requests so that they stay within the API's budgets.
+
+    Every host gets its own token bucket governed by the host limit.
+    Requests whose path starts with one of the configured route prefixes
+    additionally draw from that route's bucket; when several prefixes match,
+    the longest one applies. A caller waits until all applicable buckets
+    have a token, which keeps throughput steady at the allowed maximum
+    instead of bursting into throttling responses.
+
+    A single limiter can be shared between connections and is safe to use
+    from multiple threads and asyncio tasks: tokens are reserved under a
+    short-lived lock and the wait happens outside of it.
+    """
+
+    def __init__(
+        self,
+        host_limit: RateLimit,
+        route_limits: Optional[Mapping[str, RateLimit]] = None,
+    ):
+        """Initializes the rate limiter.
+
+        Args:
+            host_limit: The budget applied to every host separately.
+            route_limits: Budgets applied to requests whose URL path,
+                relative to the host, starts with the given prefix, e.g.
+                "voyages-api/".
+        """
+        self.__host_limit = host_limit
+        self.__route_limits = {
+            prefix.lstrip("/"): limit
+            for prefix, limit in (route_limits or {}).items()
+        }
+        self.__buckets: Dict[str, _TokenBucket] = {}
+        self.__lock = Lock()
+        self.__stats = RateLimiterStats()
+
+    def acquire(self, url: str) -> float:
+        """Blocks until a request to the given URL is allowed.
+
+        Args:
+            url: The absolute URL about to be requested.
+
+        Returns:
+            The time, in seconds, the caller waited.
+        """
+        wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Waits, without blocking the event loop, until a request is allowed.
+
+        Args:
+            url: The absolute URL about to be requested.
+
+        Returns:
+            The time, in seconds, the caller waited.
+        """
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> RateLimiterStats:
+        """Returns a snapshot of the wait counters."""
+        with self.__lock:
+            return self.__stats
+
+    def reset_stats(self) -> None:
+        """Resets the wait counters."""
+        with self.__lock:
+            self.__stats = RateLimiterStats()
+
+    def _reserve(self, url: str) -> float:
+        parts = urlsplit(url)
+        keys = self.__get_bucket_keys(parts.netloc, parts.path.lstrip("/"))
+
+        with self.__lock:
+            now = time.monotonic()
+            wait = 0.0
+            for key, limit in keys:
+                bucket = self.__buckets.get(key)
+                if bucket is None:
+                    bucket = self.__buckets[key] = _TokenBucket(limit, now)
+                wait = max(wait, bucket.reserve(now))
+
+            stats = self.__stats
+            self.__stats = RateLimiterStats(
+                requests=stats.requests + 1,
+                delayed_requests=stats.delayed_requests + (wait > 0),
+                total_wait_time=stats.total_wait_time + wait,
+                max_wait_time=max(stats.max_wait_time, wait),
+            )
+
+        return wait
+
+    def __get_bucket_keys(
+        self, host: str, path: str
+    ) -> List[Tuple[str, RateLimit]]:
+        keys = [(host, self.__host_limit)]
+
+        matching = [
+            prefix for prefix in self.__route_limits if path.startswith(prefix)
+        ]
+        if matching:
+            prefix = max(matching, key=len)
+            keys.append((f"{host}/{prefix}", self.__route_limits[prefix]))
+
+        return keys
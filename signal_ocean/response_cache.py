@@ -0,0 +1,346 @@
+# noqa: D100
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from threading import Lock
+from typing import Any, Callable, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+_DAY = timedelta(days=1)
+
+#: Reference data endpoints that change rarely and are cached for a day when
+#: no route TTLs are provided.
+REFERENCE_DATA_TTLS: Mapping[str, timedelta] = {
+    "vessels-api/v3/vesselClasses": _DAY,
+    "vessels-api/v3/vesselTypes": _DAY,
+    "geos-api/v2/areas/": _DAY,
+    "geos-api/v2/countries/": _DAY,
+    "geos-api/v2/geoAssets/": _DAY,
+    "geos-api/v2/ports/": _DAY,
+    "distances-api/api/v1/ports": _DAY,
+    "distances-api/api/v1/VesselClasses": _DAY,
+    "htl-api/historical-tonnage-list/ports": _DAY,
+    "htl-api/historical-tonnage-list/vessel-classes": _DAY,
+    "port-expenses/api/v1/AvailablePorts/": _DAY,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    encoding TEXT,
+    content BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+Send = Callable[[Mapping[str, str]], requests.Response]
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Counters describing how requests were served by a response cache.
+
+    Attributes:
+        hits: The number of requests served from a fresh cached response.
+        revalidations: The number of requests served from a stale cached
+            response after the API confirmed it had not changed.
+        misses: The number of cacheable requests the API had to respond to
+            in full.
+        evictions: The number of cached responses removed to stay within
+            the size bound.
+    """
+
+    hits: int = 0
+    revalidations: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    url: str
+    status: int
+    headers: Dict[str, str]
+    encoding: Optional[str]
+    content: bytes
+    expires: float
+
+    def to_response(self) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.url = self.url
+        response._content = self.content
+        return response
+
+    def get_validators(self) -> Dict[str, str]:
+        validators = {}
+        headers = CaseInsensitiveDict(self.headers)
+        etag = headers.get("ETag")
+        if etag is not None:
+            validators["If-None-Match"] = etag
+        last_modified = headers.get("Last-Modified")
+        if last_modified is not None:
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+
+class ResponseCache:
+    """Stores API responses on disk so they can be reused across processes.
+
+    Only requests whose URL path, relative to the host, starts with one of
+    the configured route prefixes are cached, each for the time to live of
+    its route; when several prefixes match, the longest one applies.
+    Responses are keyed by method, URL, query parameters and hashes of the
+    request body and headers. The headers carry the API key, so responses
+    fetched with one subscription key are never served for another.
+
+    Once a cached response expires, it is revalidated with the ETag and
+    Last-Modified validators the API sent along with it, if any, so an
+    unchanged resource is not downloaded again. The cache is bounded in
+    size: the least recently used responses are evicted first.
+
+    A single cache can be shared between connections and is safe to use from
+    multiple threads.
+    """
+
+    __DEFAULT_MAX_SIZE = 100 * 2 ** 20
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        route_ttls: Optional[Mapping[str, timedelta]] = None,
+        max_size: int = __DEFAULT_MAX_SIZE,
+    ):
+        """Initializes the response cache.
+
+        Args:
+            path: The path of the SQLite database storing the responses. It
+                is created if it does not exist. Defaults to
+                "~/.cache/signal_ocean/responses.sqlite". Use ":memory:" for a
+                cache that lives only as long as the process.
+            route_ttls: How long responses are fresh for, by URL path prefix
+                relative to the host, e.g. "geos-api/v2/ports/". Defaults to
+                `REFERENCE_DATA_TTLS`.
+            max_size: The maximum total size, in bytes, of the cached
+                response bodies.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer.")
+
+        if path is None:
+            path = os.path.join(
+                os.path.expanduser("~"),
+                ".cache",
+                "signal_ocean",
+                "responses.sqlite",
+            )
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.__route_ttls = {
+            prefix.lstrip("/"): ttl.total_seconds()
+            for prefix, ttl in (
+                REFERENCE_DATA_TTLS if route_ttls is None else route_ttls
+            ).items()
+        }
+        self.__max_size = max_size
+        self.__lock = Lock()
+        self.__stats = ResponseCacheStats()
+        self.__db = sqlite3.connect(
+            path, timeout=30, check_same_thread=False
+        )
+        with self.__lock, self.__db:
+            self.__db.executescript(_SCHEMA)
+
+    def stats(self) -> ResponseCacheStats:
+        """Returns a snapshot of the cache counters."""
+        with self.__lock:
+            return self.__stats
+
+    def reset_stats(self) -> None:
+        """Resets the cache counters."""
+        with self.__lock:
+            self.__stats = ResponseCacheStats()
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        with self.__lock, self.__db:
+            self.__db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the underlying database."""
+        with self.__lock:
+            self.__db.close()
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Optional[str],
+        headers: Mapping[str, Optional[str]],
+        send: Send,
+    ) -> requests.Response:
+        ttl = self.__get_ttl(url)
+        if ttl is None:
+            return send({})
+
+        key = self.__get_key(method, url, params, body, headers)
+        cached = self.__get(key)
+        if cached is not None and cached.expires > time.time():
+            self.__count(hits=1)
+            return cached.to_response()
+
+        response = send(cached.get_validators() if cached else {})
+        if cached is not None and response.status_code == 304:
+            self.__touch(key, time.time() + ttl)
+            self.__count(revalidations=1)
+            response.close()
+            return cached.to_response()
+
+        self.__count(misses=1)
+        if response.status_code == 200 and "no-store" not in (
+            response.headers.get("Cache-Control") or ""
+        ):
+            self.__put(key, url, response, time.time() + ttl)
+        return response
+
+    def __get_ttl(self, url: str) -> Optional[float]:
+        path = urlsplit(url).path.lstrip("/")
+        matching = [
+            prefix for prefix in self.__route_ttls if path.startswith(prefix)
+        ]
+        if not matching:
+            return None
+        return self.__route_ttls[max(matching, key=len)]
+
+    @staticmethod
+    def __get_key(
+        method: str,
+        url: str,
+        params: Any,
+        body: Optional[str],
+        headers: Mapping[str, Optional[str]],
+    ) -> str:
+        if isinstance(params, Mapping):
+            params = sorted((str(k), str(v)) for k, v in params.items())
+        body_hash = (
+            hashlib.sha256(body.encode()).hexdigest()
+            if body is not None
+            else None
+        )
+        headers_hash = hashlib.sha256(
+            json.dumps(sorted(headers.items(), key=str)).encode()
+        ).hexdigest()
+        return hashlib.sha256(
+            json.dumps(
+                [method.upper(), url, params, body_hash, headers_hash]
+            ).encode()
+        ).hexdigest()
+
+    def __get(self, key: str) -> Optional[_CachedResponse]:
+        with self.__lock, self.__db:
+            row = self.__db.execute(
+                "SELECT url, status, headers, encoding, content, expires "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.__db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        url, status, headers, encoding, content, expires = row
+        return _CachedResponse(
+            url, status, json.loads(headers), encoding, content, expires
+        )
+
+    def __touch(self, key: str, expires: float) -> None:
+        with self.__lock, self.__db:
+            self.__db.execute(
+                "UPDATE responses SET expires = ?, last_used = ? "
+                "WHERE key = ?",
+                (expires, time.time(), key),
+            )
+
+    def __put(
+        self,
+        key: str,
+        url: str,
+        response: requests.Response,
+        expires: float,
+    ) -> None:
+        content = response.content
+        if len(content) > self.__max_size:
+            return
+
+        with self.__lock, self.__db:
+            self.__db.execute(
+                "INSERT OR REPLACE INTO responses VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url or url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.encoding,
+                    content,
+                    len(content),
+                    expires,
+                    time.time(),
+                ),
+            )
+            evicted = self.__evict()
+            self.__stats = _add_stats(self.__stats, evictions=evicted)
+
+    def __evict(self) -> int:
+        (total,) = self.__db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        evicted = 0
+        if total <= self.__max_size:
+            return evicted
+
+        rows = self.__db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.__max_size:
+                break
+            self.__db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def __count(self, **counters: int) -> None:
+        with self.__lock:
+            self.__stats = _add_stats(self.__stats, **counters)
+
+
+def _add_stats(
+    stats: ResponseCacheStats, **counters: int
+) -> ResponseCacheStats:
+    return ResponseCacheStats(
+        **{
+            name: value + counters.get(name, 0)
+            for name, value in vars(stats).items()
+        }
+    )
@@ -0,0 +1,103 @@
+# noqa: D100
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import requests
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Controls how a connection retries failed requests.
+
+    Requests that fail with a transient status code or a connection error
+    are retried with exponential backoff and full jitter. When the API
+    responds with a Retry-After header, the connection waits at least as
+    long as requested. Retries happen per request, so paged retrievals keep
+    the pages they have already downloaded.
+
+    Attributes:
+        max_retries: The maximum number of retries for a single request.
+        backoff_factor: The base delay, in seconds, of the exponential
+            backoff. The delay before retry n is drawn uniformly from
+            [0, backoff_factor * 2 ** n].
+        max_backoff: The upper bound, in seconds, of a single backoff delay.
+            Does not limit delays requested through Retry-After.
+        max_total_time: The maximum time, in seconds, spent on a request
+            including all of its retries. A retry that would exceed it is not
+            attempted and the last response is returned. None means no limit.
+        retry_statuses: HTTP status codes considered transient.
+        retry_methods: HTTP methods that may be retried. Only idempotent
+            methods are retried by default.
+        respect_retry_after: Whether to honour the Retry-After header.
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    max_total_time: Optional[float] = 120.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset({"GET"})
+    respect_retry_after: bool = True
+
+    def _can_retry(self, method: str) -> bool:
+        return self.max_retries > 0 and method.upper() in self.retry_methods
+
+    def _is_retryable(self, response: requests.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    def _get_retry_delay(
+        self,
+        retry: int,
+        started: float,
+        response: Optional[requests.Response] = None,
+    ) -> Optional[float]:
+        if retry >= self.max_retries:
+            return None
+
+        delay = self._get_delay(retry, response)
+        if self.max_total_time is not None:
+            elapsed = time.monotonic() - started
+            if elapsed + delay > self.max_total_time:
+                return None
+
+        return delay
+
+    def _get_delay(
+        self, retry: int, response: Optional[requests.Response] = None
+    ) -> float:
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** retry)
+        delay = random.uniform(0, backoff)
+
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(
+                response.headers.get("Retry-After")
+            )
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+
+        return delay
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -2,10 +2,17 @@
 
 Classes:
     ScrapedCargoesAPI: Represents Signal's Scraped Cargoes API.
+    AsyncScrapedCargoesAPI: Represents Signal's Scraped Cargoes API, accessed
+        asynchronously.
     ScrapedCargo: Scraped Cargo.
 """
 
 from .scraped_cargoes_api import ScrapedCargoesAPI
+from .async_scraped_cargoes_api import AsyncScrapedCargoesAPI
 from .models import ScrapedCargo
 
-__all__ = ["ScrapedCargoesAPI", "ScrapedCargo"]
+__all__ = [
+    "ScrapedCargoesAPI",
+    "AsyncScrapedCargoesAPI",
+    "ScrapedCargo",
+]
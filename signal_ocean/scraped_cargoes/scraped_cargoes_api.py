@@ -18,6 +18,7 @@ class ScrapedCargoesAPI(ScrapedDataAPI[ScrapedCargoesResponse, ScrapedCargo]):
 
     relative_url = "scraped-cargoes-api/v6.0/cargoes"
     response_class = ScrapedCargoesResponse
+    id_field = "cargo_id"
 
     def get_cargoes(
         self,
@@ -1 +1,15 @@
-"""Internal Scraped Data API Pagkage."""
+"""Internal Scraped Data API Pagkage.
+
+Classes:
+    ScrapedDataSync: Keeps a local copy of a scraped dataset in sync with the
+        incremental API.
+    ScrapedDataSyncResult: The changes applied by synchronizing a vessel
+        type.
+"""
+
+from .scraped_data_sync import ScrapedDataSync, ScrapedDataSyncResult
+
+__all__ = [
+    "ScrapedDataSync",
+    "ScrapedDataSyncResult",
+]
@@ -0,0 +1,174 @@
+"""Base asynchronous Scraped Data API class."""
+
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from signal_ocean.async_connection import AsyncConnection
+from signal_ocean.scraped_data.scraped_data_api import (
+    IncrementalDataResponse,
+    ScrapedDataAPI,
+    ScrapedDataPage,
+    TRecord,
+    TResponse,
+    _build_endpoint,
+)
+from signal_ocean.util.async_request_helpers import get_single
+
+
+class AsyncScrapedDataAPI(Generic[TResponse, TRecord]):
+    """Base class for asynchronous Scraped Data API classes.
+
+    Mirrors `ScrapedDataAPI`, building the same endpoints and returning the
+    same models, with the retrieval methods implemented as coroutines.
+    """
+
+    page_size: int = ScrapedDataAPI.page_size
+    endpoints: Dict[str, str] = ScrapedDataAPI.endpoints
+    relative_url: str
+    response_class: Type[TResponse]
+
+    def __init__(self, connection: Optional[AsyncConnection] = None):
+        """Initializes the asynchronous Scraped Data API.
+
+        Args:
+            connection: API connection configuration.
+                If not provided, the default connection method is used.
+        """
+        self.__connection = connection or AsyncConnection()
+
+    def _get_endpoint(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """Generates the endpoint to call to retrieve requested scraped data.
+
+        Args:
+            endpoint: Define endpoint to use. It could be either by filters or
+                by page token.
+            params: Return scraped data by provided parameters.
+
+        Returns:
+            The endpoint to call in order to retrieve the scraped data
+            for provided parameters.
+        """
+        return _build_endpoint(
+            self.relative_url + self.endpoints[endpoint], params
+        )
+
+    async def iter_pages(
+        self, incremental: bool = False, **params: Any
+    ) -> AsyncIterator[ScrapedDataPage[TRecord]]:
+        """Lazily retrieves scraped data page by page.
+
+        See `ScrapedDataAPI.iter_pages`.
+
+        Args:
+            incremental: Whether to retrieve data from the incremental
+                endpoint.
+            params: Return scraped data by provided parameters.
+                Parameters are specified by outer functions.
+
+        Yields:
+            ScrapedDataPage objects in the order returned by the API.
+        """
+        endpoint = "incremental" if incremental else "page_size"
+        params = dict(params)
+        while True:
+            request_url: str = self._get_endpoint(endpoint, params)
+
+            response: Optional[TResponse] = await get_single(
+                self.__connection, request_url, self.response_class
+            )
+
+            page = ScrapedDataPage[TRecord](
+                data=tuple(response.data or ()) if response else (),
+                page_token=params.get("page_token"),
+                next_page_token=(
+                    response.next_page_token if response else None
+                ),
+                next_request_token=(
+                    response.next_request_token if response else None
+                ),
+            )
+            yield page
+
+            if page.next_page_token is None:
+                break
+            params["page_token"] = page.next_page_token
+
+    async def iter_data(
+        self, incremental: bool = False, **params: Any
+    ) -> AsyncIterator[TRecord]:
+        """Lazily retrieves scraped data record by record.
+
+        Args:
+            incremental: Whether to retrieve data from the incremental
+                endpoint.
+            params: Return scraped data by provided parameters.
+                Parameters are specified by outer functions.
+
+        Yields:
+            ScrapedData objects, as defined by the outer class.
+        """
+        async for page in self.iter_pages(incremental, **params):
+            for record in page.data:
+                yield record
+
+    async def get_data(self, **params: Any) -> Tuple[TRecord, ...]:
+        """Collects and returns scraped data by given filters.
+
+        Args:
+            params: Return scraped data by provided parameters.
+                Parameters are specified by outer functions.
+
+        Returns:
+            A tuple containing ScrapedData objects.
+            ScrapedData object are defined by outer class.
+        """
+        return tuple([record async for record in self.iter_data(**params)])
+
+    async def get_data_incremental(
+        self, **params: Any
+    ) -> IncrementalDataResponse[TRecord]:
+        """Returns scraped data and next request token by given filters.
+
+        Args:
+            params: Return scraped data by provided parameters.
+                Parameters are specified by outer functions.
+
+        Returns:
+            A tuple of ScrapedData objects and the NextRequestToken.
+        """
+        data: List[TRecord] = []
+        results = IncrementalDataResponse[TRecord]()
+        async for page in self.iter_pages(incremental=True, **params):
+            data.extend(page.data)
+            results.next_request_token = page.next_request_token
+
+        results.data = tuple(data)
+        return results
+
+    async def get_data_incremental_token(
+        self, updated_date_from: datetime
+    ) -> Optional[str]:
+        """Returns a token to use in the incremental data endpoints.
+
+        Args:
+            updated_date_from: Format - date-time (as date-time in RFC3339).
+                Earliest date the data was updated.
+
+        Returns:
+            A string containing the corresponding page token to
+            the provided datetime input.
+        """
+        request_url: str = self._get_endpoint(
+            "incremental_token", {"updated_date_from": updated_date_from}
+        )
+
+        return await get_single(self.__connection, request_url, str)
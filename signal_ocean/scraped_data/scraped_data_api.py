@@ -1,13 +1,23 @@
 """Base Scraped Data API class."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import (
-    Optional, List, Dict, Tuple, Type, Any, Generic, TypeVar)
+    Optional, List, Dict, Tuple, Type, Any, Callable, Generic, Iterator,
+    TypeVar, get_type_hints)
+
+import pandas as pd
 
 from signal_ocean._internals import format_iso_datetime
 from signal_ocean.connection import Connection
+from signal_ocean.util.frame_helpers import FrameBuilder, get_field
 from signal_ocean.util.parsing_helpers import _to_camel_case
-from signal_ocean.util.request_helpers import get_single
+from signal_ocean.util.request_helpers import (
+    PageRequest,
+    get_json_pages,
+    get_pages,
+    get_single,
+)
 
 TRecord = TypeVar("TRecord")
 
@@ -27,9 +37,50 @@ class IncrementalDataResponse(Generic[TRecord]):
     next_request_token: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class ScrapedDataPage(Generic[TRecord]):
+    """A single page of scraped data, along with its paging tokens.
+
+    Attributes:
+        data: The records contained in the page.
+        page_token: The token used to request the page. None for the first
+            page of a retrieval started without a token.
+        next_page_token: The token of the following page. None if this is
+            the last page.
+        next_request_token: Populated on the last page of incremental
+            results and should be used in the next incremental request.
+    """
+
+    data: Tuple[TRecord, ...]
+    page_token: Optional[str] = None
+    next_page_token: Optional[str] = None
+    next_request_token: Optional[str] = None
+
+
 TResponse = TypeVar("TResponse", bound=ScrapedDataResponse[Any])
 
 
+def _build_endpoint(url: str, params: Dict[str, Any]) -> str:
+    for param, value in params.items():
+        if value:
+            if isinstance(value, str):
+                pass
+            elif isinstance(value, List):
+                value = ",".join(map(str, value))
+            elif isinstance(value, datetime):
+                value = format_iso_datetime(value)
+            else:
+                value = str(value)
+
+            url += (
+                ("" if url[-1] == "?" else "&")
+                + _to_camel_case(param)
+                + "="
+                + value
+            )
+    return url
+
+
 class ScrapedDataAPI(Generic[TResponse, TRecord]):
     """Base class for Scraped Data API classes."""
 
@@ -41,6 +92,7 @@ class ScrapedDataAPI(Generic[TResponse, TRecord]):
     }
     relative_url: str
     response_class: Type[TResponse]
+    id_field: str
 
     def __init__(self, connection: Optional[Connection] = None):
         """Initializes the Scraped Data API.
@@ -63,26 +115,93 @@ class ScrapedDataAPI(Generic[TResponse, TRecord]):
             The endpoint to call in order to retrieve the scraped data
             for provided parameters.
         """
-        url = self.relative_url + self.endpoints[endpoint]
-
-        for param, value in params.items():
-            if value:
-                if isinstance(value, str):
-                    pass
-                elif isinstance(value, List):
-                    value = ",".join(map(str, value))
-                elif isinstance(value, datetime):
-                    value = format_iso_datetime(value)
-                else:
-                    value = str(value)
-
-                url += (
-                    ("" if url[-1] == "?" else "&")
-                    + _to_camel_case(param)
-                    + "="
-                    + value
-                )
-        return url
+        return _build_endpoint(
+            self.relative_url + self.endpoints[endpoint], params
+        )
+
+    def __page_request_factory(
+            self,
+            incremental: bool,
+            params: Dict[str, Any],
+    ) -> Callable[[Optional[str]], PageRequest]:
+        endpoint = "incremental" if incremental else "page_size"
+
+        def get_page_request(token: Optional[str]) -> PageRequest:
+            return self._get_endpoint(
+                endpoint, {**params, "page_token": token}
+            ), None
+
+        return get_page_request
+
+    def iter_pages(
+            self,
+            incremental: bool = False,
+            prefetch: bool = False,
+            **params: Any,
+    ) -> Iterator[ScrapedDataPage[TRecord]]:
+        """Lazily retrieves scraped data page by page.
+
+        At most one page beyond the one being consumed is held in memory, so
+        memory use does not grow with the size of the result. The tokens of
+        every page are exposed so that callers can checkpoint and resume an
+        interrupted retrieval by passing a page's token as `page_token`.
+
+        Args:
+            incremental: Whether to retrieve data from the incremental
+                endpoint.
+            prefetch: Whether to request the next page in the background
+                while the current one is being consumed. If False, each page
+                is requested only when the previous one has been consumed.
+            params: Return scraped data by provided parameters.
+                Parameters are specified by outer functions.
+
+        Yields:
+            ScrapedDataPage objects in the order returned by the API.
+        """
+        get_page_request = self.__page_request_factory(incremental, params)
+        page_token: Optional[str] = params.get("page_token")
+        for response in get_pages(
+            self.__connection,
+            self.response_class,
+            get_page_request,
+            page_token,
+            prefetch=prefetch,
+        ):
+            page = ScrapedDataPage[TRecord](
+                data=tuple(response.data or ()) if response else (),
+                page_token=page_token,
+                next_page_token=response.next_page_token if response else None,
+                next_request_token=(
+                    response.next_request_token if response else None
+                ),
+            )
+            yield page
+            page_token = page.next_page_token
+
+    def iter_data(
+            self,
+            incremental: bool = False,
+            prefetch: bool = False,
+            **params: Any,
+    ) -> Iterator[TRecord]:
+        """Lazily retrieves scraped data record by record.
+
+        Records are yielded as soon as their page arrives; see `iter_pages`
+        for access to the page tokens.
+
+        Args:
+            incremental: Whether to retrieve data from the incremental
+                endpoint.
+            prefetch: Whether to request the next page in the background
+                while the current one is being consumed.
+            params: Return scraped data by provided parameters.
+                Parameters are specified by outer functions.
+
+        Yields:
+            ScrapedData objects, as defined by the outer class.
+        """
+        for page in self.iter_pages(incremental, prefetch, **params):
+            yield from page.data
 
     def get_data(self, **params: Any) -> Tuple[TRecord, ...]:
         """This function collects and returns scraped data by given filters.
@@ -95,24 +214,62 @@ class ScrapedDataAPI(Generic[TResponse, TRecord]):
             A tuple containing ScrapedData objects.
             ScrapedData object are defined by outer class.
         """
-        results: List[TRecord] = []
-        while True:
-            request_url: str = self._get_endpoint("page_size", params)
+        return tuple(self.iter_data(**params))
 
-            response: Optional[TResponse] = get_single(
-                self.__connection, request_url, self.response_class
-            )
+    def get_data_frame(
+            self,
+            incremental: bool = False,
+            prefetch: bool = False,
+            **params: Any,
+    ) -> pd.DataFrame:
+        """Collects scraped data by given filters into a data frame.
 
-            if response is not None and response.data is not None:
-                results.extend(response.data)
-            params["page_token"] = (
-                response.next_page_token if response is not None else None
-            )
+        Records are decoded from each page straight into typed columns,
+        without creating a ScrapedData object per record, which makes this
+        considerably faster and lighter on memory than building a data
+        frame out of the result of `get_data`. Fields holding nested objects
+        are flattened into prefixed columns and fields holding sequences are
+        not included.
+
+        Args:
+            incremental: Whether to retrieve data from the incremental
+                endpoint.
+            prefetch: Whether to request the next page in the background
+                while the current one is being decoded.
+            params: Return scraped data by provided parameters.
+                Parameters are specified by outer functions.
+
+        Returns:
+            A data frame with a column per field of the ScrapedData objects
+            defined by the outer class and a row per record.
+        """
+        builder = FrameBuilder(self._get_record_class())
+        for page in self._iter_json_pages(incremental, prefetch, **params):
+            builder.add(get_field(page, "data"))
 
-            if params["page_token"] is None:
-                break
+        return builder.to_frame()
+
+    def _iter_json_pages(
+            self,
+            incremental: bool = False,
+            prefetch: bool = False,
+            **params: Any,
+    ) -> Iterator[Any]:
+        return get_json_pages(
+            self.__connection,
+            self.__page_request_factory(incremental, params),
+            params.get("page_token"),
+            prefetch=prefetch,
+        )
 
-        return tuple(results)
+    def _get_record_class(self) -> Type[Any]:
+        data_type = get_type_hints(self.response_class)["data"]
+        # Optional[Tuple[TRecord, ...]]
+        tuple_type = next(
+            t for t in data_type.__args__ if t is not type(None)
+        )
+        record_class: Type[Any] = tuple_type.__args__[0]
+        return record_class
 
     def get_data_incremental(
             self,
@@ -132,27 +289,11 @@ class ScrapedDataAPI(Generic[TResponse, TRecord]):
         """
         data: List[TRecord] = []
         results = IncrementalDataResponse[TRecord]()
-        while True:
-            request_url: str = self._get_endpoint("incremental", params)
-
-            response: Optional[TResponse] = get_single(
-                self.__connection, request_url, self.response_class
-            )
-
-            if response is not None and response.data is not None:
-                data.extend(response.data)
-            params["page_token"] = (
-                response.next_page_token if response is not None else None
-            )
-
-            if params["page_token"] is None:
-                results.data = tuple(data)
-                results.next_request_token = (
-                    response.next_request_token
-                    if response is not None else None
-                )
-                break
+        for page in self.iter_pages(incremental=True, **params):
+            data.extend(page.data)
+            results.next_request_token = page.next_request_token
 
+        results.data = tuple(data)
         return results
 
     def get_data_incremental_token(
@@ -0,0 +1,354 @@
+"""Keeps a local copy of scraped data in sync with the incremental API."""
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from threading import Lock
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import pandas as pd
+
+from signal_ocean.scraped_data.scraped_data_api import (
+    ScrapedDataAPI,
+    TRecord,
+    TResponse,
+)
+from signal_ocean.util.chunked_retrieval import fetch_chunks
+from signal_ocean.util.frame_helpers import get_field, records_to_frame
+from signal_ocean.util.parsing_helpers import parse_model
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    vessel_type INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    imo INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (vessel_type, id)
+);
+CREATE INDEX IF NOT EXISTS records_imo ON records (imo);
+CREATE TABLE IF NOT EXISTS tokens (
+    vessel_type INTEGER PRIMARY KEY,
+    page_token TEXT,
+    request_token TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_RELATIVE_URL = "relative_url"
+
+
+@dataclass(frozen=True)
+class ScrapedDataSyncResult:
+    """Describes the changes applied by synchronizing a vessel type.
+
+    Attributes:
+        updated: The number of records added or updated.
+        deleted: The number of records deleted.
+        pages: The number of pages retrieved.
+    """
+
+    updated: int = 0
+    deleted: int = 0
+    pages: int = 0
+
+
+class ScrapedDataSync(Generic[TResponse, TRecord]):
+    """Keeps a local copy of a scraped dataset in sync with the API.
+
+    Works with any Scraped Data API, i.e. fixtures, cargoes, lineups and
+    positions. Records are stored in an SQLite database keyed by vessel type
+    and by their ID, e.g. `fixture_id` for fixtures, along with the
+    incremental token of each vessel type. Each synchronization therefore
+    downloads only the records updated since the previous one, and records
+    marked as deleted are removed. Queries are served from disk.
+
+    The token is checkpointed after every page, in the same transaction as
+    the page's records, so an interrupted synchronization continues from the
+    first page that was not applied.
+    """
+
+    def __init__(
+        self,
+        api: ScrapedDataAPI[TResponse, TRecord],
+        path: str,
+        vessel_types: Sequence[int],
+        updated_date_from: Optional[datetime] = None,
+        **params: Any,
+    ):
+        """Opens or creates the local copy of a scraped dataset.
+
+        Args:
+            api: The Scraped Data API to synchronize with, e.g.
+                `ScrapedFixturesAPI`.
+            path: The path of the SQLite database holding the records. It is
+                created if it does not exist.
+            vessel_types: The vessel types to synchronize. Available values
+                Tanker = 1, Dry = 3, Container = 4, Lng = 5, Lpg = 6
+            updated_date_from: Earliest date of the records retrieved by the
+                first synchronization of a vessel type. If None, all records
+                are retrieved.
+            params: Additional parameters of the incremental requests, e.g.
+                `include_content=False`.
+
+        Raises:
+            ValueError: The database holds the records of a different API.
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.__api = api
+        self.__vessel_types = tuple(vessel_types)
+        self.__updated_date_from = updated_date_from
+        self.__params = params
+        self.__record_class = api._get_record_class()
+        self.__lock = Lock()
+        self.__db = sqlite3.connect(path, check_same_thread=False)
+        with self.__db:
+            self.__db.executescript(_SCHEMA)
+            row = self.__db.execute(
+                "SELECT value FROM sync_state WHERE name = ?",
+                (_RELATIVE_URL,),
+            ).fetchone()
+            if row is None:
+                self.__db.execute(
+                    "INSERT INTO sync_state VALUES (?, ?)",
+                    (_RELATIVE_URL, api.relative_url),
+                )
+
+        if row is not None and row[0] != api.relative_url:
+            self.__db.close()
+            raise ValueError(
+                f"The database holds the records of {row[0]}, not of "
+                f"{api.relative_url}."
+            )
+
+    def sync(self, max_workers: int = 1) -> Dict[int, ScrapedDataSyncResult]:
+        """Downloads and applies the changes since the last synchronization.
+
+        Args:
+            max_workers: The maximum number of vessel types synchronized at
+                the same time. Should not exceed the pool size of the API's
+                connection.
+
+        Returns:
+            The changes applied for each vessel type.
+
+        Raises:
+            ChunkRetrievalError: Some vessel types could not be synchronized.
+                The changes applied up to the failure are kept; calling its
+                `retry` method synchronizes only the failed vessel types
+                again.
+        """
+        return fetch_chunks(
+            self.__vessel_types,
+            self.__sync_vessel_type,
+            partial(_by_vessel_type, self.__vessel_types),
+            max_workers,
+        )
+
+    def get_request_token(self, vessel_type: int) -> Optional[str]:
+        """Gets the token of the next incremental request of a vessel type.
+
+        Args:
+            vessel_type: The vessel type.
+
+        Returns:
+            The token, or None if the vessel type was never synchronized.
+        """
+        return self.__get_tokens(vessel_type)[1]
+
+    def get_record(
+        self, record_id: int, vessel_type: Optional[int] = None
+    ) -> Optional[TRecord]:
+        """Reads a record from the local copy.
+
+        Args:
+            record_id: The ID of the record, e.g. its `fixture_id`.
+            vessel_type: The vessel type of the record. If None, records of
+                all synchronized vessel types are considered.
+
+        Returns:
+            The record, or None if it is not in the local copy.
+        """
+        records = tuple(
+            self.__iter_data(vessel_type, None, record_id=record_id)
+        )
+        return self.__parse(records[0]) if records else None
+
+    def get_records(
+        self,
+        vessel_type: Optional[int] = None,
+        imos: Optional[Sequence[int]] = None,
+    ) -> Tuple[TRecord, ...]:
+        """Reads records from the local copy.
+
+        Args:
+            vessel_type: Return only records of the provided vessel type. If
+                None, records of all synchronized vessel types are returned.
+            imos: Return only records for the provided vessel IMOs.
+
+        Returns:
+            The records, ordered by vessel type and ID.
+        """
+        return tuple(
+            self.__parse(data) for data in self.__iter_data(vessel_type, imos)
+        )
+
+    def get_data_frame(
+        self,
+        vessel_type: Optional[int] = None,
+        imos: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """Reads records from the local copy into a data frame.
+
+        Records are decoded straight into typed columns, as done by
+        `ScrapedDataAPI.get_data_frame`.
+
+        Args:
+            vessel_type: Return only records of the provided vessel type. If
+                None, records of all synchronized vessel types are returned.
+            imos: Return only records for the provided vessel IMOs.
+
+        Returns:
+            A data frame with a row per record, ordered by vessel type and
+            ID.
+        """
+        return records_to_frame(
+            (json.loads(data) for data in self.__iter_data(vessel_type, imos)),
+            self.__record_class,
+        )
+
+    def __len__(self) -> int:  # noqa: D105
+        with self.__lock:
+            (count,) = self.__db.execute(
+                "SELECT COUNT(*) FROM records"
+            ).fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Closes the underlying database."""
+        with self.__lock:
+            self.__db.close()
+
+    def __enter__(self) -> "ScrapedDataSync[TResponse, TRecord]":  # noqa: D105
+        return self
+
+    def __exit__(self, *_: Any) -> None:  # noqa: D105
+        self.close()
+
+    def __sync_vessel_type(self, vessel_type: int) -> ScrapedDataSyncResult:
+        page_token, request_token = self.__get_tokens(vessel_type)
+        token = page_token or request_token
+        if token is None and self.__updated_date_from is not None:
+            token = self.__api.get_data_incremental_token(
+                self.__updated_date_from
+            )
+
+        updated = deleted = pages = 0
+        for page in self.__api._iter_json_pages(
+            incremental=True,
+            **self.__params,
+            vessel_type=vessel_type,
+            page_token=token,
+        ):
+            pages += 1
+            upserts: List[Tuple[int, int, Any, str]] = []
+            deletes: List[Tuple[int, Any]] = []
+            for record in get_field(page, "data") or ():
+                record_id = get_field(record, self.__api.id_field)
+                if get_field(record, "is_deleted"):
+                    deletes.append((vessel_type, record_id))
+                else:
+                    upserts.append(
+                        (
+                            vessel_type,
+                            record_id,
+                            get_field(record, "imo"),
+                            json.dumps(record),
+                        )
+                    )
+
+            next_page_token = get_field(page, "next_page_token")
+            if next_page_token is None:
+                request_token = (
+                    get_field(page, "next_request_token") or request_token
+                )
+
+            with self.__lock, self.__db:
+                self.__db.executemany(
+                    "DELETE FROM records WHERE vessel_type = ? AND id = ?",
+                    deletes,
+                )
+                self.__db.executemany(
+                    "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?)",
+                    upserts,
+                )
+                self.__db.execute(
+                    "INSERT OR REPLACE INTO tokens VALUES (?, ?, ?)",
+                    (vessel_type, next_page_token, request_token),
+                )
+            updated += len(upserts)
+            deleted += len(deletes)
+
+        return ScrapedDataSyncResult(updated, deleted, pages)
+
+    def __get_tokens(
+        self, vessel_type: int
+    ) -> Tuple[Optional[str], Optional[str]]:
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT page_token, request_token FROM tokens "
+                "WHERE vessel_type = ?",
+                (vessel_type,),
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def __iter_data(
+        self,
+        vessel_type: Optional[int],
+        imos: Optional[Sequence[int]],
+        record_id: Optional[int] = None,
+    ) -> Iterator[str]:
+        conditions = []
+        args: List[Any] = []
+        if vessel_type is not None:
+            conditions.append("vessel_type = ?")
+            args.append(vessel_type)
+        if imos is not None:
+            conditions.append(f"imo IN ({', '.join('?' * len(imos))})")
+            args.extend(imos)
+        if record_id is not None:
+            conditions.append("id = ?")
+            args.append(record_id)
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        with self.__lock:
+            rows = self.__db.execute(
+                f"SELECT data FROM records {where}ORDER BY vessel_type, id",
+                args,
+            ).fetchall()
+        return (data for (data,) in rows)
+
+    def __parse(self, data: str) -> TRecord:
+        record: TRecord = parse_model(json.loads(data), self.__record_class)
+        return record
+
+
+def _by_vessel_type(
+    vessel_types: Sequence[int], results: List[ScrapedDataSyncResult]
+) -> Dict[int, ScrapedDataSyncResult]:
+    return dict(zip(vessel_types, results))
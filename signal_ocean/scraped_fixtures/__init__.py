@@ -2,10 +2,17 @@
 
 Classes:
     ScrapedFixturesAPI: Represents Signal's Scraped Fixtures API.
+    AsyncScrapedFixturesAPI: Represents Signal's Scraped Fixtures API, accessed
+        asynchronously.
     ScrapedFixture: Scraped Fixture.
 """
 
 from .scraped_fixtures_api import ScrapedFixturesAPI
+from .async_scraped_fixtures_api import AsyncScrapedFixturesAPI
 from .models import ScrapedFixture
 
-__all__ = ["ScrapedFixturesAPI", "ScrapedFixture"]
+__all__ = [
+    "ScrapedFixturesAPI",
+    "AsyncScrapedFixturesAPI",
+    "ScrapedFixture",
+]
@@ -20,6 +20,7 @@ class ScrapedFixturesAPI(
 
     relative_url = "scraped-fixtures-api/v6.0/fixtures"
     response_class = ScrapedFixturesResponse
+    id_field = "fixture_id"
 
     def get_fixtures(
         self,
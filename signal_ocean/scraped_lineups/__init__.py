@@ -2,10 +2,17 @@
 
 Classes:
     ScrapedLineupsAPI: Represents Signal's Scraped Lineups API.
+    AsyncScrapedLineupsAPI: Represents Signal's Scraped Lineups API, accessed
+        asynchronously.
     ScrapedLineup: Scraped Lineup.
 """
 
 from .scraped_lineups_api import ScrapedLineupsAPI
+from .async_scraped_lineups_api import AsyncScrapedLineupsAPI
 from .models import ScrapedLineup
 
-__all__ = ["ScrapedLineupsAPI", "ScrapedLineup"]
+__all__ = [
+    "ScrapedLineupsAPI",
+    "AsyncScrapedLineupsAPI",
+    "ScrapedLineup",
+]
@@ -18,6 +18,7 @@ class ScrapedLineupsAPI(ScrapedDataAPI[ScrapedLineupsResponse, ScrapedLineup]):
 
     relative_url = "scraped-lineups-api/v6.0/lineups"
     response_class = ScrapedLineupsResponse
+    id_field = "lineup_id"
 
     def get_lineups(
         self,
@@ -2,10 +2,17 @@
 
 Classes:
     ScrapedPositionsAPI: Represents Signal's Scraped Positions API.
+    AsyncScrapedPositionsAPI: Represents Signal's Scraped Positions API,
+        accessed asynchronously.
     ScrapedPosition: Scraped Position.
 """
 
 from .scraped_positions_api import ScrapedPositionsAPI
+from .async_scraped_positions_api import AsyncScrapedPositionsAPI
 from .models import ScrapedPosition
 
-__all__ = ["ScrapedPositionsAPI", "ScrapedPosition"]
+__all__ = [
+    "ScrapedPositionsAPI",
+    "AsyncScrapedPositionsAPI",
+    "ScrapedPosition",
+]
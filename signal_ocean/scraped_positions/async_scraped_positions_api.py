@@ -0,0 +1,180 @@
+"""Asynchronous Scraped Positions API."""
+
+from datetime import datetime
+from typing import Optional, List, Tuple
+
+from signal_ocean.scraped_data.async_scraped_data_api import (
+    AsyncScrapedDataAPI,
+)
+from signal_ocean.scraped_data.scraped_data_api import (
+    IncrementalDataResponse,
+)
+from signal_ocean.scraped_positions.models import (
+    ScrapedPosition,
+    ScrapedPositionsResponse,
+)
+
+
+class AsyncScrapedPositionsAPI(
+    AsyncScrapedDataAPI[ScrapedPositionsResponse, ScrapedPosition]
+):
+    """Represents Signal's Scraped Positions API, accessed asynchronously.
+
+    Mirrors `ScrapedPositionsAPI`, returning the same models from coroutines.
+    """
+
+    relative_url = "scraped-positions-api/v6.0/positions"
+    response_class = ScrapedPositionsResponse
+
+    async def get_positions(
+        self,
+        vessel_type: int,
+        position_ids: Optional[List[int]] = None,
+        message_ids: Optional[List[int]] = None,
+        external_message_ids: Optional[List[str]] = None,
+        received_date_from: Optional[datetime] = None,
+        received_date_to: Optional[datetime] = None,
+        updated_date_from: Optional[datetime] = None,
+        updated_date_to: Optional[datetime] = None,
+        imos: Optional[List[int]] = None,
+        include_details: Optional[bool] = True,
+        include_scraped_fields: Optional[bool] = True,
+        include_vessel_details: Optional[bool] = True,
+        include_labels: Optional[bool] = True,
+        include_content: Optional[bool] = True,
+        include_sender: Optional[bool] = True,
+        include_debug_info: Optional[bool] = True,
+    ) -> Tuple[ScrapedPosition, ...]:
+        """Collects and returns the positions by the given filters.
+
+        Args:
+            vessel_type: Format - int32. Available values
+                Tanker = 1, Dry = 3, Container = 4, Lng = 5, Lpg = 6
+            position_ids: List - Comma separated list of PositionIDs
+            message_ids: List - Comma separated list of MessageIDs
+            external_message_ids: List - Comma separated list of
+                ExternalMessageIDs
+            received_date_from: Format - date-time (as date-time in RFC3339).
+                Earliest date the position received.
+                Cannot be combined with 'Updated' dates
+            received_date_to: Format - date-time (as date-time in RFC3339).
+                Latest date the position received.
+                Cannot be combined with 'Updated' dates
+            updated_date_from: Format - date-time (as date-time in RFC3339).
+                Earliest date the position updated.
+                Cannot be combined with 'Received' dates
+            updated_date_to: Format - date-time (as date-time in RFC3339).
+                Latest date the position updated.
+                Cannot be combined with 'Received' dates
+            imos: List - Comma separated list of IMOs
+            include_details: Boolean - Whether to include
+                additional position details in the response.
+            include_scraped_fields: Boolean - Whether to include the relative
+                scraped fields in the response.
+            include_vessel_details: Boolean - Whether to include some vessel
+                details in the response.
+            include_labels: Boolean - Whether to include the relative labels in
+                the response.
+            include_content: Boolean - Whether to include the original message
+                line (untouched) in the response.
+            include_sender: Boolean - Whether to include some of the message
+                sender details in the response.
+            include_debug_info: Boolean - Whether to include some information
+                about the distribution of the position in the response.
+
+        Returns:
+            An Iterable of ScrapedPosition objects, as we have defined in
+            models.py Python file.
+        """
+        return await self.get_data(
+            vessel_type=vessel_type,
+            position_ids=position_ids,
+            message_ids=message_ids,
+            external_message_ids=external_message_ids,
+            received_date_from=received_date_from,
+            received_date_to=received_date_to,
+            updated_date_from=updated_date_from,
+            updated_date_to=updated_date_to,
+            imos=imos,
+            include_details=include_details,
+            include_scraped_fields=include_scraped_fields,
+            include_vessel_details=include_vessel_details,
+            include_labels=include_labels,
+            include_content=include_content,
+            include_sender=include_sender,
+            include_debug_info=include_debug_info,
+        )
+
+    async def get_positions_incremental(
+            self,
+            vessel_type: int,
+            page_token: Optional[str] = None,
+            include_details: Optional[bool] = True,
+            include_scraped_fields: Optional[bool] = True,
+            include_vessel_details: Optional[bool] = True,
+            include_labels: Optional[bool] = True,
+            include_content: Optional[bool] = True,
+            include_sender: Optional[bool] = True,
+            include_debug_info: Optional[bool] = True,
+    ) -> IncrementalDataResponse[ScrapedPosition]:
+        """This function collects and returns positions.
+
+           Specifically, all the positions updated after the given page token.
+           If page token is nullable, function will return all positions.
+
+        Args:
+            vessel_type: Format - int32. Available values
+                Tanker = 1, Dry = 3, Container = 4, Lng = 5, Lpg = 6
+            page_token: String. The key that should be used as a parameter of
+                the token to retrieve the relevant page.
+            include_details: Boolean - Whether to include
+                additional position details in the response.
+            include_scraped_fields: Boolean - Whether to include the relative
+                scraped fields in the response.
+            include_vessel_details: Boolean - Whether to include some vessel
+                details in the response.
+            include_labels: Boolean - Whether to include the relative labels in
+                the response.
+            include_content: Boolean - Whether to include the original message
+                line (untouched) in the response.
+            include_sender: Boolean - Whether to include some of the message
+                sender details in the response.
+            include_debug_info: Boolean - Whether to include some information
+                about the distribution of the position in the response.
+
+        Returns:
+            A dictionary containing a tuple of ScrapedPosition objects and
+            NextRequestToken.
+            ScrapedPosition object is defined in models.py Python file.
+            Next Request Token is used as page_token.
+        """
+        return await self.get_data_incremental(
+            vessel_type=vessel_type,
+            page_token=page_token,
+            include_details=include_details,
+            include_scraped_fields=include_scraped_fields,
+            include_vessel_details=include_vessel_details,
+            include_labels=include_labels,
+            include_content=include_content,
+            include_sender=include_sender,
+            include_debug_info=include_debug_info,
+        )
+
+    async def get_positions_incremental_token(
+            self,
+            updated_date_from: datetime,
+    ) -> Optional[str]:
+        """Returns a token to use in the incremental lineups endpoint.
+
+        Args:
+            updated_date_from: Format - date-time (as date-time in RFC3339).
+                Earliest date the cargo updated.
+                Cannot be combined with 'Received' dates
+
+        Returns:
+            A string containing the corresponding page token
+            to the provided datetime input.
+        """
+        return await self.get_data_incremental_token(
+            updated_date_from=updated_date_from,
+        )
@@ -19,6 +19,7 @@ class ScrapedPositionsAPI(
 
     relative_url = "scraped-positions-api/v6.0/positions"
     response_class = ScrapedPositionsResponse
+    id_field = "position_id"
 
     def get_positions(
         self,
@@ -22,6 +22,8 @@ from .models import (
     VesselClass,
 )
 from .data_frame import Column, IndexLevel
+from .snapshots import TonnageListDiff, TonnageListSnapshots, VesselChange
+from ..util.chunked_retrieval import ChunkRetrievalError
 
 __all__ = [
     "VesselSubclass",
@@ -45,4 +47,8 @@ __all__ = [
     "VesselClass",
     "Column",
     "IndexLevel",
+    "ChunkRetrievalError",
+    "TonnageListSnapshots",
+    "TonnageListDiff",
+    "VesselChange",
 ]
@@ -1,18 +1,16 @@
 from datetime import datetime
-from typing import Any, Iterable, List, Mapping, cast
+from typing import Any, List, Mapping, cast
 
 from .models import Area, HistoricalTonnageList, TonnageList, Vessel
-from .._internals import parse_datetime
+from .._internals import index_by_imo, parse_datetime
 
 
 def to_vessel(
     pit_vessel_data: Mapping[str, Any],
-    static_vessel_data: Iterable[Mapping[str, Any]],
+    static_vessel_data: Mapping[int, Mapping[str, Any]],
 ) -> Vessel:
     imo = pit_vessel_data["imo"]
-    data_for_imo: Mapping[str, Any] = next(
-        (svd for svd in static_vessel_data if svd["imo"] == imo), {}
-    )
+    data_for_imo: Mapping[str, Any] = static_vessel_data.get(imo, {})
 
     return Vessel(
         imo,
@@ -57,7 +55,7 @@ def to_vessel(
 
 def to_tonnage_list(
     pit_data: List[Mapping[str, Any]],
-    static_vessel_data: List[Mapping[str, Any]],
+    static_vessel_data: Mapping[int, Mapping[str, Any]],
     date: datetime,
 ) -> TonnageList:
     return TonnageList(
@@ -71,13 +69,15 @@ def parse_tonnage_list_response(json: Mapping[str, Any]) -> TonnageList:
         "staticVesselData", []
     )
 
-    return to_tonnage_list(tonnage_list, static_vessel_data, datetime.utcnow())
+    return to_tonnage_list(
+        tonnage_list, index_by_imo(static_vessel_data), datetime.utcnow()
+    )
 
 
 def parse_historical_tonnage_list_response(
     json: Mapping[str, Any]
 ) -> HistoricalTonnageList:
-    static_vessel_data = json.get("staticVesselData", [])
+    static_vessel_data = index_by_imo(json.get("staticVesselData", []))
     tonnage_lists = json.get("tonnageLists", [])
 
     return HistoricalTonnageList(
@@ -1,8 +1,10 @@
 """Tonnage List API."""
 
-from typing import Optional, Tuple
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
 
 from .. import Connection
+from ..util.chunked_retrieval import fetch_chunks
 from .models import (
     DateRange,
     HistoricalTonnageList,
@@ -73,6 +75,8 @@ class TonnageListAPI:
         laycan_end_in_days: Optional[int] = None,
         date_range: Optional[DateRange] = None,
         vessel_filter: Optional[VesselFilter] = None,
+        chunk_days: int = __MAX_DATE_RANGE_DAYS,
+        max_workers: int = 1,
     ) -> HistoricalTonnageList:
         """Retrieves a historical tonnage list.
 
@@ -91,29 +95,51 @@ class TonnageListAPI:
                 lists.
             vessel_filter: A filter defining which vessels should be included
                 in the response. See `VesselFilter` class for details.
+            chunk_days: The number of days requested at once. Date ranges
+                longer than this are split into chunks, each retrieved with
+                a separate request. Cannot exceed 365 days.
+            max_workers: The maximum number of chunks retrieved at the same
+                time. If 1, chunks are retrieved one after another. Should
+                not exceed the pool size of the connection.
 
         Returns:
             Given a time-range, returns a `HistoricalTonnageList` containing a
-            `TonnageList` for every day between the start and end dates.
+            `TonnageList` for every day between the start and end dates, in
+            chronological order.
+
+        Raises:
+            requests.HTTPError: A chunk could not be retrieved, when chunks
+                are retrieved one after another. The remaining chunks are
+                not requested.
+            ChunkRetrievalError: Some chunks could not be retrieved, when
+                chunks are retrieved concurrently. Calling its `retry`
+                method retrieves only the failed chunks again and returns
+                the complete `HistoricalTonnageList`.
         """
+        if not 1 <= chunk_days <= TonnageListAPI.__MAX_DATE_RANGE_DAYS:
+            raise ValueError(
+                "chunk_days must be between 1 and "
+                f"{TonnageListAPI.__MAX_DATE_RANGE_DAYS}."
+            )
+
         date_ranges = (date_range or DateRange(start=None, end=None))._split(
-            TonnageListAPI.__MAX_DATE_RANGE_DAYS
+            chunk_days
         )
 
-        tonnage_lists = (
-            tonnage_list
-            for dr in date_ranges
-            for tonnage_list in self._get_htl_chunk(
+        return fetch_chunks(
+            list(date_ranges),
+            partial(
+                self._get_htl_chunk,
                 loading_port,
                 vessel_class,
-                dr,
-                laycan_end_in_days,
-                vessel_filter,
-            )
+                laycan_end_in_days=laycan_end_in_days,
+                vessel_filter=vessel_filter,
+            ),
+            _combine_chunks,
+            max_workers,
+            raise_first_error=True,
         )
 
-        return HistoricalTonnageList(tonnage_lists)
-
     def _get_htl_chunk(
         self,
         loading_port: Port,
@@ -180,3 +206,11 @@ class TonnageListAPI:
         class_filter = class_filter or VesselClassFilter()
 
         return tuple(class_filter._apply(classes))
+
+
+def _combine_chunks(
+    chunks: List[Iterable[TonnageList]],
+) -> HistoricalTonnageList:
+    return HistoricalTonnageList(
+        tonnage_list for chunk in chunks for tonnage_list in chunk
+    )
@@ -51,6 +51,39 @@ DataFrameRow = Tuple[
 ]
 
 
+_vessel_attributes = (
+    "name",
+    "vessel_class",
+    "ice_class",
+    "year_built",
+    "deadweight",
+    "length_overall",
+    "breadth_extreme",
+    "subclass",
+    "market_deployment",
+    "push_type",
+    "open_port_id",
+    "open_port",
+    "open_date",
+    "operational_status",
+    "commercial_operator_id",
+    "commercial_operator",
+    "commercial_status",
+    "eta",
+    "latest_ais",
+    "open_prediction_accuracy",
+    "open_country",
+    "open_narrow_area",
+    "open_wide_area",
+    "availability_port_type",
+    "availability_date_type",
+    "fixture_type",
+    "current_vessel_sub_type_id",
+    "current_vessel_sub_type",
+    "willing_to_switch_current_vessel_sub_type",
+)
+
+
 class Column(metaclass=IterableConstants):
     """Contains constants for data frame column names."""
 
@@ -221,6 +254,10 @@ class Column(metaclass=IterableConstants):
             willing_to_switch_current_vessel_sub_type
         )
 
+    @staticmethod
+    def _get_vessel_attributes() -> Tuple[str, ...]:
+        return _vessel_attributes
+
     @staticmethod
     def _get_data_types() -> Dict[str, str]:
         return _data_types
@@ -22,6 +22,7 @@ from .._internals import (
     format_iso_date,
     contains_caseless,
 )
+from ..util.frame_helpers import tonnage_lists_to_frame
 
 
 class LocationTaxonomy(metaclass=IterableConstants):
@@ -727,19 +728,10 @@ class HistoricalTonnageList(Sequence[TonnageList]):
 
     def to_data_frame(self) -> pd.DataFrame:
         """Converts the Historical Tonnage List to a pandas data frame."""
-        index_tuples = []
-        data = []
-        for tonnage_list in self.tonnage_lists:
-            for vessel in tonnage_list.vessels:
-                index_tuples.append((tonnage_list.date, vessel.imo))
-                data.append(vessel._to_data_frame_row())
-
-        data_frame = pd.DataFrame(
-            data,
-            index=pd.MultiIndex.from_tuples(
-                index_tuples, names=[IndexLevel.DATE, IndexLevel.IMO]
-            ),
-            columns=list(Column),
+        return tonnage_lists_to_frame(
+            self.tonnage_lists,
+            dict(zip(Column, Column._get_vessel_attributes())),
+            Column._get_data_types(),
+            IndexLevel.DATE,
+            IndexLevel.IMO,
         )
-
-        return data_frame.astype(Column._get_data_types())  # type: ignore
@@ -0,0 +1,216 @@
+"""Tracks successive tonnage lists and the changes between them."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .data_frame import Column, DataFrameRow
+from .models import TonnageList, Vessel
+
+_COLUMNS = tuple(Column)
+
+
+@dataclass(frozen=True, eq=False)
+class VesselChange:
+    """A vessel whose data changed between two tonnage lists.
+
+    Attributes:
+        previous: The vessel as it was in the previous tonnage list.
+        current: The vessel as it is in the current tonnage list.
+        changes: The previous and current value of each changed column, by
+            column name. See the `Column` class for the available column
+            names.
+    """
+
+    previous: Vessel
+    current: Vessel
+    changes: Mapping[str, Tuple[Any, Any]]
+
+    @property
+    def imo(self) -> int:
+        """The vessel's IMO number."""
+        return self.current.imo
+
+
+@dataclass(frozen=True, eq=False)
+class TonnageListDiff:
+    """The changes between two successive tonnage lists of the same key.
+
+    Attributes:
+        key: The key the tonnage lists were stored under.
+        date: The date and time at which the current tonnage list was
+            captured.
+        added: Vessels present only in the current tonnage list.
+        removed: Vessels present only in the previous tonnage list.
+        changed: Vessels present in both tonnage lists whose data changed.
+    """
+
+    key: Hashable
+    date: datetime
+    added: Tuple[Vessel, ...]
+    removed: Tuple[Vessel, ...]
+    changed: Tuple[VesselChange, ...]
+
+    @property
+    def is_empty(self) -> bool:
+        """True if no vessel was added, removed or changed."""
+        return not (self.added or self.removed or self.changed)
+
+
+class _Snapshot:
+    def __init__(self, tonnage_list: TonnageList):
+        self.tonnage_list = tonnage_list
+        self.vessels: Dict[int, Vessel] = {}
+        self.rows: Dict[int, DataFrameRow] = {}
+        for vessel in tonnage_list.vessels:
+            self.vessels[vessel.imo] = vessel
+            self.rows[vessel.imo] = vessel._to_data_frame_row()
+
+
+class TonnageListSnapshots:
+    """Keeps the latest tonnage list per key and diffs updates against it.
+
+    Useful when polling tonnage lists, e.g. one per loading port and vessel
+    class pair: each update returns only the vessels that were added,
+    removed or changed since the previous update of the same key, so
+    downstream processing is proportional to the change rather than to the
+    size of the tonnage list. The latest vessels of each key are indexed by
+    IMO number.
+
+    Vessels are compared on the columns of the tonnage list data frame. See
+    the `Column` class for the available columns.
+
+    Snapshots can be updated from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty set of snapshots."""
+        self.__snapshots: Dict[Hashable, _Snapshot] = {}
+        self.__lock = Lock()
+
+    def update(
+        self, key: Hashable, tonnage_list: TonnageList
+    ) -> TonnageListDiff:
+        """Stores a tonnage list and returns its changes since the last one.
+
+        Args:
+            key: Identifies the tonnage list, e.g. a tuple of the loading
+                port and vessel class ids it was retrieved for.
+            tonnage_list: The latest tonnage list for the key.
+
+        Returns:
+            The changes between the previously stored tonnage list of the key
+            and the provided one. If no tonnage list was stored for the key,
+            all vessels are reported as added.
+        """
+        current = _Snapshot(tonnage_list)
+        with self.__lock:
+            previous = self.__snapshots.get(key)
+            self.__snapshots[key] = current
+
+        if previous is None:
+            return TonnageListDiff(
+                key, tonnage_list.date, tonnage_list.vessels, (), ()
+            )
+
+        added: List[Vessel] = []
+        changed: List[VesselChange] = []
+        for imo, vessel in current.vessels.items():
+            previous_row = previous.rows.get(imo)
+            if previous_row is None:
+                added.append(vessel)
+                continue
+
+            row = current.rows[imo]
+            if row != previous_row:
+                changed.append(
+                    VesselChange(
+                        previous.vessels[imo],
+                        vessel,
+                        _get_column_changes(previous_row, row),
+                    )
+                )
+
+        removed = tuple(
+            vessel
+            for imo, vessel in previous.vessels.items()
+            if imo not in current.vessels
+        )
+
+        return TonnageListDiff(
+            key, tonnage_list.date, tuple(added), removed, tuple(changed)
+        )
+
+    def get_tonnage_list(self, key: Hashable) -> Optional[TonnageList]:
+        """Gets the latest tonnage list stored for a key.
+
+        Args:
+            key: The key the tonnage list was stored under.
+
+        Returns:
+            The tonnage list, or None if none was stored for the key.
+        """
+        snapshot = self.__snapshots.get(key)
+        return snapshot.tonnage_list if snapshot else None
+
+    def get_vessels(self, key: Hashable) -> Mapping[int, Vessel]:
+        """Gets the vessels of the latest tonnage list of a key by IMO.
+
+        Args:
+            key: The key the tonnage list was stored under.
+
+        Returns:
+            A read-only mapping of IMO numbers to vessels. Empty if no tonnage
+            list was stored for the key.
+        """
+        snapshot = self.__snapshots.get(key)
+        return MappingProxyType(snapshot.vessels if snapshot else {})
+
+    def get_vessel(self, key: Hashable, imo: int) -> Optional[Vessel]:
+        """Gets a vessel of the latest tonnage list of a key.
+
+        Args:
+            key: The key the tonnage list was stored under.
+            imo: The vessel's IMO number.
+
+        Returns:
+            The vessel, or None if it is not in the tonnage list or no tonnage
+            list was stored for the key.
+        """
+        return self.get_vessels(key).get(imo)
+
+    def keys(self) -> Tuple[Hashable, ...]:
+        """Gets the keys tonnage lists are stored under."""
+        with self.__lock:
+            return tuple(self.__snapshots)
+
+    def remove(self, key: Hashable) -> None:
+        """Removes the tonnage list stored for a key, if any.
+
+        The next update of the key reports all of its vessels as added.
+
+        Args:
+            key: The key the tonnage list was stored under.
+        """
+        with self.__lock:
+            self.__snapshots.pop(key, None)
+
+
+def _get_column_changes(
+    previous: DataFrameRow, current: DataFrameRow
+) -> Dict[str, Tuple[Any, Any]]:
+    return {
+        column: (old, new)
+        for column, old, new in zip(_COLUMNS, previous, current)
+        if old != new
+    }
@@ -0,0 +1,235 @@
+"""Helpers for retrieving data split into independently fetched chunks."""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+TChunk = TypeVar("TChunk")
+TResult = TypeVar("TResult")
+TCombined = TypeVar("TCombined")
+
+
+class ChunkRetrievalError(Exception):
+    """Raised when some chunks of a chunked retrieval could not be fetched.
+
+    The chunks that were fetched successfully are kept, so calling `retry`
+    only fetches the failed chunks again.
+    """
+
+    def __init__(self, retrieval: "_ChunkedRetrieval[Any, Any, Any]"):
+        """Initializes the error.
+
+        Args:
+            retrieval: The retrieval whose chunks failed.
+        """
+        self.__retrieval = retrieval
+        failures = retrieval._failures
+        super().__init__(
+            f"{len(failures)} of {retrieval._chunk_count} chunks could not "
+            f"be retrieved: {next(iter(failures.values()))!r}"
+        )
+
+    @property
+    def failed_chunks(self) -> Tuple[Any, ...]:
+        """The chunks that could not be fetched, in their original order."""
+        return tuple(c for c, _ in self.__retrieval._failures.values())
+
+    @property
+    def errors(self) -> Tuple[BaseException, ...]:
+        """The errors raised by the failed chunks, in their original order."""
+        return tuple(e for _, e in self.__retrieval._failures.values())
+
+    def retry(self) -> Any:
+        """Fetches the failed chunks again and completes the retrieval.
+
+        Returns:
+            The result of the retrieval, as returned by the method that
+            raised this error.
+
+        Raises:
+            ChunkRetrievalError: Some chunks failed again.
+        """
+        return self.__retrieval.run()
+
+
+class _ChunkedRetrieval(Generic[TChunk, TResult, TCombined]):
+    def __init__(
+        self,
+        chunks: Sequence[TChunk],
+        fetch: Callable[[TChunk], TResult],
+        combine: Callable[[List[TResult]], TCombined],
+        max_workers: int,
+        raise_first_error: bool,
+    ):
+        self.__chunks = tuple(chunks)
+        self.__fetch = fetch
+        self.__combine = combine
+        self.__max_workers = max_workers
+        self.__raise_first_error = raise_first_error
+        self.__results: Dict[int, TResult] = {}
+        self._failures: Dict[int, Tuple[TChunk, BaseException]] = {}
+
+    @property
+    def _chunk_count(self) -> int:
+        return len(self.__chunks)
+
+    def run(self) -> TCombined:
+        pending = [
+            i for i in range(len(self.__chunks)) if i not in self.__results
+        ]
+        self._failures = {}
+
+        if self.__max_workers == 1 and self.__raise_first_error:
+            for i in pending:
+                self.__results[i] = self.__fetch(self.__chunks[i])
+        elif self.__max_workers == 1 or len(pending) <= 1:
+            for i in pending:
+                self.__fetch_chunk(i)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.__max_workers, len(pending))
+            ) as executor:
+                for _ in executor.map(self.__fetch_chunk, pending):
+                    pass
+
+        if self._failures:
+            first_error = next(iter(self._failures.values()))[1]
+            raise ChunkRetrievalError(self) from first_error
+
+        return self.__combine(
+            [self.__results[i] for i in range(len(self.__chunks))]
+        )
+
+    def __fetch_chunk(self, index: int) -> None:
+        chunk = self.__chunks[index]
+        try:
+            self.__results[index] = self.__fetch(chunk)
+        except Exception as error:
+            self._failures[index] = (chunk, error)
+
+
+def get_max_workers(max_workers: Optional[int], pool_size: int) -> int:
+    """Bounds the number of workers by the pool size of a connection.
+
+    Workers beyond the pool size of the connection they send requests
+    through would only wait for a pooled connection to be released.
+
+    Args:
+        max_workers: The number of workers requested, or None to use as
+            many workers as the connection pools connections.
+        pool_size: The pool size of the connection.
+
+    Returns:
+        The number of workers to fetch with.
+    """
+    return pool_size if max_workers is None else min(max_workers, pool_size)
+
+
+def fetch_chunks(
+    chunks: Sequence[TChunk],
+    fetch: Callable[[TChunk], TResult],
+    combine: Callable[[List[TResult]], TCombined],
+    max_workers: int = 1,
+    raise_first_error: bool = False,
+) -> TCombined:
+    """Fetches chunks of data, optionally concurrently, and combines them.
+
+    A failing chunk does not stop the others from being fetched. Once all
+    chunks have been attempted, a `ChunkRetrievalError` is raised if any of
+    them failed; its `retry` method fetches only the failed chunks again.
+    Methods that fetched their chunks in a plain loop before supporting
+    concurrency keep their errors with `raise_first_error`.
+
+    Args:
+        chunks: Descriptions of the chunks to fetch, e.g. date ranges.
+        fetch: Called with each chunk and returns its data.
+        combine: Called with the data of all chunks, in the order of the
+            chunks, and returns the result of the retrieval.
+        max_workers: The maximum number of chunks fetched at the same time.
+            If 1, chunks are fetched one after another.
+        raise_first_error: If True and chunks are fetched one after another,
+            the first error raised by `fetch` is propagated as is and the
+            remaining chunks are not fetched.
+
+    Returns:
+        The result of calling `combine`.
+
+    Raises:
+        ChunkRetrievalError: Some chunks could not be fetched.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be a positive integer.")
+
+    return _ChunkedRetrieval(
+        chunks, fetch, combine, max_workers, raise_first_error
+    ).run()
+
+
+def fetch_each(
+    items: Iterable[TChunk],
+    fetch: Callable[[TChunk], TResult],
+    max_workers: int = 1,
+) -> Iterator[Tuple[TChunk, Optional[TResult], Optional[Exception]]]:
+    """Fetches the data of each item, optionally concurrently, as a stream.
+
+    Items are consumed lazily and at most twice as many items as workers are
+    in flight at any time, so arbitrarily long iterables can be processed
+    with bounded memory. A failing item does not stop the others from being
+    fetched; its error is yielded instead of its data.
+
+    Args:
+        items: Descriptions of the data to fetch, e.g. request parameters.
+        fetch: Called with each item and returns its data.
+        max_workers: The maximum number of items fetched at the same time.
+            If 1, items are fetched one after another.
+
+    Yields:
+        The item, its data and None, or the item, None and the error raised
+        by fetching it, in the order of the items.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be a positive integer.")
+
+    if max_workers == 1:
+        for item in items:
+            outcome: Tuple[TChunk, Optional[TResult], Optional[Exception]]
+            try:
+                outcome = item, fetch(item), None
+            except Exception as error:
+                outcome = item, None, error
+            yield outcome
+        return
+
+    remaining = iter(items)
+    pending: Deque[Tuple[TChunk, "Future[TResult]"]] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            for item in islice(remaining, 2 * max_workers - len(pending)):
+                pending.append((item, executor.submit(fetch, item)))
+            if not pending:
+                return
+            done = _wait_for(pending.popleft())
+            yield done
+
+
+def _wait_for(
+    submitted: Tuple[TChunk, "Future[TResult]"]
+) -> Tuple[TChunk, Optional[TResult], Optional[Exception]]:
+    item, future = submitted
+    try:
+        return item, future.result(), None
+    except Exception as error:
+        return item, None, error
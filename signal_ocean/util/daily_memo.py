@@ -0,0 +1,41 @@
+"""Memoises values that change at most once a day."""
+from datetime import date
+from threading import Lock
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+TValue = TypeVar("TValue")
+
+
+class DailyMemo(Generic[TValue]):
+    """Holds a value loaded at most once per calendar day.
+
+    Used for reference data, e.g. the ports available to an API, which is
+    requested for the current date and does not change during the day.
+    Concurrent callers wait for a single load instead of repeating it.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty memo."""
+        self.__entry: Optional[Tuple[date, TValue]] = None
+        self.__lock = Lock()
+
+    def get(self, load: Callable[[date], TValue]) -> TValue:
+        """Gets today's value, loading it if needed.
+
+        Args:
+            load: Called with the current date to load the value if it was
+                not loaded today. Failures are propagated and not memoised.
+
+        Returns:
+            The value loaded today.
+        """
+        with self.__lock:
+            today = date.today()
+            if self.__entry is None or self.__entry[0] != today:
+                self.__entry = (today, load(today))
+            return self.__entry[1]
+
+    def clear(self) -> None:
+        """Forgets the memoised value, so that the next call loads it."""
+        with self.__lock:
+            self.__entry = None
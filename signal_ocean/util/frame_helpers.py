@@ -0,0 +1,461 @@
+"""Helper functions to decode API records straight into data frames.
+
+Building a model object for every record only to convert it to a data frame
+is costly for large results. The helpers in this module decode the records
+of model classes directly into typed pandas columns instead:
+
+* int fields become nullable "Int64" columns,
+* float fields become "float64" columns,
+* bool fields become nullable "boolean" columns,
+* datetime fields become "datetime64[ns, UTC]" columns,
+* str fields become "category" columns when at most half of their values
+  are distinct, and object columns otherwise.
+
+Fields holding a nested model are flattened into columns prefixed with the
+field's name, e.g. "matched_fixture_charterer". Fields holding sequences of
+models are not included.
+
+`CategoryCodes` and `columns_to_frame` support building data frames column
+by column from other sources, such as model objects, encoding categorical
+columns and index levels straight into integer codes instead of converting
+an object column afterwards. `tonnage_lists_to_frame` and
+`pricing_grid_to_frame` build on them to flatten the vessels of daily
+tonnage lists and the freight prices of a grid of port pairs and dates.
+"""
+import dataclasses
+from datetime import datetime
+from operator import attrgetter
+from typing import (
+    Any,
+    Container,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from signal_ocean.util.parsing_helpers import _to_snake_case
+
+_INT = "int"
+_FLOAT = "float"
+_BOOL = "bool"
+_STR = "str"
+_DATETIME = "datetime"
+
+_KINDS: Dict[Any, str] = {
+    int: _INT,
+    float: _FLOAT,
+    bool: _BOOL,
+    str: _STR,
+    datetime: _DATETIME,
+}
+
+_MAX_CATEGORY_RATIO = 0.5
+
+
+@dataclasses.dataclass(frozen=True)
+class _Column:
+    name: str
+    kind: str
+    index: int
+
+
+# A decoded key maps either to a column or, for nested models, to the
+# columns of the nested model's fields.
+_KeyTarget = Union[_Column, "_ModelColumns"]
+
+
+class _ModelColumns:
+    """The columns a model class is decoded into."""
+
+    def __init__(
+        self,
+        cls: Type[Any],
+        columns: List[_Column],
+        prefix: str = "",
+        parents: Tuple[Type[Any], ...] = (),
+    ):
+        self.__fields: Dict[str, _KeyTarget] = {}
+        self.__keys: Dict[str, Optional[_KeyTarget]] = {}
+
+        for field in dataclasses.fields(cls):
+            field_type = _unwrap_optional(field.type)
+            name = prefix + field.name
+            if field_type in _KINDS:
+                column = _Column(name, _KINDS[field_type], len(columns))
+                columns.append(column)
+                self.__fields[field.name] = column
+            elif (
+                isinstance(field_type, type)
+                and dataclasses.is_dataclass(field_type)
+                and field_type not in parents
+                and field_type is not cls
+            ):
+                self.__fields[field.name] = _ModelColumns(
+                    field_type, columns, name + "_", parents + (cls,)
+                )
+
+    def decode(self, record: Dict[str, Any], values: List[List[Any]]) -> None:
+        """Stores the values of a record as the last value of each column."""
+        keys = self.__keys
+        for key, value in record.items():
+            target = keys[key] if key in keys else self.__resolve(key)
+            if target is None:
+                continue
+            if isinstance(target, _Column):
+                values[target.index][-1] = value
+            elif isinstance(value, dict):
+                target.decode(value, values)
+
+    def __resolve(self, key: str) -> Optional[_KeyTarget]:
+        target = self.__fields.get(_to_snake_case(key))
+        self.__keys[key] = target
+        return target
+
+
+class FrameBuilder:
+    """Accumulates records of a model class into typed columns.
+
+    Records are decoded as they are added, so the pages they come from can
+    be released as soon as they have been added.
+    """
+
+    def __init__(
+        self,
+        cls: Type[Any],
+        rename_keys: Optional[Dict[str, str]] = None,
+    ):
+        """Initializes the builder.
+
+        Args:
+            cls: The model class of the records.
+            rename_keys: Key names to rename to match model attribute names,
+                used when an automated translation of the name from
+                CapsWords to snake_case is to sufficient.
+        """
+        self.__columns: List[_Column] = []
+        self.__model = _ModelColumns(cls, self.__columns)
+        self.__renames = tuple((rename_keys or {}).items())
+        self.__values: List[List[Any]] = [[] for _ in self.__columns]
+
+    def add(self, records: Optional[Iterable[Dict[str, Any]]]) -> None:
+        """Decodes and stores records.
+
+        Args:
+            records: Records as decoded from the API's JSON response. None
+                is treated as no records.
+        """
+        values = self.__values
+        for record in records or ():
+            for k, r in self.__renames:
+                if k in record:
+                    record[r] = record.pop(k)
+            for column_values in values:
+                column_values.append(None)
+            self.__model.decode(record, values)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Builds a data frame from the records added so far.
+
+        Returns:
+            A data frame with a typed column per field of the model class
+            and a row per record.
+        """
+        return pd.DataFrame(
+            {
+                column.name: _to_column(column.kind, column_values)
+                for column, column_values in zip(
+                    self.__columns, self.__values
+                )
+            }
+        )
+
+
+def records_to_frame(
+    records: Optional[Iterable[Dict[str, Any]]],
+    cls: Type[Any],
+    rename_keys: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """Decodes records straight into a data frame.
+
+    Args:
+        records: Records as decoded from the API's JSON response.
+        cls: The model class of the records.
+        rename_keys: Key names to rename to match model attribute names.
+
+    Returns:
+        A data frame with a typed column per field of the model class and a
+        row per record.
+    """
+    builder = FrameBuilder(cls, rename_keys)
+    builder.add(records)
+    return builder.to_frame()
+
+
+class CategoryCodes:
+    """Collects the values of a categorical column or index level.
+
+    The values are kept as references to the collected objects and encoded
+    into categorical codes in a single vectorised pass once all of them
+    have been collected, so no intermediate object column has to be
+    converted afterwards. None and NaN values are encoded as missing.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty set of values."""
+        self.__values: List[Any] = []
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Collects values.
+
+        Args:
+            values: The values to collect, in order.
+        """
+        self.__values.extend(values)
+
+    def to_categorical(self) -> pd.Categorical:
+        """Builds a categorical out of the collected values.
+
+        Returns:
+            A categorical with the distinct values as sorted categories, as
+            `astype("category")` would create.
+        """
+        categories, codes = self.to_index_level()
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    def to_index_level(self) -> Tuple[pd.Index, np.ndarray]:
+        """Builds a sorted index level and the codes referring to it.
+
+        Returns:
+            The distinct values, sorted where they are comparable, and the
+            position of each collected value in them, or -1 if missing.
+        """
+        values = np.empty(len(self.__values), dtype=object)
+        values[:] = self.__values
+        codes, uniques = pd.factorize(values, sort=True)
+        return pd.Index(uniques.tolist()), codes
+
+
+def columns_to_frame(
+    columns: Mapping[str, Any],
+    index: Optional[Mapping[str, CategoryCodes]] = None,
+) -> pd.DataFrame:
+    """Builds a data frame out of collected column values.
+
+    Args:
+        columns: The values of each column by column name, either as a
+            sequence, to let pandas infer the column's type, or as
+            `CategoryCodes` for a categorical column.
+        index: The levels of a multi-index by level name. If not provided,
+            the data frame has a default index.
+
+    Returns:
+        The data frame.
+    """
+    multi_index = None
+    if index is not None:
+        levels, codes = zip(*(c.to_index_level() for c in index.values()))
+        multi_index = pd.MultiIndex(
+            levels=levels,
+            codes=codes,
+            names=list(index),
+            verify_integrity=False,
+        )
+
+    return pd.DataFrame(
+        {
+            name: _to_frame_column(values)
+            for name, values in columns.items()
+        },
+        index=multi_index,
+    )
+
+
+def tonnage_lists_to_frame(
+    tonnage_lists: Iterable[Any],
+    attributes: Mapping[str, str],
+    categories: Container[str],
+    date_level: str,
+    imo_level: str,
+) -> pd.DataFrame:
+    """Builds a data frame out of the vessels of daily tonnage lists.
+
+    Args:
+        tonnage_lists: The tonnage lists, each with a `date` and `vessels`
+            holding an `imo`.
+        attributes: The vessel attribute filling each column by column name,
+            in column order.
+        categories: The names of the categorical columns.
+        date_level: The name of the index level holding the tonnage list
+            dates.
+        imo_level: The name of the index level holding the vessel IMOs.
+
+    Returns:
+        The data frame, with a row per vessel of each tonnage list.
+    """
+    columns: Dict[str, Union[List[Any], CategoryCodes]] = {
+        column: CategoryCodes() if column in categories else []
+        for column in attributes
+    }
+    fields = [
+        (columns[column], attrgetter(attribute))
+        for column, attribute in attributes.items()
+    ]
+    dates = CategoryCodes()
+    imos = CategoryCodes()
+    for tonnage_list in tonnage_lists:
+        vessels = tonnage_list.vessels
+        if not vessels:
+            continue
+
+        dates.extend([tonnage_list.date] * len(vessels))
+        imos.extend([vessel.imo for vessel in vessels])
+        for column, get_value in fields:
+            column.extend(map(get_value, vessels))
+
+    return columns_to_frame(columns, {date_level: dates, imo_level: imos})
+
+
+def pricing_grid_to_frame(
+    keys: Iterable[Any],
+    results: Iterable[Sequence[Any]],
+    categories: Sequence[str] = (),
+    flags: Sequence[str] = (),
+    amounts: Optional[Mapping[str, str]] = None,
+) -> pd.DataFrame:
+    """Builds a data frame out of the freight prices of a pricing grid.
+
+    Args:
+        keys: The requested grid cells, each with a `load_port_id`,
+            `discharge_port_id` and `date`.
+        results: The prices of each grid cell, in the order of `keys`.
+        categories: The price attributes filling categorical columns of the
+            same name.
+        flags: The price attributes filling nullable boolean columns of the
+            same name.
+        amounts: The price attribute, possibly dotted, filling each float
+            column by column name.
+
+    Returns:
+        The data frame, with a row per price and the `load_port_id`,
+        `discharge_port_id` and `date` columns followed by the categorical,
+        boolean and float columns, in order.
+    """
+    amounts = amounts or {}
+    load_port_ids: List[int] = []
+    discharge_port_ids: List[int] = []
+    dates: List[Any] = []
+    category_values = {name: CategoryCodes() for name in categories}
+    flag_values: Dict[str, List[Any]] = {name: [] for name in flags}
+    amount_values: Dict[str, List[Any]] = {name: [] for name in amounts}
+    fields: List[Tuple[Union[List[Any], CategoryCodes], Any]] = [
+        *((category_values[n], attrgetter(n)) for n in categories),
+        *((flag_values[n], attrgetter(n)) for n in flags),
+        *((amount_values[n], attrgetter(a)) for n, a in amounts.items()),
+    ]
+    for key, prices in zip(keys, results):
+        load_port_ids.extend([key.load_port_id] * len(prices))
+        discharge_port_ids.extend([key.discharge_port_id] * len(prices))
+        dates.extend([key.date] * len(prices))
+        for column, get_value in fields:
+            column.extend(map(get_value, prices))
+
+    return columns_to_frame(
+        {
+            "load_port_id": np.array(load_port_ids, dtype="int64"),
+            "discharge_port_id": np.array(
+                discharge_port_ids, dtype="int64"
+            ),
+            "date": np.array(dates, dtype="datetime64[ns]"),
+            **category_values,
+            **{
+                name: pd.array(values, dtype="boolean")
+                for name, values in flag_values.items()
+            },
+            **{
+                name: np.array(values, dtype="float64")
+                for name, values in amount_values.items()
+            },
+        }
+    )
+
+
+def _to_frame_column(values: Any) -> Any:
+    if isinstance(values, CategoryCodes):
+        return values.to_categorical()
+    # Without values to infer a type from, pandas would default to float.
+    # Typed arrays keep their type.
+    if isinstance(values, list) and not values:
+        return np.empty(0, dtype=object)
+    return values
+
+
+def get_field(data: Any, name: str) -> Any:
+    """Gets a field of a JSON object by its model attribute name.
+
+    Args:
+        data: An object as decoded from the API's JSON response.
+        name: The snake_case name of the field.
+
+    Returns:
+        The value of the first key of the object that translates to the
+        provided name, or None if there is no such key or the data is not an
+        object.
+    """
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if _to_snake_case(key) == name:
+                return value
+    return None
+
+
+def _unwrap_optional(field_type: Any) -> Any:
+    if getattr(field_type, "__origin__", None) is Union:
+        args = [a for a in field_type.__args__ if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return field_type
+
+
+def _to_column(kind: str, values: Sequence[Any]) -> Any:
+    if kind == _INT:
+        try:
+            return pd.array(values, dtype="Int64")
+        except (TypeError, ValueError):
+            return pd.to_numeric(pd.Series(values, dtype=object)).astype(
+                "Int64"
+            )
+
+    if kind == _FLOAT:
+        return np.array(values, dtype="float64")
+
+    if kind == _BOOL:
+        return pd.array(values, dtype="boolean")
+
+    if kind == _DATETIME:
+        return _to_datetime_column(values)
+
+    column = pd.Series(values, dtype=object)
+    distinct = column.nunique()
+    if distinct <= len(column) * _MAX_CATEGORY_RATIO:
+        return column.astype("category")
+    return column
+
+
+def _to_datetime_column(values: Sequence[Any]) -> Any:
+    try:
+        return pd.to_datetime(
+            values, utc=True, format="ISO8601", errors="raise"
+        )
+    except ValueError:
+        # Versions of pandas older than 2.0 do not know the "ISO8601"
+        # format, but infer it from the values.
+        return pd.to_datetime(values, utc=True, errors="raise")
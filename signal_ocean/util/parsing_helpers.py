@@ -2,7 +2,18 @@
 import dataclasses
 import re
 from datetime import datetime
-from typing import Union, Type, TypeVar, Any, Optional, Dict, Iterable, cast
+from functools import lru_cache, partial
+from typing import (
+    Union,
+    Type,
+    TypeVar,
+    Any,
+    Callable,
+    Optional,
+    Dict,
+    Iterable,
+    Tuple,
+)
 
 from signal_ocean._internals import parse_datetime
 
@@ -10,7 +21,13 @@ TModel = TypeVar("TModel")
 NoneType = type(None)
 ParsableClass = Union[str, int, float, bool, None, datetime]
 
+# The key vocabulary of the APIs is small and fixed, so case conversions are
+# memoised; the bound only protects against unexpectedly varied input.
+_KEY_CACHE_SIZE = 4096
+_CAP_WORDS_BOUNDARY = re.compile('([a-z0-9])([A-Z])')
 
+
+@lru_cache(maxsize=_KEY_CACHE_SIZE)
 def _to_snake_case(s: str) -> str:
     """Transforms a string from CapWords to snake_case.
 
@@ -20,7 +37,12 @@ def _to_snake_case(s: str) -> str:
     Returns:
         The transformed string
     """
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s).lower()
+    return _CAP_WORDS_BOUNDARY.sub(r'\1_\2', s).lower()
+
+
+@lru_cache(maxsize=_KEY_CACHE_SIZE)
+def _snake_to_cap_words(s: str) -> str:
+    return ''.join(word.capitalize() for word in s.split('_'))
 
 
 def _to_camel_case(s: str,
@@ -35,15 +57,11 @@ def _to_camel_case(s: str,
     Returns:
         The transformed string
     """
-    _to_camelcase = s.split('_')
-    _to_camelcase = [word.capitalize() for word in _to_camelcase]
-    result = ''.join(_to_camelcase)
-
     if rename_keys:
         if s in rename_keys:
-            result = rename_keys[s]
+            return rename_keys[s]
 
-    return result
+    return _snake_to_cap_words(s)
 
 
 def _parse_class(value: Any, cls: Type[ParsableClass]) \
@@ -102,6 +120,10 @@ def parse_model(data: Union[Dict[str, Any], Iterable[Any], Any],
     found in the mapping that do not correspond to class attributes are
     ignored.
 
+    The parser for each combination of class and renamed keys is compiled
+    on first use and cached, so that the reflection over the model's fields
+    and types is not repeated for every parsed object.
+
     Args:
         data: Dictionary containing pairs with the names of the attributes
             and their respective values provided to instantiate the model
@@ -120,77 +142,212 @@ def parse_model(data: Union[Dict[str, Any], Iterable[Any], Any],
             appropriate type.
         NotImplementedError: The type of a class attribute is not supported.
     """
-    if cls is not NoneType and dataclasses.is_dataclass(cls) \
-            and isinstance(data, dict):
-        if rename_keys:
-            for k, r, in rename_keys.items():
-                if k in data:
-                    data[r] = data.pop(k)
+    renames = tuple(rename_keys.items()) if rename_keys else ()
+    return _get_parser(cls, renames)(data)
 
-        field_names = set(f.name for f in dataclasses.fields(cls))
-        field_types = {f.name: f.type for f in dataclasses.fields(cls)}
 
-        parsed_data: Dict[str, Any] = {}
-        for key, value in data.items():
-            key = _to_snake_case(key)
-            if key in field_names:
-                field_type = field_types[key]
-                parsed_data[key] = parse_model(
-                    value, field_type, rename_keys=rename_keys
-                )
+_Parser = Callable[[Any], Any]
+_Renames = Tuple[Tuple[str, str], ...]
 
-        args = []
-        for f in dataclasses.fields(cls):
-            if f.name in parsed_data:
-                a = parsed_data[f.name]
-            elif f.default is not dataclasses.MISSING:
-                a = f.default
-            else:
-                fc = getattr(f, 'default_factory')
-                if fc is not dataclasses.MISSING:
-                    a = fc()
-                else:
-                    raise TypeError(f'Cannot initialize class {cls}. '
-                                    f'Missing required parameter {f.name}')
-            args.append(a)
+_PARSER_ERRORS = (TypeError, ValueError, NotImplementedError)
+_MAX_CACHED_KEYS = 1024
 
-        return cls(*args)
+_parsers: Dict[Tuple[Any, _Renames], _Parser] = {}
+
+
+def _get_parser(cls: Any, renames: _Renames) -> _Parser:
+    """Returns the cached parser of a class, compiling it if needed.
+
+    Args:
+        cls: The class or type annotation to parse values as.
+        renames: The key renames applied to the parsed mappings.
+
+    Returns:
+        A function parsing a decoded JSON value as cls.
+    """
+    try:
+        return _parsers[cls, renames]
+    except KeyError:
+        pass
+    except TypeError:
+        return _compile_parser(cls, renames)
+
+    parser = _compile_parser(cls, renames)
+    _parsers[cls, renames] = parser
+    return parser
+
+
+def _compile_parser(cls: Any, renames: _Renames) -> _Parser:
+    """Builds a function parsing a decoded JSON value as cls.
+
+    The returned parser behaves exactly like the reflective parsing
+    described in `parse_model`, with all decisions that depend only on cls
+    taken once, upfront.
+
+    Args:
+        cls: The class or type annotation to parse values as.
+        renames: The key renames applied to the parsed mappings.
+
+    Returns:
+        The compiled parser.
+    """
+    if cls is not NoneType and dataclasses.is_dataclass(cls):
+        return _compile_dataclass_parser(cls, renames)
+
+    origin = getattr(cls, '__origin__', None)
+    args = getattr(cls, '__args__', ())
+
+    if origin is Union:
+        return _compile_union_parser(cls, args, renames)
+
+    if origin is list:
+        return _compile_sequence_parser(cls, list, args, renames)
+
+    if origin is tuple:
+        return _compile_sequence_parser(cls, tuple, args, renames)
+
+    if cls in getattr(ParsableClass, '__args__', ()):
+        return _compile_class_parser(cls)
+
+    return _compile_unsupported_parser(cls)
+
+
+def _compile_unsupported_parser(cls: Any) -> _Parser:
+    def parse(data: Any) -> Any:
+        raise NotImplementedError(f'Cannot parse data {data} as {cls}.')
 
-    field_type_origin = getattr(cls, '__origin__', None)
+    return parse
 
-    if field_type_origin is Union:
-        for candidate_cls in getattr(cls, '__args__', []):
+
+def _compile_class_parser(cls: Any) -> _Parser:
+    if cls is NoneType:
+        return partial(_parse_class, cls=cls)
+
+    if cls is datetime:
+        def parse_datetime_value(value: Any) -> Any:
+            if value is None:
+                raise TypeError(f'Cannot parse None as {cls}')
+            return value if isinstance(value, datetime) \
+                else parse_datetime(value)
+
+        return parse_datetime_value
+
+    def parse(value: Any) -> Any:
+        if value is None:
+            raise TypeError(f'Cannot parse None as {cls}')
+        return cls(value)
+
+    return parse
+
+
+def _compile_union_parser(
+        cls: Any, args: Tuple[Any, ...], renames: _Renames) -> _Parser:
+    if len(args) == 2 and NoneType in args:
+        # None is only ever accepted by the NoneType member, so an Optional
+        # is resolved by a None check instead of trying its members in turn.
+        inner = _get_parser(
+            args[0] if args[1] is NoneType else args[1], renames)
+
+        def parse_optional(data: Any) -> Any:
+            if data is None:
+                return None
+            try:
+                return inner(data)
+            except _PARSER_ERRORS:
+                raise ValueError(f'Cannot parse value {data} as {cls}')
+
+        return parse_optional
+
+    candidates = [_get_parser(c, renames) for c in args]
+
+    def parse(data: Any) -> Any:
+        for candidate in candidates:
             try:
-                return parse_model(
-                    data, candidate_cls, rename_keys=rename_keys
-                )
-            except (TypeError, ValueError, NotImplementedError):
+                return candidate(data)
+            except _PARSER_ERRORS:
                 continue
 
         raise ValueError(f'Cannot parse value {data} as {cls}')
 
-    if field_type_origin is list and isinstance(data, Iterable):
-        list_field_type = getattr(cls, '__args__', [])[0]
-        if type(list_field_type) is TypeVar:
-            return list(data)
-        return [parse_model(
-            v, list_field_type, rename_keys=rename_keys
-            ) for v in data
-        ]
-
-    if field_type_origin is tuple and isinstance(data, Iterable):
-        tuple_field_types = getattr(cls, '__args__', [])
-
-        if not tuple_field_types:
-            return tuple(data)
-        return tuple(
-            parse_model(
-                v, tuple_field_types[0], rename_keys=rename_keys
-                ) for v in data
+    return parse
+
+
+def _compile_sequence_parser(
+        cls: Any,
+        sequence_type: Type[Any],
+        args: Tuple[Any, ...],
+        renames: _Renames) -> _Parser:
+    unsupported = _compile_unsupported_parser(cls)
+
+    if not args or (sequence_type is list and type(args[0]) is TypeVar):
+        def parse_untyped(data: Any) -> Any:
+            if not isinstance(data, Iterable):
+                return unsupported(data)
+            return sequence_type(data)
+
+        return parse_untyped
+
+    item_parser = _get_parser(args[0], renames)
+
+    def parse(data: Any) -> Any:
+        if not isinstance(data, Iterable):
+            return unsupported(data)
+        return sequence_type([item_parser(v) for v in data])
+
+    return parse
+
+
+def _compile_dataclass_parser(cls: Any, renames: _Renames) -> _Parser:
+    fields = dataclasses.fields(cls)
+    field_types = {f.name: f.type for f in fields}
+    field_specs = [(f.name, f.default, f.default_factory) for f in fields]
+    unsupported = _compile_unsupported_parser(cls)
+
+    # Maps each key encountered so far to the name and parser of its field,
+    # or to None if the key does not match any field.
+    key_fields: Dict[str, Optional[Tuple[str, _Parser]]] = {}
+
+    def resolve_key(key: str) -> Optional[Tuple[str, _Parser]]:
+        name = _to_snake_case(key)
+        key_field = (
+            (name, _get_parser(field_types[name], renames))
+            if name in field_types
+            else None
+        )
+        if len(key_fields) < _MAX_CACHED_KEYS:
+            key_fields[key] = key_field
+        return key_field
+
+    def parse(data: Any) -> Any:
+        if not isinstance(data, dict):
+            return unsupported(data)
+
+        for k, r in renames:
+            if k in data:
+                data[r] = data.pop(k)
+
+        parsed_data: Dict[str, Any] = {}
+        for key, value in data.items():
+            key_field = (
+                key_fields[key] if key in key_fields else resolve_key(key)
             )
+            if key_field is not None:
+                name, parser = key_field
+                parsed_data[name] = parser(value)
+
+        args = []
+        for name, default, default_factory in field_specs:
+            if name in parsed_data:
+                a = parsed_data[name]
+            elif default is not dataclasses.MISSING:
+                a = default
+            elif default_factory is not dataclasses.MISSING:
+                a = default_factory()  # type: ignore
+            else:
+                raise TypeError(f'Cannot initialize class {cls}. '
+                                f'Missing required parameter {name}')
+            args.append(a)
 
-    parsable_classes = tuple(getattr(ParsableClass, '__args__', []))
-    if cls in parsable_classes:
-        return _parse_class(data, cast(Type[ParsableClass], cls))
+        return cls(*args)
 
-    raise NotImplementedError(f'Cannot parse data {data} as {cls}.')
+    return parse
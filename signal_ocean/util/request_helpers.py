@@ -1,15 +1,27 @@
 """Helper functions to retrieve data from APIs."""
-from typing import TypeVar, Tuple, Type, Optional, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import requests
 
 from signal_ocean import Connection
 from signal_ocean._internals import QueryString
-from signal_ocean.util.parsing_helpers import parse_model
+from signal_ocean.util.parsing_helpers import _to_snake_case, parse_model
 
 
 TModel = TypeVar("TModel")
 
+PageRequest = Tuple[str, Optional[QueryString]]
+
 
 def get_single(
     connection: Connection,
@@ -166,3 +178,154 @@ def post_multiple(
     if data_key_label is not None:
         data = data[data_key_label]
     return tuple(parse_model(d, cls, rename_keys=rename_keys) for d in data)
+
+
+def get_pages(
+    connection: Connection,
+    cls: Type[TModel],
+    get_page_request: Callable[[Optional[str]], PageRequest],
+    token: Optional[str] = None,
+    rename_keys: Optional[Dict[str, str]] = None,
+    prefetch: bool = False,
+) -> Iterator[Optional[TModel]]:
+    """Lazily get the pages of a token-paged resource from the API.
+
+    Pages are requested until a page without a next page token is returned.
+    Because the token of the next page is known as soon as the body of the
+    current page is decoded, in prefetch mode the next page is requested on
+    a background thread while the caller parses and consumes the current
+    one, overlapping network wait with parsing. At most one page is fetched
+    ahead of the caller.
+
+    Args:
+        connection: The connection object to use to make the appropriate get
+            requests to the API.
+        cls: The class to instantiate the object for each retrieved page.
+        get_page_request: Called with the token of a page, or None for the
+            first page, and returns the relative URL and query parameters
+            of the request retrieving it.
+        token: The token of the first page to retrieve. If not provided,
+            retrieval starts from the first page.
+        rename_keys: Key names to rename to match model attribute names,
+            used when an automated translation of the name from CapsWords
+            to snake_case is to sufficient. Renaming must provide the name
+            in CapsWords.
+        prefetch: Whether to request the next page while the current one is
+            being consumed. Prefetching uses a background thread and may
+            request a page the caller never consumes, e.g. when it stops
+            early. Disabled by default.
+
+    Yields:
+        An object of the provided class for each retrieved page, or None
+        for a page the API responds to with a "Not Found" status code.
+    """
+    for data in get_json_pages(
+        connection, get_page_request, token, prefetch
+    ):
+        yield (
+            None
+            if data is None
+            else parse_model(data, cls, rename_keys=rename_keys)
+        )
+
+
+def get_json_pages(
+    connection: Connection,
+    get_page_request: Callable[[Optional[str]], PageRequest],
+    token: Optional[str] = None,
+    prefetch: bool = False,
+) -> Iterator[Any]:
+    """Lazily get the decoded JSON pages of a token-paged resource.
+
+    Behaves like `get_pages`, yielding the JSON decoded pages instead of
+    instantiating a model for each of them.
+
+    Args:
+        connection: The connection object to use to make the appropriate get
+            requests to the API.
+        get_page_request: Called with the token of a page, or None for the
+            first page, and returns the relative URL and query parameters
+            of the request retrieving it.
+        token: The token of the first page to retrieve. If not provided,
+            retrieval starts from the first page.
+        prefetch: Whether to request the next page while the current one is
+            being consumed. Prefetching uses a background thread and may
+            request a page the caller never consumes, e.g. when it stops
+            early. Disabled by default.
+
+    Yields:
+        The decoded JSON of each retrieved page, or None for a page the API
+        responds to with a "Not Found" status code.
+    """
+    def fetch(page_token: Optional[str]) -> Any:
+        relative_url, query_string = get_page_request(page_token)
+        return _get_json(connection, relative_url, query_string)
+
+    executor: Optional[ThreadPoolExecutor] = None
+    next_page: Optional["Future[Any]"] = None
+    try:
+        data = fetch(token)
+        while True:
+            next_page_token = _get_next_page_token(data)
+            if prefetch and next_page_token is not None:
+                executor = executor or ThreadPoolExecutor(max_workers=1)
+                next_page = executor.submit(fetch, next_page_token)
+
+            yield data
+
+            if next_page_token is None:
+                break
+            if next_page is not None:
+                data, next_page = next_page.result(), None
+            else:
+                data = fetch(next_page_token)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def token_page_request(
+    relative_url: str, token_param: str = "token"
+) -> Callable[[Optional[str]], PageRequest]:
+    """Builds page requests passing the page token as a query parameter.
+
+    Args:
+        relative_url: The relative URL of every page request.
+        token_param: The name of the query parameter holding the token.
+
+    Returns:
+        A function suitable as the `get_page_request` argument of
+        `get_pages`.
+    """
+    def get_page_request(token: Optional[str]) -> PageRequest:
+        return relative_url, (
+            {token_param: token} if token is not None else None
+        )
+
+    return get_page_request
+
+
+def _get_json(
+    connection: Connection,
+    relative_url: str,
+    query_string: Optional[QueryString],
+) -> Any:
+    response = connection._make_get_request(
+        relative_url, query_string=query_string
+    )
+
+    if response.status_code == requests.codes.not_found:
+        return None
+
+    response.raise_for_status()
+    return response.json()
+
+
+def _get_next_page_token(data: Any) -> Optional[str]:
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if _to_snake_case(key) == "next_page_token":
+                return value
+    return None
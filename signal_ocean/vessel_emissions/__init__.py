@@ -2,12 +2,20 @@
 
 Classes:
     VesselEmissionsAPI: Represents Signal's Vessel Emissions API.
+    AsyncVesselEmissionsAPI: Represents Signal's Vessel Emissions API,
+    accessed asynchronously.
     EmissionsEstimation: Represents Emissions Estimation for a single Voyage.
     Metrics: Represents Emissions Metrics for a Vessel.
     VesselClassEmissions: Represents Emissions Estimation
     for a all available vessels of a vessel class.
     VesselClassMetrics: Represents Emissions Metrics
     for a all available vessels of a vessel class
+    VesselEmissionsResult: The outcome of retrieving the emissions
+    of a vessel in a batch.
+    VesselMetricsResult: The outcome of retrieving the metrics
+    of a vessel in a batch.
+    EmissionsCheckpoint: Keeps the page tokens of vessel class
+    emissions retrievals.
 
 """
 
@@ -15,14 +23,22 @@ from .models import (
     VesselClassMetrics,
     VesselClassEmissions,
     EmissionsEstimation,
-    Metrics
+    Metrics,
+    VesselEmissionsResult,
+    VesselMetricsResult
 )
+from .emissions_checkpoint import EmissionsCheckpoint
 from .vessel_emissions_api import VesselEmissionsAPI
+from .async_vessel_emissions_api import AsyncVesselEmissionsAPI
 
 __all__ = [
     "Metrics",
     "EmissionsEstimation",
     "VesselClassMetrics",
     "VesselClassEmissions",
-    "VesselEmissionsAPI"
+    "VesselEmissionsAPI",
+    "AsyncVesselEmissionsAPI",
+    "VesselEmissionsResult",
+    "VesselMetricsResult",
+    "EmissionsCheckpoint"
 ]
@@ -0,0 +1,207 @@
+"""The asynchronous vessel emissions api."""
+from typing import List, Optional, Union
+from urllib.parse import urljoin
+
+from signal_ocean.async_connection import AsyncConnection
+from signal_ocean.util.async_request_helpers import get_multiple, get_single
+from signal_ocean.vessel_emissions.models import (
+    EmissionsEstimation,
+    VesselClassEmissions,
+    VesselClassMetrics,
+    VesselMetrics,
+)
+from signal_ocean.vessel_emissions.vessel_emissions_api import (
+    VesselEmissionsAPI,
+    make_url,
+)
+
+
+class AsyncVesselEmissionsAPI:
+    """Represents Signal's Vessel Emissions API, accessed asynchronously.
+
+    Mirrors `VesselEmissionsAPI` as coroutines returning the same models, so
+    that emissions for many vessels can be requested concurrently.
+    """
+
+    def __init__(self, connection: Optional[AsyncConnection] = None):
+        """Initializes AsyncVesselEmissionsAPI.
+
+        Args:
+            connection: API connection configuration. If not provided, the
+                default connection method is used.
+        """
+        connection = connection or AsyncConnection()
+        self.__connection = connection._with_auth_header(
+            "Ocp-Apim-Subscription-Key"
+        )
+
+    async def get_emissions_by_imo_and_voyage_number(
+            self,
+            imo: int,
+            voyage_number: int,
+            quantity: Union[int, None] = None,
+            include_consumptions: bool = False,
+            include_efficiency_metrics: bool = False,
+            include_distances: bool = False,
+            include_durations: bool = False,
+            include_speed_statistics: bool = False,
+            include_eu_emissions: bool = False,
+            sulphur_content_hfo: Union[float, None] = None,
+            sulphur_content_lfo: Union[float, None] = None,
+            sulphur_content_mgo: Union[float, None] = None,
+            sulphur_content_lng: Union[float, None] = None
+    ) -> Optional[EmissionsEstimation]:
+        """Retrieves voyage emissions for a vessel by IMO and Voyage Number.
+
+        See `VesselEmissionsAPI.get_emissions_by_imo_and_voyage_number` for
+        a description of the arguments.
+
+        Returns:
+            EmissionsEstimation if no vessel with
+            the specified IMO or Voyage Number has been found.
+        """
+        params_dict = VesselEmissionsAPI.construct_url_parameters(
+            quantity=quantity,
+            include_consumptions=include_consumptions,
+            include_efficiency_metrics=include_efficiency_metrics,
+            include_distances=include_distances,
+            include_durations=include_durations,
+            include_speed_statistics=include_speed_statistics,
+            include_eu_emissions=include_eu_emissions,
+            sulphur_content_hfo=sulphur_content_hfo,
+            sulphur_content_lfo=sulphur_content_lfo,
+            sulphur_content_mgo=sulphur_content_mgo,
+            sulphur_content_lng=sulphur_content_lng)
+        query_url = make_url('emissions',
+                             'imo', imo,
+                             'voyage_number', voyage_number,
+                             **params_dict)
+        url = urljoin(VesselEmissionsAPI.relative_url, query_url)
+        return await get_single(self.__connection, url, EmissionsEstimation)
+
+    async def get_emissions_by_imo(
+            self,
+            imo: int,
+            include_consumptions: bool = False,
+            include_efficiency_metrics: bool = False,
+            include_distances: bool = False,
+            include_durations: bool = False,
+            include_speed_statistics: bool = False,
+            include_eu_emissions: bool = False,
+            sulphur_content_hfo: Union[float, None] = None,
+            sulphur_content_lfo: Union[float, None] = None,
+            sulphur_content_mgo: Union[float, None] = None,
+            sulphur_content_lng: Union[float, None] = None
+    ) -> List[EmissionsEstimation]:
+        """Retrieves a list of vessel emissions by its IMO.
+
+        See `VesselEmissionsAPI.get_emissions_by_imo` for a description of
+        the arguments.
+
+        Returns:
+            A list of vessel emissions.
+        """
+        params_dict = VesselEmissionsAPI.construct_url_parameters(
+            include_consumptions=include_consumptions,
+            include_efficiency_metrics=include_efficiency_metrics,
+            include_distances=include_distances,
+            include_durations=include_durations,
+            include_speed_statistics=include_speed_statistics,
+            include_eu_emissions=include_eu_emissions,
+            sulphur_content_hfo=sulphur_content_hfo,
+            sulphur_content_lfo=sulphur_content_lfo,
+            sulphur_content_mgo=sulphur_content_mgo,
+            sulphur_content_lng=sulphur_content_lng
+        )
+        query_url = make_url('emissions',
+                             'imo', imo,
+                             **params_dict)
+        url = urljoin(VesselEmissionsAPI.relative_url, query_url)
+        return list(
+            await get_multiple(self.__connection, url, EmissionsEstimation)
+        )
+
+    async def get_metrics_by_imo(
+            self,
+            imo: int,
+            year: Union[int, None] = None
+    ) -> List[VesselMetrics]:
+        """Get vessel metrics.
+
+        Args:
+            imo: Vessel IMO to retrieve
+            year: The year for the annual metrics
+
+        Returns:
+            VesselMetrics for the requested IMO
+        """
+        url = urljoin(VesselEmissionsAPI.relative_url,
+                      f"emissions/metrics/imo/{imo}")
+        if year is not None:
+            url = urljoin(url, f"?year={year}")
+        return list(
+            await get_multiple(self.__connection, url, VesselMetrics)
+        )
+
+    async def get_emissions_by_vessel_class_id(
+            self,
+            vessel_class_id: int,
+            token: Union[str, None] = None,
+            include_consumptions: bool = False,
+            include_efficiency_metrics: bool = False,
+            include_distances: bool = False,
+            include_durations: bool = False,
+            include_speed_statistics: bool = False,
+            include_eu_emissions: bool = False
+    ) -> Optional[VesselClassEmissions]:
+        """Get emissions estimations for a vessel class.
+
+        See `VesselEmissionsAPI.get_emissions_by_vessel_class_id` for a
+        description of the arguments.
+
+        Returns:
+            List of emissions estimation for all
+             available voyages of a vessel class.
+        """
+        params_dict = VesselEmissionsAPI.construct_url_parameters(
+            token=token,
+            include_consumptions=include_consumptions,
+            include_efficiency_metrics=include_efficiency_metrics,
+            include_distances=include_distances,
+            include_durations=include_durations,
+            include_speed_statistics=include_speed_statistics,
+            include_eu_emissions=include_eu_emissions
+        )
+        query_url = make_url('emissions',
+                             'class', vessel_class_id,
+                             **params_dict)
+
+        url = urljoin(VesselEmissionsAPI.relative_url, query_url)
+        return await get_single(self.__connection, url, VesselClassEmissions)
+
+    async def get_metrics_by_vessel_class_id(
+            self,
+            vessel_class_id: int,
+            year: Union[int, None] = None,
+            token: Union[str, None] = None
+    ) -> Optional[VesselClassMetrics]:
+        """Get vessel class metrics.
+
+        Args:
+            vessel_class_id: The vessel class to retrieve
+            year: The year for the annual metrics
+            token: Next page token
+
+        Returns:
+            VesselClassMetrics for the requested Class
+        """
+        params = {}
+        if year is not None:
+            params["year"] = str(year)
+        if token is not None:
+            params["token"] = token
+        query_url = make_url('emissions/metrics/class',
+                             vessel_class_id,
+                             **params)
+        url = urljoin(VesselEmissionsAPI.relative_url, query_url)
+        return await get_single(self.__connection, url, VesselClassMetrics)
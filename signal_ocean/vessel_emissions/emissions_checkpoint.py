@@ -0,0 +1,78 @@
+"""Persists the page tokens of vessel class emissions retrievals."""
+import os
+import sqlite3
+from typing import Any, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_tokens (
+    name TEXT PRIMARY KEY,
+    token TEXT NOT NULL
+);
+"""
+
+
+class EmissionsCheckpoint:
+    """Keeps the page tokens of vessel class emissions retrievals.
+
+    Tokens are stored in an SQLite database, keyed by the endpoint and
+    parameters of the retrieval they belong to. The token of a retrieval is
+    updated every time a page has been consumed. An incremental retrieval
+    that was interrupted continues from the first page that was not
+    consumed, and one that completed continues from the token of its last,
+    empty page, which is assumed to return the voyages that changed since.
+
+    See `VesselEmissionsAPI.iter_emissions_by_vessel_class_id`.
+    """
+
+    def __init__(self, path: str):
+        """Opens or creates a checkpoint.
+
+        Args:
+            path: The path of the SQLite database holding the tokens. It is
+                created if it does not exist. Use ":memory:" to keep the
+                tokens for the lifetime of the checkpoint only.
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.__db = sqlite3.connect(path)
+        with self.__db:
+            self.__db.executescript(_SCHEMA)
+
+    def get_token(self, name: str) -> Optional[str]:
+        """Reads the token of a retrieval.
+
+        Args:
+            name: The name of the retrieval.
+
+        Returns:
+            The token of the next page of the retrieval, or None if the
+            retrieval has not consumed any pages.
+        """
+        row = self.__db.execute(
+            "SELECT token FROM page_tokens WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_token(self, name: str, token: str) -> None:
+        """Stores the token of a retrieval.
+
+        Args:
+            name: The name of the retrieval.
+            token: The token of the next page of the retrieval.
+        """
+        with self.__db:
+            self.__db.execute(
+                "INSERT OR REPLACE INTO page_tokens VALUES (?, ?)",
+                (name, token),
+            )
+
+    def close(self) -> None:
+        """Closes the underlying database."""
+        self.__db.close()
+
+    def __enter__(self) -> "EmissionsCheckpoint":  # noqa: D105
+        return self
+
+    def __exit__(self, *_: Any) -> None:  # noqa: D105
+        self.close()
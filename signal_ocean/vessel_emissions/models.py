@@ -1,10 +1,12 @@
 """The models for vessel emissions api."""
 import dataclasses
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from operator import attrgetter
 
 
+@lru_cache(maxsize=1024)
 def _to_camel_case_with_special_keywords(s: str) -> str:
     special_keywords = [
         'imo', 'id', 'co', 'co2', 'ch', 'nmvoc',
@@ -570,3 +572,34 @@ class VesselClassMetrics:
                 for vessel_metrics in self.data
             ]
         }
+
+
+@dataclass(frozen=True)
+class VesselEmissionsResult:
+    """The outcome of retrieving the emissions of a vessel in a batch.
+
+    Attributes:
+        imo: Vessel IMO
+        emissions: Emissions estimations for the voyages of the vessel,
+        or None if the retrieval failed
+        error: The error that made the retrieval fail, if any
+
+    """
+    imo: int
+    emissions: Optional[List[EmissionsEstimation]] = None
+    error: Optional[Exception] = None
+
+
+@dataclass(frozen=True)
+class VesselMetricsResult:
+    """The outcome of retrieving the metrics of a vessel in a batch.
+
+    Attributes:
+        imo: Vessel IMO
+        metrics: Metrics of the vessel, or None if the retrieval failed
+        error: The error that made the retrieval fail, if any
+
+    """
+    imo: int
+    metrics: Optional[List[VesselMetrics]] = None
+    error: Optional[Exception] = None
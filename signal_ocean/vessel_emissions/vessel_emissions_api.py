@@ -1,13 +1,33 @@
 """The vessel emissions api."""
 import os
 import copy
-from typing import Optional, List, Union, Dict, Any
+from functools import partial
+from typing import Optional, List, Union, Dict, Any, Callable, Iterable, \
+    Iterator, Tuple, Type, TypeVar, cast
 from urllib.parse import urljoin, urlencode
 from datetime import date
+
+import pandas as pd
+
 from signal_ocean import Connection
-from signal_ocean.util.request_helpers import get_multiple, get_single
+from signal_ocean.util.chunked_retrieval import fetch_each, get_max_workers
+from signal_ocean.util.frame_helpers import FrameBuilder, get_field
+from signal_ocean.util.parsing_helpers import parse_model
+from signal_ocean.util.request_helpers import PageRequest, get_json_pages, \
+    get_multiple, get_single
+from signal_ocean.vessel_emissions.emissions_checkpoint import \
+    EmissionsCheckpoint
 from signal_ocean.vessel_emissions.models import EmissionsEstimation, \
-    VesselMetrics, VesselClassEmissions, VesselClassMetrics
+    VesselMetrics, VesselClassEmissions, VesselClassMetrics, \
+    VesselEmissionsResult, VesselMetricsResult
+
+Progress = Callable[[int, int], None]
+"""Called with the number of vessels retrieved so far and their total."""
+
+TRecord = TypeVar("TRecord")
+
+_Records = List[Dict[str, Any]]
+_Outcome = Tuple[int, Optional[_Records], Optional[Exception]]
 
 
 def make_url(
@@ -81,8 +101,8 @@ class VesselEmissionsAPI:
             )
             self.__connection = connection
 
+    @staticmethod
     def construct_url_parameters(
-            self,
             quantity: Union[int, None] = None,
             token: Optional[str] = None,
             include_consumptions: bool = False,
@@ -273,6 +293,210 @@ class VesselEmissionsAPI:
                                         url,
                                         VesselMetrics)]
 
+    def get_emissions_for_imos(
+            self,
+            imos: Iterable[int],
+            include_consumptions: bool = False,
+            include_efficiency_metrics: bool = False,
+            include_distances: bool = False,
+            include_durations: bool = False,
+            include_speed_statistics: bool = False,
+            include_eu_emissions: bool = False,
+            sulphur_content_hfo: Union[float, None] = None,
+            sulphur_content_lfo: Union[float, None] = None,
+            sulphur_content_mgo: Union[float, None] = None,
+            sulphur_content_lng: Union[float, None] = None,
+            max_workers: Optional[int] = None,
+            progress: Optional[Progress] = None
+    ) -> Iterator[VesselEmissionsResult]:
+        """Retrieves the vessel emissions of many vessels by their IMOs.
+
+        The emissions of each distinct IMO are retrieved as by
+        `get_emissions_by_imo`, concurrently through the API's connection,
+        and returned as they become available, in the order of the IMOs.
+        A failing vessel does not abort the retrieval: its error is
+        captured in its result instead.
+
+        Args:
+            imos: IMOs of the vessels to retrieve emissions.
+            include_consumptions: Include consumption data in the response.
+            include_efficiency_metrics: Include efficiency metrics
+             data in the response.
+            include_distances: Include distances data in the response.
+            include_durations: Include duration data in the response.
+            include_speed_statistics: Include speed statistics
+             data in the response.
+            include_eu_emissions: Include European Union related
+             emissions data in the response.
+            sulphur_content_hfo: Sulphur Content of HFO fuel type.
+            sulphur_content_lfo: Sulphur Content of LFO fuel type.
+            sulphur_content_mgo: Sulphur Content of MGO fuel type.
+            sulphur_content_lng: Sulphur Content of LNG fuel type.
+            max_workers: The maximum number of vessels retrieved at the
+             same time. Defaults to, and is capped at, the pool size of the
+             connection.
+            progress: Called with the number of vessels retrieved so far
+             and the number of distinct IMOs after each vessel.
+
+        Returns:
+            An iterator of the result of each distinct IMO.
+        """
+        url = _get_emissions_url(
+            include_consumptions=include_consumptions,
+            include_efficiency_metrics=include_efficiency_metrics,
+            include_distances=include_distances,
+            include_durations=include_durations,
+            include_speed_statistics=include_speed_statistics,
+            include_eu_emissions=include_eu_emissions,
+            sulphur_content_hfo=sulphur_content_hfo,
+            sulphur_content_lfo=sulphur_content_lfo,
+            sulphur_content_mgo=sulphur_content_mgo,
+            sulphur_content_lng=sulphur_content_lng
+        )
+        outcomes = self.__get_records_for_imos(
+            url, imos, max_workers, progress
+        )
+        for imo, records, error in outcomes:
+            yield VesselEmissionsResult(
+                imo, _parse_records(records, EmissionsEstimation), error
+            )
+
+    def get_emissions_for_imos_frame(
+            self,
+            imos: Iterable[int],
+            include_consumptions: bool = False,
+            include_efficiency_metrics: bool = False,
+            include_distances: bool = False,
+            include_durations: bool = False,
+            include_speed_statistics: bool = False,
+            include_eu_emissions: bool = False,
+            sulphur_content_hfo: Union[float, None] = None,
+            sulphur_content_lfo: Union[float, None] = None,
+            sulphur_content_mgo: Union[float, None] = None,
+            sulphur_content_lng: Union[float, None] = None,
+            max_workers: Optional[int] = None,
+            progress: Optional[Progress] = None
+    ) -> Tuple[pd.DataFrame, Dict[int, Exception]]:
+        """Retrieves the vessel emissions of many vessels into a data frame.
+
+        Vessels are retrieved as by `get_emissions_for_imos`, but responses
+        are decoded straight into typed columns, without creating an
+        `EmissionsEstimation` per voyage.
+
+        Args:
+            imos: IMOs of the vessels to retrieve emissions.
+            include_consumptions: Include consumption data in the response.
+            include_efficiency_metrics: Include efficiency metrics
+             data in the response.
+            include_distances: Include distances data in the response.
+            include_durations: Include duration data in the response.
+            include_speed_statistics: Include speed statistics
+             data in the response.
+            include_eu_emissions: Include European Union related
+             emissions data in the response.
+            sulphur_content_hfo: Sulphur Content of HFO fuel type.
+            sulphur_content_lfo: Sulphur Content of LFO fuel type.
+            sulphur_content_mgo: Sulphur Content of MGO fuel type.
+            sulphur_content_lng: Sulphur Content of LNG fuel type.
+            max_workers: The maximum number of vessels retrieved at the
+             same time. Defaults to, and is capped at, the pool size of the
+             connection.
+            progress: Called with the number of vessels retrieved so far
+             and the number of distinct IMOs after each vessel.
+
+        Returns:
+            A data frame with a row per voyage and a column per attribute of
+            `EmissionsEstimation`, with breakdowns flattened into prefixed
+            columns, e.g. `emissions_laden_co2_in_tons`, and the errors of
+            the vessels that could not be retrieved by IMO.
+        """
+        url = _get_emissions_url(
+            include_consumptions=include_consumptions,
+            include_efficiency_metrics=include_efficiency_metrics,
+            include_distances=include_distances,
+            include_durations=include_durations,
+            include_speed_statistics=include_speed_statistics,
+            include_eu_emissions=include_eu_emissions,
+            sulphur_content_hfo=sulphur_content_hfo,
+            sulphur_content_lfo=sulphur_content_lfo,
+            sulphur_content_mgo=sulphur_content_mgo,
+            sulphur_content_lng=sulphur_content_lng
+        )
+        return _build_frame(
+            EmissionsEstimation,
+            self.__get_records_for_imos(url, imos, max_workers, progress)
+        )
+
+    def get_metrics_for_imos(
+            self,
+            imos: Iterable[int],
+            year: Union[int, None] = None,
+            max_workers: Optional[int] = None,
+            progress: Optional[Progress] = None
+    ) -> Iterator[VesselMetricsResult]:
+        """Retrieves the vessel metrics of many vessels by their IMOs.
+
+        The metrics of each distinct IMO are retrieved as by
+        `get_metrics_by_imo`, concurrently through the API's connection,
+        and returned as they become available, in the order of the IMOs.
+        A failing vessel does not abort the retrieval: its error is
+        captured in its result instead.
+
+        Args:
+            imos: IMOs of the vessels to retrieve metrics.
+            year: The year for the annual metrics
+            max_workers: The maximum number of vessels retrieved at the
+             same time. Defaults to, and is capped at, the pool size of the
+             connection.
+            progress: Called with the number of vessels retrieved so far
+             and the number of distinct IMOs after each vessel.
+
+        Returns:
+            An iterator of the result of each distinct IMO.
+        """
+        outcomes = self.__get_records_for_imos(
+            _get_metrics_url(year), imos, max_workers, progress
+        )
+        for imo, records, error in outcomes:
+            yield VesselMetricsResult(
+                imo, _parse_records(records, VesselMetrics), error
+            )
+
+    def get_metrics_for_imos_frame(
+            self,
+            imos: Iterable[int],
+            year: Union[int, None] = None,
+            max_workers: Optional[int] = None,
+            progress: Optional[Progress] = None
+    ) -> Tuple[pd.DataFrame, Dict[int, Exception]]:
+        """Retrieves the vessel metrics of many vessels into a data frame.
+
+        Vessels are retrieved as by `get_metrics_for_imos`, but responses
+        are decoded straight into typed columns, without creating
+        `VesselMetrics` objects.
+
+        Args:
+            imos: IMOs of the vessels to retrieve metrics.
+            year: The year for the annual metrics
+            max_workers: The maximum number of vessels retrieved at the
+             same time. Defaults to, and is capped at, the pool size of the
+             connection.
+            progress: Called with the number of vessels retrieved so far
+             and the number of distinct IMOs after each vessel.
+
+        Returns:
+            A data frame with a row per vessel and year and a column per
+            attribute of `VesselMetrics`, with nested metrics flattened into
+            prefixed columns, e.g. `cii_rating`, and the errors of the
+            vessels that could not be retrieved by IMO.
+        """
+        return _build_frame(
+            VesselMetrics,
+            self.__get_records_for_imos(
+                _get_metrics_url(year), imos, max_workers, progress
+            )
+        )
+
     def get_emissions_by_vessel_class_id(
             self,
             vessel_class_id: int,
@@ -354,3 +578,213 @@ class VesselEmissionsAPI:
                             query_url)
         url = urljoin(VesselEmissionsAPI.relative_url, query_url)
         return get_single(self.__connection, url, VesselClassMetrics)
+
+    def iter_emissions_by_vessel_class_id(
+            self,
+            vessel_class_id: int,
+            token: Union[str, None] = None,
+            include_consumptions: bool = False,
+            include_efficiency_metrics: bool = False,
+            include_distances: bool = False,
+            include_durations: bool = False,
+            include_speed_statistics: bool = False,
+            include_eu_emissions: bool = False,
+            checkpoint: Optional[EmissionsCheckpoint] = None,
+            incremental: bool = False
+    ) -> Iterator[EmissionsEstimation]:
+        """Iterates over all emissions estimations of a vessel class.
+
+        Pages are requested as by `get_emissions_by_vessel_class_id`,
+        following the next page token of each page until a page without
+        estimations is returned. Only one page is held in memory at a time,
+        and the next page is requested once the current one is consumed, so
+        the empty page ending the iteration is the last request.
+
+        With a checkpoint, the token of the next page is stored every time a
+        page has been consumed. An incremental iteration then continues from
+        the first page that was not consumed by an interrupted one.
+        Estimations of a page that was partly consumed are returned again.
+
+        A completed iteration stores the next page token of the empty page
+        ending it. Incremental iterations assume that the API returns that
+        token as a change cursor, i.e. that requesting it later returns the
+        voyages that changed since, so a periodic refresh only downloads
+        changed voyages. Since this is not guaranteed by the API, iterations
+        retrieve all voyages unless `incremental` is set to True.
+
+        Args:
+            vessel_class_id: The vessel class to retrieve
+            token: Token of the first page to retrieve. If provided, the
+             token stored in the checkpoint is ignored.
+            include_consumptions: Include consumption data in the response.
+            include_efficiency_metrics: Include efficiency metrics
+             data in the response.
+            include_distances: Include distances data in the response.
+            include_durations: Include duration data in the response.
+            include_speed_statistics: Include speed statistics
+             data in the response.
+            include_eu_emissions: Include European Union related emissions
+             data in the response.
+            checkpoint: Stores the token of the next page.
+            incremental: Whether to continue from the token stored in the
+             checkpoint, instead of retrieving all voyages of the class.
+             Defaults to False.
+
+        Returns:
+            An iterator of the emissions estimations of the vessel class.
+        """
+        parameters = self.construct_url_parameters(
+            include_consumptions=include_consumptions,
+            include_efficiency_metrics=include_efficiency_metrics,
+            include_distances=include_distances,
+            include_durations=include_durations,
+            include_speed_statistics=include_speed_statistics,
+            include_eu_emissions=include_eu_emissions
+        )
+        return self.__iter_pages(
+            make_url('emissions', 'class', vessel_class_id),
+            parameters,
+            EmissionsEstimation,
+            token,
+            checkpoint,
+            incremental
+        )
+
+    def iter_metrics_by_vessel_class_id(
+            self,
+            vessel_class_id: int,
+            year: Union[int, None] = None,
+            token: Union[str, None] = None,
+            checkpoint: Optional[EmissionsCheckpoint] = None,
+            incremental: bool = False
+    ) -> Iterator[VesselMetrics]:
+        """Iterates over all vessel metrics of a vessel class.
+
+        Pages are requested as by `get_metrics_by_vessel_class_id` and
+        iterated over as by `iter_emissions_by_vessel_class_id`.
+
+        Args:
+            vessel_class_id: The vessel class to retrieve
+            year: The year for the annual metrics
+            token: Token of the first page to retrieve. If provided, the
+             token stored in the checkpoint is ignored.
+            checkpoint: Stores the token of the next page.
+            incremental: Whether to continue from the token stored in the
+             checkpoint, instead of retrieving all vessels of the class.
+             Defaults to False.
+
+        Returns:
+            An iterator of the vessel metrics of the vessel class.
+        """
+        parameters = {'year': str(year)} if year is not None else {}
+        return self.__iter_pages(
+            make_url('emissions', 'metrics', 'class', vessel_class_id),
+            parameters,
+            VesselMetrics,
+            token,
+            checkpoint,
+            incremental
+        )
+
+    def __iter_pages(
+            self,
+            query_url: str,
+            parameters: Dict[Any, str],
+            cls: Type[TRecord],
+            token: Optional[str],
+            checkpoint: Optional[EmissionsCheckpoint],
+            incremental: bool
+    ) -> Iterator[TRecord]:
+        # Tokens are stored per endpoint and parameters, since they refer
+        # to them.
+        name = make_url(query_url, **parameters)
+        if token is None and checkpoint is not None and incremental:
+            token = checkpoint.get_token(name)
+
+        def get_page_request(page_token: Optional[str]) -> PageRequest:
+            query = dict(parameters)
+            if page_token is not None:
+                query['token'] = page_token
+            return urljoin(VesselEmissionsAPI.relative_url, query_url), query
+
+        pages = get_json_pages(
+            self.__connection, get_page_request, token, prefetch=False
+        )
+        for page in pages:
+            records = get_field(page, 'data')
+            next_page_token = get_field(page, 'next_page_token')
+            for record in records or ():
+                yield parse_model(record, cls)
+
+            # The token of an empty page is assumed to be the one to request
+            # the voyages that change later on.
+            if checkpoint is not None and next_page_token is not None:
+                checkpoint.set_token(name, next_page_token)
+            if not records or next_page_token in (None, token):
+                break
+            token = next_page_token
+
+    def __get_records_for_imos(
+            self,
+            url: str,
+            imos: Iterable[int],
+            max_workers: Optional[int],
+            progress: Optional[Progress]
+    ) -> Iterator[_Outcome]:
+        distinct_imos = tuple(dict.fromkeys(imos))
+        outcomes = fetch_each(
+            distinct_imos,
+            partial(self.__get_records, url),
+            get_max_workers(max_workers, self.__connection.pool_size)
+        )
+        for retrieved, outcome in enumerate(outcomes, 1):
+            if progress is not None:
+                progress(retrieved, len(distinct_imos))
+            yield outcome
+
+    def __get_records(self, url: str, imo: int) -> _Records:
+        response = self.__connection._make_get_request(url.format(imo=imo))
+        response.raise_for_status()
+        return cast(_Records, response.json())
+
+
+def _get_emissions_url(**parameters: Any) -> str:
+    # The query is encoded once for all vessels.
+    query = urlencode(
+        VesselEmissionsAPI.construct_url_parameters(**parameters)
+    )
+    return urljoin(VesselEmissionsAPI.relative_url,
+                   f"emissions/imo/{{imo}}?{query}")
+
+
+def _get_metrics_url(year: Optional[int]) -> str:
+    url = urljoin(VesselEmissionsAPI.relative_url,
+                  "emissions/metrics/imo/{imo}")
+    if year is not None:
+        url = urljoin(url, f"?year={year}")
+    return url
+
+
+def _parse_records(
+        records: Optional[_Records],
+        cls: Type[Any]
+) -> Optional[List[Any]]:
+    if records is None:
+        return None
+    return [parse_model(record, cls) for record in records]
+
+
+def _build_frame(
+        cls: Type[Any],
+        outcomes: Iterator[_Outcome]
+) -> Tuple[pd.DataFrame, Dict[int, Exception]]:
+    builder = FrameBuilder(cls)
+    errors: Dict[int, Exception] = {}
+    for imo, records, error in outcomes:
+        if error is not None:
+            errors[imo] = error
+        else:
+            # Records are decoded as they arrive, so responses are released
+            # while the remaining vessels are retrieved.
+            builder.add(records)
+    return builder.to_frame(), errors
@@ -2,10 +2,17 @@
 
 Classes:
     VesselValuationsAPI: Represents Signal's Vessel Valuations API.
+    AsyncVesselValuationsAPI: Represents Signal's Vessel Valuations API,
+        accessed asynchronously.
     Valuation: Valuation for a specific vessel.
 """
 
 from .vessel_valuations_api import VesselValuationsAPI
+from .async_vessel_valuations_api import AsyncVesselValuationsAPI
 from .models import Valuation
 
-__all__ = ["VesselValuationsAPI", "Valuation"]
+__all__ = [
+    "VesselValuationsAPI",
+    "AsyncVesselValuationsAPI",
+    "Valuation",
+]
@@ -0,0 +1,133 @@
+"""The asynchronous vessel valuations api."""
+from typing import List, Optional
+
+from signal_ocean.async_connection import AsyncConnection
+from signal_ocean.util.async_request_helpers import (
+    get_multiple,
+    get_single,
+    post_multiple,
+)
+from signal_ocean.vessel_valuations.models import (
+    HistoricalValuation,
+    PageValuations,
+    Valuation,
+)
+from signal_ocean.vessel_valuations.vessel_valuations_api import (
+    VesselValuationsAPI,
+    make_url,
+)
+
+
+class AsyncVesselValuationsAPI:
+    """Represents Signal's Vessel Valuation API, accessed asynchronously.
+
+    Mirrors `VesselValuationsAPI` as coroutines returning the same models.
+    """
+
+    def __init__(self, connection: Optional[AsyncConnection] = None):
+        """Initializes AsyncVesselValuationsAPI.
+
+        Args:
+            connection: API connection configuration. If not provided, the
+                default connection method is used.
+        """
+        connection = connection or AsyncConnection()
+        self.__connection = connection._with_auth_header(
+            "Ocp-Apim-Subscription-Key"
+        )
+
+    async def get_all_historical_valuations_by_imo(
+            self,
+            imo: int,
+            from_date: Optional[str] = None,
+            to_date: Optional[str] = None,
+    ) -> Optional[List[HistoricalValuation]]:
+        """Retrieves the historical valuations for a specific vessel.
+
+        Args:
+            imo: The IMO number of the vessel.
+            from_date: The first date of valuation (optional).
+            to_date: The last date of valuation (optional).
+
+        Returns:
+            A List of Historical Valuations for this vessel.
+        """
+        params_dict = {}
+        if from_date is not None:
+            params_dict['FromDate'] = from_date
+        if to_date is not None:
+            params_dict['ToDate'] = to_date
+        query_url = make_url(VesselValuationsAPI.relative_url,
+                             imo,
+                             'historical',
+                             **params_dict)
+        return list(
+            await get_multiple(
+                self.__connection, query_url, HistoricalValuation
+            )
+        )
+
+    async def get_latest_valuation_by_imo(
+            self, imo: int
+    ) -> Optional[Valuation]:
+        """Retrieves the latest valuation for a specific vessel.
+
+        Args:
+            imo: The IMO number of the vessel.
+
+        Returns:
+            A valuation or None if a vessel with the given IMO number does not
+            exist or has no valuation.
+        """
+        url = make_url(VesselValuationsAPI.relative_url,
+                       imo,
+                       'latest')
+        return await get_single(self.__connection, url, Valuation)
+
+    async def get_latest_valuations_by_page(
+            self,
+            page: Optional[int] = None,
+            page_size: Optional[int] = None,
+            changed_since: Optional[str] = None
+    ) -> Optional[PageValuations]:
+        """Retrieves a page of the latest valuations.
+
+        See `VesselValuationsAPI.get_latest_valuations_by_page` for a
+        description of the arguments.
+
+        Returns:
+            A page of valuations.
+        """
+        params_dict = {}
+        if page is not None:
+            params_dict['Page'] = str(page)
+        if page_size is not None:
+            params_dict['PageSize'] = str(page_size)
+        if changed_since is not None:
+            params_dict['ChangedSince'] = str(changed_since)
+        url = make_url(VesselValuationsAPI.relative_url,
+                       'latest',
+                       '',
+                       **params_dict)
+        return await get_single(self.__connection, url, PageValuations)
+
+    async def get_latest_valuations_for_list_of_vessels(
+            self,
+            imo_list: List[int]
+    ) -> List[Optional[Valuation]]:
+        """Retrieves the latest estimated valuations for a list of vessels.
+
+        Args:
+            imo_list: The list of IMO numbers of the vessels.
+
+        Returns:
+            A list of latest valuations
+            for the requested imo numbers.
+        """
+        data = await post_multiple(
+            connection=self.__connection,
+            relative_url=f"{VesselValuationsAPI.relative_url}/latest",
+            cls=Valuation,
+            query_string=imo_list  # type: ignore
+        )
+        return list(data)
@@ -1,5 +1,6 @@
 # noqa: D100
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
 
@@ -15,18 +16,21 @@ def _to_camel_case_custom(s: str,
     Returns:
         The transformed string
     """
+    if rename_keys:
+        if s in rename_keys:
+            return rename_keys[s]
+
+    return _to_lower_camel_case(s)
+
+
+@lru_cache(maxsize=1024)
+def _to_lower_camel_case(s: str) -> str:
     _to_camelcase = s.split('_')
     _to_camelcase = [
         word.capitalize() if _to_camelcase.index(word) > 0
         else word for word in _to_camelcase
     ]
-    result = ''.join(_to_camelcase)
-
-    if rename_keys:
-        if s in rename_keys:
-            result = rename_keys[s]
-
-    return result
+    return ''.join(_to_camelcase)
 
 
 @dataclass(frozen=True)
@@ -2,6 +2,7 @@
 
 Classes:
     VesselsAPI: Represents Signal's Vessels API.
+    AsyncVesselsAPI: Represents Signal's Vessels API, accessed asynchronously.
     Vessel: Represents a Vessel.
     VesselType: Represents the type of the vessel.
     VesselClass: Represents the class of the vessel.
@@ -9,5 +10,7 @@ Classes:
 
 from .models import Vessel, VesselType, VesselClass
 from .vessels_api import VesselsAPI
+from .async_vessels_api import AsyncVesselsAPI
 
-__all__ = ["Vessel", "VesselType", "VesselClass", "VesselsAPI"]
+__all__ = ["Vessel", "VesselType", "VesselClass", "VesselsAPI",
+           "AsyncVesselsAPI"]
@@ -0,0 +1,137 @@
+"""The asynchronous vessels api."""
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin
+
+from signal_ocean.async_connection import AsyncConnection
+from signal_ocean.util.async_request_helpers import get_multiple, get_single
+from signal_ocean.vessels.models import (
+    SingleVesselPagedResponse,
+    Vessel,
+    VesselClass,
+    VesselPagedResponse,
+    VesselType,
+)
+from signal_ocean.vessels.vessels_api import VesselsAPI
+
+
+class AsyncVesselsAPI:
+    """Represents Signal's Vessels API, accessed asynchronously.
+
+    Mirrors the retrieval methods of `VesselsAPI` as coroutines returning the
+    same models.
+    """
+
+    def __init__(self, connection: Optional[AsyncConnection] = None):
+        """Initializes AsyncVesselsAPI.
+
+        Args:
+            connection: API connection configuration. If not provided, the
+                default connection method is used.
+        """
+        self.__connection = connection or AsyncConnection()
+
+    async def get_vessel_classes(self) -> Tuple[VesselClass, ...]:
+        """Retrieves all available vessel classes.
+
+        Returns:
+            A tuple of all available vessel classes.
+        """
+        url = urljoin(VesselsAPI.relative_url, "vesselClasses")
+        return await get_multiple(self.__connection, url, VesselClass)
+
+    async def get_vessel_types(self) -> Tuple[VesselType, ...]:
+        """Retrieves all available vessel types.
+
+        Returns:
+            A tuple of all available vessel types.
+        """
+        url = urljoin(VesselsAPI.relative_url, "vesselTypes")
+        return await get_multiple(self.__connection, url, VesselType)
+
+    async def get_vessel(
+        self, imo: int, includeVesselSanctions: bool = False
+    ) -> Optional[Vessel]:
+        """Retrieves a vessel by its IMO.
+
+        Args:
+            imo: IMO of the vessel to retrieve.
+            includeVesselSanctions: Whether to include sanctions data.
+
+        Returns:
+            A vessel or None if no vessel with the specified IMO has
+                been found.
+        """
+        url = urljoin(
+            VesselsAPI.relative_url,
+            f"vessels/{imo}"
+            + f"?includeVesselSanctions={includeVesselSanctions}",
+        )
+        response = await get_single(
+            self.__connection,
+            url,
+            SingleVesselPagedResponse,
+            rename_keys=VesselsAPI.rename_keys,
+        )
+        return response if response is None else response.data
+
+    async def get_vessels(
+        self, name: Optional[str] = None, includeVesselSanctions: bool = False
+    ) -> Tuple[Vessel, ...]:
+        """Retrieves all available vessels.
+
+        Args:
+            name: String to filter and return only vessels the name of which
+                contains the provided string. If None, all vessels are
+                returned.
+            includeVesselSanctions: Whether to include sanctions data.
+
+        Returns:
+            A tuple of all available vessels.
+        """
+        endpoint = (
+            "vessels" if name is None else f"vessels/searchByName/{name}"
+        ) + f"?includeVesselSanctions={includeVesselSanctions}"
+        return await self.__get_vessels_pages(
+            urljoin(VesselsAPI.relative_url, endpoint)
+        )
+
+    async def get_vessels_by_vessel_class(
+        self, vesselClass: int, includeVesselSanctions: bool = False
+    ) -> Optional[Tuple[Vessel, ...]]:
+        """Retrieves all vessels of a specific vessel class.
+
+        Args:
+            vesselClass: Vessel Class of the vessels to retrieve.
+            includeVesselSanctions: Whether to include sanctions data.
+
+        Returns:
+            A tuple of all available vessels.
+        """
+        endpoint = f"vessels?vesselClass={vesselClass}"
+        endpoint += f"&includeVesselSanctions={includeVesselSanctions}"
+        vessels = await self.__get_vessels_pages(
+            urljoin(VesselsAPI.relative_url, endpoint)
+        )
+        return vessels if len(vessels) > 0 else None
+
+    async def __get_vessels_pages(self, url: str) -> Tuple[Vessel, ...]:
+        vessels: List[Vessel] = []
+        next_page_token: Optional[str] = None
+        while True:
+            specific_url = (
+                url
+                if next_page_token is None
+                else f"{url}&token={next_page_token}"
+            )
+            response = await get_single(
+                self.__connection,
+                specific_url,
+                VesselPagedResponse,
+                rename_keys=VesselsAPI.rename_keys,
+            )
+            vessels.extend(response.data if response else ())
+            next_page_token = response.next_page_token if response else None
+            if next_page_token is None:
+                break
+
+        return tuple(vessels)
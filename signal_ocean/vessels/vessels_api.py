@@ -1,9 +1,14 @@
 """The vessels api."""
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from urllib.parse import urljoin
 from datetime import date
 from signal_ocean import Connection
-from signal_ocean.util.request_helpers import get_multiple, get_single
+from signal_ocean.util.request_helpers import (
+    PageRequest,
+    get_multiple,
+    get_pages,
+    get_single,
+)
 from signal_ocean.vessels.models import (VesselClass, VesselType,
                                          Vessel, SingleVesselPagedResponse,
                                          VesselPagedResponse,
@@ -79,7 +84,8 @@ class VesselsAPI:
 
     def get_vessels(self,
                     name: Optional[str] = None,
-                    includeVesselSanctions: bool = False
+                    includeVesselSanctions: bool = False,
+                    prefetch: bool = False
                     ) -> Tuple[Vessel, ...]:
         """Retrieves all available vessels.
 
@@ -87,6 +93,10 @@ class VesselsAPI:
                 name: String to filter and return only companies the name
                         of which contains the provided string. If None, all
                         companies are returned.
+                prefetch: Whether to request the next page on a background
+                        thread while the current one is being decoded.
+                        Makes a speculative request for the page after the
+                        last one.
 
         Returns:
             A tuple of all available vessels.
@@ -99,22 +109,7 @@ class VesselsAPI:
         )
         url = urljoin(VesselsAPI.relative_url, endpoint)
 
-        hasNextPage = True
-        nextPageToken: Optional[str] = ""
-        vessels: Tuple[Vessel, ...] = ()
-        while(hasNextPage):
-            specific_url = url + (nextPageToken
-                                  if nextPageToken == ""
-                                  else f"&token={nextPageToken}")
-            response = get_single(self.__connection,
-                                  specific_url,
-                                  VesselPagedResponse,
-                                  rename_keys=VesselsAPI.rename_keys)
-            vessels = vessels + (response.data if response else ())
-            nextPageToken = response.next_page_token if response else None
-            hasNextPage = nextPageToken is not None
-
-        return vessels
+        return self.__get_vessels_pages(url, prefetch)
 
     def get_vessels_by_vessel_class(
         self, vesselClass: int,  includeVesselSanctions: bool = False
@@ -130,23 +125,26 @@ class VesselsAPI:
         endpoint = f"vessels?vesselClass={vesselClass}"
         endpoint += f"&includeVesselSanctions={includeVesselSanctions}"
         url = urljoin(VesselsAPI.relative_url, endpoint)
-        vessels: Tuple[Vessel, ...] = ()
-        hasNextPage = True
-        nextPageToken: Optional[str] = ""
-        while(hasNextPage):
-            specific_url = url + (nextPageToken
-                                  if nextPageToken == ""
-                                  else f"&token={nextPageToken}")
-            response = get_single(self.__connection,
-                                  specific_url,
-                                  VesselPagedResponse,
-                                  rename_keys=VesselsAPI.rename_keys)
-            vessels = vessels + (response.data if response else ())
-            nextPageToken = response.next_page_token if response else None
-            hasNextPage = nextPageToken is not None
+        vessels = self.__get_vessels_pages(url)
 
         return vessels if len(vessels) > 0 else None
 
+    def __get_vessels_pages(
+        self, url: str, prefetch: bool = False
+    ) -> Tuple[Vessel, ...]:
+        def get_page_request(token: Optional[str]) -> PageRequest:
+            return (url if token is None else f"{url}&token={token}"), None
+
+        vessels: List[Vessel] = []
+        for response in get_pages(self.__connection,
+                                  VesselPagedResponse,
+                                  get_page_request,
+                                  rename_keys=VesselsAPI.rename_keys,
+                                  prefetch=prefetch):
+            vessels.extend(response.data if response else ())
+
+        return tuple(vessels)
+
     def get_vessels_name_history(
             self, imo: Optional[int] = None
     ) -> Tuple[VesselFieldResponse, ...]:
@@ -2,13 +2,19 @@
 
 Classes:
     VoyagesAPI: Represents Signal's Voyages API.
+    AsyncVoyagesAPI: Represents Signal's Voyages API, accessed asynchronously.
     Voyage: Represents a Voyage of a vessel.
     VoyageEvent: Represents an Event associated with a Voyage.
     VoyageEventDetail: Represents details about a VoyageEvent.
     VoyageGeo: Represents a geo asset object associated with a voyage.
     VoyagesFlat: Voyages with additional information in flat format.
+    VoyagesFlatFrames: Voyages with additional information in flat format,
+        as data frames.
     VoyagesIncremental: Incremental voyages, including token for next request.
     VoyagesCondensed: Voyages with additional information in condensed format.
+    VoyagesStore: A local store of voyages kept up to date with incremental
+        requests.
+    VoyagesSyncResult: The changes applied to a store by a synchronization.
     Vessel: Vessel name and IMO
     VesselFilter: Vessel Filter object
     VesselClass: Vessel class
@@ -29,8 +35,11 @@ from .models import (
     VesselClassFilter,
     VesselTypeFilter,
     VoyageCondensed,
+    VoyagesFlatFrames,
 )
 from .voyages_api import VoyagesAPI
+from .async_voyages_api import AsyncVoyagesAPI
+from .voyages_store import VoyagesStore, VoyagesSyncResult
 
 __all__ = [
     "Voyage",
@@ -38,6 +47,7 @@ __all__ = [
     "VoyageEventDetail",
     "VoyageGeo",
     "VoyagesAPI",
+    "AsyncVoyagesAPI",
     "Vessel",
     "VesselFilter",
     "VesselClass",
@@ -45,4 +55,7 @@ __all__ = [
     "VesselType",
     "VesselTypeFilter",
     "VoyageCondensed",
+    "VoyagesFlatFrames",
+    "VoyagesStore",
+    "VoyagesSyncResult",
 ]
@@ -0,0 +1,303 @@
+"""The asynchronous voyages api."""
+from datetime import date
+from typing import Any, List, Optional, Tuple, Type
+
+from signal_ocean.async_connection import AsyncConnection
+from signal_ocean.util.async_request_helpers import get_single
+from signal_ocean.voyages.models import (
+    Voyage,
+    VoyageCondensed,
+    VoyageEvent,
+    VoyageEventDetail,
+    VoyageGeo,
+    VoyagesCondensedPagedResponse,
+    VoyagesFlat,
+    VoyagesFlatPagedResponse,
+    VoyagesPagedResponse,
+)
+from signal_ocean.voyages.voyages_api import (
+    NextRequestToken,
+    Voyages,
+    VoyagesAPI,
+    VoyagesCondensed,
+)
+
+
+class AsyncVoyagesAPI:
+    """Represents Signal's Voyages API, accessed asynchronously.
+
+    Mirrors the retrieval methods of `VoyagesAPI` as coroutines returning the
+    same models. Pages of a single query are fetched one after another,
+    while separate queries, e.g. for many IMOs, can run concurrently up to
+    the connection's concurrency limit.
+    """
+
+    def __init__(self, connection: Optional[AsyncConnection] = None):
+        """Initializes AsyncVoyagesAPI.
+
+        Args:
+            connection: API connection configuration. If not provided, the
+                default connection method is used.
+        """
+        self.__connection = connection or AsyncConnection()
+
+    @staticmethod
+    def __get_endpoint(
+        imo: Optional[int],
+        vessel_class_id: Optional[int],
+        vessel_type_id: Optional[int],
+        date_from: Optional[date],
+        incremental: bool = False,
+        nested: bool = True,
+        condensed: bool = False,
+    ) -> str:
+        return VoyagesAPI._get_endpoint(
+            imo=[imo] if imo is not None else [],
+            vessel_class_id=(
+                [vessel_class_id] if vessel_class_id is not None else []
+            ),
+            vessel_type_id=vessel_type_id,
+            start_date_from=None if incremental else date_from,
+            voyage_date_from=date_from if incremental else None,
+            nested=nested,
+            condensed=condensed,
+            incremental=incremental,
+        )
+
+    async def __get_pages(
+        self,
+        endpoint: str,
+        response_class: Type[Any],
+        token: Optional[str] = None,
+    ) -> Tuple[List[Any], Optional[NextRequestToken]]:
+        pages: List[Any] = []
+        next_page_token = token
+        while True:
+            params = (
+                {"token": next_page_token}
+                if next_page_token is not None
+                else None
+            )
+            response = await get_single(
+                self.__connection,
+                endpoint,
+                response_class,
+                query_string=params,
+            )
+            if response is not None and response.data is not None:
+                pages.append(response.data)
+            next_page_token = (
+                response.next_page_token if response is not None else None
+            )
+
+            if next_page_token is None:
+                break
+
+        next_request_token = (
+            response.next_request_token if response is not None else None
+        )
+        return pages, next_request_token
+
+    async def __get_voyages_pages(
+        self, endpoint: str, token: Optional[str] = None
+    ) -> Tuple[Voyages, Optional[NextRequestToken]]:
+        pages, next_request_token = await self.__get_pages(
+            endpoint, VoyagesPagedResponse, token
+        )
+        voyages: Voyages = tuple(v for page in pages for v in page)
+        return voyages, next_request_token
+
+    async def __get_voyages_flat_pages(
+        self, endpoint: str, token: Optional[str] = None
+    ) -> Tuple[VoyagesFlat, Optional[NextRequestToken]]:
+        pages, next_request_token = await self.__get_pages(
+            endpoint, VoyagesFlatPagedResponse, token
+        )
+        voyages: List[Voyage] = []
+        events: List[VoyageEvent] = []
+        event_details: List[VoyageEventDetail] = []
+        geos: List[VoyageGeo] = []
+        for page in pages:
+            voyages.extend(page.voyages or [])
+            events.extend(page.events or [])
+            event_details.extend(page.event_details or [])
+            geos.extend(page.geos or [])
+
+        # Remove duplicate geos entries because of the multiple paging
+        geos = list({geo.id: geo for geo in geos}.values())
+
+        result = VoyagesFlat(
+            voyages=tuple(voyages),
+            events=tuple(events),
+            event_details=tuple(event_details),
+            geos=tuple(geos),
+        )
+        return result, next_request_token
+
+    async def __get_voyages_condensed_pages(
+        self, endpoint: str, token: Optional[str] = None
+    ) -> Tuple[VoyagesCondensed, Optional[NextRequestToken]]:
+        pages, next_request_token = await self.__get_pages(
+            endpoint, VoyagesCondensedPagedResponse, token
+        )
+        voyages: Tuple[VoyageCondensed, ...] = tuple(
+            v for page in pages for v in page
+        )
+        return voyages, next_request_token
+
+    async def get_voyages(
+        self,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+    ) -> Voyages:
+        """Retrieves all voyages filtered with the provided parameters.
+
+        See `VoyagesAPI.get_voyages` for a description of the arguments.
+
+        Returns:
+            Voyages data as a tupple.
+        """
+        endpoint = self.__get_endpoint(
+            imo, vessel_class_id, vessel_type_id, date_from
+        )
+        results, _ = await self.__get_voyages_pages(endpoint)
+        return results
+
+    async def get_voyages_flat(
+        self,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+    ) -> VoyagesFlat:
+        """Retrieves all voyages filtered with the provided parameters.
+
+        See `VoyagesAPI.get_voyages_flat` for a description of the arguments.
+
+        Returns:
+            A VoyagesFlat object containing lists of voyages, voyage events, \
+            voyage event details and voyage geos.
+        """
+        endpoint = self.__get_endpoint(
+            imo, vessel_class_id, vessel_type_id, date_from, nested=False
+        )
+        results, _ = await self.__get_voyages_flat_pages(endpoint)
+        return results
+
+    async def get_voyages_condensed(
+        self,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+    ) -> VoyagesCondensed:
+        """Retrieves all voyages filtered with the provided parameters.
+
+        See `VoyagesAPI.get_voyages_condensed` for a description of the
+        arguments.
+
+        Returns:
+            A tuple of voyages in condensed format.
+        """
+        endpoint = self.__get_endpoint(
+            imo,
+            vessel_class_id,
+            vessel_type_id,
+            date_from,
+            nested=False,
+            condensed=True,
+        )
+        results, _ = await self.__get_voyages_condensed_pages(endpoint)
+        return results
+
+    async def get_incremental_voyages(
+        self,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        incremental_token: Optional[str] = None,
+    ) -> Tuple[Voyages, Optional[NextRequestToken]]:
+        """Retrieves all voyages filtered with the provided parameters.
+
+        See `VoyagesAPI.get_incremental_voyages` for a description of the
+        arguments.
+
+        Returns:
+            A tuple containing the returned voyages, including any deleted \
+            voyages, and the token for the next incremental request.
+        """
+        endpoint = self.__get_endpoint(
+            imo,
+            vessel_class_id,
+            vessel_type_id,
+            date_from,
+            incremental=True,
+            nested=True,
+        )
+        return await self.__get_voyages_pages(
+            endpoint, token=incremental_token
+        )
+
+    async def get_incremental_voyages_flat(
+        self,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        incremental_token: Optional[str] = None,
+    ) -> Tuple[VoyagesFlat, Optional[NextRequestToken]]:
+        """Retrieves all voyages filtered with the provided parameters.
+
+        See `VoyagesAPI.get_incremental_voyages_flat` for a description of
+        the arguments.
+
+        Returns:
+            A tuple containing the returned voyages in flat format, \
+            including any deleted voyages, and the token for the next \
+            incremental request.
+        """
+        endpoint = self.__get_endpoint(
+            imo,
+            vessel_class_id,
+            vessel_type_id,
+            date_from,
+            incremental=True,
+            nested=False,
+        )
+        return await self.__get_voyages_flat_pages(
+            endpoint, token=incremental_token
+        )
+
+    async def get_incremental_voyages_condensed(
+        self,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        incremental_token: Optional[str] = None,
+    ) -> Tuple[VoyagesCondensed, Optional[NextRequestToken]]:
+        """Retrieves all voyages filtered with the provided parameters.
+
+        See `VoyagesAPI.get_incremental_voyages_condensed` for a description
+        of the arguments.
+
+        Returns:
+            A tuple containing the returned voyages in condensed format, \
+            including any deleted voyages, and the token for the next \
+            incremental request.
+        """
+        endpoint = self.__get_endpoint(
+            imo,
+            vessel_class_id,
+            vessel_type_id,
+            date_from,
+            incremental=True,
+            nested=False,
+            condensed=True,
+        )
+        return await self.__get_voyages_condensed_pages(
+            endpoint, token=incremental_token
+        )
@@ -2,6 +2,9 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Tuple, Iterable
+
+import pandas as pd
+
 from .._internals import contains_caseless
 
 
@@ -997,6 +1000,29 @@ class VoyagesFlat:
     geos: Optional[Tuple[VoyageGeo, ...]] = None
 
 
+@dataclass(frozen=True, eq=False)
+class VoyagesFlatFrames:
+    """Voyages with additional information in flat format, as data frames.
+
+    Each data frame has a column per attribute of the corresponding model
+    and a row per record. Attributes holding sequences of models, such as
+    the events of a voyage, are not included; they are available in the
+    data frame of the related records instead.
+
+    Attributes:
+        voyages: Data frame of voyages.
+        events: Data frame of the events that relate to the voyages.
+        event_details: Data frame of the event details that relate to the
+            events.
+        geos: Data frame of the geo assets linked in events or event details.
+    """
+
+    voyages: pd.DataFrame
+    events: pd.DataFrame
+    event_details: pd.DataFrame
+    geos: pd.DataFrame
+
+
 @dataclass(frozen=True)
 class VoyagesPagedResponse:
     """Paged response for voyages in nested format from the Voyages API.
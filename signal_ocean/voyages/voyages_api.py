@@ -1,16 +1,22 @@
 """The voyages api."""
 from datetime import date
-from typing import Optional, Tuple, List
+from typing import Any, Iterator, Optional, Tuple, List
 from urllib.parse import urljoin, urlencode
 
 from signal_ocean import Connection
-from signal_ocean.util.request_helpers import get_single
+from signal_ocean.util.frame_helpers import FrameBuilder, get_field
+from signal_ocean.util.request_helpers import (
+    get_json_pages,
+    get_pages,
+    token_page_request,
+)
 from signal_ocean.util.parsing_helpers import _to_camel_case, parse_model
 from signal_ocean.voyages.models import (
     Voyage,
     VoyageCondensed,
     VoyagesCondensedPagedResponse,
     VoyagesFlat,
+    VoyagesFlatFrames,
     VoyagesFlatPagedResponse,
     VoyageEvent,
     VoyageEventDetail,
@@ -114,13 +120,18 @@ class VoyagesAPI:
         return urljoin(VoyagesAPI.relative_url, endpoint)
 
     def _get_voyages_pages(
-        self, endpoint: str, token: Optional[str] = None
+        self,
+        endpoint: str,
+        token: Optional[str] = None,
+        prefetch: bool = False,
     ) -> Tuple[Voyages, Optional[NextRequestToken]]:
         """Get voyages paged data.
 
         Args:
             endpoint: The endpoint to call.
             token: Next request token for incremental voyages.
+            prefetch: Whether to request the next page while the current one
+                is being decoded.
 
         Make consecutive requests until no next page token is returned, gather
         and return data.
@@ -130,27 +141,16 @@ class VoyagesAPI:
             The next request token, to be used for incremental updates.
         """
         results: List[Voyage] = []
-        next_page_token = token
-        while True:
-            params = (
-                {"token": next_page_token}
-                if next_page_token is not None
-                else None
-            )
-            response = get_single(
-                self.__connection,
-                endpoint,
-                VoyagesPagedResponse,
-                query_string=params,
-            )
+        response: Optional[VoyagesPagedResponse] = None
+        for response in get_pages(
+            self.__connection,
+            VoyagesPagedResponse,
+            token_page_request(endpoint),
+            token,
+            prefetch=prefetch,
+        ):
             if response is not None and response.data is not None:
                 results.extend(response.data)
-            next_page_token = (
-                response.next_page_token if response is not None else None
-            )
-
-            if next_page_token is None:
-                break
 
         next_request_token = (
             response.next_request_token if response is not None else None
@@ -158,13 +158,18 @@ class VoyagesAPI:
         return tuple(results), next_request_token
 
     def _get_voyages_flat_pages(
-        self, endpoint: str, token: Optional[str] = None
+        self,
+        endpoint: str,
+        token: Optional[str] = None,
+        prefetch: bool = False,
     ) -> Tuple[VoyagesFlat, Optional[NextRequestToken]]:
         """Get voyages flat paged data.
 
         Args:
             endpoint: The endpoint to call.
             token: Next request token for incremental voyages.
+            prefetch: Whether to request the next page while the current one
+                is being decoded.
 
         Make consecutive requests until no next page token is returned, gather
         and return data.
@@ -177,34 +182,20 @@ class VoyagesAPI:
         events: List[VoyageEvent] = []
         event_details: List[VoyageEventDetail] = []
         geos: List[VoyageGeo] = []
-        next_page_token = token
-        while True:
-            params = (
-                {"token": next_page_token}
-                if next_page_token is not None
-                else None
-            )
-
-            response = get_single(
-                self.__connection,
-                endpoint,
-                VoyagesFlatPagedResponse,
-                query_string=params,
-            )
-
+        response: Optional[VoyagesFlatPagedResponse] = None
+        for response in get_pages(
+            self.__connection,
+            VoyagesFlatPagedResponse,
+            token_page_request(endpoint),
+            token,
+            prefetch=prefetch,
+        ):
             if response is not None and response.data is not None:
                 voyages.extend(response.data.voyages or [])
                 events.extend(response.data.events or [])
                 event_details.extend(response.data.event_details or [])
                 geos.extend(response.data.geos or [])
 
-            next_page_token = (
-                response.next_page_token if response is not None else None
-            )
-
-            if next_page_token is None:
-                break
-
         # Remove duplicate geos entries because of the multiple paging
         geos = list({geo.id: geo for geo in geos}.values())
 
@@ -221,14 +212,89 @@ class VoyagesAPI:
 
         return result, next_request_token
 
+    def _get_voyages_flat_frames(
+        self,
+        endpoint: str,
+        token: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> Tuple[VoyagesFlatFrames, Optional[NextRequestToken]]:
+        """Get voyages flat paged data as data frames.
+
+        Args:
+            endpoint: The endpoint to call.
+            token: Next request token for incremental voyages.
+            prefetch: Whether to request the next page while the current one
+                is being decoded.
+
+        Make consecutive requests until no next page token is returned and
+        decode the records of each page straight into data frame columns.
+
+        Returns:
+            Voyages flat data gathered from the returned pages as data
+            frames. The next request token, to be used for incremental
+            updates.
+        """
+        voyages = FrameBuilder(Voyage)
+        events = FrameBuilder(VoyageEvent)
+        event_details = FrameBuilder(VoyageEventDetail)
+        geos = FrameBuilder(VoyageGeo)
+        page = None
+        for page in self._get_json_pages(endpoint, token, prefetch):
+            data = get_field(page, "data")
+            voyages.add(get_field(data, "voyages"))
+            events.add(get_field(data, "events"))
+            event_details.add(get_field(data, "event_details"))
+            geos.add(get_field(data, "geos"))
+
+        result = VoyagesFlatFrames(
+            voyages=voyages.to_frame(),
+            events=events.to_frame(),
+            event_details=event_details.to_frame(),
+            # Remove duplicate geos entries because of the multiple paging
+            geos=geos.to_frame()
+            .drop_duplicates(subset="id", keep="last")
+            .reset_index(drop=True),
+        )
+
+        return result, get_field(page, "next_request_token")
+
+    def _get_json_pages(
+        self,
+        endpoint: str,
+        token: Optional[str] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Any]:
+        """Get voyages paged data as decoded JSON pages.
+
+        Args:
+            endpoint: The endpoint to call.
+            token: Next request token for incremental voyages, or the next
+                page token to continue from.
+            prefetch: Whether to request the next page while the current one
+                is being consumed.
+
+        Make consecutive requests until no next page token is returned.
+
+        Yields:
+            The decoded JSON of each returned page.
+        """
+        return get_json_pages(
+            self.__connection, token_page_request(endpoint), token, prefetch
+        )
+
     def _get_voyages_condensed_pages(
-        self, endpoint: str, token: Optional[str] = None
+        self,
+        endpoint: str,
+        token: Optional[str] = None,
+        prefetch: bool = False,
     ) -> Tuple[VoyagesCondensed, Optional[NextRequestToken]]:
         """Get voyages condensed paged data.
 
         Args:
             endpoint: The endpoint to call.
             token: Next request token for incremental voyages.
+            prefetch: Whether to request the next page while the current one
+                is being decoded.
 
         Make consecutive requests until no next page token is returned, gather
         and return data.
@@ -238,27 +304,16 @@ class VoyagesAPI:
             tupple. The next request token, for incremental updates.
         """
         results: List[VoyageCondensed] = []
-        next_page_token = token
-        while True:
-            params = (
-                {"token": next_page_token}
-                if next_page_token is not None
-                else None
-            )
-            response = get_single(
-                self.__connection,
-                endpoint,
-                VoyagesCondensedPagedResponse,
-                query_string=params,
-            )
+        response: Optional[VoyagesCondensedPagedResponse] = None
+        for response in get_pages(
+            self.__connection,
+            VoyagesCondensedPagedResponse,
+            token_page_request(endpoint),
+            token,
+            prefetch=prefetch,
+        ):
             if response is not None and response.data is not None:
                 results.extend(response.data)
-            next_page_token = (
-                response.next_page_token if response is not None else None
-            )
-
-            if next_page_token is None:
-                break
 
         next_request_token = (
             response.next_request_token if response is not None else None
@@ -271,6 +326,7 @@ class VoyagesAPI:
         vessel_class_id: Optional[int] = None,
         vessel_type_id: Optional[int] = None,
         date_from: Optional[date] = None,
+        prefetch: bool = False,
     ) -> Voyages:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -286,6 +342,10 @@ class VoyagesAPI:
                 ignored.
             date_from: Return voyages after provided date. If imo is
                 specified, then date_from is ignored.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             Voyages data as a tupple.
@@ -306,7 +366,7 @@ class VoyagesAPI:
             vessel_type_id=vessel_type_id,
             start_date_from=date_from
         )
-        results, _ = self._get_voyages_pages(endpoint)
+        results, _ = self._get_voyages_pages(endpoint, prefetch=prefetch)
         return results
 
     def get_voyages_flat(
@@ -315,6 +375,7 @@ class VoyagesAPI:
         vessel_class_id: Optional[int] = None,
         vessel_type_id: Optional[int] = None,
         date_from: Optional[date] = None,
+        prefetch: bool = False,
     ) -> Optional[VoyagesFlat]:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -330,6 +391,10 @@ class VoyagesAPI:
                 ignored.
             date_from: Return voyages after provided date. If imo is
                 specified, then date_from is treated as None.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             A VoyagesFlat object containing lists of voyages, voyage events, \
@@ -352,7 +417,57 @@ class VoyagesAPI:
             start_date_from=date_from,
             nested=False
         )
-        results, _ = self._get_voyages_flat_pages(endpoint)
+        results, _ = self._get_voyages_flat_pages(
+            endpoint, prefetch=prefetch
+        )
+        return results
+
+    def get_voyages_flat_frames(
+        self,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        prefetch: bool = False,
+    ) -> VoyagesFlatFrames:
+        """Retrieves all voyages filtered with the provided parameters.
+
+        Unlike `get_voyages_flat`, records are decoded straight into data
+        frame columns without creating a model object per record, which is
+        considerably faster and lighter on memory for large results.
+
+        Args:
+            imo: Return only voyages for the provided vessel IMO. If None
+                voyages for all vessels are returned.
+            vessel_class_id: Return only voyages for the provided vessel
+                class. If None, voyages for all vessels are returned. If imo
+                is specified, then vessel_class_id is ignored.
+            vessel_type_id: Return only voyages for the provided vessel type.
+                If None, voyages for all vessels are returned. If either imo
+                or vessel_class_id is specified, then vessel_type_id is
+                ignored.
+            date_from: Return voyages after provided date. If imo is
+                specified, then date_from is treated as None.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding.
+
+        Returns:
+            A VoyagesFlatFrames object containing data frames of voyages, \
+            voyage events, voyage event details and voyage geos.
+        """
+        endpoint = self._get_endpoint(
+            imo=[imo] if imo is not None else [],
+            vessel_class_id=(
+                [vessel_class_id] if vessel_class_id is not None else []
+            ),
+            vessel_type_id=vessel_type_id,
+            start_date_from=date_from,
+            nested=False
+        )
+        results, _ = self._get_voyages_flat_frames(
+            endpoint, prefetch=prefetch
+        )
         return results
 
     def get_voyages_condensed(
@@ -361,6 +476,7 @@ class VoyagesAPI:
         vessel_class_id: Optional[int] = None,
         vessel_type_id: Optional[int] = None,
         date_from: Optional[date] = None,
+        prefetch: bool = False,
     ) -> VoyagesCondensed:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -376,6 +492,10 @@ class VoyagesAPI:
                 ignored.
             date_from: Return voyages after provided date. If imo is
                 specified, then date_from is treated as None.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             A VoyagesCondensed object containing lists of voyages.
@@ -397,7 +517,9 @@ class VoyagesAPI:
             nested=False,
             condensed=True
         )
-        results, _ = self._get_voyages_condensed_pages(endpoint)
+        results, _ = self._get_voyages_condensed_pages(
+            endpoint, prefetch=prefetch
+        )
         return results
 
     def get_incremental_voyages(
@@ -407,6 +529,7 @@ class VoyagesAPI:
         vessel_type_id: Optional[int] = None,
         date_from: Optional[date] = None,
         incremental_token: Optional[str] = None,
+        prefetch: bool = False,
     ) -> Tuple[Voyages, Optional[NextRequestToken]]:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -424,6 +547,10 @@ class VoyagesAPI:
                 specified, then date_from is treated as None.
             incremental_token: Token returned from the previous incremental
                 call. If this is the first call, then it can be omitted.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             A tuple containing the returned voyages, including any deleted \
@@ -446,7 +573,9 @@ class VoyagesAPI:
             nested=True,
             incremental=True
         )
-        results = self._get_voyages_pages(endpoint, token=incremental_token)
+        results = self._get_voyages_pages(
+            endpoint, token=incremental_token, prefetch=prefetch
+        )
         return results
 
     def get_incremental_voyages_flat(
@@ -456,6 +585,7 @@ class VoyagesAPI:
         vessel_type_id: Optional[int] = None,
         date_from: Optional[date] = None,
         incremental_token: Optional[str] = None,
+        prefetch: bool = False,
     ) -> Tuple[VoyagesFlat, Optional[NextRequestToken]]:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -473,6 +603,10 @@ class VoyagesAPI:
                 specified, then datevoyages_from is treated as None.
             incremental_token: Token returned from the previous incremental
                 call. If this is the first call, then it can be omitted.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             A tuple containing the returned voyages in flat format, \
@@ -497,7 +631,7 @@ class VoyagesAPI:
             incremental=True
         )
         results = self._get_voyages_flat_pages(
-            endpoint, token=incremental_token
+            endpoint, token=incremental_token, prefetch=prefetch
         )
         return results
 
@@ -508,6 +642,7 @@ class VoyagesAPI:
         vessel_type_id: Optional[int] = None,
         date_from: Optional[date] = None,
         incremental_token: Optional[str] = None,
+        prefetch: bool = False,
     ) -> Tuple[VoyagesCondensed, Optional[NextRequestToken]]:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -525,6 +660,10 @@ class VoyagesAPI:
                 specified, then date_from is treated as None.
             incremental_token: Token returned from the previous incremental
                 call. If this is the first call, then it can be omitted.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             A tuple containing the returned voyages in condensed format, \
@@ -550,7 +689,7 @@ class VoyagesAPI:
             condensed=True
         )
         results = self._get_voyages_condensed_pages(
-            endpoint, token=incremental_token
+            endpoint, token=incremental_token, prefetch=prefetch
         )
         return results
 
@@ -585,6 +724,7 @@ class VoyagesAPI:
         hide_event_details: Optional[bool] = None,
         hide_events: Optional[bool] = None,
         hide_market_info: Optional[bool] = None,
+        prefetch: bool = False,
     ) -> Voyages:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -647,6 +787,10 @@ class VoyagesAPI:
             hide_events: If True, then events will be excluded.
             hide_market_info: If True, then market information will be
                 excluded.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             Voyages data as a tupple.
@@ -701,7 +845,7 @@ class VoyagesAPI:
             hide_events=hide_events,
             hide_market_info=hide_market_info,
         )
-        results, _ = self._get_voyages_pages(endpoint)
+        results, _ = self._get_voyages_pages(endpoint, prefetch=prefetch)
         return results
 
     def get_voyages_flat_by_advanced_search(
@@ -735,6 +879,7 @@ class VoyagesAPI:
         hide_event_details: Optional[bool] = None,
         hide_events: Optional[bool] = None,
         hide_market_info: Optional[bool] = None,
+        prefetch: bool = False,
     ) -> VoyagesFlat:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -797,6 +942,10 @@ class VoyagesAPI:
             hide_events: If True, then events will be excluded.
             hide_market_info: If True, then market information will be
                 excluded.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             Voyages data in flat format as a tupple.
@@ -854,7 +1003,9 @@ class VoyagesAPI:
             hide_market_info=hide_market_info,
             nested=False
         )
-        results, _ = self._get_voyages_flat_pages(endpoint)
+        results, _ = self._get_voyages_flat_pages(
+            endpoint, prefetch=prefetch
+        )
         return results
 
     def get_voyages_condensed_by_advanced_search(
@@ -888,6 +1039,7 @@ class VoyagesAPI:
         hide_event_details: Optional[bool] = None,
         hide_events: Optional[bool] = None,
         hide_market_info: Optional[bool] = None,
+        prefetch: bool = False,
     ) -> VoyagesCondensed:
         """Retrieves all voyages filtered with the provided parameters.
 
@@ -950,6 +1102,10 @@ class VoyagesAPI:
             hide_events: If True, then events will be excluded.
             hide_market_info: If True, then market information will be
                 excluded.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one.
 
         Returns:
             Voyages data in condensed format as a tupple.
@@ -1008,7 +1164,9 @@ class VoyagesAPI:
             nested=False,
             condensed=True
         )
-        results, _ = self._get_voyages_condensed_pages(endpoint)
+        results, _ = self._get_voyages_condensed_pages(
+            endpoint, prefetch=prefetch
+        )
         return results
 
     def get_vessel_classes(
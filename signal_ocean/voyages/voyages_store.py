@@ -0,0 +1,262 @@
+"""A local store of voyages kept up to date with incremental requests."""
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Iterator, Optional, Tuple, Type, Union
+
+import pandas as pd
+
+from signal_ocean.util.frame_helpers import get_field, records_to_frame
+from signal_ocean.util.parsing_helpers import parse_model
+from signal_ocean.voyages.models import Voyage, VoyageCondensed
+from signal_ocean.voyages.voyages_api import VoyagesAPI
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS voyages (
+    id TEXT PRIMARY KEY,
+    imo INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS voyages_imo ON voyages (imo);
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_ENDPOINT = "endpoint"
+_INCREMENTAL_TOKEN = "incremental_token"
+_PAGE_TOKEN = "page_token"
+
+StoredVoyage = Union[Voyage, VoyageCondensed]
+
+
+@dataclass(frozen=True)
+class VoyagesSyncResult:
+    """Describes the changes applied to a store by a synchronization.
+
+    Attributes:
+        updated: The number of voyages added or updated.
+        deleted: The number of voyages deleted.
+        pages: The number of pages retrieved.
+    """
+
+    updated: int = 0
+    deleted: int = 0
+    pages: int = 0
+
+
+class VoyagesStore:
+    """Keeps a local copy of voyages in sync with the Voyages API.
+
+    Voyages are stored in an SQLite database, keyed by voyage ID, together
+    with the token of the next incremental request. Each synchronization
+    therefore only downloads the voyages that were added, updated or deleted
+    since the previous one, while reads are served from disk.
+
+    Every retrieved page is applied in its own transaction, together with
+    the token of the next page. A synchronization that is interrupted, e.g.
+    by a crash or a network error, continues from the first page that was
+    not applied the next time `sync` is called.
+
+    The filters a store is created with are fixed once the store has been
+    synchronized, since the incremental token refers to them.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        imo: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        date_from: Optional[date] = None,
+        condensed: bool = False,
+    ):
+        """Opens or creates a voyages store.
+
+        Args:
+            path: The path of the SQLite database holding the voyages. It is
+                created if it does not exist.
+            imo: Store only voyages for the provided vessel IMO.
+            vessel_class_id: Store only voyages for the provided vessel
+                class. If imo is specified, then vessel_class_id is ignored.
+            vessel_type_id: Store only voyages for the provided vessel type.
+                If either imo or vessel_class_id is specified, then
+                vessel_type_id is ignored.
+            date_from: Store voyages after the provided date. If imo is
+                specified, then date_from is treated as None.
+            condensed: Whether to store voyages in condensed format instead
+                of nested format.
+
+        Raises:
+            ValueError: The store was synchronized with different filters.
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.__cls: Type[StoredVoyage] = (
+            VoyageCondensed if condensed else Voyage
+        )
+        self.__endpoint = VoyagesAPI._get_endpoint(
+            imo=[imo] if imo is not None else [],
+            vessel_class_id=(
+                [vessel_class_id] if vessel_class_id is not None else []
+            ),
+            vessel_type_id=vessel_type_id,
+            voyage_date_from=date_from,
+            nested=not condensed,
+            condensed=condensed,
+            incremental=True,
+        )
+        self.__db = sqlite3.connect(path)
+        with self.__db:
+            self.__db.executescript(_SCHEMA)
+            stored_endpoint = self.__get_state(_ENDPOINT)
+            if stored_endpoint is None:
+                self.__set_state(_ENDPOINT, self.__endpoint)
+
+        if stored_endpoint not in (None, self.__endpoint):
+            self.__db.close()
+            raise ValueError(
+                "The store was synchronized with different filters: "
+                f"{stored_endpoint}"
+            )
+
+    @property
+    def incremental_token(self) -> Optional[str]:
+        """The token of the next incremental request, if synchronized."""
+        return self.__get_state(_INCREMENTAL_TOKEN)
+
+    def sync(self, api: Optional[VoyagesAPI] = None) -> VoyagesSyncResult:
+        """Downloads and applies the changes since the last synchronization.
+
+        Voyages marked as deleted by the API are removed from the store.
+
+        Args:
+            api: The API to retrieve the changes from. If not provided, an
+                API using the default connection is created.
+
+        Returns:
+            The changes applied to the store.
+        """
+        api = api or VoyagesAPI()
+        token = self.__get_state(_PAGE_TOKEN) or self.incremental_token
+        updated = deleted = pages = 0
+
+        for page in api._get_json_pages(self.__endpoint, token):
+            pages += 1
+            with self.__db:
+                for record in get_field(page, "data") or ():
+                    voyage_id = get_field(record, "id")
+                    if get_field(record, "deleted"):
+                        self.__db.execute(
+                            "DELETE FROM voyages WHERE id = ?", (voyage_id,)
+                        )
+                        deleted += 1
+                    else:
+                        self.__db.execute(
+                            "INSERT OR REPLACE INTO voyages VALUES (?, ?, ?)",
+                            (
+                                voyage_id,
+                                get_field(record, "imo"),
+                                json.dumps(record),
+                            ),
+                        )
+                        updated += 1
+
+                next_page_token = get_field(page, "next_page_token")
+                self.__set_state(_PAGE_TOKEN, next_page_token)
+                if next_page_token is None:
+                    next_request_token = get_field(page, "next_request_token")
+                    if next_request_token is not None:
+                        self.__set_state(
+                            _INCREMENTAL_TOKEN, next_request_token
+                        )
+
+        return VoyagesSyncResult(updated, deleted, pages)
+
+    def get_voyage(self, voyage_id: str) -> Optional[StoredVoyage]:
+        """Reads a voyage from the store.
+
+        Args:
+            voyage_id: The ID of the voyage.
+
+        Returns:
+            The voyage, or None if it is not in the store.
+        """
+        row = self.__db.execute(
+            "SELECT data FROM voyages WHERE id = ?", (voyage_id,)
+        ).fetchone()
+        return self.__parse(row[0]) if row else None
+
+    def get_voyages(
+        self, imo: Optional[int] = None
+    ) -> Tuple[StoredVoyage, ...]:
+        """Reads voyages from the store.
+
+        Args:
+            imo: Return only voyages for the provided vessel IMO. If None,
+                then all stored voyages are returned.
+
+        Returns:
+            The stored voyages, ordered by voyage ID.
+        """
+        return tuple(self.__parse(data) for data in self.__iter_data(imo))
+
+    def get_voyages_frame(self, imo: Optional[int] = None) -> pd.DataFrame:
+        """Reads voyages from the store into a data frame.
+
+        Records are decoded straight into typed columns, without creating a
+        model object per voyage. Nested events are not included.
+
+        Args:
+            imo: Return only voyages for the provided vessel IMO. If None,
+                then all stored voyages are returned.
+
+        Returns:
+            A data frame with a row per stored voyage, ordered by voyage ID.
+        """
+        return records_to_frame(
+            (json.loads(data) for data in self.__iter_data(imo)), self.__cls
+        )
+
+    def __len__(self) -> int:  # noqa: D105
+        (count,) = self.__db.execute(
+            "SELECT COUNT(*) FROM voyages"
+        ).fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Closes the underlying database."""
+        self.__db.close()
+
+    def __enter__(self) -> "VoyagesStore":  # noqa: D105
+        return self
+
+    def __exit__(self, *_: Any) -> None:  # noqa: D105
+        self.close()
+
+    def __iter_data(self, imo: Optional[int]) -> Iterator[str]:
+        if imo is None:
+            rows = self.__db.execute("SELECT data FROM voyages ORDER BY id")
+        else:
+            rows = self.__db.execute(
+                "SELECT data FROM voyages WHERE imo = ? ORDER BY id", (imo,)
+            )
+        return (data for (data,) in rows)
+
+    def __parse(self, data: str) -> StoredVoyage:
+        return parse_model(json.loads(data), self.__cls)
+
+    def __get_state(self, name: str) -> Optional[str]:
+        row = self.__db.execute(
+            "SELECT value FROM sync_state WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def __set_state(self, name: str, value: Optional[str]) -> None:
+        self.__db.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (name, value)
+        )
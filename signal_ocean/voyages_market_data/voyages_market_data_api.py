@@ -3,9 +3,12 @@ from datetime import date
 from typing import Optional, Tuple, List, Any, Dict
 from urllib.parse import urljoin, urlencode
 
+import pandas as pd
+
 from signal_ocean import Connection
+from signal_ocean.util.frame_helpers import FrameBuilder, get_field
 from signal_ocean.util.request_helpers import (
-    get_single, get_multiple, post_single
+    get_json_pages, get_pages, get_multiple, post_single, token_page_request
 )
 from signal_ocean.util.parsing_helpers import _to_camel_case
 from signal_ocean.voyages_market_data.models import (
@@ -127,7 +130,10 @@ class VoyagesMarketDataAPI:
         return urljoin(VoyagesMarketDataAPI.relative_url, endpoint)
 
     def _get_voyage_market_data_pages(
-        self, endpoint: str, token: Optional[str] = None
+        self,
+        endpoint: str,
+        token: Optional[str] = None,
+        prefetch: bool = False,
     ) -> Tuple[VoyagesMarketDataMultiple, Optional[NextRequestToken]]:
         """Retrieves data filtered for the provided parameters.
 
@@ -136,33 +142,24 @@ class VoyagesMarketDataAPI:
             token: Next request token for incremental voyage market data.
                 Make consecutive requests until no next page token is
                 returned, gather and return data.
+            prefetch: Whether to request the next page while the current one
+                is being decoded.
 
         Returns:
             Voyage market data gathered from the returned pages.
             The next request token, to be used for incremental updates.
         """
         results: List[VoyagesMarketData] = []
-        next_page_token = token
-        while True:
-            params = (
-                {"token": next_page_token}
-                if next_page_token is not None
-                else None
-            )
-            response = get_single(
-                self.__connection,
-                endpoint,
-                VoyagesMarketDataPagedResponse,
-                query_string=params,
-            )
+        response: Optional[VoyagesMarketDataPagedResponse] = None
+        for response in get_pages(
+            self.__connection,
+            VoyagesMarketDataPagedResponse,
+            token_page_request(endpoint),
+            token,
+            prefetch=prefetch,
+        ):
             if response is not None and response.data is not None:
                 results.extend(response.data)
-            next_page_token = (
-                response.next_page_token if response is not None else None
-            )
-
-            if next_page_token is None:
-                break
 
         next_request_token = (
             response.next_request_token if response is not None else None
@@ -181,7 +178,8 @@ class VoyagesMarketDataAPI:
         include_fixtures: Optional[bool] = None,
         include_matched_fixture: Optional[bool] = None,
         include_labels: Optional[bool] = None,
-        filter_by_matched_fixture: Optional[bool] = None
+        filter_by_matched_fixture: Optional[bool] = None,
+        prefetch: bool = False,
     ) -> VoyagesMarketDataMultiple:
         """Retrieves market data filtered for the provided parameters.
 
@@ -216,6 +214,11 @@ class VoyagesMarketDataAPI:
                 RedeliveryToTaxonomy.
             filter_by_matched_fixture: If set to true, only results with a
                 matched fixture will be included in the response.
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding. Makes a speculative request for
+                the page after the last one. Only applies when imo is not
+                provided, since the data of a vessel is not paged.
 
         Returns:
             A tuple containing the returned voyage market data.
@@ -231,10 +234,61 @@ class VoyagesMarketDataAPI:
             results = get_multiple(self.__connection, endpoint,
                                    VoyagesMarketData, data_key_label='Data')
         else:
-            results, _ = self._get_voyage_market_data_pages(endpoint)
+            results, _ = self._get_voyage_market_data_pages(
+                endpoint, prefetch=prefetch
+            )
 
         return results
 
+    def get_voyage_market_data_frame(
+        self,
+        imo: Optional[int] = None,
+        voyage_id: Optional[int] = None,
+        voyage_number: Optional[int] = None,
+        vessel_class_id: Optional[int] = None,
+        vessel_type_id: Optional[int] = None,
+        incremental: Optional[date] = None,
+        include_vessel_details: Optional[bool] = None,
+        include_fixtures: Optional[bool] = None,
+        include_matched_fixture: Optional[bool] = None,
+        include_labels: Optional[bool] = None,
+        filter_by_matched_fixture: Optional[bool] = None,
+        prefetch: bool = False
+    ) -> pd.DataFrame:
+        """Retrieves market data filtered for the provided parameters.
+
+        Unlike `get_voyage_market_data`, records are decoded straight into
+        data frame columns without creating a model object per record, which
+        is considerably faster and lighter on memory for large results. The
+        matched fixture is flattened into columns prefixed with
+        "matched_fixture_"; the list of fixtures is not included.
+
+        See `get_voyage_market_data` for a description of the other
+        arguments.
+
+        Args:
+            prefetch: Whether to request the next page on a background
+                thread while the current one is being decoded, overlapping
+                network wait with decoding.
+
+        Returns:
+            A data frame with a row per returned voyage market data record.
+        """
+        endpoint = self._get_endpoint(
+                        imo, voyage_id, voyage_number, vessel_class_id,
+                        vessel_type_id, incremental, include_vessel_details,
+                        include_fixtures, include_matched_fixture,
+                        include_labels, filter_by_matched_fixture
+        )
+
+        builder = FrameBuilder(VoyagesMarketData)
+        for page in get_json_pages(
+            self.__connection, token_page_request(endpoint), prefetch=prefetch
+        ):
+            builder.add(get_field(page, "data"))
+
+        return builder.to_frame()
+
     def get_voyage_market_data_advanced(
         self,
         imos: Optional[List[int]] = None,
@@ -0,0 +1,248 @@
+from decimal import Decimal
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from signal_ocean.distances import (
+    CompactRoute,
+    DistanceCache,
+    DistancesAPI,
+    LoadingCondition,
+    Port,
+    RouteResponse,
+    VesselClass,
+)
+from signal_ocean.distances import _distances_json
+
+_ROUTE = {
+    "id": 1,
+    "startPoint": {"lat": 0.0, "lon": 0.0},
+    "endPoint": {"lat": 0.0, "lon": 2.0},
+    "calculatedRoute": [
+        {"lat": 0.0, "lon": 0.0},
+        {"lat": 0.0, "lon": 1.0},
+        {"lat": 0.0, "lon": 2.0},
+    ],
+    "routingPointsOnRoute": [
+        {
+            "isHra": False,
+            "isSeca": True,
+            "distance": 60.02,
+            "distanceToEnter": 0.0,
+            "heading": 90,
+            "editable": False,
+            "name": "Point",
+            "isShown": True,
+            "delayMins": 0,
+            "centerPoint": {"lat": 0.0, "lon": 1.0},
+        }
+    ],
+    "distance": 120.04,
+    "piracyDistance": None,
+    "secaDistance": 60.02,
+    "alternativePaths": [
+        {
+            "calculatedRoute": [
+                {"lat": 0.0, "lon": 0.0},
+                {"lat": 1.0, "lon": 1.0},
+                {"lat": 0.0, "lon": 2.0},
+            ],
+            "routingPointsOnRoute": [],
+            "distance": 169.7,
+            "piracyDistance": 0.0,
+            "secaDistance": None,
+        }
+    ],
+    "isEmpty": False,
+    "bBox": [0.0, 0.0, 2.0, 0.0],
+}
+
+_ANTIMERIDIAN_ROUTE = {
+    **_ROUTE,
+    "calculatedRoute": [
+        {"lat": 10.0, "lon": 179.0},
+        {"lat": 20.0, "lon": -179.0},
+    ],
+    "alternativePaths": [],
+}
+
+
+_EMPTY_ROUTE = {"id": 0, "startPoint": {}, "endPoint": {}, "isEmpty": True}
+
+_SINGLE_POINT_ROUTE = {
+    **_ROUTE,
+    "calculatedRoute": [{"lat": 10.0, "lon": 20.0}],
+    "alternativePaths": [],
+}
+
+
+def create_distances_api(data: Any, cache: Any = None) -> DistancesAPI:
+    response = MagicMock()
+    response.json.return_value = data
+    connection = MagicMock()
+    connection._make_get_request.return_value = response
+    return DistancesAPI(connection, cache)
+
+
+def get_compact_route(api: DistancesAPI) -> CompactRoute:
+    return api.get_port_to_port_compact_route(
+        VesselClass(86, ""), LoadingCondition.LADEN, Port(1, ""), Port(2, "")
+    )
+
+
+def get_route(api: DistancesAPI) -> RouteResponse:
+    return api.get_port_to_port_route(
+        VesselClass(86, ""), LoadingCondition.LADEN, Port(1, ""), Port(2, "")
+    )
+
+
+def test_parses_coordinates_into_an_array() -> None:
+    route = _distances_json.parse_compact_route_response(_ROUTE)
+
+    assert route.coordinates.shape == (3, 2)
+    assert route.coordinates.dtype == np.float64
+    assert route.coordinates[:, 1].tolist() == [0.0, 1.0, 2.0]
+    assert route.distance == 120.04
+    assert np.isnan(route.piracy_distance)
+    assert route.alternative_paths[0].coordinates.shape == (3, 2)
+
+
+def test_converts_to_the_equivalent_route_response() -> None:
+    route = _distances_json.parse_compact_route_response(_ROUTE)
+
+    assert route.to_route_response() == _distances_json.parse_route_response(
+        _ROUTE
+    )
+
+
+def test_parses_empty_routes() -> None:
+    route = _distances_json.parse_compact_route_response(_EMPTY_ROUTE)
+
+    assert route.coordinates.shape == (0, 2)
+    assert route.is_empty
+    assert route.to_route_response().bbox is None
+
+
+def test_calculates_cumulative_distances() -> None:
+    route = _distances_json.parse_compact_route_response(_ROUTE)
+
+    distances = route.cumulative_distances()
+
+    # A degree of longitude along the equator is about 60 NM.
+    assert distances == pytest.approx([0.0, 60.04, 120.08], abs=0.01)
+
+
+def test_calculates_the_bounding_box() -> None:
+    path = _distances_json.parse_compact_route_response(
+        _ROUTE
+    ).alternative_paths[0]
+
+    assert path.bounding_box() == (0.0, 0.0, 2.0, 1.0)
+
+
+def test_calculates_the_bounding_box_across_the_antimeridian() -> None:
+    route = _distances_json.parse_compact_route_response(_ANTIMERIDIAN_ROUTE)
+
+    assert route.bounding_box() == pytest.approx((179.0, 10.0, -179.0, 20.0))
+
+
+def test_calculates_the_bounding_box_of_a_single_point() -> None:
+    route = _distances_json.parse_compact_route_response(_SINGLE_POINT_ROUTE)
+
+    assert route.bounding_box() == (20.0, 10.0, 20.0, 10.0)
+
+
+def test_empty_routes_have_no_cumulative_distances() -> None:
+    route = _distances_json.parse_compact_route_response(_EMPTY_ROUTE)
+
+    assert route.cumulative_distances().shape == (0,)
+
+
+def test_empty_routes_have_no_bounding_box() -> None:
+    route = _distances_json.parse_compact_route_response(_EMPTY_ROUTE)
+
+    with pytest.raises(ValueError):
+        route.bounding_box()
+
+
+def test_empty_routes_cannot_be_interpolated() -> None:
+    route = _distances_json.parse_compact_route_response(_EMPTY_ROUTE)
+
+    with pytest.raises(ValueError):
+        route.interpolate(0.0)
+
+
+def test_interpolates_positions() -> None:
+    route = _distances_json.parse_compact_route_response(_ROUTE)
+    half = route.cumulative_distances()[-1] / 2
+
+    assert route.interpolate(half) == pytest.approx([0.0, 1.0])
+    np.testing.assert_allclose(
+        route.interpolate(np.array([0.0, 1000.0])),
+        [[0.0, 0.0], [0.0, 2.0]],
+        atol=1e-9,
+    )
+
+
+def test_interpolates_across_the_antimeridian() -> None:
+    route = _distances_json.parse_compact_route_response(_ANTIMERIDIAN_ROUTE)
+    half = route.cumulative_distances()[-1] / 2
+
+    lat, lon = route.interpolate(half)
+
+    assert lat == pytest.approx(15.0)
+    assert abs(lon) == pytest.approx(180.0)
+
+
+def test_interpolates_single_point_routes_to_the_point() -> None:
+    route = _distances_json.parse_compact_route_response(_SINGLE_POINT_ROUTE)
+
+    assert route.cumulative_distances().tolist() == [0.0]
+    np.testing.assert_array_equal(
+        route.interpolate(np.array([0.0, 10.0])), [[10.0, 20.0], [10.0, 20.0]]
+    )
+
+
+def test_retrieves_compact_routes() -> None:
+    api = create_distances_api(_ROUTE)
+
+    route = get_compact_route(api)
+
+    assert isinstance(route, CompactRoute)
+    assert route.to_points()[1].lon == Decimal("1.0")
+
+
+def test_cache_keeps_routes_and_compact_routes_apart() -> None:
+    api = create_distances_api(_ROUTE, DistanceCache())
+
+    compact = get_compact_route(api)
+    route = get_route(api)
+
+    assert isinstance(compact, CompactRoute)
+    assert isinstance(route, RouteResponse)
+    assert get_compact_route(api) is compact
+    assert get_route(api) is route
+
+
+def test_cached_route_coordinates_are_read_only() -> None:
+    api = create_distances_api(_ROUTE, DistanceCache())
+    route = get_compact_route(api)
+
+    with pytest.raises(ValueError):
+        route.coordinates[0, 0] = 1.0
+    for path in (route, *route.alternative_paths):
+        assert not path.coordinates.flags.writeable
+    assert get_compact_route(api).coordinates[0, 0] == 0.0
+
+
+def test_cache_stores_the_response_once() -> None:
+    cache = DistanceCache(":memory:")
+    api = create_distances_api(_ROUTE, cache)
+
+    get_compact_route(api)
+    get_route(api)
+
+    connection = api._DistancesAPI__connection  # type: ignore
+    assert connection._make_get_request.call_count == 1
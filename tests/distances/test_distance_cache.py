@@ -0,0 +1,157 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from signal_ocean.distances import (
+    DistanceCache,
+    DistancesAPI,
+    LoadingCondition,
+    Point,
+    Port,
+    RouteRestrictions,
+    VesselClass,
+)
+
+_ROUTE = {
+    "id": 1,
+    "startPoint": {"lat": 1.5, "lon": 2.5},
+    "endPoint": {"lat": 3.5, "lon": 4.5},
+    "calculatedRoute": [{"lat": 1.5, "lon": 2.5}, {"lat": 3.5, "lon": 4.5}],
+    "distance": 120.5,
+    "isEmpty": False,
+    "bBox": [1.5, 2.5, 3.5, 4.5],
+}
+
+
+def create_distances_api(
+    cache: DistanceCache, data: Any = 100.5
+) -> Tuple[DistancesAPI, MagicMock]:
+    response = MagicMock()
+    response.json.return_value = data
+    connection = MagicMock()
+    connection._make_get_request.return_value = response
+    return DistancesAPI(connection, cache), connection
+
+
+def get_distance(api: DistancesAPI, port_to: int = 2) -> Any:
+    return api.get_port_to_port_distance(
+        VesselClass(86, ""), LoadingCondition.LADEN, Port(1, ""),
+        Port(port_to, "")
+    )
+
+
+def test_requests_each_distance_once() -> None:
+    api, connection = create_distances_api(DistanceCache())
+
+    distances = [get_distance(api) for _ in range(3)]
+
+    assert distances == [Decimal("100.5")] * 3
+    assert connection._make_get_request.call_count == 1
+
+
+def test_distinguishes_inputs() -> None:
+    api, connection = create_distances_api(DistanceCache())
+
+    get_distance(api, port_to=2)
+    get_distance(api, port_to=3)
+    api.get_port_to_port_distance(
+        VesselClass(86, ""), LoadingCondition.BALLAST, Port(1, ""),
+        Port(2, "")
+    )
+
+    assert connection._make_get_request.call_count == 3
+
+
+def test_caches_routes_by_restrictions_and_delays_date() -> None:
+    api, connection = create_distances_api(DistanceCache(), _ROUTE)
+    start = Point(Decimal("1.5"), Decimal("2.5"))
+    end = Point(Decimal("3.5"), Decimal("4.5"))
+
+    first = api.get_generic_point_to_point_route(start, end)
+    second = api.get_generic_point_to_point_route(start, end)
+    api.get_generic_point_to_point_route(
+        start, end, RouteRestrictions(is_suez_open=False)
+    )
+    api.get_generic_point_to_point_route(
+        start, end, delays_valid_at=date(2021, 1, 1)
+    )
+
+    assert second is first
+    assert first.distance == Decimal("120.5")
+    assert connection._make_get_request.call_count == 3
+
+
+def test_caches_missing_distances() -> None:
+    api, connection = create_distances_api(DistanceCache(), None)
+
+    assert get_distance(api) is None
+    assert get_distance(api) is None
+    assert connection._make_get_request.call_count == 1
+
+
+def test_evicts_least_recently_used_entries() -> None:
+    api, connection = create_distances_api(DistanceCache(max_entries=2))
+    get_distance(api, port_to=2)
+    get_distance(api, port_to=3)
+    get_distance(api, port_to=2)
+
+    get_distance(api, port_to=4)
+    get_distance(api, port_to=2)
+    get_distance(api, port_to=3)
+
+    requested = [
+        c[0][1]["portIdTo"]
+        for c in connection._make_get_request.call_args_list
+    ]
+    assert requested == [2, 3, 4, 3]
+
+
+def test_persists_entries_to_disk(tmp_path) -> None:
+    path = str(tmp_path / "distances.sqlite")
+    cache = DistanceCache(path)
+    api, _ = create_distances_api(cache)
+    get_distance(api)
+    cache.close()
+
+    api, connection = create_distances_api(DistanceCache(path), 5)
+
+    assert get_distance(api) == Decimal("100.5")
+    connection._make_get_request.assert_not_called()
+
+
+def test_preloads_entries_from_disk(tmp_path) -> None:
+    path = str(tmp_path / "distances.sqlite")
+    cache = DistanceCache(path)
+    api, _ = create_distances_api(cache, _ROUTE)
+    api.get_port_to_port_route(
+        VesselClass(86, ""), LoadingCondition.LADEN, Port(1, ""), Port(2, "")
+    )
+    get_distance(api, port_to=3)
+    cache.close()
+
+    cache = DistanceCache(path)
+    loaded = cache.preload()
+
+    assert loaded == 2
+    assert len(cache) == 2
+
+
+def test_disk_holds_at_most_max_entries(tmp_path) -> None:
+    path = str(tmp_path / "distances.sqlite")
+    cache = DistanceCache(path, max_entries=2)
+    api, _ = create_distances_api(cache)
+    for port_to in (2, 3, 4):
+        get_distance(api, port_to=port_to)
+    cache.close()
+
+    cache = DistanceCache(path, max_entries=10)
+
+    assert cache.preload() == 2
+
+
+def test_rejects_non_positive_max_entries() -> None:
+    with pytest.raises(ValueError):
+        DistanceCache(max_entries=0)
@@ -0,0 +1,145 @@
+from decimal import Decimal
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from signal_ocean.distances import (
+    DistanceEstimator,
+    LoadingCondition,
+    Point,
+    Port,
+    VesselClass,
+)
+from signal_ocean.geos.models import Port as GeoPort
+
+# A degree along the equator is about 60 NM.
+_DEGREE = 60.04
+
+
+def create_geo_port(
+    port_id: int,
+    lon: Optional[float],
+    region: int,
+    lat: float = 0.0,
+) -> GeoPort:
+    return GeoPort(
+        port_id,
+        2,
+        "Port",
+        latitude=lat if lon is not None else None,
+        longitude=lon,
+        area_id_level1=region,
+    )
+
+
+_GEO_PORTS = (
+    create_geo_port(1, 0.0, 10),
+    create_geo_port(2, 1.0, 10),
+    create_geo_port(3, 10.0, 20),
+    create_geo_port(4, None, 20),
+)
+_PORTS = tuple(Port(i, f"Port {i}") for i in range(1, 5))
+
+
+def create_estimator() -> DistanceEstimator:
+    return DistanceEstimator(_GEO_PORTS)
+
+
+def create_matrix(values: Any, from_ids: Any, to_ids: Any) -> pd.DataFrame:
+    return pd.DataFrame(
+        values,
+        index=pd.Index(from_ids, name="port_from_id"),
+        columns=pd.Index(to_ids, name="port_to_id"),
+    )
+
+
+def test_calculates_great_circle_distances() -> None:
+    distances = DistanceEstimator.great_circle_distances(
+        [Point(Decimal(0), Decimal(0)), Point(Decimal(0), Decimal(179))],
+        np.array([[0.0, 1.0], [0.0, -179.0]]),
+    )
+
+    assert distances == pytest.approx([_DEGREE, 2 * _DEGREE], rel=1e-3)
+
+
+def test_estimates_great_circle_distances_until_calibrated() -> None:
+    estimates = create_estimator().estimate(_PORTS[:1], _PORTS)
+
+    assert estimates.index.tolist() == [1]
+    assert estimates.columns.tolist() == [1, 2, 3, 4]
+    assert estimates.iloc[0, :3].tolist() == pytest.approx(
+        [0, _DEGREE, 10 * _DEGREE], rel=1e-3
+    )
+    assert np.isnan(estimates.loc[1, 4])
+
+
+def test_calibrates_factors_per_pair_of_regions() -> None:
+    estimator = create_estimator()
+
+    used = estimator.calibrate(
+        create_matrix(
+            [[_DEGREE * 1.5, _DEGREE * 10 * 2, np.nan, 100.0]],
+            [1],
+            [2, 3, 5, 4],
+        )
+    )
+
+    assert used == 2
+    assert estimator.get_correction_factor(1, 2) == pytest.approx(1.5, 1e-3)
+    assert estimator.get_correction_factor(2, 3) == pytest.approx(2, 1e-3)
+    # Unknown pairs of regions use the median of all ratios.
+    assert estimator.get_correction_factor(3, 1) == pytest.approx(
+        1.75, 1e-3
+    )
+    assert estimator.estimate(_PORTS[1:2], _PORTS[2:3]).iloc[
+        0, 0
+    ] == pytest.approx(9 * _DEGREE * 2, rel=1e-3)
+
+
+def test_estimates_distances_from_points() -> None:
+    estimator = create_estimator()
+
+    estimates = estimator.estimate_from_points(
+        np.array([[0.0, 2.0], [0.0, 9.0]]), _PORTS[2:3]
+    )
+
+    assert estimates.index.tolist() == [0, 1]
+    assert estimates[3].tolist() == pytest.approx(
+        [8 * _DEGREE, _DEGREE], rel=1e-3
+    )
+
+
+def test_rejects_invalid_region_levels() -> None:
+    with pytest.raises(ValueError):
+        DistanceEstimator(_GEO_PORTS, region_level=4)
+
+
+def test_retrieves_distances_of_the_nearest_pairs_only() -> None:
+    api = MagicMock()
+    api.get_port_to_port_distance.side_effect = (
+        lambda vc, lc, port_from, port_to: Decimal(
+            {(1, 2): 300, (1, 1): 0}[port_from.id, port_to.id]
+        )
+    )
+
+    nearest = create_estimator().get_nearest(
+        api,
+        VesselClass(86, ""),
+        LoadingCondition.LADEN,
+        _PORTS[:1],
+        _PORTS,
+        top_k=2,
+    )
+
+    assert api.get_port_to_port_distance.call_count == 2
+    assert nearest.columns.tolist() == [
+        "port_from_id",
+        "port_to_id",
+        "estimated_distance",
+        "distance",
+    ]
+    assert nearest["port_to_id"].tolist() == [1, 2]
+    assert nearest["distance"].tolist() == [0.0, 300.0]
@@ -1,5 +1,5 @@
 from unittest.mock import MagicMock
-from typing import Tuple
+from typing import Optional, Tuple
 from decimal import Decimal
 from datetime import date
 
@@ -7,6 +7,7 @@ import requests
 
 from signal_ocean import Connection
 from signal_ocean.distances import (
+    DistanceCache,
     DistancesAPI,
     Point,
     Port,
@@ -29,6 +30,7 @@ def create_distances_api(
 ) -> Tuple[DistancesAPI, Connection]:
     connection = MagicMock()
     connection._make_get_request.return_value = response
+    connection.pool_size = 4
     api = DistancesAPI(connection)
 
     return (api, connection)
@@ -308,3 +310,119 @@ def test_requests_generic_point_to_point_route_with_alternatives():
             "GetAlternatives": True,
         },
     )
+
+
+def create_distance_matrix_api(
+    cache: Optional[DistanceCache] = None,
+) -> Tuple[DistancesAPI, MagicMock]:
+    def make_get_request(relative_url, query_string):
+        response = MagicMock()
+        response.json.return_value = (
+            query_string["portIdFrom"] * 100 + query_string["portIdTo"]
+        )
+        return response
+
+    connection = MagicMock()
+    connection._make_get_request.side_effect = make_get_request
+    connection.pool_size = 4
+    return DistancesAPI(connection, cache), connection
+
+
+def test_distance_matrix_has_a_distance_per_pair_of_ports():
+    api, _ = create_distance_matrix_api()
+
+    matrix = api.get_distance_matrix(
+        create_vessel_class(86),
+        LoadingCondition.LADEN,
+        [create_port(1), create_port(2)],
+        [create_port(3), create_port(4), create_port(5)],
+        max_workers=4,
+    )
+
+    assert matrix.index.tolist() == [1, 2]
+    assert matrix.columns.tolist() == [3, 4, 5]
+    assert matrix.values.tolist() == [[103, 104, 105], [203, 204, 205]]
+
+
+def test_distance_matrix_requests_each_pair_once():
+    api, connection = create_distance_matrix_api()
+    ports = [create_port(1), create_port(2), create_port(1)]
+
+    matrix = api.get_distance_matrix(
+        create_vessel_class(86), LoadingCondition.LADEN, ports, ports
+    )
+
+    assert connection._make_get_request.call_count == 4
+    assert matrix.values.tolist() == [
+        [101, 102, 101],
+        [201, 202, 201],
+        [101, 102, 101],
+    ]
+
+
+def test_symmetric_distance_matrix_requests_one_direction():
+    api, connection = create_distance_matrix_api()
+    ports = [create_port(1), create_port(2)]
+
+    matrix = api.get_distance_matrix(
+        create_vessel_class(86),
+        LoadingCondition.LADEN,
+        ports,
+        ports,
+        symmetric=True,
+    )
+
+    assert connection._make_get_request.call_count == 3
+    assert matrix.values.tolist() == [[101, 102], [102, 202]]
+
+
+def test_distance_matrix_reuses_cached_distances():
+    api, connection = create_distance_matrix_api(DistanceCache())
+    vessel_class = create_vessel_class(86)
+    api.get_distance_matrix(
+        vessel_class, LoadingCondition.LADEN, [create_port(1)],
+        [create_port(2)]
+    )
+
+    api.get_distance_matrix(
+        vessel_class, LoadingCondition.LADEN, [create_port(1)],
+        [create_port(2), create_port(3)]
+    )
+    api.get_distance_matrix(
+        vessel_class, LoadingCondition.BALLAST, [create_port(1)],
+        [create_port(2)]
+    )
+
+    requested = [
+        (c[0][1]["loadingcondition"], c[0][1]["portIdTo"])
+        for c in connection._make_get_request.call_args_list
+    ]
+    assert requested == [(1, 2), (1, 3), (2, 2)]
+
+
+def test_distance_matrix_requests_distances_again_without_a_cache():
+    api, connection = create_distance_matrix_api()
+    vessel_class = create_vessel_class(86)
+
+    for _ in range(2):
+        api.get_distance_matrix(
+            vessel_class, LoadingCondition.LADEN, [create_port(1)],
+            [create_port(2)]
+        )
+
+    assert connection._make_get_request.call_count == 2
+
+
+def test_distance_matrix_contains_nan_for_missing_distances():
+    response = MagicMock()
+    response.json.return_value = None
+    api, _ = create_distances_api(response)
+
+    matrix = api.get_distance_matrix(
+        create_vessel_class(86),
+        LoadingCondition.LADEN,
+        [create_port(1)],
+        [create_port(2)],
+    )
+
+    assert matrix.isna().all().all()
@@ -0,0 +1,125 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from signal_ocean.freight_pricing import (
+    FreightPricingAPI,
+    Port,
+    VesselClass,
+    VesselSubclass,
+    VesselType,
+)
+from signal_ocean.util.chunked_retrieval import ChunkRetrievalError
+
+
+def create_pricing(vessel_class, cargo_quantity):
+    return {
+        "vesselClass": vessel_class,
+        "cargoQuantity": cargo_quantity,
+        "costs": {"freightRate": 5.5, "freightCost": 1000.0, "canal": None},
+        "totals": {"totalCost": 1200.0, "totalCostPerTon": 6.0},
+    }
+
+
+def create_connection():
+    connection = MagicMock()
+    connection.pool_size = 4
+    response = MagicMock()
+    response.json.return_value = [
+        create_pricing("Suezmax", 130000),
+        create_pricing("Aframax", 80000),
+    ]
+    connection._make_get_request.return_value = response
+    return connection
+
+
+_TANKER = VesselType(1, "Tanker")
+_LOAD_PORTS = (Port(1, "Load"), Port(1, "Load"))
+_DISCHARGE_PORTS = (Port(2, "Discharge"), Port(3, "Other discharge"))
+_DATES = (date(2021, 1, 1), date(2021, 1, 2))
+
+
+def test_get_freight_pricing_grid_requests_each_combination_once():
+    connection = create_connection()
+    api = FreightPricingAPI(connection)
+
+    grid = api.get_freight_pricing_grid(
+        _TANKER, _LOAD_PORTS, _DISCHARGE_PORTS, _DATES, max_workers=2
+    )
+
+    assert connection._make_get_request.call_count == 4
+    assert len(grid) == 8
+    assert grid.columns.tolist() == [
+        "load_port_id",
+        "discharge_port_id",
+        "date",
+        "vessel_class",
+        "cargo_quantity",
+        "freight_rate",
+        "freight_cost",
+        "canal",
+        "total_cost",
+        "total_cost_per_ton",
+    ]
+    assert grid["discharge_port_id"].tolist() == [2, 2, 2, 2, 3, 3, 3, 3]
+    assert grid["date"].dt.day.tolist() == [1, 1, 2, 2] * 2
+    assert grid["vessel_class"].dtype == "category"
+    assert grid["cargo_quantity"].tolist() == [130000.0, 80000.0] * 4
+    assert grid["canal"].isna().all()
+
+
+def test_get_freight_pricing_grid_requests_prices_for_every_grid():
+    connection = create_connection()
+    api = FreightPricingAPI(connection)
+
+    api.get_freight_pricing_grid(
+        _TANKER, _LOAD_PORTS, _DISCHARGE_PORTS[:1], _DATES
+    )
+    grid = api.get_freight_pricing_grid(
+        _TANKER, _LOAD_PORTS, _DISCHARGE_PORTS, _DATES
+    )
+
+    assert connection._make_get_request.call_count == 6
+    assert len(grid) == 8
+
+
+def test_get_freight_pricing_grid_passes_the_request_parameters():
+    connection = create_connection()
+    api = FreightPricingAPI(connection)
+
+    api.get_freight_pricing_grid(
+        _TANKER,
+        _LOAD_PORTS[:1],
+        _DISCHARGE_PORTS[:1],
+        _DATES[:1],
+        VesselSubclass.CLEAN,
+        (VesselClass(86, "Aframax"),),
+    )
+
+    connection._make_get_request.assert_called_once_with(
+        "freight-pricing-api/freight-pricing",
+        {
+            "vesselType": 1,
+            "loadPortId": 1,
+            "dischargePortId": 2,
+            "date": "2021-01-01",
+            "vesselClassId": [86],
+            "vesselSubclass": 2,
+        },
+    )
+
+
+def test_get_freight_pricing_grid_retries_failed_combinations():
+    connection = create_connection()
+    response = connection._make_get_request.return_value
+    connection._make_get_request.side_effect = [RuntimeError(), response]
+    api = FreightPricingAPI(connection)
+
+    with pytest.raises(ChunkRetrievalError) as error:
+        api.get_freight_pricing_grid(
+            _TANKER, _LOAD_PORTS, _DISCHARGE_PORTS[:1], _DATES[:1]
+        )
+    grid = error.value.retry()
+
+    assert len(grid) == 2
@@ -3,9 +3,12 @@ from datetime import date
 from unittest.mock import MagicMock
 
 import pytest
+import requests
 
-from signal_ocean.freight_rates import FreightRatesAPI, FreightPricing
+from signal_ocean.freight_rates import FreightRatesAPI, FreightPricing, \
+    PortFilter
 from signal_ocean.freight_rates.enums import VesselClass
+from signal_ocean.util.chunked_retrieval import ChunkRetrievalError
 
 
 @pytest.mark.parametrize('load_ports, discharge_ports, vessel_classes, '
@@ -50,3 +53,120 @@ def test_get_vessel_classes():
 
     assert vessel_classes == tuple(vessel_class.name for
                                    vessel_class in VesselClass)
+
+
+def create_ports_connection():
+    connection = MagicMock()
+    response = MagicMock()
+    response.json.return_value = {
+        "1": {"name": "Test Port", "country": "GR", "area": "Med"},
+        "2": {"name": "Other Port", "country": "GR", "area": "Med"},
+    }
+    connection._make_get_request.return_value = response
+    connection.pool_size = 4
+    return connection
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 4])
+def test_get_ports_returns_each_port_once(max_workers):
+    connection = create_ports_connection()
+    api = FreightRatesAPI(connection)
+
+    ports = api.get_ports(max_workers=max_workers)
+
+    assert [port.name for port in ports] == ["Test Port", "Other Port"]
+    assert connection._make_get_request.call_count == len(VesselClass)
+
+
+def test_get_ports_raises_the_first_error_with_a_single_worker():
+    connection = create_ports_connection()
+    connection._make_get_request.side_effect = requests.HTTPError()
+    api = FreightRatesAPI(connection)
+
+    with pytest.raises(requests.HTTPError):
+        api.get_ports(max_workers=1)
+    assert connection._make_get_request.call_count == 1
+
+
+def test_get_ports_collects_errors_by_default():
+    connection = create_ports_connection()
+    connection._make_get_request.side_effect = requests.HTTPError()
+    api = FreightRatesAPI(connection)
+
+    with pytest.raises(ChunkRetrievalError):
+        api.get_ports()
+    assert connection._make_get_request.call_count == len(VesselClass)
+
+
+def test_get_ports_requests_ports_once_per_day():
+    connection = create_ports_connection()
+    api = FreightRatesAPI(connection)
+
+    api.get_ports()
+    ports = api.get_ports(PortFilter(name_like="other"))
+
+    assert [port.name for port in ports] == ["Other Port"]
+    assert connection._make_get_request.call_count == len(VesselClass)
+
+
+def create_pricing(vessel_class):
+    return {
+        "vesselClass": vessel_class,
+        "rate": 100.0,
+        "rateType": "WS",
+        "estimatedFlatRate": 12.5,
+        "costs": [
+            {"canal": 0.0, "freightCost": 1000.0, "otherPortExpenses": None}
+        ],
+        "totalFreightCost": 1000.0,
+        "totalFreightRate": 12.5,
+        "routeType": "Direct",
+        "quantity": 80000.0,
+        "minFlatAugustaUsed": False,
+        "routingChoices": ["Suez"],
+    }
+
+
+def create_pricing_connection():
+    connection = MagicMock()
+    connection.pool_size = 4
+    response = MagicMock()
+    response.json.return_value = [
+        create_pricing("VLCC"), create_pricing("Aframax")
+    ]
+    connection._make_get_request.return_value = response
+    return connection
+
+
+def test_get_freight_pricing_grid():
+    connection = create_pricing_connection()
+    api = FreightRatesAPI(connection)
+    dates = [date(2021, 1, 1), date(2021, 1, 2)]
+
+    grid = api.get_freight_pricing_grid(
+        [3153, 3153], [3157, 3158], ["VLCC", "Aframax"], False, dates,
+        max_workers=2
+    )
+
+    assert connection._make_get_request.call_count == 4
+    assert len(grid) == 8
+    assert grid["load_port_id"].tolist() == [3153] * 8
+    assert grid["discharge_port_id"].tolist() == [3157] * 4 + [3158] * 4
+    assert grid["vessel_class"].tolist() == ["VLCC", "Aframax"] * 4
+    assert grid["freight_cost"].tolist() == [1000.0] * 8
+    assert grid["other_port_expenses"].isna().all()
+    assert grid["min_flat_augusta_used"].dtype == "boolean"
+    query_string = connection._make_get_request.call_args[0][1]
+    assert query_string["VesselClasses"] == "VLCC&VesselClasses=Aframax"
+
+
+def test_get_freight_pricing_grid_requests_prices_for_every_grid():
+    connection = create_pricing_connection()
+    api = FreightRatesAPI(connection)
+    dates = [date(2021, 1, 1)]
+
+    api.get_freight_pricing_grid([3153], [3157], ["VLCC"], False, dates)
+    api.get_freight_pricing_grid([3153], [3157], ["VLCC"], False, dates)
+    api.get_freight_pricing_grid([3153], [3157], ["VLCC"], True, dates)
+
+    assert connection._make_get_request.call_count == 3
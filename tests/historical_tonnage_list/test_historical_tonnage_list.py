@@ -1,6 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Tuple
 
+import pandas as pd
+
 from signal_ocean.historical_tonnage_list import HistoricalTonnageList, TonnageList, Vessel, \
     IndexLevel, Column
 from .create_vessel import create_vessel
@@ -81,3 +83,34 @@ def test_contains_vessel_data_when_converted_to_data_frame():
     assert df[Column.SUBCLASS].to_list() == [v.subclass]
     assert df[Column.VESSEL_CLASS].to_list() == [v.vessel_class]
     assert df[Column.YEAR_BUILT].to_list() == [v.year_built]
+
+
+def test_data_frame_matches_row_based_conversion():
+    htl = HistoricalTonnageList(
+        create_tonnage_list(
+            datetime(2020, 1, 1 + day, tzinfo=timezone.utc),
+            tuple(
+                create_vessel(
+                    imo=1000 + (imo + day) % 20,
+                    ice_class=None if imo % 3 else "1A",
+                    open_port=f"port {imo % 7}",
+                    open_date=None,
+                    open_areas=(),
+                )
+                for imo in range(20)
+            ),
+        )
+        for day in range(3)
+    )
+    rows = [
+        Column._create_row(v) for tl in htl for v in tl.vessels
+    ]
+    index = pd.MultiIndex.from_tuples(
+        [(tl.date, v.imo) for tl in htl for v in tl.vessels],
+        names=[IndexLevel.DATE, IndexLevel.IMO],
+    )
+    expected = pd.DataFrame(rows, index=index, columns=list(Column)).astype(
+        Column._get_data_types()
+    )
+
+    pd.testing.assert_frame_equal(htl.to_data_frame(), expected)
@@ -1,6 +1,9 @@
 from datetime import date, time
 from unittest.mock import MagicMock, call
 
+import pytest
+import requests
+
 from signal_ocean.historical_tonnage_list import HistoricalTonnageListAPI
 
 from ..builders import create_port, create_vessel_class
@@ -94,3 +97,38 @@ def test_splits_long_date_ranges_into_multiple_calls():
         ],
         any_order=True
     )
+
+
+def test_retrieves_chunks_of_configured_size_concurrently():
+    connection = MagicMock()
+    api = HistoricalTonnageListAPI(connection)
+
+    api.get_historical_tonnage_list(
+        create_port(),
+        create_vessel_class(),
+        start_date=date(2020, 1, 1),
+        end_date=date(2020, 1, 10),
+        chunk_days=4,
+        max_workers=3,
+    )
+
+    assert sorted(
+        c.args[1]["startDate"]
+        for c in connection._make_get_request.call_args_list
+    ) == ["2020-01-01", "2020-01-05", "2020-01-09"]
+
+
+def test_raises_the_first_error_when_retrieving_chunks_sequentially():
+    connection = MagicMock()
+    connection._make_get_request.side_effect = requests.HTTPError()
+    api = HistoricalTonnageListAPI(connection)
+
+    with pytest.raises(requests.HTTPError):
+        api.get_historical_tonnage_list(
+            create_port(),
+            create_vessel_class(),
+            start_date=date(2020, 1, 1),
+            end_date=date(2020, 1, 10),
+            chunk_days=4,
+        )
+    assert connection._make_get_request.call_count == 1
@@ -1,13 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from unittest.mock import MagicMock
 
 import pytest
+import requests
 
 from signal_ocean.port_expenses import PortExpensesAPI, PortExpenses, \
     Operation, OperationStatus, ItalianAnchorageDues, EstimationStatus, \
-    VesselType, PortFilter
+    VesselType, PortFilter, PortExpensesScenario, ModelVesselExpensesScenario
 from signal_ocean.port_expenses.enums import VesselTypeEnum
+from signal_ocean.util.chunked_retrieval import ChunkRetrievalError
 
 
 @pytest.mark.parametrize('imo, port_id', [
@@ -153,8 +155,144 @@ def test_get_vessel_types():
 
 def test_get_ports():
     connection = MagicMock()
+    connection.pool_size = 4
     api = PortExpensesAPI(connection)
 
     api.get_ports(PortFilter(name_like='test'))
 
-    assert connection._make_get_request.call_count == len(VesselTypeEnum)
\ No newline at end of file
+    assert connection._make_get_request.call_count == len(VesselTypeEnum)
+
+def create_ports_connection():
+    connection = MagicMock()
+    response = MagicMock()
+    response.json.return_value = {
+        "Ports": [
+            {"PortId": 1, "PortName": "Test Port"},
+            {"PortId": 2, "PortName": "Other Port"},
+        ]
+    }
+    connection._make_get_request.return_value = response
+    connection.pool_size = 4
+    return connection
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 4])
+def test_get_ports_returns_each_port_once(max_workers):
+    api = PortExpensesAPI(create_ports_connection())
+
+    ports = api.get_ports(max_workers=max_workers)
+
+    assert [port.id for port in ports] == [1, 2]
+
+
+def test_get_ports_raises_the_first_error_with_a_single_worker():
+    connection = create_ports_connection()
+    connection._make_get_request.side_effect = requests.HTTPError()
+    api = PortExpensesAPI(connection)
+
+    with pytest.raises(requests.HTTPError):
+        api.get_ports(max_workers=1)
+    assert connection._make_get_request.call_count == 1
+
+
+def test_get_ports_collects_errors_by_default():
+    connection = create_ports_connection()
+    connection._make_get_request.side_effect = requests.HTTPError()
+    api = PortExpensesAPI(connection)
+
+    with pytest.raises(ChunkRetrievalError):
+        api.get_ports()
+    assert connection._make_get_request.call_count == len(VesselTypeEnum)
+
+
+def test_get_ports_requests_ports_once_per_day():
+    connection = create_ports_connection()
+    api = PortExpensesAPI(connection)
+
+    api.get_ports()
+    ports = api.get_ports(PortFilter(name_like='test'))
+
+    assert [port.name for port in ports] == ["Test Port"]
+    assert connection._make_get_request.call_count == len(VesselTypeEnum)
+    query_string = connection._make_get_request.call_args[0][1]
+    assert query_string == {"date": date.today().isoformat()}
+
+
+def create_expenses_connection(total_cost=1000):
+    def post(relative_url, query_string):
+        if query_string.get("imo") == "1":
+            raise RuntimeError("Estimation failed")
+        response = MagicMock()
+        response.json.return_value = {
+            "PortId": int(query_string["portId"]),
+            "TotalCost": total_cost,
+            "IsEstimated": True,
+        }
+        return response
+
+    connection = MagicMock()
+    connection.pool_size = 4
+    connection._make_post_request.side_effect = post
+    return connection
+
+
+_SCENARIOS = [
+    PortExpensesScenario(9867621, 3153),
+    PortExpensesScenario(9867621, 3153),
+    PortExpensesScenario(1, 3153),
+    ModelVesselExpensesScenario(3154, 1, datetime(2021, 1, 1)),
+]
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 3])
+def test_get_port_expenses_batch(max_workers):
+    connection = create_expenses_connection()
+    api = PortExpensesAPI(connection)
+
+    results = list(
+        api.get_port_expenses_batch(iter(_SCENARIOS), max_workers)
+    )
+
+    assert connection._make_post_request.call_count == 3
+    assert [r.scenario for r in results] == [
+        _SCENARIOS[0], _SCENARIOS[2], _SCENARIOS[3]
+    ]
+    assert results[0].port_expenses.total_cost == 1000
+    assert results[0].error is None
+    assert results[1].port_expenses is None
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[2].port_expenses.port_id == 3154
+    assert connection._make_post_request.call_args_list[-1][0][0] == \
+        "port-expenses/api/v1/PortModelVessel"
+
+
+def test_get_port_expenses_batch_frame():
+    api = PortExpensesAPI(create_expenses_connection())
+
+    frame = api.get_port_expenses_batch_frame(_SCENARIOS)
+
+    assert frame["imo"].fillna(0).tolist() == [9867621, 1, 0]
+    assert frame["port_id"].tolist() == [3153, 3153, 3154]
+    assert frame["vessel_type_id"].fillna(0).tolist() == [0, 0, 1]
+    assert frame["total_cost"].fillna(0).tolist() == [1000, 0, 1000]
+    assert frame["total_cost"].dtype == "float64"
+    assert frame["is_estimated"].dtype == "boolean"
+    assert frame["error"].notna().tolist() == [False, True, False]
+
+
+def test_get_port_expenses_batch_frame_keeps_fractional_costs():
+    api = PortExpensesAPI(create_expenses_connection(total_cost=1000.5))
+
+    frame = api.get_port_expenses_batch_frame(_SCENARIOS)
+
+    assert frame["total_cost"].fillna(0).tolist() == [1000.5, 0, 1000.5]
+
+
+def test_get_port_expenses_batch_frame_without_scenarios():
+    api = PortExpensesAPI(create_expenses_connection())
+
+    frame = api.get_port_expenses_batch_frame([])
+
+    assert frame.empty
+    assert frame["total_cost"].dtype == "float64"
+    assert frame["is_estimated"].dtype == "boolean"
@@ -0,0 +1,97 @@
+from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock
+
+from signal_ocean import Connection
+from signal_ocean.scraped_fixtures import ScrapedFixture, ScrapedFixturesAPI
+
+
+def create_api(
+    pages: List[Dict[str, Any]]
+) -> Tuple[ScrapedFixturesAPI, MagicMock]:
+    responses = []
+    for page in pages:
+        response = MagicMock(status_code=200)
+        response.json.return_value = page
+        responses.append(response)
+    mocked_make_request = MagicMock(side_effect=responses)
+    connection = Connection("", "")
+    connection._make_get_request = mocked_make_request
+    return ScrapedFixturesAPI(connection), mocked_make_request
+
+
+_PAGES = [
+    {"NextPageToken": "p2", "Data": [{"FixtureID": 1}, {"FixtureID": 2}]},
+    {"NextPageToken": "p3", "Data": []},
+    {
+        "NextPageToken": None,
+        "NextRequestToken": "next",
+        "Data": [{"FixtureID": 3}],
+    },
+]
+
+
+def test_iter_pages_exposes_page_tokens():
+    api, _ = create_api(_PAGES)
+
+    pages = list(api.iter_pages(vessel_type=1))
+
+    assert [p.page_token for p in pages] == [None, "p2", "p3"]
+    assert [p.next_page_token for p in pages] == ["p2", "p3", None]
+    assert pages[-1].next_request_token == "next"
+    assert pages[0].data == (ScrapedFixture(1), ScrapedFixture(2))
+
+
+def test_iter_pages_requests_pages_lazily_by_default():
+    api, mocked_make_request = create_api(_PAGES)
+
+    pages = api.iter_pages(vessel_type=1)
+    next(pages)
+
+    assert mocked_make_request.call_count == 1
+
+
+def test_iter_pages_resumes_from_page_token():
+    api, mocked_make_request = create_api(_PAGES[2:])
+
+    pages = list(api.iter_pages(vessel_type=1, page_token="p3"))
+
+    assert len(pages) == 1
+    url = mocked_make_request.call_args[0][0]
+    assert url.endswith("&PageToken=p3")
+
+
+def test_iter_data_yields_records_of_all_pages():
+    api, _ = create_api(_PAGES)
+
+    fixture_ids = [f.fixture_id for f in api.iter_data(vessel_type=1)]
+
+    assert fixture_ids == [1, 2, 3]
+
+
+def test_get_data_returns_all_records():
+    api, _ = create_api(_PAGES)
+
+    assert api.get_fixtures(vessel_type=1) == (
+        ScrapedFixture(1),
+        ScrapedFixture(2),
+        ScrapedFixture(3),
+    )
+
+
+def test_get_data_incremental_returns_the_next_request_token():
+    api, mocked_make_request = create_api(_PAGES)
+
+    result = api.get_fixtures_incremental(vessel_type=1)
+
+    assert len(result.data) == 3
+    assert result.next_request_token == "next"
+    assert "/incremental?" in mocked_make_request.call_args[0][0]
+
+
+def test_get_data_frame_decodes_all_pages():
+    api, _ = create_api(_PAGES)
+
+    frame = api.get_data_frame(vessel_type=1)
+
+    assert frame["fixture_id"].tolist() == [1, 2, 3]
+    assert frame["fixture_id"].dtype == "Int64"
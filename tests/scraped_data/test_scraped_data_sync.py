@@ -0,0 +1,156 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from signal_ocean import Connection
+from signal_ocean.scraped_data import ScrapedDataSync, ScrapedDataSyncResult
+from signal_ocean.scraped_fixtures import ScrapedFixture, ScrapedFixturesAPI
+from signal_ocean.scraped_positions import ScrapedPositionsAPI
+from signal_ocean.util.chunked_retrieval import ChunkRetrievalError
+
+
+def create_api(
+    pages_by_vessel_type: Dict[int, List[Any]]
+) -> ScrapedFixturesAPI:
+    pages = {k: list(v) for k, v in pages_by_vessel_type.items()}
+
+    def make_get_request(url: str, query_string: Any = None) -> MagicMock:
+        vessel_type = int(url.split("VesselType=")[1].split("&")[0])
+        page = pages[vessel_type].pop(0)
+        if isinstance(page, Exception):
+            raise page
+        response = MagicMock(status_code=200)
+        response.json.return_value = page
+        return response
+
+    connection = Connection("", "")
+    connection._make_get_request = MagicMock(side_effect=make_get_request)
+    return ScrapedFixturesAPI(connection)
+
+
+def _fixture(fixture_id: int, imo: int, deleted: bool = False) -> Any:
+    return {"FixtureID": fixture_id, "IMO": imo, "IsDeleted": deleted}
+
+
+def test_sync_stores_records_of_each_vessel_type(tmp_path) -> None:
+    api = create_api(
+        {
+            1: [
+                {"NextPageToken": "p2", "Data": [_fixture(1, 10)]},
+                {"NextRequestToken": "t1", "Data": [_fixture(2, 20)]},
+            ],
+            3: [{"NextRequestToken": "t3", "Data": [_fixture(3, 10)]}],
+        }
+    )
+
+    with ScrapedDataSync(api, str(tmp_path / "db.sqlite"), [1, 3]) as sync:
+        results = sync.sync(max_workers=2)
+
+        assert results == {
+            1: ScrapedDataSyncResult(updated=2, deleted=0, pages=2),
+            3: ScrapedDataSyncResult(updated=1, deleted=0, pages=1),
+        }
+        assert sync.get_request_token(1) == "t1"
+        assert sync.get_request_token(3) == "t3"
+        assert len(sync) == 3
+        assert sync.get_record(2) == ScrapedFixture(
+            fixture_id=2, imo=20, is_deleted=False
+        )
+        assert [f.fixture_id for f in sync.get_records(imos=[10])] == [1, 3]
+        assert [f.fixture_id for f in sync.get_records(vessel_type=3)] == [3]
+        frame = sync.get_data_frame(vessel_type=1)
+        assert frame["fixture_id"].tolist() == [1, 2]
+
+
+def test_sync_applies_updates_and_deletions_since_last_sync(tmp_path) -> None:
+    path = str(tmp_path / "db.sqlite")
+    api = create_api(
+        {
+            1: [
+                {
+                    "NextRequestToken": "t1",
+                    "Data": [_fixture(1, 10), _fixture(2, 20)],
+                },
+                {
+                    "NextRequestToken": "t2",
+                    "Data": [_fixture(1, 11), _fixture(2, 20, deleted=True)],
+                },
+            ]
+        }
+    )
+    ScrapedDataSync(api, path, [1]).sync()
+
+    with ScrapedDataSync(api, path, [1]) as sync:
+        results = sync.sync()
+
+        url = api._ScrapedDataAPI__connection._make_get_request.call_args[0][0]
+        assert "PageToken=t1" in url
+        assert "/incremental?" in url
+        assert results[1] == ScrapedDataSyncResult(1, 1, 1)
+        assert sync.get_records() == (
+            ScrapedFixture(fixture_id=1, imo=11, is_deleted=False),
+        )
+        assert sync.get_request_token(1) == "t2"
+
+
+def test_failed_sync_resumes_from_last_applied_page(tmp_path) -> None:
+    api = create_api(
+        {
+            1: [
+                {"NextPageToken": "p2", "Data": [_fixture(1, 10)]},
+                ConnectionError("Connection reset"),
+                {"NextRequestToken": "t1", "Data": [_fixture(2, 20)]},
+            ],
+            3: [{"NextRequestToken": "t3", "Data": [_fixture(3, 10)]}],
+        }
+    )
+    sync = ScrapedDataSync(api, str(tmp_path / "db.sqlite"), [1, 3])
+
+    with pytest.raises(ChunkRetrievalError) as error:
+        sync.sync()
+    assert error.value.failed_chunks == (1,)
+    assert [f.fixture_id for f in sync.get_records()] == [1, 3]
+
+    results = error.value.retry()
+
+    url = api._ScrapedDataAPI__connection._make_get_request.call_args[0][0]
+    assert "PageToken=p2" in url
+    assert results[1] == ScrapedDataSyncResult(1, 0, 1)
+    assert results[3] == ScrapedDataSyncResult(1, 0, 1)
+    assert [f.fixture_id for f in sync.get_records()] == [1, 2, 3]
+    assert sync.get_request_token(1) == "t1"
+
+
+def test_first_sync_starts_from_updated_date(tmp_path) -> None:
+    api = create_api({})
+    connection = api._ScrapedDataAPI__connection
+    token_response = MagicMock(status_code=200)
+    token_response.json.return_value = "from-date"
+    pages_response = MagicMock(status_code=200)
+    pages_response.json.return_value = {"NextRequestToken": "t1", "Data": []}
+    connection._make_get_request = MagicMock(
+        side_effect=[token_response, pages_response]
+    )
+
+    sync = ScrapedDataSync(
+        api,
+        str(tmp_path / "db.sqlite"),
+        [1],
+        updated_date_from=datetime(2021, 1, 1),
+    )
+    sync.sync()
+
+    urls = [c[0][0] for c in connection._make_get_request.call_args_list]
+    assert "getincrementaltoken" in urls[0]
+    assert "PageToken=from-date" in urls[1]
+    assert sync.get_request_token(1) == "t1"
+
+
+def test_rejects_database_of_a_different_api(tmp_path) -> None:
+    path = str(tmp_path / "db.sqlite")
+    ScrapedDataSync(create_api({}), path, [1]).close()
+
+    with pytest.raises(ValueError):
+        ScrapedDataSync(ScrapedPositionsAPI(Connection("", "")), path, [1])
@@ -0,0 +1,218 @@
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, List
+
+import pytest
+
+from signal_ocean import AsyncConnection, RetryPolicy
+
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+
+def run_with_server(
+    handler: Handler, test: Callable[[str], Awaitable[Any]]
+) -> Any:
+    async def run() -> Any:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        try:
+            return await test(str(server.make_url("/")))
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_sends_get_requests_with_headers_and_query_string():
+    received: List[Dict[str, Any]] = []
+
+    async def handler(request):
+        received.append(
+            {
+                "path": request.path,
+                "query": dict(request.query),
+                "headers": dict(request.headers),
+            }
+        )
+        return web.json_response({"ok": True})
+
+    async def test(host):
+        async with AsyncConnection("key", host) as connection:
+            response = await connection._make_get_request(
+                "some/url", {"a": 1, "b": None, "c": "x y"}
+            )
+            return response.status_code, response.json()
+
+    status, body = run_with_server(handler, test)
+
+    assert (status, body) == (200, {"ok": True})
+    assert received[0]["path"] == "/some/url"
+    assert received[0]["query"] == {"a": "1", "c": "x y"}
+    assert received[0]["headers"]["Api-Key"] == "key"
+    assert received[0]["headers"]["Source"] == "SignalSDK"
+
+
+def test_sends_post_requests_with_json_body():
+    bodies: List[Any] = []
+
+    async def handler(request):
+        bodies.append(await request.json())
+        return web.json_response([])
+
+    async def test(host):
+        async with AsyncConnection("key", host) as connection:
+            await connection._make_post_request("some/url", [1, 2])
+
+    run_with_server(handler, test)
+
+    assert bodies == [[1, 2]]
+
+
+def test_returns_unsuccessful_responses_without_raising():
+    async def handler(request):
+        return web.Response(status=404)
+
+    async def test(host):
+        async with AsyncConnection("key", host) as connection:
+            return await connection._make_get_request("missing")
+
+    response = run_with_server(handler, test)
+
+    assert response.status_code == 404
+
+
+def test_custom_auth_header_does_not_affect_original_connection():
+    headers: List[Dict[str, str]] = []
+
+    async def handler(request):
+        headers.append(dict(request.headers))
+        return web.json_response({})
+
+    async def test(host):
+        async with AsyncConnection("key", host) as connection:
+            other = connection._with_auth_header("Ocp-Apim-Subscription-Key")
+            await other._make_get_request("url")
+            await connection._make_get_request("url")
+
+    run_with_server(handler, test)
+
+    assert headers[0]["Ocp-Apim-Subscription-Key"] == "key"
+    assert "Api-Key" not in headers[0]
+    assert headers[1]["Api-Key"] == "key"
+
+
+def test_retries_transient_errors_until_success():
+    statuses = [503, 502, 200]
+
+    async def handler(request):
+        return web.json_response({}, status=statuses.pop(0))
+
+    async def test(host):
+        policy = RetryPolicy(backoff_factor=0)
+        async with AsyncConnection("key", host, retry_policy=policy) as c:
+            return await c._make_get_request("url")
+
+    response = run_with_server(handler, test)
+
+    assert response.status_code == 200
+    assert statuses == []
+
+
+def test_does_not_retry_without_a_policy():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.Response(status=503)
+
+    async def test(host):
+        async with AsyncConnection("key", host) as connection:
+            return await connection._make_get_request("url")
+
+    response = run_with_server(handler, test)
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+def test_bounds_the_number_of_requests_in_flight():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response({})
+
+    async def test(host):
+        async with AsyncConnection("key", host, max_concurrency=3) as c:
+            await asyncio.gather(
+                *(c._make_get_request("url") for _ in range(12))
+            )
+
+    run_with_server(handler, test)
+
+    assert max_in_flight == 3
+
+
+def test_can_be_reused_after_closing():
+    async def handler(request):
+        return web.json_response({})
+
+    async def test(host):
+        connection = AsyncConnection("key", host)
+        await connection._make_get_request("url")
+        await connection.close()
+        response = await connection._make_get_request("url")
+        await connection.close()
+        return response
+
+    assert run_with_server(handler, test).status_code == 200
+
+
+def test_closes_the_session_of_a_previous_event_loop():
+    async def handler(request):
+        return web.json_response({})
+
+    connection = AsyncConnection("key")
+    pool = connection._AsyncConnection__session_pool
+    sessions = []
+
+    async def test(host):
+        connection._AsyncConnection__api_host = host
+        response = await connection._make_get_request("url")
+        session, _ = await pool.get()
+        sessions.append(session)
+        return response
+
+    run_with_server(handler, test)
+    response = run_with_server(handler, test)
+    run_with_server(handler, lambda _: connection.close())
+
+    assert response.status_code == 200
+    assert sessions[0] is not sessions[1]
+    assert sessions[0].closed and sessions[1].closed
+
+
+def test_deepcopy_shares_the_session_pool():
+    connection = AsyncConnection("key")
+
+    copied = copy.deepcopy(connection)
+
+    assert (
+        copied._AsyncConnection__session_pool
+        is connection._AsyncConnection__session_pool
+    )
+
+
+def test_rejects_invalid_max_concurrency():
+    with pytest.raises(ValueError):
+        AsyncConnection(max_concurrency=0)
@@ -1,8 +1,10 @@
-from unittest.mock import patch
+import copy
+from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
-from signal_ocean import Connection
+from signal_ocean import Connection, RetryPolicy
 
 
 def test_uses_api_key_from_environment_variables_by_default():
@@ -11,7 +13,7 @@ def test_uses_api_key_from_environment_variables_by_default():
 
     with patch.dict(
         "os.environ", {"SIGNAL_OCEAN_API_KEY": key_from_env_var}, clear=True
-    ), patch("requests.get") as get:
+    ), patch("requests.Session.get") as get:
         connection._make_get_request(None)
 
     assert get.call_args.kwargs["headers"]["Api-Key"] == key_from_env_var
@@ -21,7 +23,9 @@ def test_uses_provided_api_key():
     provided_key = "provided key"
     connection = Connection(api_key=provided_key)
 
-    with patch.dict("os.environ", clear=True), patch("requests.get") as get:
+    with patch.dict("os.environ", clear=True), patch(
+        "requests.Session.get"
+    ) as get:
         connection._make_get_request(None)
 
     assert get.call_args.kwargs["headers"]["Api-Key"] == provided_key
@@ -31,7 +35,7 @@ def test_has_no_api_key_if_not_provided_and_no_environment_variable():
     connection = Connection()
 
     with patch.dict("os.environ", {}, clear=True), patch(
-        "requests.get"
+        "requests.Session.get"
     ) as get:
         connection._make_get_request(None)
 
@@ -42,7 +46,7 @@ def test_targets_production_host_by_default():
     connection = Connection()
 
     with patch.dict("os.environ", {}, clear=True), patch(
-        "requests.get"
+        "requests.Session.get"
     ) as get:
         connection._make_get_request(None)
 
@@ -54,7 +58,7 @@ def test_host_can_be_overridden_via_parameter(overridden_host: str):
     connection = Connection(api_host=overridden_host)
 
     with patch.dict("os.environ", {}, clear=True), patch(
-        "requests.get"
+        "requests.Session.get"
     ) as get:
         connection._make_get_request(None)
 
@@ -67,7 +71,7 @@ def test_host_can_be_overridden_via_environment_variable(overridden_host: str):
 
     with patch.dict(
         "os.environ", {"SIGNAL_OCEAN_API_HOST": overridden_host}, clear=True
-    ), patch("requests.get") as get:
+    ), patch("requests.Session.get") as get:
         connection._make_get_request(None)
 
     assert get.call_args.args == ("host/",)
@@ -77,7 +81,7 @@ def test_makes_get_requests_with_specified_parameters():
     connection = Connection("api_key", "api_host")
     query_string = {"key": "value"}
 
-    with patch("requests.get") as get:
+    with patch("requests.Session.get") as get:
         connection._make_get_request("relative_url", query_string)
 
     get.assert_called_with(
@@ -89,3 +93,249 @@ def test_makes_get_requests_with_specified_parameters():
             "Source": "SignalSDK",
         },
     )
+
+
+def test_makes_post_requests_with_specified_parameters():
+    connection = Connection("api_key", "api_host")
+    query_string = {"key": "value"}
+
+    with patch("requests.Session.post") as post:
+        connection._make_post_request("relative_url", query_string)
+
+    post.assert_called_with(
+        "api_host/relative_url",
+        data='{"key": "value"}',
+        headers={
+            "Api-Key": "api_key",
+            "Content-Type": "application/json",
+            "Source": "SignalSDK",
+        },
+    )
+
+
+def test_reuses_the_same_session_across_requests():
+    connection = Connection("api_key", "api_host")
+
+    with patch("requests.Session") as session_class:
+        connection._make_get_request("first")
+        connection._make_post_request("second")
+
+    session_class.assert_called_once()
+    session = session_class.return_value
+    assert session.get.call_count == 1
+    assert session.post.call_count == 1
+
+
+def test_mounts_adapter_with_configured_pool_size():
+    connection = Connection("api_key", "api_host", pool_size=32)
+
+    with patch("requests.Session") as session_class:
+        connection._make_get_request("relative_url")
+
+    adapter = session_class.return_value.mount.call_args.args[1]
+    assert adapter._pool_connections == 32
+    assert adapter._pool_maxsize == 32
+
+
+def test_exposes_the_pool_size():
+    assert Connection(pool_size=32).pool_size == 32
+
+
+def test_rejects_non_positive_pool_size():
+    with pytest.raises(ValueError):
+        Connection(pool_size=0)
+
+
+def test_close_releases_the_session_and_reopens_on_next_request():
+    connection = Connection("api_key", "api_host")
+
+    with patch("requests.Session") as session_class:
+        connection._make_get_request("relative_url")
+        connection.close()
+        connection._make_get_request("relative_url")
+
+    assert session_class.return_value.close.call_count == 1
+    assert session_class.call_count == 2
+
+
+def test_closes_the_session_when_used_as_context_manager():
+    with patch("requests.Session") as session_class:
+        with Connection("api_key", "api_host") as connection:
+            connection._make_get_request("relative_url")
+
+    session_class.return_value.close.assert_called_once()
+
+
+def test_copies_share_the_pooled_session():
+    connection = Connection("api_key", "api_host")
+    copied = copy.deepcopy(connection)
+
+    with patch("requests.Session") as session_class:
+        connection._make_get_request("relative_url")
+        copied._make_get_request("relative_url")
+
+    session_class.assert_called_once()
+    assert session_class.return_value.get.call_count == 2
+
+
+def create_response(status_code, retry_after=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {} if retry_after is None else {
+        "Retry-After": retry_after
+    }
+    return response
+
+
+def test_does_not_retry_without_retry_policy():
+    connection = Connection("api_key", "api_host")
+
+    with patch("requests.Session.get") as get:
+        get.return_value = create_response(503)
+        response = connection._make_get_request("relative_url")
+
+    assert response.status_code == 503
+    assert get.call_count == 1
+
+
+def test_retries_transient_errors_until_success():
+    connection = Connection(
+        "api_key", "api_host", retry_policy=RetryPolicy(backoff_factor=0)
+    )
+    responses = [
+        create_response(503),
+        create_response(429),
+        create_response(200),
+    ]
+
+    with patch("requests.Session.get", side_effect=responses) as get, patch(
+        "time.sleep"
+    ):
+        response = connection._make_get_request("relative_url")
+
+    assert response.status_code == 200
+    assert get.call_count == 3
+    responses[0].close.assert_called_once()
+
+
+def test_retries_connection_errors():
+    connection = Connection(
+        "api_key", "api_host", retry_policy=RetryPolicy(backoff_factor=0)
+    )
+    responses = [requests.ConnectionError(), create_response(200)]
+
+    with patch("requests.Session.get", side_effect=responses), patch(
+        "time.sleep"
+    ):
+        response = connection._make_get_request("relative_url")
+
+    assert response.status_code == 200
+
+
+def test_raises_connection_error_when_retries_are_exhausted():
+    connection = Connection(
+        "api_key",
+        "api_host",
+        retry_policy=RetryPolicy(max_retries=1, backoff_factor=0),
+    )
+
+    with patch(
+        "requests.Session.get", side_effect=requests.ConnectionError()
+    ) as get, patch("time.sleep"), pytest.raises(requests.ConnectionError):
+        connection._make_get_request("relative_url")
+
+    assert get.call_count == 2
+
+
+def test_returns_last_response_when_retries_are_exhausted():
+    connection = Connection(
+        "api_key",
+        "api_host",
+        retry_policy=RetryPolicy(max_retries=2, backoff_factor=0),
+    )
+
+    with patch("requests.Session.get") as get, patch("time.sleep"):
+        get.return_value = create_response(503)
+        response = connection._make_get_request("relative_url")
+
+    assert response.status_code == 503
+    assert get.call_count == 3
+
+
+def test_waits_as_long_as_retry_after_requests():
+    connection = Connection(
+        "api_key", "api_host", retry_policy=RetryPolicy(backoff_factor=0)
+    )
+    responses = [create_response(429, retry_after="4"), create_response(200)]
+
+    with patch("requests.Session.get", side_effect=responses), patch(
+        "time.sleep"
+    ) as sleep:
+        connection._make_get_request("relative_url")
+
+    sleep.assert_called_once_with(4)
+
+
+def test_stops_retrying_when_total_time_would_be_exceeded():
+    connection = Connection(
+        "api_key",
+        "api_host",
+        retry_policy=RetryPolicy(max_total_time=10),
+    )
+    responses = [create_response(429, retry_after="60"), create_response(200)]
+
+    with patch("requests.Session.get", side_effect=responses) as get, patch(
+        "time.sleep"
+    ) as sleep:
+        response = connection._make_get_request("relative_url")
+
+    assert response.status_code == 429
+    assert get.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_does_not_retry_non_idempotent_methods_by_default():
+    connection = Connection("api_key", "api_host", retry_policy=RetryPolicy())
+
+    with patch("requests.Session.post") as post:
+        post.return_value = create_response(503)
+        connection._make_post_request("relative_url")
+
+    assert post.call_count == 1
+
+
+def test_retries_methods_allowed_by_policy():
+    connection = Connection(
+        "api_key",
+        "api_host",
+        retry_policy=RetryPolicy(
+            backoff_factor=0, retry_methods=frozenset({"GET", "POST"})
+        ),
+    )
+    responses = [create_response(502), create_response(200)]
+
+    with patch("requests.Session.post", side_effect=responses), patch(
+        "time.sleep"
+    ):
+        response = connection._make_post_request("relative_url")
+
+    assert response.status_code == 200
+
+
+def test_acquires_rate_limiter_before_every_attempt():
+    rate_limiter = MagicMock()
+    connection = Connection(
+        "api_key",
+        "api_host",
+        retry_policy=RetryPolicy(backoff_factor=0),
+        rate_limiter=rate_limiter,
+    )
+    responses = [create_response(503), create_response(200)]
+
+    with patch("requests.Session.get", side_effect=responses), patch(
+        "time.sleep"
+    ):
+        connection._make_get_request("relative_url")
+
+    assert rate_limiter.acquire.call_count == 2
+    rate_limiter.acquire.assert_called_with("api_host/relative_url")
@@ -0,0 +1,139 @@
+import asyncio
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+
+from signal_ocean import RateLimit, RateLimiter, RateLimiterStats
+
+HOST = "https://api-gateway.signalocean.com/"
+
+
+def reserve_all(limiter: RateLimiter, urls, now: float = 0.0):
+    with patch("time.monotonic", return_value=now):
+        return [limiter._reserve(url) for url in urls]
+
+
+def test_allows_a_burst_without_waiting():
+    limiter = RateLimiter(RateLimit(requests_per_second=2, burst=3))
+
+    waits = reserve_all(limiter, [HOST + "a"] * 3)
+
+    assert waits == [0, 0, 0]
+
+
+def test_spaces_out_requests_beyond_the_burst():
+    limiter = RateLimiter(RateLimit(requests_per_second=2, burst=1))
+
+    waits = reserve_all(limiter, [HOST + "a"] * 3)
+
+    assert waits == [0, 0.5, 1.0]
+
+
+def test_refills_tokens_over_time():
+    limiter = RateLimiter(RateLimit(requests_per_second=2, burst=1))
+
+    reserve_all(limiter, [HOST + "a"], now=0)
+    waits = reserve_all(limiter, [HOST + "a"], now=0.5)
+
+    assert waits == [0]
+
+
+def test_keeps_separate_budgets_per_host():
+    limiter = RateLimiter(RateLimit(requests_per_second=1, burst=1))
+
+    waits = reserve_all(limiter, ["https://first/a", "https://second/a"])
+
+    assert waits == [0, 0]
+
+
+def test_applies_longest_matching_route_budget():
+    limiter = RateLimiter(
+        RateLimit(requests_per_second=100),
+        route_limits={
+            "voyages-api/": RateLimit(requests_per_second=10, burst=10),
+            "voyages-api/v4/voyages": RateLimit(
+                requests_per_second=1, burst=1
+            ),
+        },
+    )
+
+    waits = reserve_all(
+        limiter,
+        [
+            HOST + "voyages-api/v4/voyages/nested",
+            HOST + "voyages-api/v4/voyages/flat",
+            HOST + "voyages-api/v4/filters/availableVessels",
+        ],
+    )
+
+    assert waits == [0, 1.0, 0]
+
+
+def test_collects_wait_statistics():
+    limiter = RateLimiter(RateLimit(requests_per_second=2, burst=1))
+
+    reserve_all(limiter, [HOST + "a"] * 3)
+
+    assert limiter.stats() == RateLimiterStats(
+        requests=3, delayed_requests=2, total_wait_time=1.5, max_wait_time=1.0
+    )
+
+
+def test_resets_wait_statistics():
+    limiter = RateLimiter(RateLimit(requests_per_second=2, burst=1))
+    reserve_all(limiter, [HOST + "a"] * 3)
+
+    limiter.reset_stats()
+
+    assert limiter.stats() == RateLimiterStats()
+
+
+def test_acquire_sleeps_for_the_reserved_time():
+    limiter = RateLimiter(RateLimit(requests_per_second=2, burst=1))
+
+    with patch("time.monotonic", return_value=0), patch(
+        "time.sleep"
+    ) as sleep:
+        limiter.acquire(HOST)
+        limiter.acquire(HOST)
+
+    sleep.assert_called_once_with(0.5)
+
+
+def test_acquire_async_waits_without_blocking():
+    limiter = RateLimiter(RateLimit(requests_per_second=1000, burst=1))
+
+    async def acquire_many():
+        return await asyncio.gather(
+            *(limiter.acquire_async(HOST) for _ in range(3))
+        )
+
+    waits = asyncio.run(acquire_many())
+
+    assert waits[0] == 0
+    assert limiter.stats().requests == 3
+
+
+def test_is_safe_to_share_between_threads():
+    limiter = RateLimiter(RateLimit(requests_per_second=1, burst=1))
+
+    with patch("time.monotonic", return_value=0):
+        threads = [
+            Thread(target=limiter._reserve, args=(HOST,)) for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert limiter.stats().requests == 20
+    assert limiter.stats().max_wait_time == 19
+
+
+@pytest.mark.parametrize(
+    "requests_per_second, burst", [(0, None), (-1, None), (1, 0)]
+)
+def test_rejects_invalid_limits(requests_per_second, burst):
+    with pytest.raises(ValueError):
+        RateLimit(requests_per_second, burst)
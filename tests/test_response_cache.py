@@ -0,0 +1,234 @@
+import copy
+from datetime import timedelta
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from signal_ocean import Connection, ResponseCache, ResponseCacheStats
+
+CACHED_ROUTE = "geos-api/v2/ports/all"
+
+
+def create_response(
+    status_code: int = 200, content: bytes = b"[1]", **headers: str
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.raw = BytesIO(content)
+    response.headers.update(headers)
+    response.encoding = "utf-8"
+    return response
+
+
+def create_connection(cache: ResponseCache) -> Connection:
+    return Connection("api_key", "https://host/", response_cache=cache)
+
+
+def test_serves_repeated_requests_from_the_cache():
+    cache = ResponseCache(":memory:")
+    connection = create_connection(cache)
+
+    with patch(
+        "requests.Session.get", return_value=create_response()
+    ) as get:
+        first = connection._make_get_request(CACHED_ROUTE)
+        second = connection._make_get_request(CACHED_ROUTE)
+
+    assert get.call_count == 1
+    assert first.json() == second.json() == [1]
+    assert cache.stats() == ResponseCacheStats(hits=1, misses=1)
+
+
+def test_persists_responses_across_cache_instances(tmp_path):
+    path = str(tmp_path / "cache" / "responses.sqlite")
+    with patch("requests.Session.get", return_value=create_response()):
+        create_connection(ResponseCache(path))._make_get_request(
+            CACHED_ROUTE
+        )
+
+    with patch("requests.Session.get") as get:
+        response = create_connection(ResponseCache(path))._make_get_request(
+            CACHED_ROUTE
+        )
+
+    get.assert_not_called()
+    assert response.json() == [1]
+
+
+def test_does_not_cache_routes_without_ttl():
+    cache = ResponseCache(":memory:")
+    connection = create_connection(cache)
+
+    with patch(
+        "requests.Session.get", return_value=create_response()
+    ) as get:
+        connection._make_get_request("voyages-api/v4/voyages/nested")
+        connection._make_get_request("voyages-api/v4/voyages/nested")
+
+    assert get.call_count == 2
+    assert cache.stats() == ResponseCacheStats()
+
+
+def test_keys_include_query_parameters_and_body():
+    cache = ResponseCache(":memory:", {"route": timedelta(hours=1)})
+    connection = create_connection(cache)
+
+    with patch(
+        "requests.Session.get", return_value=create_response()
+    ) as get, patch(
+        "requests.Session.post", return_value=create_response()
+    ) as post:
+        connection._make_get_request("route", {"a": "1"})
+        connection._make_get_request("route", {"a": "2"})
+        connection._make_post_request("route", {"a": "1"})
+        connection._make_post_request("route", {"a": "1"})
+
+    assert get.call_count == 2
+    assert post.call_count == 1
+
+
+def test_keys_include_the_api_key():
+    cache = ResponseCache(":memory:")
+    first = Connection("first", "https://host/", response_cache=cache)
+    second = Connection("second", "https://host/", response_cache=cache)
+    sent = MagicMock(return_value=create_response())
+
+    with patch("requests.Session.get", sent):
+        first._make_get_request(CACHED_ROUTE)
+        second._make_get_request(CACHED_ROUTE)
+        first._make_get_request(CACHED_ROUTE)
+
+    assert sent.call_count == 2
+    assert cache.stats() == ResponseCacheStats(hits=1, misses=2)
+
+
+def test_longest_matching_route_prefix_applies():
+    cache = ResponseCache(
+        ":memory:",
+        {"api/": timedelta(hours=1), "api/live": timedelta(0)},
+    )
+    connection = create_connection(cache)
+
+    with patch(
+        "requests.Session.get", return_value=create_response()
+    ) as get:
+        connection._make_get_request("api/live")
+        connection._make_get_request("api/live")
+
+    assert get.call_count == 2
+
+
+def test_revalidates_expired_responses():
+    cache = ResponseCache(":memory:", {"route": timedelta(seconds=10)})
+    connection = create_connection(cache)
+    responses = [
+        create_response(ETag='"v1"', **{"Last-Modified": "yesterday"}),
+        create_response(304, b""),
+    ]
+
+    with patch("requests.Session.get", side_effect=responses) as get:
+        with patch("time.time", return_value=0):
+            connection._make_get_request("route")
+        with patch("time.time", return_value=20):
+            response = connection._make_get_request("route")
+
+    headers = get.call_args[1]["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "yesterday"
+    assert response.status_code == 200
+    assert response.json() == [1]
+    assert cache.stats() == ResponseCacheStats(misses=1, revalidations=1)
+
+
+def test_replaces_expired_responses_that_changed():
+    cache = ResponseCache(":memory:", {"route": timedelta(seconds=10)})
+    connection = create_connection(cache)
+    responses = [create_response(content=b"[1]"), create_response(
+        content=b"[2]"
+    )]
+
+    with patch("requests.Session.get", side_effect=responses):
+        with patch("time.time", return_value=0):
+            connection._make_get_request("route")
+        with patch("time.time", return_value=20):
+            connection._make_get_request("route")
+        with patch("time.time", return_value=21):
+            response = connection._make_get_request("route")
+
+    assert response.json() == [2]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [create_response(404), create_response(**{"Cache-Control": "no-store"})],
+)
+def test_does_not_store_uncacheable_responses(response):
+    cache = ResponseCache(":memory:")
+    connection = create_connection(cache)
+
+    with patch("requests.Session.get", return_value=response) as get:
+        connection._make_get_request(CACHED_ROUTE)
+        connection._make_get_request(CACHED_ROUTE)
+
+    assert get.call_count == 2
+
+
+def test_evicts_least_recently_used_responses():
+    cache = ResponseCache(
+        ":memory:", {"route": timedelta(hours=1)}, max_size=6
+    )
+    connection = create_connection(cache)
+
+    with patch(
+        "requests.Session.get", return_value=create_response(content=b"[1]")
+    ) as get:
+        with patch("time.time", return_value=1):
+            connection._make_get_request("route/a")
+        with patch("time.time", return_value=2):
+            connection._make_get_request("route/b")
+        with patch("time.time", return_value=3):
+            connection._make_get_request("route/a")
+        with patch("time.time", return_value=4):
+            connection._make_get_request("route/c")
+        with patch("time.time", return_value=5):
+            connection._make_get_request("route/a")
+            connection._make_get_request("route/b")
+
+    assert get.call_count == 4
+    assert cache.stats().evictions == 2
+
+
+def test_clear_removes_all_responses():
+    cache = ResponseCache(":memory:")
+    connection = create_connection(cache)
+
+    with patch(
+        "requests.Session.get", return_value=create_response()
+    ) as get:
+        connection._make_get_request(CACHED_ROUTE)
+        cache.clear()
+        connection._make_get_request(CACHED_ROUTE)
+
+    assert get.call_count == 2
+
+
+def test_rejects_non_positive_max_size():
+    with pytest.raises(ValueError):
+        ResponseCache(":memory:", max_size=0)
+
+
+def test_copies_of_a_connection_share_the_cache():
+    cache = ResponseCache(":memory:")
+    connection = create_connection(cache)
+    sent = MagicMock(return_value=create_response())
+
+    with patch("requests.Session.get", sent):
+        connection._make_get_request(CACHED_ROUTE)
+        copy.deepcopy(connection)._make_get_request(
+            CACHED_ROUTE
+        )
+
+    assert sent.call_count == 1
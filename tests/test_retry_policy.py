@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from signal_ocean import RetryPolicy
+
+
+def create_response(retry_after=None):
+    response = MagicMock()
+    response.headers = {} if retry_after is None else {
+        "Retry-After": retry_after
+    }
+    return response
+
+
+@pytest.mark.parametrize("retry, expected_backoff", [(0, 1), (1, 2), (3, 8)])
+def test_backoff_grows_exponentially(retry: int, expected_backoff: float):
+    policy = RetryPolicy(backoff_factor=1, max_backoff=100)
+
+    with patch("random.uniform", side_effect=lambda a, b: b) as uniform:
+        delay = policy._get_delay(retry)
+
+    uniform.assert_called_once_with(0, expected_backoff)
+    assert delay == expected_backoff
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+    with patch("random.uniform", side_effect=lambda a, b: b):
+        delay = policy._get_delay(10)
+
+    assert delay == 5
+
+
+def test_honours_retry_after_seconds():
+    policy = RetryPolicy(backoff_factor=0.1)
+
+    delay = policy._get_delay(0, create_response("7"))
+
+    assert delay == 7
+
+
+def test_honours_retry_after_http_date():
+    policy = RetryPolicy(backoff_factor=0.1)
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = policy._get_delay(0, create_response(format_datetime(retry_at)))
+
+    assert 25 < delay <= 30
+
+
+def test_ignores_retry_after_if_disabled():
+    policy = RetryPolicy(backoff_factor=0.1, respect_retry_after=False)
+
+    delay = policy._get_delay(0, create_response("7"))
+
+    assert delay <= 0.1
+
+
+def test_ignores_invalid_retry_after():
+    policy = RetryPolicy(backoff_factor=0.1)
+
+    delay = policy._get_delay(0, create_response("soon"))
+
+    assert delay <= 0.1
+
+
+def test_retries_only_idempotent_methods_by_default():
+    policy = RetryPolicy()
+
+    assert policy._can_retry("GET")
+    assert not policy._can_retry("POST")
+
+
+def test_does_not_retry_when_max_retries_is_zero():
+    assert not RetryPolicy(max_retries=0)._can_retry("GET")
@@ -0,0 +1,13 @@
+from types import SimpleNamespace
+
+from signal_ocean._internals import unique_by_id
+
+
+def test_keeps_the_first_item_of_each_id_in_order():
+    first = SimpleNamespace(id=1, name="first")
+    second = SimpleNamespace(id=2, name="second")
+    duplicate = SimpleNamespace(id=1, name="duplicate")
+
+    unique = unique_by_id([[first], [second, duplicate], []])
+
+    assert unique == (first, second)
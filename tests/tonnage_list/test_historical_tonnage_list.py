@@ -1,6 +1,8 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
+import pandas as pd
+
 from signal_ocean.tonnage_list import (
     HistoricalTonnageList,
     TonnageList,
@@ -87,3 +89,64 @@ def test_contains_vessel_data_when_converted_to_data_frame() -> None:
     assert df[Column.SUBCLASS].to_list() == [v.subclass]
     assert df[Column.VESSEL_CLASS].to_list() == [v.vessel_class]
     assert df[Column.YEAR_BUILT].to_list() == [v.year_built]
+
+
+def create_row_based_data_frame(htl: HistoricalTonnageList) -> pd.DataFrame:
+    index_tuples = []
+    data = []
+    for tonnage_list in htl:
+        for vessel in tonnage_list.vessels:
+            index_tuples.append((tonnage_list.date, vessel.imo))
+            data.append(vessel._to_data_frame_row())
+
+    data_frame = pd.DataFrame(
+        data,
+        index=pd.MultiIndex.from_tuples(
+            index_tuples, names=[IndexLevel.DATE, IndexLevel.IMO]
+        ),
+        columns=list(Column),
+    )
+
+    return data_frame.astype(Column._get_data_types())  # type: ignore
+
+
+def create_varied_historical_tonnage_list(
+    days: int, vessels: int
+) -> HistoricalTonnageList:
+    return HistoricalTonnageList(
+        create_tonnage_list(
+            datetime(2020, 1, 1, tzinfo=timezone.utc) + timedelta(days=day),
+            tuple(
+                create_vessel(
+                    imo=9000000 + (imo * 7 + day) % vessels,
+                    name=f"vessel {imo}",
+                    ice_class=None if imo % 3 else "1A",
+                    open_port=f"port {imo % 11}",
+                    open_port_id=imo % 11,
+                    open_date=None if imo % 5 == 0 else datetime(
+                        2020, 1, 1 + imo % 28, tzinfo=timezone.utc
+                    ),
+                    commercial_operator=None if imo % 4 == 0 else f"co {imo}",
+                    open_areas=tuple(),
+                )
+                for imo in range(vessels)
+            ),
+        )
+        for day in range(days)
+    )
+
+
+def test_data_frame_matches_row_based_conversion() -> None:
+    htl = create_varied_historical_tonnage_list(days=3, vessels=40)
+
+    pd.testing.assert_frame_equal(
+        htl.to_data_frame(), create_row_based_data_frame(htl)
+    )
+
+
+def test_empty_data_frame_matches_row_based_conversion() -> None:
+    htl = HistoricalTonnageList([create_tonnage_list()])
+
+    pd.testing.assert_frame_equal(
+        htl.to_data_frame(), create_row_based_data_frame(htl)
+    )
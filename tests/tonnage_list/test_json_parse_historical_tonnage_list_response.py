@@ -228,3 +228,25 @@ def test_tolerates_unkown_values() -> None:
     assert vessel.commercial_status == "unknown cs"
     assert vessel.subclass == "unknown sc"
 
+
+
+def test_joins_static_vessel_data_by_imo_across_tonnage_lists() -> None:
+    htl = _json.parse_historical_tonnage_list_response(
+        {
+            "tonnageLists": [
+                {
+                    "date": f"2020-05-{day}T00:00:00Z",
+                    "pointInTimeVesselData": [{"imo": 2}, {"imo": 1}],
+                }
+                for day in (28, 29)
+            ],
+            "staticVesselData": [
+                {"imo": 1, "vesselName": "First"},
+                {"imo": 2, "vesselName": "Second"},
+                {"imo": 1, "vesselName": "Duplicate"},
+            ],
+        }
+    )
+
+    for tonnage_list in htl:
+        assert [v.name for v in tonnage_list] == ["Second", "First"]
@@ -1,7 +1,12 @@
 from datetime import date, time
+from time import sleep
+from typing import Any, Dict, cast
 from unittest.mock import MagicMock, call
 
-from signal_ocean.tonnage_list import TonnageListAPI
+import pytest
+import requests
+
+from signal_ocean.tonnage_list import ChunkRetrievalError, TonnageListAPI
 from signal_ocean.tonnage_list.models import DateRange
 
 from .builders import create_port, create_vessel_class
@@ -86,3 +91,115 @@ def test_splits_long_date_ranges_into_multiple_calls() -> None:
         ],
         any_order=True,
     )
+
+
+def create_chunk_response(day: str) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {
+        "tonnageLists": [
+            {"date": f"{day}T00:00:00Z", "pointInTimeVesselData": []}
+        ]
+    }
+    return response
+
+
+def get_start_date(request: Any) -> str:
+    return cast(str, request.args[1]["startDate"])
+
+
+def test_retrieves_chunks_of_configured_size() -> None:
+    connection = MagicMock()
+    api = TonnageListAPI(connection)
+
+    api.get_historical_tonnage_list(
+        create_port(),
+        create_vessel_class(),
+        date_range=DateRange(date(2020, 1, 1), date(2020, 1, 10)),
+        chunk_days=4,
+    )
+
+    assert [
+        get_start_date(c) for c in connection._make_get_request.call_args_list
+    ] == ["2020-01-01", "2020-01-05", "2020-01-09"]
+
+
+@pytest.mark.parametrize("chunk_days", [0, 366])
+def test_rejects_chunk_days_out_of_range(chunk_days: int) -> None:
+    api = TonnageListAPI(MagicMock())
+
+    with pytest.raises(ValueError):
+        api.get_historical_tonnage_list(
+            create_port(), create_vessel_class(), chunk_days=chunk_days
+        )
+
+
+def test_keeps_concurrently_retrieved_chunks_in_chronological_order() -> None:
+    def get(url: str, query_string: Dict[str, str]) -> MagicMock:
+        start = query_string["startDate"]
+        # Make earlier chunks complete last.
+        sleep(0.01 if start < "2020-01-05" else 0)
+        return create_chunk_response(start)
+
+    connection = MagicMock()
+    connection._make_get_request.side_effect = get
+    api = TonnageListAPI(connection)
+
+    htl = api.get_historical_tonnage_list(
+        create_port(),
+        create_vessel_class(),
+        date_range=DateRange(date(2020, 1, 1), date(2020, 1, 10)),
+        chunk_days=2,
+        max_workers=5,
+    )
+
+    assert [tl.date.day for tl in htl] == [1, 3, 5, 7, 9]
+
+
+def test_raises_the_first_error_when_retrieving_chunks_sequentially() -> None:
+    connection = MagicMock()
+    connection._make_get_request.side_effect = [
+        create_chunk_response("2020-01-01"),
+        requests.HTTPError(),
+    ]
+    api = TonnageListAPI(connection)
+
+    with pytest.raises(requests.HTTPError):
+        api.get_historical_tonnage_list(
+            create_port(),
+            create_vessel_class(),
+            date_range=DateRange(date(2020, 1, 1), date(2020, 1, 6)),
+            chunk_days=2,
+        )
+    assert connection._make_get_request.call_count == 2
+
+
+def test_retries_only_failed_chunks() -> None:
+    failed = [False]
+
+    def get(url: str, query_string: Dict[str, str]) -> MagicMock:
+        start = query_string["startDate"]
+        if start == "2020-01-03" and not failed[0]:
+            failed[0] = True
+            raise requests.ConnectionError()
+        return create_chunk_response(start)
+
+    connection = MagicMock()
+    connection._make_get_request.side_effect = get
+    api = TonnageListAPI(connection)
+
+    with pytest.raises(ChunkRetrievalError) as error_info:
+        api.get_historical_tonnage_list(
+            create_port(),
+            create_vessel_class(),
+            date_range=DateRange(date(2020, 1, 1), date(2020, 1, 6)),
+            chunk_days=2,
+            max_workers=3,
+        )
+    error = error_info.value
+    assert [r.start for r in error.failed_chunks] == [date(2020, 1, 3)]
+    assert isinstance(error.errors[0], requests.ConnectionError)
+
+    htl = error.retry()
+
+    assert [tl.date.day for tl in htl] == [1, 3, 5]
+    assert connection._make_get_request.call_count == 4
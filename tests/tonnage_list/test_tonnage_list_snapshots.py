@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+
+from signal_ocean.tonnage_list import (
+    Column,
+    CommercialStatus,
+    TonnageList,
+    TonnageListSnapshots,
+)
+
+from .builders import create_vessel
+
+_DATE = datetime(2021, 1, 1, tzinfo=timezone.utc)
+_OPEN_DATE = datetime(2021, 1, 5, tzinfo=timezone.utc)
+
+
+def test_first_update_reports_all_vessels_as_added() -> None:
+    snapshots = TonnageListSnapshots()
+    vessels = [create_vessel(imo=1), create_vessel(imo=2)]
+
+    diff = snapshots.update("key", TonnageList(vessels, _DATE))
+
+    assert diff.key == "key"
+    assert diff.date == _DATE
+    assert diff.added == tuple(vessels)
+    assert diff.removed == ()
+    assert diff.changed == ()
+
+
+def test_reports_added_removed_and_changed_vessels() -> None:
+    snapshots = TonnageListSnapshots()
+    unchanged = create_vessel(imo=1, open_date=_OPEN_DATE)
+    removed = create_vessel(imo=2, open_date=_OPEN_DATE)
+    before = create_vessel(
+        imo=3,
+        open_date=_OPEN_DATE,
+        commercial_status=CommercialStatus.AVAILABLE,
+    )
+    after = create_vessel(
+        imo=3,
+        open_date=_OPEN_DATE + timedelta(days=1),
+        commercial_status=CommercialStatus.ON_SUBS,
+    )
+    added = create_vessel(imo=4, open_date=_OPEN_DATE)
+    snapshots.update("key", TonnageList([unchanged, removed, before], _DATE))
+
+    diff = snapshots.update(
+        "key",
+        TonnageList(
+            [create_vessel(imo=1, open_date=_OPEN_DATE), after, added],
+            _DATE + timedelta(hours=1),
+        ),
+    )
+
+    assert diff.added == (added,)
+    assert diff.removed == (removed,)
+    assert len(diff.changed) == 1
+    change = diff.changed[0]
+    assert change.imo == 3
+    assert change.previous is before
+    assert change.current is after
+    assert change.changes == {
+        Column.OPEN_DATE: (_OPEN_DATE, _OPEN_DATE + timedelta(days=1)),
+        Column.COMMERCIAL_STATUS: (
+            CommercialStatus.AVAILABLE,
+            CommercialStatus.ON_SUBS,
+        ),
+    }
+
+
+def test_unchanged_tonnage_list_results_in_empty_diff() -> None:
+    snapshots = TonnageListSnapshots()
+    snapshots.update(
+        "key", TonnageList([create_vessel(open_date=_OPEN_DATE)], _DATE)
+    )
+
+    diff = snapshots.update(
+        "key", TonnageList([create_vessel(open_date=_OPEN_DATE)], _DATE)
+    )
+
+    assert diff.is_empty
+
+
+def test_keys_are_diffed_independently() -> None:
+    snapshots = TonnageListSnapshots()
+    snapshots.update(("port", 1), TonnageList([create_vessel(imo=1)], _DATE))
+
+    diff = snapshots.update(
+        ("port", 2), TonnageList([create_vessel(imo=2)], _DATE)
+    )
+
+    assert [v.imo for v in diff.added] == [2]
+    assert diff.removed == ()
+    assert set(snapshots.keys()) == {("port", 1), ("port", 2)}
+
+
+def test_indexes_latest_vessels_by_imo() -> None:
+    snapshots = TonnageListSnapshots()
+    vessel = create_vessel(imo=1)
+    tonnage_list = TonnageList([vessel, create_vessel(imo=2)], _DATE)
+
+    snapshots.update("key", tonnage_list)
+
+    assert snapshots.get_tonnage_list("key") is tonnage_list
+    assert snapshots.get_vessel("key", 1) is vessel
+    assert snapshots.get_vessel("key", 3) is None
+    assert set(snapshots.get_vessels("key")) == {1, 2}
+
+
+def test_unknown_key_has_no_vessels() -> None:
+    snapshots = TonnageListSnapshots()
+
+    assert snapshots.get_tonnage_list("key") is None
+    assert snapshots.get_vessel("key", 1) is None
+    assert not snapshots.get_vessels("key")
+
+
+def test_removed_key_reports_all_vessels_as_added_again() -> None:
+    snapshots = TonnageListSnapshots()
+    vessel = create_vessel(imo=1)
+    snapshots.update("key", TonnageList([vessel], _DATE))
+
+    snapshots.remove("key")
+    diff = snapshots.update("key", TonnageList([vessel], _DATE))
+
+    assert diff.added == (vessel,)
+    assert snapshots.keys() == ("key",)
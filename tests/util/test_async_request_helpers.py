@@ -0,0 +1,98 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import pytest
+import requests
+
+from signal_ocean import AsyncConnection
+from signal_ocean.util.async_request_helpers import (
+    get_multiple,
+    get_single,
+    post_multiple,
+)
+
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+
+@dataclass(frozen=True)
+class Model:
+    model_id: int
+    name: str
+
+
+def run_with_response(
+    response: Callable[[], Any],
+    test: Callable[[AsyncConnection], Awaitable[Any]],
+) -> Any:
+    async def handler(request):
+        return response()
+
+    async def run() -> Any:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", handler)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        try:
+            async with AsyncConnection(
+                "key", str(server.make_url("/"))
+            ) as connection:
+                return await test(connection)
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_get_single_parses_the_model():
+    result = run_with_response(
+        lambda: web.json_response({"ModelID": 1, "Name": "a"}),
+        lambda c: get_single(
+            c, "url", Model, rename_keys={"ModelID": "model_id"}
+        ),
+    )
+
+    assert result == Model(1, "a")
+
+
+def test_get_single_returns_none_when_not_found():
+    result = run_with_response(
+        lambda: web.Response(status=404),
+        lambda c: get_single(c, "url", Model),
+    )
+
+    assert result is None
+
+
+def test_get_multiple_parses_models_under_data_key():
+    result = run_with_response(
+        lambda: web.json_response(
+            {
+                "Data": [
+                    {"ModelId": 1, "Name": "a"},
+                    {"ModelId": 2, "Name": "b"},
+                ]
+            }
+        ),
+        lambda c: get_multiple(c, "url", Model, data_key_label="Data"),
+    )
+
+    assert result == (Model(1, "a"), Model(2, "b"))
+
+
+def test_post_multiple_parses_models():
+    result = run_with_response(
+        lambda: web.json_response([{"ModelId": 1, "Name": "a"}]),
+        lambda c: post_multiple(c, "url", Model, query_string=[1]),
+    )
+
+    assert result == (Model(1, "a"),)
+
+
+def test_raises_on_unsuccessful_responses():
+    with pytest.raises(requests.HTTPError):
+        run_with_response(
+            lambda: web.Response(status=500),
+            lambda c: get_multiple(c, "url", Model),
+        )
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from signal_ocean.util.chunked_retrieval import (
+    ChunkRetrievalError,
+    fetch_chunks,
+    fetch_each,
+    get_max_workers,
+)
+
+
+def fail_on_odd(item: int) -> int:
+    if item % 2:
+        raise ValueError(item)
+    return item * 10
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_fetch_chunks_attempts_all_chunks(max_workers: int) -> None:
+    fetched = []
+
+    def fetch(item: int) -> int:
+        fetched.append(item)
+        return fail_on_odd(item)
+
+    with pytest.raises(ChunkRetrievalError) as error:
+        fetch_chunks(range(4), fetch, sum, max_workers)
+
+    assert sorted(fetched) == [0, 1, 2, 3]
+    assert error.value.failed_chunks == (1, 3)
+
+
+def test_fetch_chunks_can_raise_the_first_error_sequentially() -> None:
+    fetched = []
+
+    def fetch(item: int) -> int:
+        fetched.append(item)
+        return fail_on_odd(item)
+
+    with pytest.raises(ValueError):
+        fetch_chunks(range(4), fetch, sum, raise_first_error=True)
+
+    assert fetched == [0, 1]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_fetch_each_yields_outcomes_in_order(max_workers: int) -> None:
+    outcomes = list(fetch_each(range(6), fail_on_odd, max_workers))
+
+    assert [item for item, _, _ in outcomes] == list(range(6))
+    assert [result for _, result, _ in outcomes] == [
+        0, None, 20, None, 40, None
+    ]
+    assert all(
+        isinstance(error, ValueError) for _, _, error in outcomes[1::2]
+    )
+
+
+def test_fetch_each_bounds_the_items_in_flight() -> None:
+    consumed = []
+    release = threading.Event()
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    def fetch(item: int) -> int:
+        release.wait()
+        return item
+
+    outcomes = fetch_each(items(), fetch, max_workers=2)
+    release.set()
+    first = next(outcomes)
+
+    assert first == (0, 0, None)
+    assert len(consumed) <= 5
+    assert len(list(outcomes)) == 99
+
+
+def test_fetch_each_rejects_invalid_max_workers() -> None:
+    with pytest.raises(ValueError):
+        list(fetch_each([1], fail_on_odd, max_workers=0))
+
+
+@pytest.mark.parametrize(
+    "max_workers, expected", [(None, 10), (1, 1), (4, 4), (32, 10)]
+)
+def test_get_max_workers_is_bounded_by_the_pool_size(
+    max_workers: int, expected: int
+) -> None:
+    assert get_max_workers(max_workers, pool_size=10) == expected
@@ -0,0 +1,207 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from typing import Optional, Tuple
+
+import pandas as pd
+import pytest
+
+from signal_ocean.util.frame_helpers import (
+    FrameBuilder,
+    get_field,
+    pricing_grid_to_frame,
+    records_to_frame,
+    tonnage_lists_to_frame,
+)
+from signal_ocean.util.parsing_helpers import parse_model
+
+
+@dataclass(frozen=True)
+class _Owner:
+    name: str
+    country_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class _Record:
+    id: int
+    speed: Optional[float] = None
+    is_laden: Optional[bool] = None
+    updated: Optional[datetime] = None
+    vessel_name: Optional[str] = None
+    owner: Optional[_Owner] = None
+    tags: Optional[Tuple[str, ...]] = None
+
+
+_RECORDS = [
+    {
+        "ID": 1,
+        "Speed": 12.5,
+        "IsLaden": True,
+        "Updated": "2021-03-04T05:06:07",
+        "VesselName": "Alpha",
+        "Owner": {"Name": "Acme", "CountryId": 30},
+        "Tags": ["a", "b"],
+    },
+    {
+        "ID": 2,
+        "Speed": None,
+        "IsLaden": None,
+        "Updated": "2021-03-05T00:00:00+00:00",
+        "VesselName": "Alpha",
+        "Owner": None,
+        "Unknown": "ignored",
+    },
+    {"ID": 3, "VesselName": "Alpha"},
+]
+
+
+def test_columns_are_typed():
+    frame = records_to_frame(_RECORDS, _Record)
+
+    assert list(frame.columns) == [
+        "id",
+        "speed",
+        "is_laden",
+        "updated",
+        "vessel_name",
+        "owner_name",
+        "owner_country_id",
+    ]
+    assert frame["id"].dtype == "Int64"
+    assert frame["speed"].dtype == "float64"
+    assert frame["is_laden"].dtype == "boolean"
+    assert frame["updated"].dtype == "datetime64[ns, UTC]"
+    assert frame["vessel_name"].dtype == "category"
+    assert frame["owner_country_id"].dtype == "Int64"
+
+
+def test_values_match_parsed_models():
+    frame = records_to_frame(_RECORDS, _Record)
+
+    for row, record in zip(frame.itertuples(index=False), _RECORDS):
+        model = parse_model(dict(record), _Record)
+        assert row.id == model.id
+        assert row.vessel_name == model.vessel_name
+        if model.updated is None:
+            assert pd.isna(row.updated)
+        else:
+            assert row.updated.to_pydatetime() == model.updated
+    assert frame["updated"][0] == datetime(2021, 3, 4, 5, 6, 7,
+                                           tzinfo=timezone.utc)
+
+
+def test_missing_values_are_null():
+    frame = records_to_frame(_RECORDS, _Record)
+
+    assert frame["speed"].isna().tolist() == [False, True, True]
+    assert frame["is_laden"].isna().tolist() == [False, True, True]
+    assert frame["owner_name"].isna().tolist() == [False, True, True]
+
+
+def test_invalid_datetime_raises():
+    with pytest.raises(ValueError):
+        records_to_frame([{"ID": 1, "Updated": "not a date"}], _Record)
+
+
+def test_str_column_of_mostly_distinct_values_is_not_categorical():
+    frame = records_to_frame(
+        [{"ID": i, "VesselName": str(i)} for i in range(4)], _Record
+    )
+
+    assert frame["vessel_name"].dtype == object
+
+
+def test_builder_accumulates_pages():
+    builder = FrameBuilder(_Record)
+
+    builder.add(_RECORDS[:1])
+    builder.add(None)
+    builder.add(_RECORDS[1:])
+
+    assert builder.to_frame()["id"].tolist() == [1, 2, 3]
+
+
+def test_renamed_keys_are_decoded():
+    frame = records_to_frame(
+        [{"Identifier": 7}], _Record, rename_keys={"Identifier": "Id"}
+    )
+
+    assert frame["id"].tolist() == [7]
+
+
+def test_empty_frame_has_all_columns():
+    frame = records_to_frame([], _Record)
+
+    assert len(frame) == 0
+    assert "owner_country_id" in frame.columns
+    assert frame["id"].dtype == "Int64"
+
+
+def test_tonnage_lists_to_frame():
+    vessel = SimpleNamespace(imo=1, name="Alpha", vessel_class="VLCC")
+    tonnage_lists = [
+        SimpleNamespace(date=date(2021, 1, 1), vessels=[vessel]),
+        SimpleNamespace(date=date(2021, 1, 2), vessels=[]),
+        SimpleNamespace(date=date(2021, 1, 3), vessels=[vessel]),
+    ]
+
+    frame = tonnage_lists_to_frame(
+        tonnage_lists,
+        {"vessel_name": "name", "class": "vessel_class"},
+        {"class"},
+        "date",
+        "imo",
+    )
+
+    assert frame.index.names == ["date", "imo"]
+    assert frame.index.tolist() == [
+        (date(2021, 1, 1), 1), (date(2021, 1, 3), 1)
+    ]
+    assert frame["vessel_name"].tolist() == ["Alpha", "Alpha"]
+    assert frame["class"].dtype == "category"
+
+
+def test_pricing_grid_to_frame():
+    key = SimpleNamespace(
+        load_port_id=1, discharge_port_id=2, date=date(2021, 1, 1)
+    )
+    price = SimpleNamespace(
+        vessel_class="VLCC",
+        is_estimated=None,
+        costs=SimpleNamespace(canal=1.5),
+    )
+
+    frame = pricing_grid_to_frame(
+        [key, key],
+        [(price, price), ()],
+        categories=("vessel_class",),
+        flags=("is_estimated",),
+        amounts={"canal": "costs.canal"},
+    )
+
+    assert frame.columns.tolist() == [
+        "load_port_id",
+        "discharge_port_id",
+        "date",
+        "vessel_class",
+        "is_estimated",
+        "canal",
+    ]
+    assert frame["load_port_id"].tolist() == [1, 1]
+    assert frame["vessel_class"].dtype == "category"
+    assert frame["is_estimated"].dtype == "boolean"
+    assert frame["canal"].tolist() == [1.5, 1.5]
+
+
+@pytest.mark.parametrize(
+    "data, name, expected",
+    [
+        ({"NextRequestToken": "t"}, "next_request_token", "t"),
+        ({"data": [1]}, "data", [1]),
+        ({"Data": [1]}, "geos", None),
+        (None, "data", None),
+    ],
+)
+def test_get_field(data, name, expected):
+    assert get_field(data, name) == expected
@@ -26,6 +26,23 @@ def test_to_camel_case(snake_cased: str, camel_cased: str) -> None:
     transformed = parsing_helpers._to_camel_case(snake_cased)
     assert transformed == camel_cased
 
+
+def test_to_camel_case_rename_keys() -> None:
+    rename_keys = {'imos': 'IMOs'}
+
+    assert parsing_helpers._to_camel_case('imos', rename_keys) == 'IMOs'
+    assert parsing_helpers._to_camel_case('imos') == 'Imos'
+
+
+def test_key_case_conversions_are_memoised() -> None:
+    parsing_helpers._to_snake_case.cache_clear()
+
+    parsing_helpers._to_snake_case('VesselTypeId')
+    parsing_helpers._to_snake_case('VesselTypeId')
+
+    assert parsing_helpers._to_snake_case.cache_info().hits == 1
+
+
 @pytest.mark.parametrize("value, cls, expected",
                          [(None, type(None), None),
                           ('Abc', str, 'Abc'),
@@ -209,3 +226,57 @@ def test_parse_model_rename_key_extra_attribute_ignored():
     parsed = parsing_helpers.parse_model(data, TestModel, rename_keys)
     assert isinstance(parsed, TestModel)
     assert parsed == TestModel(model_id=1)
+
+
+def test_parse_model_reuses_compiled_parser():
+    @dataclass(frozen=True)
+    class Model:
+        model_id: int
+
+    parsing_helpers.parse_model({'ModelId': 1}, Model)
+    parser = parsing_helpers._get_parser(Model, ())
+
+    assert parsing_helpers._get_parser(Model, ()) is parser
+    assert parser({'ModelId': 2}) == Model(2)
+
+
+def test_parse_model_compiles_parsers_per_rename_keys():
+    @dataclass(frozen=True)
+    class Model:
+        model_id: Optional[int] = None
+
+    plain = parsing_helpers.parse_model({'ID': 1}, Model)
+    renamed = parsing_helpers.parse_model(
+        {'ID': 1}, Model, rename_keys={'ID': 'ModelId'})
+
+    assert plain == Model()
+    assert renamed == Model(1)
+
+
+def test_parse_model_recursive_model():
+    @dataclass(frozen=True)
+    class Node:
+        name: str
+        children: Tuple['Node', ...] = ()
+
+    Node.__dataclass_fields__['children'].type = Tuple[Node, ...]
+    data = {'Name': 'a', 'Children': [{'Name': 'b'}, {'Name': 'c'}]}
+
+    node = parsing_helpers.parse_model(data, Node)
+
+    assert node == Node('a', (Node('b'), Node('c')))
+
+
+@pytest.mark.parametrize("value, field_type",
+                         [('Abc', Optional[int]),
+                          ('x', Optional[float]),
+                          (1, Union[List[int], Tuple[int, ...]])])
+def test_parse_model_field_union_raises_value_error(value: Any,
+                                                    field_type: Type) -> None:
+    with pytest.raises(ValueError):
+        parsing_helpers.parse_model(value, field_type)
+
+
+def test_parse_model_unsupported_type_raises_not_implemented_error():
+    with pytest.raises(NotImplementedError):
+        parsing_helpers.parse_model({'a': 1}, dict)
@@ -1,11 +1,18 @@
+import threading
 from dataclasses import dataclass
-from typing import Tuple, Dict, Union
+from typing import Any, List, Optional, Tuple, Dict, Union
 from unittest.mock import MagicMock
 
+import pytest
 import requests
 
 from signal_ocean import Connection
-from signal_ocean.util.request_helpers import get_single, get_multiple
+from signal_ocean.util.request_helpers import (
+    get_multiple,
+    get_pages,
+    get_single,
+    token_page_request,
+)
 
 __test_response_1 = {'ModelID': 1, 'ModelName': 'model1'}
 __test_response_2 = {'ModelID': 2, 'ModelName': 'model2'}
@@ -70,3 +77,108 @@ def test_get_single_returns():
     connection, _ = create_mock_connection(__test_responses)
     objects = get_multiple(connection, relative_url, DummyModel)
     assert objects == (__test_model_object_1, __test_model_object_2)
+
+
+@dataclass(frozen=True)
+class DummyPage:
+    next_page_token: Optional[str]
+    data: Tuple[DummyModel, ...]
+
+
+__test_pages = (
+    {'NextPageToken': 'p2', 'Data': [__test_response_1]},
+    {'NextPageToken': None, 'Data': [__test_response_2]},
+)
+
+
+def create_mock_paged_connection(pages: Tuple[Optional[Dict], ...]) \
+        -> Tuple[Connection, MagicMock, List[threading.Event]]:
+    requested = [threading.Event() for _ in pages]
+
+    def make_request(*args: Any, **kwargs: Any) -> MagicMock:
+        index = mocked_make_request.call_count - 1
+        requested[index].set()
+        response = MagicMock()
+        if pages[index] is None:
+            response.status_code = requests.codes.not_found
+        response.json.return_value = pages[index]
+        return response
+
+    connection = Connection('', '')
+    mocked_make_request = MagicMock(side_effect=make_request)
+    connection._make_get_request = mocked_make_request
+    return connection, mocked_make_request, requested
+
+
+def test_get_pages_follows_page_tokens():
+    connection, mocked_make_request, _ = create_mock_paged_connection(
+        __test_pages)
+
+    pages = list(get_pages(
+        connection, DummyPage, token_page_request('url')))
+
+    assert pages == [
+        DummyPage('p2', (__test_model_object_1,)),
+        DummyPage(None, (__test_model_object_2,)),
+    ]
+    assert [c.kwargs['query_string'] for c in
+            mocked_make_request.call_args_list] == [None, {'token': 'p2'}]
+
+
+def test_get_pages_starts_from_token():
+    connection, mocked_make_request, _ = create_mock_paged_connection(
+        __test_pages[1:])
+
+    pages = list(get_pages(
+        connection, DummyPage, token_page_request('url', 'Token'), 'p2'))
+
+    assert len(pages) == 1
+    mocked_make_request.assert_called_once_with(
+        'url', query_string={'Token': 'p2'})
+
+
+def test_get_pages_prefetches_the_next_page():
+    connection, _, requested = create_mock_paged_connection(__test_pages)
+
+    pages = get_pages(
+        connection, DummyPage, token_page_request('url'), prefetch=True)
+    next(pages)
+
+    assert requested[1].wait(timeout=5)
+    pages.close()
+
+
+def test_get_pages_requests_pages_lazily_by_default():
+    connection, mocked_make_request, _ = create_mock_paged_connection(
+        __test_pages)
+
+    pages = get_pages(connection, DummyPage, token_page_request('url'))
+    next(pages)
+
+    assert mocked_make_request.call_count == 1
+    pages.close()
+
+
+def test_get_pages_yields_none_if_page_does_not_exist():
+    connection, _, _ = create_mock_paged_connection((None,))
+
+    pages = list(get_pages(connection, DummyPage, token_page_request('url')))
+
+    assert pages == [None]
+
+
+def test_get_pages_raises_errors_of_prefetched_pages():
+    connection = Connection('', '')
+    first_page = MagicMock()
+    first_page.json.return_value = __test_pages[0]
+    failed_page = MagicMock()
+    failed_page.raise_for_status.side_effect = requests.HTTPError()
+    connection._make_get_request = MagicMock(
+        side_effect=[first_page, failed_page])
+
+    pages = get_pages(
+        connection, DummyPage, token_page_request('url'), prefetch=True)
+    next(pages)
+
+    with pytest.raises(requests.HTTPError):
+        next(pages)
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock
 import requests
 
 from signal_ocean import Connection
+from signal_ocean.vessel_emissions import EmissionsCheckpoint
 from vessel_emissions_mock_data import __mock_emissions_response_imo_voyage_no_args, __mock_metrics_response, \
     __mock_emissions_response_imo_voyage_all_args, \
     __mock_emissions_imo_voyage_no_args, __mock_metrics_1, __mock_emissions_imo_voyage_all_args, \
@@ -16,7 +17,7 @@ from vessel_class_emissions_mock_data import __mock_emissions_vessel_class_no_ar
     __mock_emissions_response_vessel_class_one_arg, __mock_emissions_vessel_class_one_arg, \
     __mock_emissions_response_vessel_class_all_args, __mock_emissions_vessel_class_all_args
 from mock_data_test import __mock_emissions_response_2, __mock_emissions_2
-from signal_ocean.vessel_emissions.vessel_emissions_api import VesselEmissionsAPI
+from signal_ocean.vessel_emissions.vessel_emissions_api import VesselEmissionsAPI, make_url
 
 
 def create_vessel_emissions_api(response: requests.Response) -> Tuple[VesselEmissionsAPI, MagicMock]:
@@ -122,3 +123,165 @@ def test_request_vessel_class_metrics():
     api, mocked_make_request = create_vessel_emissions_api(response)
     metrics = api.get_metrics_by_vessel_class_id(vessel_class_id=86)
     assert metrics == __mock_vessel_class_metrics_1
+
+
+def create_bulk_vessel_emissions_api(data) -> Tuple[VesselEmissionsAPI, MagicMock]:
+    def make_request(url):
+        if "/imo/1?" in url or url.endswith("/imo/1"):
+            raise requests.HTTPError("Not available")
+        response = MagicMock()
+        response.json.return_value = data
+        return response
+
+    connection = Connection()
+    mocked_make_request = MagicMock(side_effect=make_request)
+    connection._make_get_request = mocked_make_request
+    return VesselEmissionsAPI(connection), mocked_make_request
+
+
+def test_request_vessel_emissions_for_imos():
+    api, mocked_make_request = create_bulk_vessel_emissions_api(__mock_emissions_response_imo_no_args)
+    progress = MagicMock()
+    results = list(api.get_emissions_for_imos([9412036, 1, 9412036], max_workers=2, progress=progress))
+
+    assert [r.imo for r in results] == [9412036, 1]
+    assert results[0].emissions == __mock_emissions_imo_no_args
+    assert results[0].error is None
+    assert results[1].emissions is None
+    assert isinstance(results[1].error, requests.HTTPError)
+    assert mocked_make_request.call_count == 2
+    assert [c.args for c in progress.call_args_list] == [(1, 2), (2, 2)]
+
+
+def test_request_vessel_emissions_for_imos_passes_the_parameters():
+    api, mocked_make_request = create_bulk_vessel_emissions_api([])
+    list(api.get_emissions_for_imos([9412036], include_consumptions=True, sulphur_content_hfo=0.5))
+
+    url = mocked_make_request.call_args.args[0]
+    assert url == VesselEmissionsAPI.relative_url + make_url(
+        'emissions', 'imo', 9412036,
+        **VesselEmissionsAPI.construct_url_parameters(include_consumptions=True, sulphur_content_hfo=0.5)
+    )
+
+
+def test_request_vessel_emissions_for_imos_frame():
+    api, _ = create_bulk_vessel_emissions_api(__mock_emissions_response_imo_no_args)
+    frame, errors = api.get_emissions_for_imos_frame([9412036, 1])
+
+    assert len(frame) == len(__mock_emissions_imo_no_args)
+    assert frame["id"].tolist() == [e.id for e in __mock_emissions_imo_no_args]
+    assert frame["emissions_voyage_co2_in_tons"].tolist() == [
+        e.emissions.voyage.co2_in_tons for e in __mock_emissions_imo_no_args
+    ]
+    assert list(errors) == [1]
+
+
+def test_request_vessel_metrics_for_imos():
+    api, mocked_make_request = create_bulk_vessel_emissions_api(__mock_metrics_response)
+    results = list(api.get_metrics_for_imos([9412036], year=2022))
+
+    assert results[0].metrics == __mock_metrics_1
+    assert mocked_make_request.call_args.args[0].endswith("emissions/metrics/imo/9412036?year=2022")
+
+
+def test_request_vessel_metrics_for_imos_frame():
+    api, _ = create_bulk_vessel_emissions_api(__mock_metrics_response)
+    frame, errors = api.get_metrics_for_imos_frame([1, 9412036])
+
+    assert frame["imo"].tolist() == [9412036]
+    assert frame["cii_rating"].tolist() == ["B"]
+    assert frame["aer_value"].tolist() == [__mock_metrics_1[0].aer.value]
+    assert list(errors) == [1]
+
+
+__mock_class_records = __mock_emissions_response_vessel_class_no_args["Data"]
+__mock_class_pages = {
+    None: {"NextPageToken": "page-2", "Data": __mock_class_records[:1]},
+    "page-2": {"NextPageToken": "changes", "Data": __mock_class_records[1:]},
+    "changes": {"NextPageToken": "changes", "Data": []},
+}
+
+
+def create_paged_vessel_emissions_api(pages=None) -> Tuple[VesselEmissionsAPI, MagicMock]:
+    pages = pages or __mock_class_pages
+
+    def make_request(url, query_string=None):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = pages[query_string.get("token")]
+        return response
+
+    connection = Connection()
+    mocked_make_request = MagicMock(side_effect=make_request)
+    connection._make_get_request = mocked_make_request
+    return VesselEmissionsAPI(connection), mocked_make_request
+
+
+def requested_tokens(mocked_make_request: MagicMock):
+    return [c.kwargs["query_string"].get("token") for c in mocked_make_request.call_args_list]
+
+
+def test_iterate_vessel_class_emissions_over_all_pages():
+    api, mocked_make_request = create_paged_vessel_emissions_api()
+    emissions = list(api.iter_emissions_by_vessel_class_id(vessel_class_id=86, include_distances=True))
+
+    assert emissions == __mock_emissions_vessel_class_no_args.data
+    assert requested_tokens(mocked_make_request) == [None, "page-2", "changes"]
+    url, query = mocked_make_request.call_args.args[0], mocked_make_request.call_args.kwargs["query_string"]
+    assert url == VesselEmissionsAPI.relative_url + "emissions/class/86"
+    assert query["include_distances"] == "True"
+
+
+def test_iterate_vessel_class_emissions_continues_from_checkpoint(tmp_path):
+    path = str(tmp_path / "tokens.sqlite")
+    api, _ = create_paged_vessel_emissions_api()
+    with EmissionsCheckpoint(path) as checkpoint:
+        list(api.iter_emissions_by_vessel_class_id(vessel_class_id=86, checkpoint=checkpoint))
+
+    api, mocked_make_request = create_paged_vessel_emissions_api()
+    with EmissionsCheckpoint(path) as checkpoint:
+        emissions = list(api.iter_emissions_by_vessel_class_id(vessel_class_id=86, checkpoint=checkpoint,
+                                                               incremental=True))
+
+    assert emissions == []
+    assert requested_tokens(mocked_make_request) == ["changes"]
+
+
+def test_iterate_vessel_class_emissions_resumes_from_the_first_unconsumed_page():
+    api, mocked_make_request = create_paged_vessel_emissions_api()
+    checkpoint = EmissionsCheckpoint(":memory:")
+    emissions = api.iter_emissions_by_vessel_class_id(vessel_class_id=86, checkpoint=checkpoint)
+    next(emissions)
+    next(emissions)
+    emissions.close()
+    mocked_make_request.reset_mock()
+
+    resumed = list(api.iter_emissions_by_vessel_class_id(vessel_class_id=86, checkpoint=checkpoint,
+                                                         incremental=True))
+
+    assert resumed == __mock_emissions_vessel_class_no_args.data[1:]
+    assert requested_tokens(mocked_make_request) == ["page-2", "changes"]
+
+
+def test_iterate_vessel_class_emissions_starts_over_by_default():
+    api, mocked_make_request = create_paged_vessel_emissions_api()
+    checkpoint = EmissionsCheckpoint(":memory:")
+    list(api.iter_emissions_by_vessel_class_id(vessel_class_id=86, checkpoint=checkpoint))
+    mocked_make_request.reset_mock()
+
+    emissions = list(api.iter_emissions_by_vessel_class_id(vessel_class_id=86, checkpoint=checkpoint))
+
+    assert emissions == __mock_emissions_vessel_class_no_args.data
+    assert requested_tokens(mocked_make_request)[0] is None
+
+
+def test_iterate_vessel_class_metrics():
+    api, mocked_make_request = create_paged_vessel_emissions_api({
+        None: {"NextPageToken": "changes", "Data": __mock_vessel_class_metrics_response_1["Data"]},
+        "changes": {"NextPageToken": "changes", "Data": []},
+    })
+    metrics = list(api.iter_metrics_by_vessel_class_id(vessel_class_id=86, year=2022))
+
+    assert metrics == __mock_vessel_class_metrics_1.data
+    assert mocked_make_request.call_args.args[0] == VesselEmissionsAPI.relative_url + "emissions/metrics/class/86"
+    assert mocked_make_request.call_args.kwargs["query_string"]["year"] == "2022"
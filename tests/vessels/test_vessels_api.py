@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timezone
 from typing import Tuple
 from unittest.mock import MagicMock
@@ -254,6 +255,31 @@ def test_response_vessels():
     assert vessels == (__mock_vessel_1, __mock_vessel_2)
 
 
+def test_get_vessels_can_prefetch_the_next_page():
+    request_threads = []
+
+    def make_request(*args, **kwargs):
+        request_threads.append(threading.current_thread())
+        response = MagicMock()
+        response.json.return_value = (
+            {'NextPageToken': 'p2', 'Data': __mock_vessels_response[:1]}
+            if len(request_threads) == 1
+            else {'Data': __mock_vessels_response[1:]}
+        )
+        return response
+
+    api, mocked_make_request = create_vessels_api(MagicMock())
+    mocked_make_request.side_effect = make_request
+    vessels = api.get_vessels(prefetch=True)
+
+    assert vessels == (__mock_vessel_1, __mock_vessel_2)
+    assert mocked_make_request.call_args.args[0].endswith('&token=p2')
+    # The second page is requested on the background thread while the
+    # first one is decoded.
+    assert request_threads[0] is threading.current_thread()
+    assert request_threads[1] is not threading.current_thread()
+
+
 def test_requests_search_vessels():
     response = MagicMock()
     response.json.return_value = {'Data':__mock_vessels_response}
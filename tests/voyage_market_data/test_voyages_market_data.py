@@ -1,8 +1,9 @@
 import dataclasses
 from datetime import datetime, date, timezone
 import re
+import threading
 from typing import Tuple, Dict, Union, List
-from unittest.mock import MagicMock
+from unittest.mock import DEFAULT, MagicMock
 from urllib.parse import urljoin
 
 import pytest
@@ -124,6 +125,26 @@ def test_voyages_market_data_vessel_class_requests():
         urljoin(VoyagesMarketDataAPI.relative_url, f'marketData/class/{vessel_class_id}'),
         query_string=None)
 
+def test_voyages_market_data_can_prefetch_the_next_page():
+    first_page = {**_mock_voyages_market_data_response_1, 'NextPageToken': 'p2'}
+    api, mocked_make_request = create_voyages_market_data_api(None)
+    mocked_make_request.return_value.json.side_effect = [
+        first_page, _mock_voyages_market_data_response_1]
+    request_threads = []
+
+    def make_request(*args, **kwargs):
+        request_threads.append(threading.current_thread())
+        return DEFAULT
+
+    mocked_make_request.side_effect = make_request
+    voyage_market_data = api.get_voyage_market_data(vessel_class_id=84, prefetch=True)
+
+    assert voyage_market_data == (_mock_voyage_market_data_object,) * 2
+    # The second page is requested on the background thread while the
+    # first one is decoded.
+    assert request_threads[0] is threading.current_thread()
+    assert request_threads[1] is not threading.current_thread()
+
 def test_get_voyages_market_data_request_imo_voyage_number_return():
     mock_response = _mock_voyages_market_data_response_1
     imo = _mock_voyage_market_data_object.imo
@@ -131,3 +152,12 @@ def test_get_voyages_market_data_request_imo_voyage_number_return():
     api, _ = create_voyages_market_data_api(mock_response)
     voyage_market_data = api.get_voyage_market_data(imo=imo, voyage_number=voyage_number)
     assert voyage_market_data[0] == _mock_voyage_market_data_object
+
+def test_get_voyages_market_data_frame_return():
+    mock_response = _mock_voyages_market_data_response_1
+    imo = _mock_voyage_market_data_object.imo
+    api, _ = create_voyages_market_data_api(mock_response)
+    frame = api.get_voyage_market_data_frame(imo=imo)
+    assert frame['id'].tolist() == [_mock_voyage_market_data_object.id]
+    assert frame['imo'].tolist() == [imo]
+    assert 'matched_fixture_charterer' in frame.columns
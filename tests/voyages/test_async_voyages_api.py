@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from signal_ocean import AsyncConnection
+from signal_ocean.voyages import AsyncVoyagesAPI
+
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+_PAGES: Dict[str, Dict[str, Any]] = {
+    "": {"NextPageToken": "p2", "Data": [{"IMO": 1, "VoyageNumber": 1}]},
+    "p2": {
+        "NextPageToken": None,
+        "NextRequestToken": "next",
+        "Data": [{"IMO": 1, "VoyageNumber": 2}],
+    },
+}
+
+
+def run_api(test: Any) -> Any:
+    requests: List[Any] = []
+
+    async def handler(request):
+        requests.append(request)
+        return web.json_response(_PAGES[request.query.get("token", "")])
+
+    async def run() -> Any:
+        app = web.Application()
+        app.router.add_route("GET", "/{tail:.*}", handler)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        try:
+            async with AsyncConnection(
+                "key", str(server.make_url("/"))
+            ) as connection:
+                return await test(AsyncVoyagesAPI(connection))
+        finally:
+            await server.close()
+
+    return asyncio.run(run()), requests
+
+
+def test_get_voyages_follows_page_tokens():
+    voyages, requests = run_api(lambda api: api.get_voyages(imo=1))
+
+    assert [v.voyage_number for v in voyages] == [1, 2]
+    assert [r.path for r in requests] == ["/voyages-api/v4/voyages/nested"] * 2
+    assert all(r.query["Imo"] == "1" for r in requests)
+    assert requests[1].query["token"] == "p2"
+
+
+def test_get_incremental_voyages_returns_next_request_token():
+    (voyages, token), _ = run_api(
+        lambda api: api.get_incremental_voyages(imo=1)
+    )
+
+    assert len(voyages) == 2
+    assert token == "next"
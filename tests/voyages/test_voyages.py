@@ -2,8 +2,9 @@ import dataclasses
 from copy import copy
 from datetime import datetime, date, timezone
 import re
+import threading
 from typing import Tuple, Dict, Union, List
-from unittest.mock import MagicMock
+from unittest.mock import DEFAULT, MagicMock
 from urllib.parse import urljoin
 
 import pytest
@@ -791,6 +792,21 @@ def test_voyages_api_pages_flat():
     assert voyages == _mock_flat_voyages
 
 
+def test_voyages_api_flat_frames_match_models():
+    mock_responses = [_mock_voyages_paged_flat_response_data_1,
+                      _mock_voyages_paged_flat_response_data_2]
+    api, _ = create_voyages_api_multiple_requests(mock_responses)
+    frames = api.get_voyages_flat_frames(vessel_class_id=84)
+    assert frames.voyages['id'].tolist() == \
+        [v.id for v in _mock_flat_voyages.voyages]
+    assert frames.events['id'].tolist() == \
+        [e.id for e in _mock_flat_voyages.events]
+    assert frames.event_details['id'].tolist() == \
+        [d.id for d in _mock_flat_voyages.event_details]
+    assert sorted(frames.geos['id'].tolist()) == \
+        sorted(g.id for g in _mock_flat_voyages.geos)
+
+
 def test_voyages_api_pages_nested():
     mock_responses = [_mock_voyages_paged_nested_response_data_1,
                       _mock_voyages_paged_nested_response_data_2]
@@ -821,6 +837,27 @@ def test_get_voyages_class_returns():
     assert voyages == (_mock_nested_voyage_1, _mock_nested_voyage_2)
 
 
+def test_get_voyages_can_prefetch_the_next_page():
+    mock_responses = [_mock_voyages_paged_nested_response_data_1,
+                      _mock_voyages_paged_nested_response_data_2]
+    api, mocked_make_request = create_voyages_api_multiple_requests(
+        mock_responses)
+    request_threads = []
+
+    def make_request(*args, **kwargs):
+        request_threads.append(threading.current_thread())
+        return DEFAULT
+
+    mocked_make_request.side_effect = make_request
+    voyages = api.get_voyages(vessel_class_id=84, prefetch=True)
+
+    assert voyages == (_mock_nested_voyage_1, _mock_nested_voyage_2)
+    # The second page is requested on the background thread while the
+    # first one is decoded.
+    assert request_threads[0] is threading.current_thread()
+    assert request_threads[1] is not threading.current_thread()
+
+
 def test_get_voyages_flat_class_requests():
     mock_responses = [_mock_voyages_paged_flat_response_data_1,
                       _mock_voyages_paged_flat_response_data_2]
@@ -0,0 +1,143 @@
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from signal_ocean import Connection
+from signal_ocean.voyages import Voyage, VoyagesAPI, VoyagesStore
+
+
+def _voyage_data(voyage_id: str, imo: int, number: int) -> Dict[str, Any]:
+    return {
+        'ID': voyage_id,
+        'IMO': imo,
+        'VoyageNumber': number,
+        'VesselName': 'Signal Vessel',
+        'Deleted': False,
+        'Events': [],
+    }
+
+
+def _page(data: List[Dict[str, Any]], **tokens: str) -> Dict[str, Any]:
+    return {'Data': data, **tokens}
+
+
+def create_voyages_api(*pages: Any) -> VoyagesAPI:
+    connection = Connection('', '')
+    responses = []
+    for page in pages:
+        response = MagicMock()
+        if isinstance(page, Exception):
+            response.raise_for_status.side_effect = page
+        response.json.return_value = page
+        responses.append(response)
+    connection._make_get_request = MagicMock(side_effect=responses)
+    return VoyagesAPI(connection)
+
+
+def test_sync_stores_voyages_and_incremental_token(tmp_path) -> None:
+    path = str(tmp_path / 'voyages.sqlite')
+    api = create_voyages_api(
+        _page([_voyage_data('1.1', 1, 1)], NextPageToken='page-2'),
+        _page([_voyage_data('2.1', 2, 1)], NextRequestToken='next'),
+    )
+
+    with VoyagesStore(path, vessel_class_id=84) as store:
+        result = store.sync(api)
+
+    assert (result.updated, result.deleted, result.pages) == (2, 0, 2)
+    with VoyagesStore(path, vessel_class_id=84) as store:
+        assert store.incremental_token == 'next'
+        assert len(store) == 2
+        assert store.get_voyage('1.1') == Voyage(
+            imo=1,
+            voyage_number=1,
+            vessel_name='Signal Vessel',
+            deleted=False,
+            events=(),
+            id='1.1',
+        )
+        assert [v.id for v in store.get_voyages()] == ['1.1', '2.1']
+
+
+def test_sync_requests_changes_since_last_sync(tmp_path) -> None:
+    store = VoyagesStore(str(tmp_path / 'voyages.sqlite'))
+    store.sync(
+        create_voyages_api(
+            _page(
+                [_voyage_data('1.1', 1, 1), _voyage_data('2.1', 2, 1)],
+                NextRequestToken='first',
+            )
+        )
+    )
+    deleted = {**_voyage_data('2.1', 2, 1), 'Deleted': True}
+    api = create_voyages_api(
+        _page(
+            [_voyage_data('1.1', 1, 2), deleted, _voyage_data('3.1', 3, 1)],
+            NextRequestToken='second',
+        )
+    )
+
+    result = store.sync(api)
+
+    api._VoyagesAPI__connection._make_get_request.assert_called_once_with(
+        'voyages-api/v4/voyages/nested/incremental',
+        query_string={'token': 'first'},
+    )
+    assert (result.updated, result.deleted) == (2, 1)
+    assert store.incremental_token == 'second'
+    assert [(v.id, v.voyage_number) for v in store.get_voyages()] == [
+        ('1.1', 2),
+        ('3.1', 1),
+    ]
+
+
+def test_interrupted_sync_resumes_from_last_applied_page(tmp_path) -> None:
+    store = VoyagesStore(str(tmp_path / 'voyages.sqlite'))
+    failing_api = create_voyages_api(
+        _page([_voyage_data('1.1', 1, 1)], NextPageToken='page-2'),
+        requests.HTTPError('Service unavailable'),
+    )
+    with pytest.raises(requests.HTTPError):
+        store.sync(failing_api)
+    api = create_voyages_api(
+        _page([_voyage_data('2.1', 2, 1)], NextRequestToken='next')
+    )
+
+    store.sync(api)
+
+    api._VoyagesAPI__connection._make_get_request.assert_called_once_with(
+        'voyages-api/v4/voyages/nested/incremental',
+        query_string={'token': 'page-2'},
+    )
+    assert [v.id for v in store.get_voyages()] == ['1.1', '2.1']
+    assert store.incremental_token == 'next'
+
+
+def test_reads_voyages_of_a_vessel(tmp_path) -> None:
+    store = VoyagesStore(str(tmp_path / 'voyages.sqlite'))
+    store.sync(
+        create_voyages_api(
+            _page(
+                [
+                    _voyage_data('1.1', 1, 1),
+                    _voyage_data('2.1', 2, 1),
+                    _voyage_data('1.2', 1, 2),
+                ]
+            )
+        )
+    )
+
+    assert [v.id for v in store.get_voyages(imo=1)] == ['1.1', '1.2']
+    frame = store.get_voyages_frame(imo=1)
+    assert frame['id'].tolist() == ['1.1', '1.2']
+    assert frame['voyage_number'].tolist() == [1, 2]
+
+
+def test_rejects_store_synchronized_with_different_filters(tmp_path) -> None:
+    path = str(tmp_path / 'voyages.sqlite')
+    VoyagesStore(path, vessel_class_id=84).close()
+
+    with pytest.raises(ValueError):
+        VoyagesStore(path, vessel_class_id=85)